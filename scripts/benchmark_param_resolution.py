@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure per-node parameter resolution cost with and without the metadata cache.
+
+Resolves every parameter of a processor from its defaults (the path that
+consults :meth:`get_metadata`) and reports the mean time per node. The
+"uncached" figure invalidates the metadata cache before each node, which
+reproduces the cost of rebuilding metadata on every call.
+
+Usage::
+
+    python scripts/benchmark_param_resolution.py [--iterations N]
+"""
+
+import argparse
+import timeit
+
+from semantiva.context_processors import ContextType
+from semantiva.core import invalidate_metadata_cache
+from semantiva.examples.test_utils import FloatMultiplyOperation
+from semantiva.pipeline._param_resolution import resolve_runtime_value
+
+
+def _resolve_node(processor_cls, names, context) -> None:
+    for name in names:
+        try:
+            resolve_runtime_value(
+                name=name,
+                processor_cls=processor_cls,
+                processor_config={},
+                context=context,
+            )
+        except KeyError:
+            pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    processor_cls = FloatMultiplyOperation
+    names = list(processor_cls.get_metadata()["parameters"])
+    context = ContextType()
+
+    def cached() -> None:
+        _resolve_node(processor_cls, names, context)
+
+    def uncached() -> None:
+        invalidate_metadata_cache(processor_cls)
+        _resolve_node(processor_cls, names, context)
+
+    for label, func in (("uncached", uncached), ("cached", cached)):
+        seconds = timeit.timeit(func, number=args.iterations)
+        print(f"{label:>8}: {seconds / args.iterations * 1e6:8.2f} us/node")
+
+
+if __name__ == "__main__":
+    main()
@@ -47,7 +47,7 @@ from .inspection import (
     json_report,
     parameter_resolutions,
 )
-from .core import get_component_registry
+from .core import get_component_registry, get_registered_components
 from .workflows import FittingModel, ModelFittingContextProcessor
 
 __all__ = [
@@ -71,6 +71,7 @@ __all__ = [
     "PayloadSink",
     "FittingModel",
     "get_component_registry",
+    "get_registered_components",
     "build_pipeline_inspection",
     "summary_report",
     "extended_report",
@@ -23,7 +23,7 @@ import time
 from dataclasses import asdict
 from difflib import get_close_matches
 from pathlib import Path
-from typing import Any, Dict, List, NoReturn
+from typing import Any, Dict, Iterator, List, NoReturn, Sequence
 from importlib.metadata import PackageNotFoundError, version as pkg_version
 
 import yaml
@@ -35,16 +35,31 @@ from semantiva.exceptions.pipeline_exceptions import (
     RunSpaceMaxRunsExceededError,
 )
 from semantiva.execution.component_registry import ExecutionComponentRegistry
-from semantiva.execution.run_space import expand_run_space
+from semantiva.execution.run_space import plan_run_space
+from semantiva.execution.run_space_sources import (
+    RunSpaceSourceCache,
+    default_source_cache,
+)
+from semantiva.execution.run_space_pool import (
+    RunSpaceWorkerError,
+    iter_run_outcomes,
+    replay_trace_calls,
+    summarize_payload,
+)
 from semantiva.execution.orchestrator.factory import build_orchestrator
 from semantiva.logger import Logger
 from semantiva.registry import RegistryProfile, apply_profile
 from semantiva.trace.factory import build_trace_driver
 from semantiva.trace.runtime import (
     RunSpaceIdentityService,
+    RunSpaceLaunch,
     RunSpaceLaunchManager,
+    RunSpaceResume,
+    RunSpaceResumeError,
     RunSpaceTraceEmitter,
     TraceContext,
+    TraceSession,
+    plan_resume,
 )
 
 # Exit code constants
@@ -140,13 +155,16 @@ def _apply_override(config: Any, key: str, value: Any) -> None:
         raise KeyError(key)
 
 
-def _configure_logger(verbose: bool, quiet: bool) -> Logger:
-    level = "INFO"
+def _log_level(verbose: bool, quiet: bool) -> str:
     if verbose:
-        level = "DEBUG"
-    elif quiet:
-        level = "ERROR"
-    return Logger(level=level)
+        return "DEBUG"
+    if quiet:
+        return "ERROR"
+    return "INFO"
+
+
+def _configure_logger(verbose: bool, quiet: bool) -> Logger:
+    return Logger(level=_log_level(verbose, quiet))
 
 
 def _parse_yaml_value(value_str: str) -> Any:
@@ -171,7 +189,7 @@ def _parse_options_list(items: List[str]) -> Dict[str, Any]:
     return options
 
 
-def _print_run_space_plan(meta: Dict[str, Any], runs: List[Dict[str, Any]]) -> None:
+def _print_run_space_plan(meta: Dict[str, Any], runs: Sequence[Dict[str, Any]]) -> None:
     combine = meta.get("combine", "product")
     max_runs = meta.get("max_runs")
     expanded = meta.get("expanded_runs", len(runs))
@@ -226,6 +244,17 @@ def _build_trace_driver(trace_cfg: TraceConfig):
     return build_trace_driver(trace_cfg)
 
 
+def _trace_driver_options(trace_driver: Any) -> Dict[str, Any] | None:
+    """Return the detail flags worker processes must honour for ``trace_driver``."""
+
+    if trace_driver is None:
+        return None
+    getter = getattr(trace_driver, "get_options", None)
+    if callable(getter):
+        return dict(getter() or {})
+    return {"hash": True}
+
+
 def _suggest_component(kind: str, name: str, available: List[str]) -> str:
     matches = get_close_matches(name, available, n=3, cutoff=0.6)
     suggestion = (
@@ -264,7 +293,7 @@ def _build_execution_components(exec_cfg: ExecutionConfig):
     transport_obj = None
     transport_cls = _resolve_registry_class("transport", exec_cfg.transport)
     if transport_cls is not None:
-        transport_obj = transport_cls()
+        transport_obj = transport_cls(**exec_cfg.transport_options)
 
     executor_obj = None
     executor_cls = _resolve_registry_class("executor", exec_cfg.executor)
@@ -367,15 +396,23 @@ def _parse_args(argv: List[str] | None) -> argparse.Namespace:
         metavar="key=value",
         help="Additional execution option (repeatable)",
     )
+    run_p.add_argument(
+        "--execution.transport-option",
+        dest="exec_transport_options",
+        action="append",
+        default=[],
+        metavar="key=value",
+        help="Transport constructor option, e.g. retention=ring (repeatable)",
+    )
     run_p.add_argument(
         "--trace.driver",
         dest="trace_driver",
-        help="Trace driver name ('jsonl', default JSONL trace driver)",
+        help="Trace driver name ('jsonl' default JSONL trace driver, or 'sqlite')",
     )
     run_p.add_argument(
         "--trace.output",
         dest="trace_output",
-        help="Trace output path for the JSONL driver",
+        help="Trace output path (JSONL file/directory or SQLite database)",
     )
     run_p.add_argument(
         "--trace.option",
@@ -418,6 +455,36 @@ def _parse_args(argv: List[str] | None) -> argparse.Namespace:
         type=int,
         help="Attempt counter for the run-space launch (default: 1)",
     )
+    run_p.add_argument(
+        "--resume",
+        dest="resume",
+        nargs="?",
+        const="",
+        metavar="TRACE",
+        help=(
+            "Resume a run-space launch from the trace of its earlier attempts "
+            "(default: --trace.output); runs that finished ok are skipped"
+        ),
+    )
+    run_p.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        help="Worker processes for run-space runs (overrides execution.run_space_parallelism)",
+    )
+    run_p.add_argument(
+        "--profile",
+        dest="profile",
+        metavar="DIR",
+        help="Profile every node with cProfile; write pstats and flamegraph stacks to DIR",
+    )
+    run_p.add_argument(
+        "--cache",
+        dest="cache",
+        metavar="DIR",
+        help="Reuse node results cached in DIR (content-addressed, LRU-bounded)",
+    )
     run_p.add_argument("--version", action="version", version=_get_version())
 
     inspect_p = sub.add_parser(
@@ -509,6 +576,74 @@ Use --debug for detailed information about which rules are checked for each comp
     )
     lint_p.add_argument("--version", action="version", version=_get_version())
 
+    # Trace analysis commands
+    trace_p = sub.add_parser(
+        "trace",
+        help="Trace analysis tools",
+        description=(
+            "Commands operating on recorded trace files. Use "
+            "'semantiva trace summarize' to aggregate large trace collections "
+            "and 'semantiva trace timeline' to view executions in Perfetto."
+        ),
+    )
+    trace_sub = trace_p.add_subparsers(dest="trace_command")
+
+    summarize_p = trace_sub.add_parser(
+        "summarize",
+        help="Summarize run/launch completeness and node timings of trace files",
+        description=(
+            "Stream plain or compressed JSONL trace files and segment directories "
+            "through the trace aggregator. Runs are finalized and evicted as soon "
+            "as they end, so memory stays bounded by the runs in flight."
+        ),
+    )
+    summarize_p.add_argument(
+        "paths", nargs="+", help="Trace files or directories, in write order"
+    )
+    summarize_p.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Parser processes (default: 1, streams in-process)",
+    )
+    summarize_p.add_argument(
+        "--chunk-mb",
+        type=int,
+        default=32,
+        help="Split plain trace files into chunks of this many MiB across workers",
+    )
+    summarize_p.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of nodes and problem runs to list (default: 10)",
+    )
+    summarize_p.add_argument(
+        "--json", action="store_true", help="Print the summary as JSON"
+    )
+    summarize_p.add_argument("--version", action="version", version=_get_version())
+
+    timeline_p = trace_sub.add_parser(
+        "timeline",
+        help="Export trace files as a Chrome/Perfetto timeline",
+        description=(
+            "Convert trace files into Chrome Trace Event Format JSON. Run-space "
+            "launches, runs and nodes become spans per process and thread; open "
+            "the output in https://ui.perfetto.dev or chrome://tracing."
+        ),
+    )
+    timeline_p.add_argument(
+        "paths", nargs="+", help="Trace files or directories, in write order"
+    )
+    timeline_p.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="Output JSON file ('-' for stdout)",
+    )
+    timeline_p.add_argument("--version", action="version", version=_get_version())
+
     args = parser.parse_args(argv)
     if args.command is None:
         parser.print_usage(sys.stderr)
@@ -516,6 +651,9 @@ Use --debug for detailed information about which rules are checked for each comp
     if args.command == "dev" and getattr(args, "dev_command", None) is None:
         dev_p.print_usage(sys.stderr)
         raise SystemExit(EXIT_CLI_ERROR)
+    if args.command == "trace" and getattr(args, "trace_command", None) is None:
+        trace_p.print_usage(sys.stderr)
+        raise SystemExit(EXIT_CLI_ERROR)
     return args
 
 
@@ -557,6 +695,10 @@ def _run(args: argparse.Namespace) -> int:
             args.exec_executor,
             args.exec_transport,
             args.exec_options,
+            args.exec_transport_options,
+            args.jobs is not None,
+            args.profile is not None,
+            args.cache is not None,
         ]
     ):
         exec_section = config.setdefault("execution", {})
@@ -569,6 +711,13 @@ def _run(args: argparse.Namespace) -> int:
             exec_section["executor"] = args.exec_executor
         if args.exec_transport:
             exec_section["transport"] = args.exec_transport
+        if args.jobs is not None:
+            exec_section["run_space_parallelism"] = args.jobs
+        if args.profile is not None:
+            # Absolute, so worker processes write to the same place.
+            exec_section["profile_dir"] = str(Path(args.profile).expanduser().resolve())
+        if args.cache is not None:
+            exec_section["cache_dir"] = str(Path(args.cache).expanduser().resolve())
         if args.exec_options:
             opts = exec_section.setdefault("options", {})
             if not isinstance(opts, dict):
@@ -582,6 +731,19 @@ def _run(args: argparse.Namespace) -> int:
             except ValueError as exc:
                 print(str(exc), file=sys.stderr)
                 return EXIT_CONFIG_ERROR
+        if args.exec_transport_options:
+            opts = exec_section.setdefault("transport_options", {})
+            if not isinstance(opts, dict):
+                print(
+                    "Invalid config: execution.transport_options must be a mapping",
+                    file=sys.stderr,
+                )
+                return EXIT_CONFIG_ERROR
+            try:
+                opts.update(_parse_options_list(args.exec_transport_options))
+            except ValueError as exc:
+                print(str(exc), file=sys.stderr)
+                return EXIT_CONFIG_ERROR
 
     if any([args.trace_driver, args.trace_output is not None, args.trace_options]):
         trace_section = config.setdefault("trace", {})
@@ -700,10 +862,18 @@ def _run(args: argparse.Namespace) -> int:
         trace=trace_driver,
     )
 
+    # Shared by planning and run-space identity: each source is read once.
+    cache_dir = pipeline_cfg.execution.cache_dir
+    source_cache = (
+        RunSpaceSourceCache(Path(cache_dir) / "run_space_sources")
+        if cache_dir
+        else default_source_cache()
+    )
     try:
-        runs, run_space_meta = expand_run_space(
+        runs, run_space_meta = plan_run_space(
             pipeline_cfg.run_space,
             cwd=pipeline_cfg.base_dir or pipeline_path.parent,
+            source_cache=source_cache,
         )
     except PipelineConfigurationError as exc:
         print(f"Error: Run space configuration error\n\n{exc}", file=sys.stderr)
@@ -791,7 +961,14 @@ def _run(args: argparse.Namespace) -> int:
     trace_context: TraceContext | None = None
     run_space_launch_id: str | None = None
     run_space_attempt = 1
+    resume: RunSpaceResume | None = None
+    # run_space_index of runs a resumed launch already completed
+    completed: frozenset[int] = frozenset()
+    planned_runs = run_count
 
+    if args.resume is not None and not run_space_active:
+        print("--resume requires a run_space", file=sys.stderr)
+        return EXIT_CONFIG_ERROR
     if run_space_active:
         attempt_arg = (
             args.run_space_attempt if args.run_space_attempt is not None else 1
@@ -802,7 +979,7 @@ def _run(args: argparse.Namespace) -> int:
         try:
             run_space_spec_dict = asdict(pipeline_cfg.run_space)
             base_dir = pipeline_cfg.base_dir or pipeline_path.parent
-            identity_service = RunSpaceIdentityService()
+            identity_service = RunSpaceIdentityService(file_digest=source_cache.digest)
             run_space_ids = identity_service.compute(
                 run_space_spec_dict, base_dir=base_dir
             )
@@ -816,8 +993,50 @@ def _run(args: argparse.Namespace) -> int:
             idempotency_key=args.run_space_idempotency_key,
             attempt=attempt_arg,
         )
+        if args.resume is not None:
+            resume_path = args.resume or pipeline_cfg.trace.output_path
+            if not resume_path:
+                print("--resume needs a trace path or --trace.output", file=sys.stderr)
+                return EXIT_CONFIG_ERROR
+            explicit_launch = bool(
+                args.run_space_launch_id or args.run_space_idempotency_key
+            )
+            try:
+                resume = plan_resume(
+                    resume_path,
+                    run_space_spec_id=run_space_ids.spec_id,
+                    run_space_inputs_id=run_space_ids.inputs_id,
+                    run_space_launch_id=launch.id if explicit_launch else None,
+                )
+            except FileNotFoundError as exc:
+                print(f"resume trace not found: {exc}", file=sys.stderr)
+                return EXIT_FILE_ERROR
+            except RunSpaceResumeError as exc:
+                print(f"Cannot resume: {exc}", file=sys.stderr)
+                return EXIT_CONFIG_ERROR
+            if args.run_space_attempt is None:
+                attempt_arg = resume.previous_attempt + 1
+            elif attempt_arg <= resume.previous_attempt:
+                print(
+                    "run-space attempt must be greater than the resumed attempt "
+                    f"({resume.previous_attempt})",
+                    file=sys.stderr,
+                )
+                return EXIT_CONFIG_ERROR
+            launch = RunSpaceLaunch(id=resume.run_space_launch_id, attempt=attempt_arg)
+            logger.info(
+                "Resuming run-space launch %s (attempt %d): %d of %d runs already "
+                "completed",
+                launch.id,
+                launch.attempt,
+                len(resume.completed_indices),
+                run_count,
+            )
         run_space_launch_id = launch.id
         run_space_attempt = launch.attempt
+        if resume is not None:
+            completed = resume.completed_indices
+            planned_runs = run_count - sum(1 for i in completed if 0 <= i < run_count)
         trace_context = TraceContext()
         trace_context.set_run_space_fk(
             spec_id=run_space_ids.spec_id,
@@ -836,60 +1055,102 @@ def _run(args: argparse.Namespace) -> int:
                 run_space_max_runs_limit=run_space_meta.get("max_runs"),
                 run_space_inputs_id=run_space_ids.inputs_id,
                 run_space_input_fingerprints=run_space_ids.fingerprints,
-                run_space_planned_run_count=run_count,
+                run_space_planned_run_count=planned_runs,
+                run_space_resumed_from=(
+                    resume.as_record() if resume is not None else None
+                ),
             )
 
+    def _pending_indices() -> Iterator[int]:
+        # run_space_index of every run this attempt executes, in order
+        return (idx for idx in range(run_count) if idx not in completed)
+
+    # One trace session per launch: files stay open across runs and are
+    # flushed by the session policy instead of after every run.
+    trace_session = TraceSession(trace_driver).open() if trace_driver else None
     exit_code = EXIT_SUCCESS
     runs_completed = 0
+    jobs = pipeline_cfg.execution.run_space_parallelism
+
+    def _run_metadata(idx: int, run_context: Dict[str, Any]) -> Dict[str, Any]:
+        # Only build run_space metadata when run_space is active
+        if not run_space_active:
+            return {}
+        return {
+            "trace_context": trace_context,
+            "run_space_index": idx,
+            "run_space_context": dict(run_context),
+        }
+
+    def _log_outcome(idx: int, duration: float, data_text: str, ctx_text: str):
+        logger.info("✅ Run %d/%d completed in %.2fs", idx + 1, run_count, duration)
+        logger.info("Output data: %s", data_text)
+        logger.info(ctx_text)
 
     try:
-        for idx, run_values in enumerate(runs):
-            run_context = dict(ctx_dict)
-            run_context.update(run_values)
-
-            # Only build run_space metadata when run_space is active
-            metadata: Dict[str, Any] = {}
-            if run_space_active:
-                metadata = {
-                    "trace_context": trace_context,
-                    "run_space_index": idx,
-                    "run_space_context": dict(run_context),
-                }
-
-            pipeline.set_run_metadata(metadata if metadata else None)
-            initial_payload = (
-                Payload(NoDataType(), ContextType(run_context)) if run_context else None
+        if jobs > 1 and planned_runs > 1:
+
+            def _pending_runs():
+                for idx in _pending_indices():
+                    run_context = dict(ctx_dict)
+                    run_context.update(runs[idx])
+                    logger.info("▶️  Run %d/%d submitted", idx + 1, run_count)
+                    yield idx, run_context, _run_metadata(idx, run_context)
+
+            logger.info("Executing %d runs on %d worker processes", planned_runs, jobs)
+            outcomes = iter_run_outcomes(
+                _pending_runs(),
+                jobs=jobs,
+                config=config,
+                pipeline_path=pipeline_path,
+                log_level=_log_level(args.verbose, args.quiet),
+                trace_options=_trace_driver_options(trace_driver),
             )
-            logger.info("▶️  Run %d/%d starting", idx + 1, run_count)
-            start = time.time()
-            result_payload = pipeline.process(initial_payload)
-            duration = time.time() - start
-            logger.info("✅ Run %d/%d completed in %.2fs", idx + 1, run_count, duration)
-            runs_completed += 1
             try:
-                logger.info("Output data: %s", repr(result_payload.data))
-            except Exception:  # pragma: no cover - defensive
-                logger.info("Output data: <unrepresentable data>")
-            try:
-                ctx = result_payload.context.to_dict()
-                lines = ["Output context:"]
-                for k, v in ctx.items():
-                    try:
-                        v_repr = repr(v)
-                    except Exception:  # pragma: no cover - defensive
-                        v_repr = "<unrepresentable>"
-                    v_repr_repl = v_repr.replace("\n", " ")
-                    lines.append(f"  {k}: {v_repr_repl}")
-                logger.info("\n".join(lines))
-            except Exception:  # pragma: no cover - defensive
-                logger.info("Output context: <unrepresentable context>")
+                for outcome in outcomes:
+                    # Replay in run_space_index order so traces match a serial launch
+                    if trace_driver is not None:
+                        replay_trace_calls(trace_driver, outcome.trace_calls)
+                    if outcome.error is not None:
+                        raise RunSpaceWorkerError(
+                            outcome.index, outcome.error, outcome.error_traceback
+                        )
+                    runs_completed += 1
+                    _log_outcome(
+                        outcome.index,
+                        outcome.duration,
+                        outcome.output_data,
+                        outcome.output_context,
+                    )
+            finally:
+                outcomes.close()
+        else:
+            for idx in _pending_indices():
+                run_context = dict(ctx_dict)
+                run_context.update(runs[idx])
+
+                metadata = _run_metadata(idx, run_context)
+                pipeline.set_run_metadata(metadata if metadata else None)
+                initial_payload = (
+                    Payload(NoDataType(), ContextType(run_context))
+                    if run_context
+                    else None
+                )
+                logger.info("▶️  Run %d/%d starting", idx + 1, run_count)
+                start = time.time()
+                result_payload = pipeline.process(initial_payload)
+                duration = time.time() - start
+                runs_completed += 1
+                _log_outcome(idx, duration, *summarize_payload(result_payload))
     except KeyboardInterrupt:
         print("Interrupted.", file=sys.stderr)
         exit_code = EXIT_INTERRUPT
     except (
         Exception
     ) as exc:  # pragma: no cover - runtime failures are tested separately
-        if args.verbose:
+        if args.verbose and isinstance(exc, RunSpaceWorkerError):
+            print(exc.worker_traceback or exc.message, file=sys.stderr)
+        elif args.verbose:
             import traceback
 
             traceback.print_exc()
@@ -897,20 +1158,26 @@ def _run(args: argparse.Namespace) -> int:
             print(f"Execution failed: {exc}", file=sys.stderr)
         exit_code = EXIT_RUNTIME_ERROR
     finally:
-        if run_space_emitter is not None and run_space_launch_id is not None:
-            summary: dict[str, int | str] = {
-                "planned_runs": run_count,
-                "completed_runs": runs_completed,
-            }
-            if exit_code == EXIT_INTERRUPT:
-                summary["status"] = "interrupted"
-            elif exit_code != EXIT_SUCCESS:
-                summary["status"] = "failed"
-            run_space_emitter.emit_end(
-                run_space_launch_id=run_space_launch_id,
-                run_space_attempt=run_space_attempt,
-                summary=summary,
-            )
+        try:
+            if run_space_emitter is not None and run_space_launch_id is not None:
+                summary: dict[str, int | str] = {
+                    "planned_runs": planned_runs,
+                    "completed_runs": runs_completed,
+                }
+                if resume is not None:
+                    summary["skipped_runs"] = run_count - planned_runs
+                if exit_code == EXIT_INTERRUPT:
+                    summary["status"] = "interrupted"
+                elif exit_code != EXIT_SUCCESS:
+                    summary["status"] = "failed"
+                run_space_emitter.emit_end(
+                    run_space_launch_id=run_space_launch_id,
+                    run_space_attempt=run_space_attempt,
+                    summary=summary,
+                )
+        finally:
+            if trace_session is not None:
+                trace_session.close()
 
     return exit_code
 
@@ -1126,6 +1393,83 @@ def _lint(args: argparse.Namespace) -> int:
     )
 
 
+def _trace_summarize(args: argparse.Namespace) -> int:
+    from semantiva.trace.aggregation import summarize_traces
+
+    missing = [path for path in args.paths if not Path(path).exists()]
+    if missing:
+        print(f"Trace path not found: {missing[0]}", file=sys.stderr)
+        return EXIT_FILE_ERROR
+    if args.workers < 1 or args.chunk_mb < 1 or args.top < 0:
+        print("--workers and --chunk-mb must be >= 1 and --top >= 0", file=sys.stderr)
+        return EXIT_CLI_ERROR
+    try:
+        summary = summarize_traces(
+            args.paths,
+            workers=args.workers,
+            chunk_bytes=args.chunk_mb << 20,
+            max_problem_runs=args.top,
+        )
+    except (OSError, ValueError) as exc:
+        print(f"Failed to read traces: {exc}", file=sys.stderr)
+        return EXIT_FILE_ERROR
+
+    data = summary.to_dict()
+    if args.json:
+        data["nodes"] = data["nodes"][: args.top]
+        print(json.dumps(data, indent=2, sort_keys=True))
+        return EXIT_SUCCESS
+
+    by_status = data["runs_by_status"]
+    print(
+        f"Traces: {data['files']} files, {data['runs_total']} runs "
+        f"(complete {by_status['complete']}, partial {by_status['partial']}, "
+        f"invalid {by_status['invalid']})"
+    )
+    if summary.launches:
+        print("Launches:")
+        for launch in summary.launches:
+            problems = f" [{', '.join(launch.problems)}]" if launch.problems else ""
+            print(
+                f"  {launch.run_space_launch_id} attempt {launch.run_space_attempt}: "
+                f"{launch.status}, {launch.summary.get('runs_total', 0)} runs{problems}"
+            )
+    if summary.problem_runs:
+        print("Runs with problems:")
+        for run in summary.problem_runs:
+            print(f"  {run.run_id}: {run.status} [{', '.join(run.problems)}]")
+        if summary.problem_runs_omitted:
+            print(f"  ... {summary.problem_runs_omitted} more")
+    if data["nodes"] and args.top:
+        print("Nodes by total wall time:")
+        for node in data["nodes"][: args.top]:
+            errors = node["counts"].get("error", 0)
+            print(
+                f"  {node['node_id']} ({node['processor_ref'] or '?'}): "
+                f"{node['runs']} runs, {errors} errors, "
+                f"total {node['total_wall_ms']:.0f} ms, max {node['max_wall_ms']:.0f} ms"
+            )
+    return EXIT_SUCCESS
+
+
+def _trace_timeline(args: argparse.Namespace) -> int:
+    from semantiva.trace.timeline import write_chrome_trace
+
+    missing = [path for path in args.paths if not Path(path).exists()]
+    if missing:
+        print(f"Trace path not found: {missing[0]}", file=sys.stderr)
+        return EXIT_FILE_ERROR
+    try:
+        output = sys.stdout if args.output == "-" else args.output
+        count = write_chrome_trace(args.paths, output)
+    except (OSError, ValueError) as exc:
+        print(f"Failed to export timeline: {exc}", file=sys.stderr)
+        return EXIT_FILE_ERROR
+    if args.output != "-":
+        print(f"Wrote {count} timeline events to {args.output}")
+    return EXIT_SUCCESS
+
+
 def main(argv: List[str] | None = None) -> None:
     """Entry point for the semantiva command-line interface."""
     # Initialize default processor modules and extensions for CLI usage.
@@ -1141,6 +1485,13 @@ def main(argv: List[str] | None = None) -> None:
             code = _lint(args)
         else:
             code = EXIT_CLI_ERROR
+    elif args.command == "trace":
+        if args.trace_command == "summarize":
+            code = _trace_summarize(args)
+        elif args.trace_command == "timeline":
+            code = _trace_timeline(args)
+        else:
+            code = EXIT_CLI_ERROR
     else:
         code = EXIT_CLI_ERROR
     sys.exit(code)
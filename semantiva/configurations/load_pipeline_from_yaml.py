@@ -52,11 +52,39 @@ def _parse_execution_block(block: Any) -> ExecutionConfig:
         options = {}
     if not isinstance(options, Mapping):
         raise ValueError("execution.options must be a mapping")
+    transport_options = data.get("transport_options") or {}
+    if not isinstance(transport_options, Mapping):
+        raise ValueError("execution.transport_options must be a mapping")
+    parallelism = data.get("run_space_parallelism", 1)
+    if parallelism is None:
+        parallelism = 1
+    if isinstance(parallelism, bool) or not isinstance(parallelism, int):
+        raise ValueError("execution.run_space_parallelism must be an integer")
+    if parallelism < 1:
+        raise ValueError("execution.run_space_parallelism must be >= 1")
+    profile_dir = data.get("profile_dir")
+    if profile_dir is not None and not isinstance(profile_dir, str):
+        raise ValueError("execution.profile_dir must be a string path")
+    cache_dir = data.get("cache_dir")
+    if cache_dir is not None and not isinstance(cache_dir, str):
+        raise ValueError("execution.cache_dir must be a string path")
+    cache_max_bytes = data.get("cache_max_bytes")
+    if cache_max_bytes is not None and (
+        isinstance(cache_max_bytes, bool)
+        or not isinstance(cache_max_bytes, int)
+        or cache_max_bytes < 0
+    ):
+        raise ValueError("execution.cache_max_bytes must be a non-negative integer")
     return ExecutionConfig(
         orchestrator=data.get("orchestrator"),
         executor=data.get("executor"),
         transport=data.get("transport"),
         options=dict(options),
+        transport_options=dict(transport_options),
+        run_space_parallelism=parallelism,
+        profile_dir=profile_dir,
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_bytes,
     )
 
 
@@ -22,12 +22,26 @@ from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence
 
 @dataclass
 class ExecutionConfig:
-    """Configuration for orchestrator, executor, and transport resolution."""
+    """Configuration for orchestrator, executor, and transport resolution.
+
+    ``run_space_parallelism`` sets how many worker processes execute
+    independent run-space runs concurrently (``1`` runs them in-process).
+    ``profile_dir`` enables per-node profiling into that directory.
+    ``cache_dir`` enables the node result cache with its on-disk tier in that
+    directory, bounded to ``cache_max_bytes`` (default 4 GiB).
+    ``transport_options`` are keyword arguments of the transport constructor
+    (e.g. ``retention`` and ``max_messages`` for ``in_memory``).
+    """
 
     orchestrator: Optional[str] = None
     executor: Optional[str] = None
     transport: Optional[str] = None
     options: Dict[str, Any] = field(default_factory=dict)
+    transport_options: Dict[str, Any] = field(default_factory=dict)
+    run_space_parallelism: int = 1
+    profile_dir: Optional[str] = None
+    cache_dir: Optional[str] = None
+    cache_max_bytes: Optional[int] = None
 
 
 @dataclass
@@ -15,9 +15,10 @@
 """Context types and processors module."""
 
 from .context_processors import ContextProcessor
-from .context_types import ContextType, ContextCollectionType
+from .context_types import ContextChanges, ContextType, ContextCollectionType
 
 __all__ = [
+    "ContextChanges",
     "ContextProcessor",
     "ContextType",
     "ContextCollectionType",
@@ -15,13 +15,43 @@
 """Context type definitions and structured metadata containers.
 
 Provides context types for dual-channel pipeline metadata flow.
+
+Contexts keep a write journal: every mutation made through their methods bumps
+a version counter and records the key it touched. :meth:`ContextType.journal_mark`
+and :meth:`ContextType.journal_since` turn the journal into the set of keys
+created, updated and deleted between two points in time, which lets tracing
+compute context deltas without comparing whole contexts. Writes made directly
+to the underlying containers bypass the journal.
 """
 
-from typing import Any, List, Optional, Iterator, Union, Dict, Tuple
+from dataclasses import dataclass
+from typing import Any, List, Optional, Iterable, Iterator, Union, Dict, Tuple
 from collections import ChainMap
 from semantiva.logger import Logger
 from semantiva.core.semantiva_component import _SemantivaComponent
 
+# Journal entries kept before the journal is reset. Marks taken before a reset
+# can no longer be resolved and ``journal_since`` returns ``None`` for them.
+_JOURNAL_LIMIT = 10_000
+
+
+@dataclass(frozen=True)
+class ContextChanges:
+    """Keys of a context's ``to_dict()`` view changed since a journal mark.
+
+    Attributes:
+        created: Keys absent at the mark and present now.
+        updated: Keys present at the mark and now that were written since.
+        deleted: Keys present at the mark and absent now.
+    """
+
+    created: Tuple[str, ...] = ()
+    updated: Tuple[str, ...] = ()
+    deleted: Tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
 
 class ContextType(_SemantivaComponent):
     """A generic container for managing context in Semantiva via specific key-value pairs."""
@@ -38,6 +68,79 @@ class ContextType(_SemantivaComponent):
         """
         super().__init__(logger)
         self._context_container = {} if context_dict is None else context_dict
+        self._version = 0
+        self._journal_floor = 0
+        # (version, key, existed_before) per journaled write or deletion.
+        self._journal: List[Tuple[int, str, bool]] = []
+
+    # ------------------------------------------------------------------
+    # Write journal
+    # ------------------------------------------------------------------
+    @property
+    def version(self) -> int:
+        """Number of journaled mutations applied to this context."""
+        return self._version
+
+    def journal_mark(self) -> Any:
+        """Return an opaque token for :meth:`journal_since`."""
+        return self._version
+
+    def journal_since(self, mark: Any) -> Optional[ContextChanges]:
+        """Return the changes made since ``mark`` was taken.
+
+        Args:
+            mark: Token returned by :meth:`journal_mark` on this context.
+
+        Returns:
+            The created, updated and deleted keys (sorted), or ``None`` when
+            the journal no longer reaches back to ``mark``.
+        """
+        if mark < self._journal_floor:
+            return None
+        existed: Dict[str, bool] = {}
+        for version, key, existed_before in reversed(self._journal):
+            if version <= mark:
+                break
+            # Walking backwards, the last assignment is the earliest write.
+            existed[key] = existed_before
+        created, updated, deleted = [], [], []
+        for key, before in existed.items():
+            now = key in self._context_container
+            if before and now:
+                updated.append(key)
+            elif before:
+                deleted.append(key)
+            elif now:
+                created.append(key)
+        return ContextChanges(
+            tuple(sorted(created)), tuple(sorted(updated)), tuple(sorted(deleted))
+        )
+
+    def _record_write(self, key: str, existed_before: bool) -> None:
+        """Append a journal entry for ``key``."""
+        self._version += 1
+        self._journal.append((self._version, key, existed_before))
+        if len(self._journal) > _JOURNAL_LIMIT:
+            self._journal.clear()
+            self._journal_floor = self._version
+
+    def _journaled_set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` in this context's own container."""
+        self._record_write(key, key in self._context_container)
+        self._context_container[key] = value
+
+    def _journaled_delete(self, key: str) -> None:
+        """Remove ``key`` (which must exist) from this context's own container."""
+        self._record_write(key, True)
+        del self._context_container[key]
+
+    def __copy__(self) -> "ContextType":
+        # Shallow copy with an independent journal: writes to the copy must
+        # not appear in the original's journal.
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._journal = list(self._journal)
+        return clone
 
     def get_value(self, key: str) -> Any:
         """
@@ -59,7 +162,7 @@ class ContextType(_SemantivaComponent):
             key (str): The key associated with the value to be stored.
             value (Any): The value to store in the context.
         """
-        self._context_container[key] = value
+        self._journaled_set(key, value)
 
     def delete_value(self, key: str):
         """
@@ -73,7 +176,7 @@ class ContextType(_SemantivaComponent):
         """
         if key not in self._context_container:
             raise KeyError(f"Key '{key}' not found in context.")
-        del self._context_container[key]
+        self._journaled_delete(key)
 
     def clear(self):
         """
@@ -81,7 +184,8 @@ class ContextType(_SemantivaComponent):
 
         This method resets the context to an empty state.
         """
-        self._context_container.clear()
+        for key in list(self._context_container):
+            self._journaled_delete(key)
 
     def keys(self) -> List[str]:
         """
@@ -116,6 +220,13 @@ class ContextType(_SemantivaComponent):
         """
         return dict(self._context_container)
 
+    def to_dict_subset(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Return the entries of :meth:`to_dict` for ``keys`` that are present.
+        """
+        container = self._context_container
+        return {key: container[key] for key in keys if key in container}
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(context={self._context_container})"
 
@@ -195,6 +306,41 @@ class ContextCollectionType(ContextType):
             context_list if context_list is not None else []
         )
 
+    def journal_mark(self) -> Any:
+        """Return an opaque token for :meth:`journal_since`.
+
+        The token records the global journal version and the version of every
+        individual context, so taking it is O(number of items).
+        """
+        return (
+            self._version,
+            tuple((context, context.version) for context in self._context_list),
+        )
+
+    def journal_since(self, mark: Any) -> Optional[ContextChanges]:
+        """Return the changes of the ``to_dict()`` view since ``mark``.
+
+        ``"global"`` is reported as updated when a global key was written or
+        deleted, and ``"locals"`` when an item was added, replaced or written.
+
+        Returns:
+            The changed top-level keys, or ``None`` when the global journal no
+            longer reaches back to ``mark``.
+        """
+        global_mark, item_marks = mark
+        global_changes = super().journal_since(global_mark)
+        if global_changes is None:
+            return None
+        updated = []
+        if global_changes:
+            updated.append("global")
+        if len(item_marks) != len(self._context_list) or any(
+            context is not marked or context.version != version
+            for (marked, version), context in zip(item_marks, self._context_list)
+        ):
+            updated.append("locals")
+        return ContextChanges(updated=tuple(updated))
+
     def __iter__(self) -> Iterator[ContextType]:
         """
         Return an iterator over the stored `ContextType` instances.
@@ -357,7 +503,7 @@ class ContextCollectionType(ContextType):
         """
         # If key exists in the global collection, update it.
         if key in self._context_container:
-            self._context_container[key] = value
+            self._journaled_set(key, value)
 
         # If key exists in any individual context, update all of them.
         elif key in self.keys():
@@ -365,7 +511,7 @@ class ContextCollectionType(ContextType):
                 context.set_value(key, value)
         # Otherwise, add the key to the global context.
         else:
-            self._context_container[key] = value
+            self._journaled_set(key, value)
 
     def set_item_value(self, index: int, key: str, value: Any):
         """
@@ -434,7 +580,7 @@ class ContextCollectionType(ContextType):
 
         # Remove key from the global context if it exists.
         if key in self._context_container:
-            del self._context_container[key]
+            self._journaled_delete(key)
             found = True
 
         # Remove key from each individual context if present.
@@ -456,7 +602,8 @@ class ContextCollectionType(ContextType):
         internal context list (_context_list). This ensures that the entire ContextCollectionType
         is reset to an empty state.
         """
-        self._context_container.clear()
+        for key in list(self._context_container):
+            self._journaled_delete(key)
         for context in self._context_list:
             context.clear()
 
@@ -541,3 +688,17 @@ class ContextCollectionType(ContextType):
             "global": dict(self._context_container),
             "locals": [ctx.to_dict() for ctx in self._context_list],
         }
+
+    def to_dict_subset(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Return the entries of :meth:`to_dict` for ``keys`` that are present.
+
+        Only ``"global"`` and ``"locals"`` exist; the other view is not built.
+        """
+        wanted = set(keys)
+        subset: Dict[str, Any] = {}
+        if "global" in wanted:
+            subset["global"] = dict(self._context_container)
+        if "locals" in wanted:
+            subset["locals"] = [ctx.to_dict() for ctx in self._context_list]
+        return subset
@@ -22,6 +22,7 @@ from typing import List
 from semantiva.context_processors.context_processors import (
     ContextProcessor,
 )
+from semantiva.core.semantiva_component import intern_generated_class
 
 
 _SAFE_KEY_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
@@ -81,8 +82,15 @@ def _extract_strict_placeholders(template: str) -> List[str]:
 def _context_renamer_factory(
     original_key: str, destination_key: str
 ) -> type[ContextProcessor]:
-    """Create a ContextProcessor subclass that renames a context key."""
+    """Return the ContextProcessor subclass that renames a context key."""
 
+    return intern_generated_class(
+        ("rename", original_key, destination_key),
+        lambda: _build_renamer(original_key, destination_key),
+    )
+
+
+def _build_renamer(original_key: str, destination_key: str) -> type[ContextProcessor]:
     _ensure_valid_key(original_key)
     _ensure_valid_key(destination_key)
 
@@ -133,8 +141,12 @@ def _context_renamer_factory(
 
 
 def _context_deleter_factory(key: str) -> type[ContextProcessor]:
-    """Create a ContextProcessor subclass that deletes a context key."""
+    """Return the ContextProcessor subclass that deletes a context key."""
+
+    return intern_generated_class(("delete", key), lambda: _build_deleter(key))
 
+
+def _build_deleter(key: str) -> type[ContextProcessor]:
     _ensure_valid_key(key)
 
     param_name = _sanitize_identifier(key)
@@ -189,8 +201,15 @@ def create_delete_operation(key: str) -> type[ContextProcessor]:
 
 
 def _context_template_factory(template: str, output_key: str) -> type[ContextProcessor]:
-    """Create a ContextProcessor subclass that renders templates from context keys."""
+    """Return the ContextProcessor subclass that renders templates from context keys."""
+
+    return intern_generated_class(
+        ("template", template, output_key),
+        lambda: _build_template(template, output_key),
+    )
+
 
+def _build_template(template: str, output_key: str) -> type[ContextProcessor]:
     _ensure_valid_key(output_key)
     required_keys = _extract_strict_placeholders(template)
     class_suffix_out = _sanitize_identifier(output_key)
@@ -328,9 +328,9 @@ def _r_registry_coherence(cls: type, md: Optional[dict]) -> List[Diagnostic]:
     if not isinstance(md, dict):
         return []
     try:
-        from semantiva.core.semantiva_component import get_component_registry
+        from semantiva.core.semantiva_component import get_registered_components
 
-        reg = get_component_registry()
+        reg = get_registered_components()
         ctype = md.get("component_type")
         if ctype not in reg or cls not in reg.get(ctype, []):
             return [_diag("SVA107", "error", cls, {"component_type": ctype})]
@@ -752,11 +752,11 @@ def validate_components(
 
 def discover_from_registry() -> List[type]:
     """Collect all registered Semantiva component classes from the global registry."""
-    from semantiva.core.semantiva_component import get_component_registry
+    from semantiva.core.semantiva_component import get_registered_components
     from semantiva.data_processors.data_processors import DataOperation, DataProbe
     from semantiva.data_io.data_io import DataSource, PayloadSource
 
-    reg = get_component_registry()
+    reg = get_registered_components()
     classes = {
         cls
         for bucket in reg.values()
@@ -17,8 +17,14 @@
 Defines fundamental abstractions and component registration infrastructure.
 """
 
-from .semantiva_component import get_component_registry
+from .semantiva_component import (
+    get_component_registry,
+    get_registered_components,
+    invalidate_metadata_cache,
+)
 
 __all__ = [
     "get_component_registry",
+    "get_registered_components",
+    "invalidate_metadata_cache",
 ]
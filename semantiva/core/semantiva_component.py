@@ -22,6 +22,8 @@ from typing import (
     Dict,
     Any,
     Callable,
+    Hashable,
+    Iterable,
     List,
     Tuple,
     Type,
@@ -31,11 +33,14 @@ from typing import (
     TYPE_CHECKING,
 )
 from abc import abstractmethod, ABCMeta
+from collections import OrderedDict
+import itertools
 import textwrap
 import threading
 import inspect
 import types
 import typing
+import weakref
 
 if TYPE_CHECKING:
     from semantiva.logger import Logger
@@ -44,15 +49,223 @@ if TYPE_CHECKING:
 # A thread-safe registry mapping category names to component classes
 _COMPONENT_REGISTRY: Dict[str, List[Type[_SemantivaComponent]]] = {}
 _REGISTRY_LOCK = threading.Lock()
+# Classes generated by factories are registered weakly, in creation order, so
+# that they are dropped once nothing uses them.
+_GENERATED_REGISTRY: Dict[str, "weakref.WeakValueDictionary[int, type]"] = {}
+_GENERATED_ORDER = itertools.count()
+_GENERATING = threading.local()
 
 
 def get_component_registry() -> Dict[str, List[Type[_SemantivaComponent]]]:
     """
     Returns the global component registry, which maps component categories to their respective classes.
+
+    Classes generated through :func:`intern_generated_class` are registered
+    weakly and are not part of this mapping; see
+    :func:`get_registered_components`.
     """
     return _COMPONENT_REGISTRY
 
 
+def get_registered_components() -> Dict[str, List[type]]:
+    """
+    Returns a snapshot of every registered component class by category.
+
+    Declared classes come first, then the live classes generated through
+    :func:`intern_generated_class`.
+    """
+    with _REGISTRY_LOCK:
+        registry: Dict[str, List[type]] = {
+            cat: list(classes) for cat, classes in _COMPONENT_REGISTRY.items()
+        }
+        for cat, generated in _GENERATED_REGISTRY.items():
+            registry.setdefault(cat, []).extend(generated.values())
+    return registry
+
+
+#: Number of generated classes :func:`intern_generated_class` keeps alive.
+GENERATED_CLASS_CACHE_SIZE = 1024
+_GENERATED_CLASSES: "OrderedDict[Hashable, type]" = OrderedDict()
+_GENERATED_LOCK = threading.Lock()
+
+
+def intern_generated_class(key: Optional[Hashable], build: Callable[[], type]) -> type:
+    """Return the class ``build`` generates for ``key``, building it once.
+
+    Factories of dynamic components (``rename:``, ``slice:``, parameter
+    sweeps, ...) key their classes by their canonical arguments, so resolving
+    the same symbol again returns the same class. Component classes created by
+    ``build`` are registered weakly in the component registry. The most
+    recently used :data:`GENERATED_CLASS_CACHE_SIZE` classes are kept.
+
+    Args:
+        key: Canonical factory arguments; ``None`` builds a new, uncached class.
+        build: Creates the class on a cache miss.
+    """
+
+    if key is not None:
+        with _GENERATED_LOCK:
+            cls = _GENERATED_CLASSES.get(key)
+            if cls is not None:
+                _GENERATED_CLASSES.move_to_end(key)
+                return cls
+    depth = getattr(_GENERATING, "depth", 0)
+    _GENERATING.depth = depth + 1
+    try:
+        cls = build()
+    finally:
+        _GENERATING.depth = depth
+    if key is None:
+        return cls
+    with _GENERATED_LOCK:
+        # A concurrent build of the same key may have won the race.
+        cls = _GENERATED_CLASSES.setdefault(key, cls)
+        _GENERATED_CLASSES.move_to_end(key)
+        while len(_GENERATED_CLASSES) > GENERATED_CLASS_CACHE_SIZE:
+            _GENERATED_CLASSES.popitem(last=False)
+    return cls
+
+
+# Per-class memo of get_metadata() results. Weak keys let dynamically generated
+# classes be garbage collected together with their cached metadata.
+_METADATA_CACHE: "weakref.WeakKeyDictionary[type, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _read_only(*_args: Any, **_kwargs: Any) -> None:
+    raise TypeError(
+        "Component metadata is read-only; copy it (e.g. dict(meta)) before modifying"
+    )
+
+
+class _ReadOnlyDict(dict):
+    """Dictionary view of cached metadata that rejects mutation.
+
+    Subclassing ``dict`` keeps ``isinstance(meta, dict)`` checks and JSON
+    serialization working. Copies (``dict(meta)``, ``copy``, pickling) yield
+    plain, mutable dictionaries.
+    """
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+    __ior__ = _read_only  # type: ignore[assignment]
+
+    def copy(self) -> Dict[str, Any]:  # type: ignore[override]
+        return dict(self)
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        import copy
+
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class _ReadOnlyOrderedDict(OrderedDict):
+    """Ordered variant of :class:`_ReadOnlyDict` for ordered metadata fields."""
+
+    __setitem__ = __delitem__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+    move_to_end = __ior__ = _read_only  # type: ignore[assignment]
+
+    @classmethod
+    def _from_items(cls, items: Iterable[Tuple[Any, Any]]) -> "_ReadOnlyOrderedDict":
+        frozen = cls()
+        for key, value in items:
+            OrderedDict.__setitem__(frozen, key, value)
+        return frozen
+
+    def copy(self) -> "OrderedDict[Any, Any]":  # type: ignore[override]
+        return OrderedDict(self)
+
+    def __copy__(self) -> "OrderedDict[Any, Any]":
+        return OrderedDict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "OrderedDict[Any, Any]":
+        import copy
+
+        return OrderedDict(
+            (copy.deepcopy(k, memo), copy.deepcopy(v, memo)) for k, v in self.items()
+        )
+
+    def __reduce__(self):
+        return (OrderedDict, (list(self.items()),))
+
+
+class _ReadOnlyList(list):
+    """List view of cached metadata that rejects mutation."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only  # type: ignore[assignment]
+    append = extend = insert = pop = remove = clear = _read_only  # type: ignore[assignment]
+    sort = reverse = _read_only  # type: ignore[assignment]
+
+    def copy(self) -> List[Any]:  # type: ignore[override]
+        return list(self)
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        import copy
+
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """Return ``value`` with nested dicts and lists wrapped as read-only views."""
+
+    if isinstance(value, (_ReadOnlyDict, _ReadOnlyOrderedDict)):
+        return value
+    if isinstance(value, OrderedDict):
+        return _ReadOnlyOrderedDict._from_items(
+            (k, _freeze(v)) for k, v in value.items()
+        )
+    if isinstance(value, dict):
+        return _ReadOnlyDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list) and not isinstance(value, _ReadOnlyList):
+        return _ReadOnlyList(_freeze(v) for v in value)
+    return value
+
+
+def invalidate_metadata_cache(cls: Optional[type] = None) -> None:
+    """Drop memoized :meth:`_SemantivaComponent.get_metadata` results.
+
+    Class attribute assignments on components invalidate automatically; call
+    this when metadata depends on state the cache cannot observe (for example a
+    module-level registry consulted by ``_define_metadata``).
+
+    Args:
+        cls: Component class whose entry (and whose subclasses' entries) should
+            be dropped. ``None`` clears the whole cache.
+    """
+
+    if cls is None:
+        _METADATA_CACHE.clear()
+        return
+    pending = [cls]
+    seen: set[int] = set()
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        _METADATA_CACHE.pop(current, None)
+        try:
+            pending.extend(type.__subclasses__(current))
+        except TypeError:  # pragma: no cover - defensive
+            continue
+
+
 class _SemantivaComponentMeta(ABCMeta):
     """
     Metaclass for _SemantivaComponent, responsible for registering subclasses in a global registry.
@@ -75,7 +288,23 @@ class _SemantivaComponentMeta(ABCMeta):
                 return
             if cat:
                 with _REGISTRY_LOCK:
-                    _COMPONENT_REGISTRY.setdefault(cat, []).append(cls)
+                    if getattr(_GENERATING, "depth", 0):
+                        generated = _GENERATED_REGISTRY.setdefault(
+                            cat, weakref.WeakValueDictionary()
+                        )
+                        generated[next(_GENERATED_ORDER)] = cls
+                    else:
+                        _COMPONENT_REGISTRY.setdefault(cat, []).append(cls)
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Metadata derives from class attributes; factories often bind them
+        # after class creation.
+        invalidate_metadata_cache(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        invalidate_metadata_cache(cls)
 
 
 class _SemantivaComponent(metaclass=_SemantivaComponentMeta):
@@ -112,7 +341,21 @@ class _SemantivaComponent(metaclass=_SemantivaComponentMeta):
         Gathers metadata in dictionary form, combining:
         - Default or framework-level fields
         - Component-specific fields via _define_metadata()
+
+        The result is computed once per class and memoized. It is a read-only
+        view: nested dictionaries and lists raise ``TypeError`` on mutation, so
+        callers needing to modify it must work on a copy (``dict(meta)``).
         """
+        cached = _METADATA_CACHE.get(cls)
+        if cached is not None:
+            return cached
+        metadata = _freeze(cls._build_metadata())
+        _METADATA_CACHE[cls] = metadata
+        return metadata
+
+    @classmethod
+    def _build_metadata(cls) -> Dict[str, Any]:
+        """Compute the (uncached) metadata dictionary for ``cls``."""
         # Base metadata, applicable to all _SemantivaComponents
         docstring_content = inspect.getdoc(cls)
         if docstring_content is None:
@@ -140,7 +383,7 @@ class _SemantivaComponent(metaclass=_SemantivaComponentMeta):
         Useful for quick debugging, LLM-based queries, or
         human inspection in logs/dashboards.
         """
-        metadata = cls.get_metadata()
+        metadata = dict(cls.get_metadata())
 
         # We'll temporarily pop the docstring so we can process it separately
         docstring = metadata.pop("docstring", None)
@@ -15,9 +15,28 @@
 """Factory for creating data slice operations.
 
 Provides utilities for extracting subsets from data collections.
+
+Slicers apply an element processor to every item of a collection. By default
+elements are processed one after another; :class:`SliceOptions` lets a slicer
+split the collection into chunks and run them on a shared thread or process
+pool. When the element processor defines the optional batch hook::
+
+    def _process_batch(self, items: Sequence[T], *args, **kwargs) -> Sequence[Any]
+
+each chunk is handed to it in a single (typically vectorized) call instead of
+calling ``process`` per element. The hook receives the same parameters as
+``_process_logic`` and must return one output per input item, in order.
+Output order never depends on the executor.
 """
 
-from typing import Type, List, Any
+import math
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+from semantiva.core.semantiva_component import intern_generated_class
 from semantiva.data_types.data_types import DataCollectionType
 from semantiva.data_processors.data_processors import (
     _BaseDataProcessor,
@@ -25,6 +44,232 @@ from semantiva.data_processors.data_processors import (
     DataProbe,
 )
 
+#: Executors accepted by :class:`SliceOptions`.
+SLICE_EXECUTORS = ("sequential", "thread", "process")
+
+# Chunks submitted per worker when ``chunk_size`` is not set; a few chunks per
+# worker balance uneven element costs without flooding the pool.
+_CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class SliceOptions:
+    """Execution options of a slicer.
+
+    Attributes:
+        executor: ``"sequential"`` (default), ``"thread"`` or ``"process"``.
+        max_workers: Pool size for ``"thread"`` / ``"process"``; defaults to
+            the CPU count.
+        chunk_size: Elements per task and per ``_process_batch`` call. By
+            default sequential slicers use a single chunk and pooled slicers
+            split the collection into a few chunks per worker.
+        batch: Use the element processor's ``_process_batch`` hook when it
+            defines one. Set to ``False`` to force per-element processing.
+    """
+
+    executor: str = "sequential"
+    max_workers: Optional[int] = None
+    chunk_size: Optional[int] = None
+    batch: bool = True
+
+    def __post_init__(self) -> None:
+        if self.executor not in SLICE_EXECUTORS:
+            raise ValueError(
+                f"slice executor must be one of {', '.join(SLICE_EXECUTORS)}, "
+                f"got {self.executor!r}"
+            )
+        for name in ("max_workers", "chunk_size"):
+            value = getattr(self, name)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < 1
+            ):
+                raise ValueError(f"slice {name} must be a positive integer")
+        if not isinstance(self.batch, bool):
+            raise ValueError("slice batch must be a boolean")
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "SliceOptions":
+        """Build options from a node's ``slice`` mapping.
+
+        Raises:
+            ValueError: If ``raw`` is not a mapping, has unknown keys or holds
+                invalid values.
+        """
+        if not isinstance(raw, Mapping):
+            raise ValueError("slice options must be a mapping")
+        allowed = {f.name for f in fields(cls)}
+        unknown = sorted(set(raw) - allowed)
+        if unknown:
+            raise ValueError(
+                f"Unknown slice option(s): {', '.join(unknown)}; "
+                f"expected {', '.join(sorted(allowed))}"
+            )
+        return cls(**dict(raw))
+
+    @property
+    def workers(self) -> int:
+        """Effective pool size."""
+        return self.max_workers or os.cpu_count() or 1
+
+    def chunk_length(self, total: int) -> int:
+        """Return the number of elements per chunk for ``total`` elements."""
+        if self.chunk_size is not None:
+            return self.chunk_size
+        if self.executor == "sequential":
+            return max(total, 1)
+        return max(1, math.ceil(total / (self.workers * _CHUNKS_PER_WORKER)))
+
+
+_POOLS: Dict[Tuple[str, int], Executor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _shared_pool(kind: str, workers: int) -> Executor:
+    """Return the process-wide pool of ``kind`` with ``workers`` workers."""
+    key = (kind, workers)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            factory = ThreadPoolExecutor if kind == "thread" else ProcessPoolExecutor
+            pool = factory(max_workers=workers)
+            _POOLS[key] = pool
+        return pool
+
+
+def _run_chunk(
+    process: Callable[..., Any],
+    process_batch: Optional[Callable[..., Sequence[Any]]],
+    chunk: List[Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> List[Any]:
+    if process_batch is None:
+        return [process(item, *args, **kwargs) for item in chunk]
+    outputs = list(process_batch(chunk, *args, **kwargs))
+    if len(outputs) != len(chunk):
+        raise ValueError(
+            f"_process_batch returned {len(outputs)} outputs for {len(chunk)} items"
+        )
+    return outputs
+
+
+def _run_chunk_in_worker(
+    processor_class: Type[_BaseDataProcessor],
+    use_batch: bool,
+    chunk: List[Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Tuple[List[Any], List[Tuple[str, Any]]]:
+    """Process ``chunk`` with a fresh element processor (process-pool worker).
+
+    Processors with created context keys are rejected for process pools, so
+    the returned list of context updates is always empty.
+    """
+    processor = processor_class()
+    process_batch = processor._process_batch if use_batch else None  # type: ignore[attr-defined]
+    return _run_chunk(processor.process, process_batch, chunk, args, kwargs), []
+
+
+def _run_chunk_recording(
+    processor_class: Type[_BaseDataProcessor],
+    logger: Any,
+    use_batch: bool,
+    chunk: List[Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Tuple[List[Any], List[Tuple[str, Any]]]:
+    """Process ``chunk`` with a fresh element processor (thread-pool worker).
+
+    Context updates are recorded instead of applied so the caller can replay
+    them in element order.
+    """
+    processor = processor_class(logger=logger)
+    updates: List[Tuple[str, Any]] = []
+
+    def record(key: str, value: Any) -> None:
+        updates.append((key, value))
+
+    processor._notify_context_update = record  # type: ignore[attr-defined]
+    process_batch = processor._process_batch if use_batch else None  # type: ignore[attr-defined]
+    return _run_chunk(processor.process, process_batch, chunk, args, kwargs), updates
+
+
+def _apply_elementwise(
+    slicer: _BaseDataProcessor,
+    processor_class: Type[_BaseDataProcessor],
+    data: Any,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> List[Any]:
+    """Return the outputs of ``processor_class`` for every element of ``data``."""
+    options: SliceOptions = slicer.slice_options  # type: ignore[attr-defined]
+    items = list(data)
+    if not items:
+        return []
+    use_batch = options.batch and hasattr(processor_class, "_process_batch")
+    size = options.chunk_length(len(items))
+    chunks = [items[i : i + size] for i in range(0, len(items), size)]
+
+    if options.executor == "process":
+        pool = _shared_pool("process", options.workers)
+        futures = [
+            pool.submit(
+                _run_chunk_in_worker, processor_class, use_batch, chunk, args, kwargs
+            )
+            for chunk in chunks
+        ]
+    elif options.executor == "sequential" or len(chunks) == 1:
+        # Element processing runs on the slicer instance itself so context
+        # notifications reach the node's observer.
+        def process(item: Any, *a: Any, **kw: Any) -> Any:
+            return processor_class.process(slicer, item, *a, **kw)
+
+        process_batch = slicer._process_batch if use_batch else None  # type: ignore[attr-defined]
+        results: List[Any] = []
+        for chunk in chunks:
+            results.extend(_run_chunk(process, process_batch, chunk, args, kwargs))
+        return results
+    else:
+        pool = _shared_pool("thread", options.workers)
+        futures = [
+            pool.submit(
+                _run_chunk_recording,
+                processor_class,
+                slicer.logger,
+                use_batch,
+                chunk,
+                args,
+                kwargs,
+            )
+            for chunk in chunks
+        ]
+
+    results = []
+    updates: List[Tuple[str, Any]] = []
+    try:
+        for future in futures:
+            outputs, chunk_updates = future.result()
+            results.extend(outputs)
+            updates.extend(chunk_updates)
+    finally:
+        for future in futures:
+            future.cancel()
+    # Replay context updates in element order, as sequential execution would.
+    for key, value in updates:
+        slicer._notify_context_update(key, value)  # type: ignore[attr-defined]
+    return results
+
+
+def _check_options(
+    processor_class: Type[_BaseDataProcessor], options: SliceOptions
+) -> None:
+    if options.executor == "process" and processor_class.get_created_keys():
+        raise ValueError(
+            f"{processor_class.__name__} updates context keys "
+            f"{processor_class.get_created_keys()}; slice executor 'process' cannot "
+            "propagate context updates from worker processes"
+        )
+
 
 class _SlicingDataProcessorFactory:
     """
@@ -35,6 +280,7 @@ class _SlicingDataProcessorFactory:
     def create(
         processor_class: Type[_BaseDataProcessor],
         input_data_collection_type: Type[DataCollectionType],
+        options: Optional[SliceOptions] = None,
     ):
         """
         Creates a new processor class that slices data and manages context.
@@ -42,10 +288,26 @@ class _SlicingDataProcessorFactory:
         Args:
             processor_class (Type): Base processor class.
             input_data_collection_type (Type[DataCollectionType]): Expected input collection type.
+            options (Optional[SliceOptions]): Execution options; sequential by default.
 
         Returns:
             A new processor class with slicing enabled.
         """
+        options = options or SliceOptions()
+        _check_options(processor_class, options)
+        return intern_generated_class(
+            ("slice", processor_class, input_data_collection_type, options),
+            lambda: _SlicingDataProcessorFactory._build(
+                processor_class, input_data_collection_type, options
+            ),
+        )
+
+    @staticmethod
+    def _build(
+        processor_class: Type[_BaseDataProcessor],
+        input_data_collection_type: Type[DataCollectionType],
+        options: SliceOptions,
+    ):
         processor_name = processor_class.__name__
         class_name = f"SlicerFor{processor_name}"
 
@@ -61,6 +323,7 @@ class _SlicingDataProcessorFactory:
                 """
 
                 data_type_override = input_data_collection_type
+                slice_options = options
 
                 @classmethod
                 def input_data_type(cls) -> type[DataCollectionType]:
@@ -72,6 +335,21 @@ class _SlicingDataProcessorFactory:
                     """Return the collection data type produced by the slicer."""
                     return cls.data_type_override
 
+                @classmethod
+                def with_slice_options(
+                    cls, slice_options: SliceOptions
+                ) -> Type["SlicingDataOperator"]:
+                    """Return a slicer for the same processor using ``slice_options``."""
+                    _check_options(processor_class, slice_options)
+                    return intern_generated_class(
+                        ("slice_options", cls, slice_options),
+                        lambda: type(
+                            cls.__name__,
+                            (cls,),
+                            {"slice_options": slice_options, "__doc__": cls.__doc__},
+                        ),
+                    )
+
                 def process(
                     self,
                     data,
@@ -82,12 +360,9 @@ class _SlicingDataProcessorFactory:
                     Automatically slices input data and manages context.
                     """
 
-                    processed_data = self.data_type_override.from_list([])
-                    for _, data_item in enumerate(data):
-                        output = super().process(data_item, *args, **kwargs)
-                        processed_data.append(output)
-
-                    return processed_data
+                    return self.data_type_override.from_list(
+                        _apply_elementwise(self, processor_class, data, args, kwargs)
+                    )
 
             SlicingDataOperator.__name__ = class_name
             SlicingDataOperator.__doc__ = f"{SlicingDataOperator.__doc__} For each element in the collection: {processor_class.__doc__}"
@@ -101,12 +376,28 @@ class _SlicingDataProcessorFactory:
                 """
 
                 input_data_type_override = input_data_collection_type
+                slice_options = options
 
                 @classmethod
                 def input_data_type(cls) -> type[DataCollectionType]:
                     """Return the collection data type consumed by the probe."""
                     return cls.input_data_type_override
 
+                @classmethod
+                def with_slice_options(
+                    cls, slice_options: SliceOptions
+                ) -> Type["SlicingDataProbe"]:
+                    """Return a slicer for the same processor using ``slice_options``."""
+                    _check_options(processor_class, slice_options)
+                    return intern_generated_class(
+                        ("slice_options", cls, slice_options),
+                        lambda: type(
+                            cls.__name__,
+                            (cls,),
+                            {"slice_options": slice_options, "__doc__": cls.__doc__},
+                        ),
+                    )
+
                 def process(
                     self,
                     data,
@@ -117,13 +408,7 @@ class _SlicingDataProcessorFactory:
                     Automatically slices input data and manages context.
                     """
 
-                    probed_results = []
-                    for data_item in data:
-                        probed_results.append(
-                            super().process(data_item, *args, **kwargs)
-                        )
-
-                    return probed_results
+                    return _apply_elementwise(self, processor_class, data, args, kwargs)
 
             SlicingDataProbe.__name__ = class_name
 
@@ -134,8 +419,9 @@ class _SlicingDataProcessorFactory:
 def slice(
     processor_cls: Type[_BaseDataProcessor],
     input_data_collection_type: Type[DataCollectionType],
+    options: Optional[SliceOptions] = None,
 ):
     """Convenient user API for creating slice processors with explicit types."""
     return _SlicingDataProcessorFactory.create(
-        processor_cls, input_data_collection_type
+        processor_cls, input_data_collection_type, options
     )
@@ -37,20 +37,50 @@ specialized processor classes that evaluate parameters across variable ranges.
 - Unknown parameter names in expressions raise ``TypeError``
 - Missing required ``collection`` for DataSource/DataOperation raises ``TypeError``
 - Invalid ``collection`` specification for DataProbe raises ``TypeError``
+
+**Parallel Execution:**
+
+With :class:`SweepParallelism`, sweep points are split into ordered chunks and
+evaluated on a shared thread or process pool. Each worker reuses a single
+element instance for all the points it evaluates, and results are reassembled
+in sweep order, so ``{var}_values`` context entries stay aligned with the
+output collection.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 import itertools
 import inspect
-from typing import Any, Dict, Sequence, Type, Union, Literal, Set, List
+import json
+import math
+import os
+import threading
+from typing import (
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    Literal,
+    Set,
+    List,
+    cast,
+)
 
 import numpy as np
 
+from semantiva.core.semantiva_component import intern_generated_class
 from semantiva.data_io.data_io import DataSource
 from semantiva.data_types import DataCollectionType
 from semantiva.data_processors.data_processors import DataOperation, DataProbe
+from semantiva.data_processors.data_slicer_factory import (
+    _CHUNKS_PER_WORKER,
+    _shared_pool,
+)
 from semantiva.utils.safe_eval import ExpressionEvaluator, ExpressionError
 from semantiva.metadata import normalize_expression_sig_v1, variable_domain_signature
 
@@ -303,14 +333,296 @@ def _build_signature(
     return inspect.Signature(params)
 
 
-def _merge_call_parameters(
+def _numeric_array(values: Sequence[Any]) -> np.ndarray | None:
+    array = np.asarray(values)
+    if array.ndim != 1 or array.dtype.kind not in "biuf":
+        return None
+    if not isinstance(values, np.ndarray) and len({type(v) for v in values}) > 1:
+        # Mixed ints and floats would all become floats; keep per-point types.
+        return None
+    return array
+
+
+def _sweep_grid(
+    sequences: Dict[str, Sequence[Any]],
     *,
+    mode: Literal["combinatorial", "by_position"],
+    broadcast: bool,
+) -> Dict[str, np.ndarray] | None:
+    """Return one array per variable, laid out in :func:`_iterate_sweep` order.
+
+    Returns ``None`` when a variable is not numeric or mixes numeric types.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    for var, seq in sequences.items():
+        array = _numeric_array(seq)
+        if array is None:
+            return None
+        arrays[var] = array
+    if mode == "by_position":
+        lengths = [len(array) for array in arrays.values()]
+        if broadcast:
+            step_count = max(lengths)
+            return {
+                var: array[np.arange(step_count) % len(array)]
+                for var, array in arrays.items()
+            }
+        if len(set(lengths)) != 1:
+            raise ValueError(
+                "All variable sequences must have identical lengths in by_position mode"
+            )
+        return arrays
+    var_names = sorted(arrays)
+    # "ij" indexing with C-order ravel matches itertools.product ordering.
+    grids = np.meshgrid(*(arrays[v] for v in var_names), indexing="ij")
+    return {var: grid.ravel() for var, grid in zip(var_names, grids)}
+
+
+def _evaluate_column(
+    fn: Any, grid: Dict[str, np.ndarray], size: int
+) -> List[Any] | None:
+    """Evaluate a vectorized expression over ``grid``; ``None`` on failure."""
+    try:
+        result = np.asarray(fn(**grid))
+    except (ArithmeticError, TypeError, ValueError):
+        # Let the per-point path reproduce Python semantics and errors.
+        return None
+    if result.ndim == 0:
+        result = np.broadcast_to(result, (size,))
+    if result.shape != (size,):
+        return None
+    return result.tolist()
+
+
+def _sweep_call_parameters(
+    sweep: Any,
+    sequences: Dict[str, Sequence[Any]],
     base_kwargs: Dict[str, Any],
-    expression_outputs: Dict[str, Any],
-) -> Dict[str, Any]:
-    merged = dict(base_kwargs)
-    merged.update(expression_outputs)
-    return merged
+) -> List[Dict[str, Any]]:
+    """Return the element call parameters of every sweep point, in order.
+
+    Expression outputs take precedence over ``base_kwargs``. When the sweep
+    is vectorized, expressions that support it are evaluated once over NumPy
+    arrays spanning the whole grid; the others are evaluated per point.
+    """
+    base = {k: v for k, v in base_kwargs.items() if k in sweep._allowed_names}
+    pending = dict(sweep._compiled_exprs)
+    columns: Dict[str, List[Any]] = {}
+    if sweep._vectorize and sweep._vector_exprs:
+        grid = _sweep_grid(sequences, mode=sweep._mode, broadcast=sweep._broadcast)
+        if grid is not None:
+            size = len(next(iter(grid.values())))
+            for out_param, fn in sweep._vector_exprs.items():
+                column = _evaluate_column(fn, grid, size)
+                if column is not None:
+                    columns[out_param] = column
+                    del pending[out_param]
+    if columns and not pending:
+        names = tuple(columns)
+        return [
+            {**base, **dict(zip(names, values))} for values in zip(*columns.values())
+        ]
+    points: List[Dict[str, Any]] = []
+    for i, sweep_args in enumerate(
+        _iterate_sweep(sequences, mode=sweep._mode, broadcast=sweep._broadcast)
+    ):
+        params = dict(base)
+        for out_param, fn in pending.items():
+            params[out_param] = fn(**sweep_args)
+        for name, column in columns.items():
+            params[name] = column[i]
+        points.append(params)
+    return points
+
+
+#: Executors accepted by :class:`SweepParallelism`.
+SWEEP_EXECUTORS = ("thread", "process")
+
+
+@dataclass(frozen=True)
+class SweepParallelism:
+    """Pool execution of sweep points.
+
+    Attributes:
+        executor: ``"thread"`` (default) or ``"process"``. Process workers
+            receive the input data and chunk parameters by pickling, so the
+            element class and data must be picklable.
+        max_workers: Pool size; defaults to the CPU count.
+        chunk_size: Sweep points per task. By default points are split into a
+            few chunks per worker.
+    """
+
+    executor: str = "thread"
+    max_workers: Optional[int] = None
+    chunk_size: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.executor not in SWEEP_EXECUTORS:
+            raise ValueError(
+                f"sweep executor must be one of {', '.join(SWEEP_EXECUTORS)}, "
+                f"got {self.executor!r}"
+            )
+        for name in ("max_workers", "chunk_size"):
+            value = getattr(self, name)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < 1
+            ):
+                raise ValueError(f"sweep {name} must be a positive integer")
+
+    @classmethod
+    def from_spec(cls, raw: Any) -> "SweepParallelism":
+        """Build options from an executor name or a ``parallel`` mapping.
+
+        Raises:
+            ValueError: If ``raw`` has unknown keys or holds invalid values.
+        """
+        if isinstance(raw, str):
+            return cls(executor=raw)
+        if not isinstance(raw, Mapping):
+            raise ValueError("sweep parallel options must be a string or a mapping")
+        allowed = {f.name for f in fields(cls)}
+        unknown = sorted(set(raw) - allowed)
+        if unknown:
+            raise ValueError(
+                f"Unknown sweep parallel option(s): {', '.join(unknown)}; "
+                f"expected {', '.join(sorted(allowed))}"
+            )
+        return cls(**dict(raw))
+
+    @property
+    def workers(self) -> int:
+        """Effective pool size."""
+        return self.max_workers or os.cpu_count() or 1
+
+    def chunk_length(self, total: int) -> int:
+        """Return the number of sweep points per chunk for ``total`` points."""
+        if self.chunk_size is not None:
+            return self.chunk_size
+        return max(1, math.ceil(total / (self.workers * _CHUNKS_PER_WORKER)))
+
+
+# Element instances of process-pool workers, one per element class.
+_WORKER_ELEMENTS: Dict[type, Any] = {}
+
+
+def _new_element(sweep: Any) -> Any:
+    """Return an element instance wired like ``sweep`` (``None`` for sources)."""
+    if sweep._element_kind == "DataSource":
+        return None
+    if sweep._element_kind == "DataOperation":
+        return sweep._element(
+            context_observer=sweep.context_observer, logger=sweep.logger
+        )
+    return sweep._element(logger=sweep.logger)
+
+
+def _run_points(
+    element_cls: type,
+    element: Any,
+    data: Any,
+    points: Sequence[Dict[str, Any]],
+) -> List[Any]:
+    """Evaluate ``points`` in order with one element (class for sources)."""
+    if element is None:
+        source = cast(Type[DataSource], element_cls)
+        return [source.get_data(**params) for params in points]
+    return [element.process(data, **params) for params in points]
+
+
+def _run_points_in_worker(
+    element_cls: type,
+    element_kind: str,
+    data: Any,
+    points: Sequence[Dict[str, Any]],
+) -> List[Any]:
+    """Evaluate ``points`` with the worker's element instance (process pool)."""
+    element = None
+    if element_kind != "DataSource":
+        element = _WORKER_ELEMENTS.get(element_cls)
+        if element is None:
+            element = _WORKER_ELEMENTS[element_cls] = element_cls()
+    return _run_points(element_cls, element, data, points)
+
+
+def _evaluate_sweep_points(
+    sweep: Any,
+    points: List[Dict[str, Any]],
+    data: Any = None,
+) -> List[Any]:
+    """Return the element output of every sweep point, in point order."""
+    parallel: Optional[SweepParallelism] = sweep._parallel
+    if parallel is None or len(points) <= 1:
+        return _run_points(sweep._element, _new_element(sweep), data, points)
+    size = parallel.chunk_length(len(points))
+    chunks = [points[i : i + size] for i in range(0, len(points), size)]
+    pool = _shared_pool(parallel.executor, parallel.workers)
+    if parallel.executor == "process":
+        futures = [
+            pool.submit(
+                _run_points_in_worker, sweep._element, sweep._element_kind, data, chunk
+            )
+            for chunk in chunks
+        ]
+    else:
+        local = threading.local()
+
+        def run(chunk: List[Dict[str, Any]]) -> List[Any]:
+            if not hasattr(local, "element"):
+                local.element = _new_element(sweep)
+            return _run_points(sweep._element, local.element, data, chunk)
+
+        futures = [pool.submit(run, chunk) for chunk in chunks]
+    results: List[Any] = []
+    try:
+        for future in futures:
+            results.extend(future.result())
+    finally:
+        for future in futures:
+            future.cancel()
+    return results
+
+
+def _var_spec_key(spec: Any) -> Optional[Tuple[Any, ...]]:
+    if isinstance(spec, RangeSpec):
+        return ("range", spec.lo, spec.hi, spec.steps, spec.scale, spec.endpoint)
+    if isinstance(spec, SequenceSpec):
+        try:
+            return ("sequence", json.dumps(list(spec.values), sort_keys=True))
+        except (TypeError, ValueError):
+            return None
+    if isinstance(spec, FromContext):
+        return ("from_context", spec.key)
+    return None
+
+
+def _sweep_class_key(
+    *,
+    vars: Dict[str, VarSpec],
+    parametric_expressions: Dict[str, str] | None,
+    expression_evaluator: ExpressionEvaluator | None,
+    **arguments: Any,
+) -> Optional[Tuple[Any, ...]]:
+    """Return the canonical factory arguments of a sweep class, or ``None``."""
+
+    if expression_evaluator is not None:
+        return None
+    var_keys = []
+    for var_name in sorted(vars):
+        spec_key = _var_spec_key(vars[var_name])
+        if spec_key is None:
+            return None
+        var_keys.append((var_name, spec_key))
+    key = (
+        "parameter_sweep",
+        tuple(var_keys),
+        tuple(sorted((parametric_expressions or {}).items())),
+        tuple(sorted(arguments.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 class ParametricSweepFactory:
@@ -328,6 +640,80 @@ class ParametricSweepFactory:
         broadcast: bool = False,
         name: str | None = None,
         expression_evaluator: ExpressionEvaluator | None = None,
+        vectorize: bool = False,
+        parallel: SweepParallelism | None = None,
+    ) -> Type[Any]:
+        """Create a sweep processor class.
+
+        Args:
+            element: Processor class invoked once per sweep point.
+            element_kind: ``"DataSource"``, ``"DataOperation"`` or ``"DataProbe"``.
+            collection_output: Collection type assembled from element outputs
+                (sources and operations only).
+            vars: Variable specifications spanning the sweep.
+            parametric_expressions: Element parameter name -> expression over
+                the variables.
+            mode: ``"combinatorial"`` (Cartesian product) or ``"by_position"``.
+            broadcast: In ``by_position`` mode, repeat shorter sequences.
+            name: Optional class name.
+            expression_evaluator: Evaluator used to compile expressions.
+            vectorize: Evaluate each expression once over NumPy arrays spanning
+                the whole grid instead of once per point. Expressions that
+                cannot be vectorized (conditionals, boolean operators, ``str``,
+                non-numeric variables) and points raising errors fall back to
+                per-point evaluation. Vectorized outputs are Python scalars.
+            parallel: Evaluate sweep points on a thread or process pool.
+                Process pools cannot forward context updates, so they are
+                rejected for elements that create context keys.
+
+        Classes are interned: the same arguments return the same class unless
+        a custom ``expression_evaluator`` is given or a variable's values are
+        not JSON-serializable.
+        """
+        key = _sweep_class_key(
+            element=element,
+            element_kind=element_kind,
+            collection_output=collection_output,
+            vars=vars,
+            parametric_expressions=parametric_expressions,
+            mode=mode,
+            broadcast=broadcast,
+            name=name,
+            expression_evaluator=expression_evaluator,
+            vectorize=vectorize,
+            parallel=parallel,
+        )
+        return intern_generated_class(
+            key,
+            lambda: ParametricSweepFactory._build(
+                element=element,
+                element_kind=element_kind,
+                collection_output=collection_output,
+                vars=vars,
+                parametric_expressions=parametric_expressions,
+                mode=mode,
+                broadcast=broadcast,
+                name=name,
+                expression_evaluator=expression_evaluator,
+                vectorize=vectorize,
+                parallel=parallel,
+            ),
+        )
+
+    @staticmethod
+    def _build(
+        *,
+        element: Type[Any],
+        element_kind: Literal["DataSource", "DataOperation", "DataProbe"],
+        collection_output: Type[DataCollectionType] | None,
+        vars: Dict[str, VarSpec],
+        parametric_expressions: Dict[str, str] | None,
+        mode: Literal["combinatorial", "by_position"],
+        broadcast: bool,
+        name: str | None,
+        expression_evaluator: ExpressionEvaluator | None,
+        vectorize: bool,
+        parallel: SweepParallelism | None,
     ) -> Type[Any]:
         if not vars:
             raise ValueError("vars must be non-empty")
@@ -359,11 +745,28 @@ class ParametricSweepFactory:
         else:  # pragma: no cover - defensive
             raise ValueError(f"Unsupported element_kind '{element_kind}'")
 
+        if (
+            parallel is not None
+            and parallel.executor == "process"
+            and element_kind != "DataSource"
+            and list(getattr(element, "get_created_keys", lambda: [])())
+        ):
+            raise ValueError(
+                f"{element.__name__} creates context keys and cannot be swept "
+                "on a process pool"
+            )
+
         evaluator = expression_evaluator or ExpressionEvaluator()
         compiled_exprs = _compile_parametric_expressions(
             parametric_expressions or {}, set(vars.keys()), evaluator
         )
         expr_src = dict(parametric_expressions or {})
+        vector_exprs: Dict[str, Any] = {}
+        if vectorize:
+            for out_param, expr in expr_src.items():
+                fn = evaluator.compile_vectorized(expr, set(vars.keys()))
+                if fn is not None:
+                    vector_exprs[out_param] = fn
 
         parameters, allowed_names = _allowed_parameter_names(element, element_kind)
 
@@ -441,6 +844,10 @@ class ParametricSweepFactory:
                 _collection_output: Type[DataCollectionType] = collection_output  # type: ignore[assignment]
                 _vars = vars
                 _compiled_exprs = compiled_exprs
+                _vector_exprs = vector_exprs
+                _vectorize = vectorize
+                _parallel = parallel
+                _element_kind = element_kind
                 _expr_src = expr_src
                 _mode = mode
                 _broadcast = broadcast
@@ -487,24 +894,9 @@ class ParametricSweepFactory:
                         if name in kwargs
                     }
 
-                    items = []
-                    for sweep_args in _iterate_sweep(
-                        sequences, mode=cls._mode, broadcast=cls._broadcast
-                    ):
-                        expr_outputs = {
-                            out_param: fn(**sweep_args)
-                            for out_param, fn in cls._compiled_exprs.items()
-                        }
-                        call_params = _merge_call_parameters(
-                            base_kwargs=base_kwargs,
-                            expression_outputs=expr_outputs,
-                        )
-                        call_params = {
-                            key: value
-                            for key, value in call_params.items()
-                            if key in cls._allowed_names
-                        }
-                        items.append(cls._element.get_data(**call_params))
+                    items = _evaluate_sweep_points(
+                        cls, _sweep_call_parameters(cls, sequences, base_kwargs)
+                    )
 
                     _publish_created_context(created, context)
                     return cls._collection_output.from_list(items)
@@ -541,6 +933,10 @@ class ParametricSweepFactory:
                 _collection_output: Type[DataCollectionType] = collection_output  # type: ignore[assignment]
                 _vars = vars
                 _compiled_exprs = compiled_exprs
+                _vector_exprs = vector_exprs
+                _vectorize = vectorize
+                _parallel = parallel
+                _element_kind = element_kind
                 _expr_src = expr_src
                 _mode = mode
                 _broadcast = broadcast
@@ -593,28 +989,11 @@ class ParametricSweepFactory:
                         if name in kwargs
                     }
 
-                    results = []
-                    for sweep_args in _iterate_sweep(
-                        sequences, mode=self._mode, broadcast=self._broadcast
-                    ):
-                        expr_outputs = {
-                            out_param: fn(**sweep_args)
-                            for out_param, fn in self._compiled_exprs.items()
-                        }
-                        call_params = _merge_call_parameters(
-                            base_kwargs=base_kwargs,
-                            expression_outputs=expr_outputs,
-                        )
-                        call_params = {
-                            key: value
-                            for key, value in call_params.items()
-                            if key in self._allowed_names
-                        }
-                        element_instance = self._element(
-                            context_observer=self.context_observer,
-                            logger=self.logger,
-                        )
-                        results.append(element_instance.process(data, **call_params))
+                    results = _evaluate_sweep_points(
+                        self,
+                        _sweep_call_parameters(self, sequences, base_kwargs),
+                        data,
+                    )
 
                     self._last_created_sequences = created
                     self.__class__._last_created_sequences = created
@@ -656,6 +1035,10 @@ class ParametricSweepFactory:
             _element = element
             _vars = vars
             _compiled_exprs = compiled_exprs
+            _vector_exprs = vector_exprs
+            _vectorize = vectorize
+            _parallel = parallel
+            _element_kind = element_kind
             _expr_src = expr_src
             _mode = mode
             _broadcast = broadcast
@@ -702,25 +1085,9 @@ class ParametricSweepFactory:
                     name: kwargs[name] for name in base_kwargs_filter if name in kwargs
                 }
 
-                results = []
-                for sweep_args in _iterate_sweep(
-                    sequences, mode=self._mode, broadcast=self._broadcast
-                ):
-                    expr_outputs = {
-                        out_param: fn(**sweep_args)
-                        for out_param, fn in self._compiled_exprs.items()
-                    }
-                    call_params = _merge_call_parameters(
-                        base_kwargs=base_kwargs,
-                        expression_outputs=expr_outputs,
-                    )
-                    call_params = {
-                        key: value
-                        for key, value in call_params.items()
-                        if key in self._allowed_names
-                    }
-                    probe_instance = self._element(logger=self.logger)
-                    results.append(probe_instance.process(data, **call_params))
+                results = _evaluate_sweep_points(
+                    self, _sweep_call_parameters(self, sequences, base_kwargs), data
+                )
 
                 self._last_created_sequences = created
                 self.__class__._last_created_sequences = created
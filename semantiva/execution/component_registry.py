@@ -145,11 +145,15 @@ class ExecutionComponentRegistry:
 
         # Import here to avoid circular dependencies
         from .orchestrator.orchestrator import (
+            GraphSemantivaOrchestrator,
             LocalSemantivaOrchestrator,
             SemantivaOrchestrator,
         )
-        from .executor.executor import SequentialSemantivaExecutor
-        from .transport import InMemorySemantivaTransport
+        from .executor.executor import (
+            SequentialSemantivaExecutor,
+            ThreadPoolSemantivaExecutor,
+        )
+        from .transport import InMemorySemantivaTransport, NullSemantivaTransport
 
         # Register default orchestrators
         cls.register_orchestrator(
@@ -157,16 +161,26 @@ class ExecutionComponentRegistry:
         )
         cls.register_orchestrator("SemantivaOrchestrator", SemantivaOrchestrator)
         cls.register_orchestrator("local", LocalSemantivaOrchestrator)
+        cls.register_orchestrator(
+            "GraphSemantivaOrchestrator", GraphSemantivaOrchestrator
+        )
+        cls.register_orchestrator("graph", GraphSemantivaOrchestrator)
 
         # Register default executors
         cls.register_executor(
             "SequentialSemantivaExecutor", SequentialSemantivaExecutor
         )
         cls.register_executor("sequential", SequentialSemantivaExecutor)
+        cls.register_executor(
+            "ThreadPoolSemantivaExecutor", ThreadPoolSemantivaExecutor
+        )
+        cls.register_executor("thread_pool", ThreadPoolSemantivaExecutor)
 
         # Register default transports
         cls.register_transport("InMemorySemantivaTransport", InMemorySemantivaTransport)
         cls.register_transport("in_memory", InMemorySemantivaTransport)
+        cls.register_transport("NullSemantivaTransport", NullSemantivaTransport)
+        cls.register_transport("null", NullSemantivaTransport)
 
         cls._initialized = True
         Logger().debug("ExecutionComponentRegistry initialized with defaults")
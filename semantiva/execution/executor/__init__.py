@@ -17,9 +17,14 @@
 Defines task execution abstractions for local and distributed processing.
 """
 
-from .executor import SemantivaExecutor, SequentialSemantivaExecutor
+from .executor import (
+    SemantivaExecutor,
+    SequentialSemantivaExecutor,
+    ThreadPoolSemantivaExecutor,
+)
 
 __all__ = [
     "SemantivaExecutor",
     "SequentialSemantivaExecutor",
+    "ThreadPoolSemantivaExecutor",
 ]
@@ -19,15 +19,17 @@ decoupling the orchestration logic from the actual execution strategy.
 
 This abstraction allows Semantiva to support multiple execution models:
   - Synchronous (SequentialSemantivaExecutor)
-  - Thread- or process-based pools
+  - Thread pools (ThreadPoolSemantivaExecutor)
+  - Process-based pools
   - Distributed task frameworks (Ray, Dask, Celery, etc.)
 
 An executor's submit() returns a Future, enabling orchestrators to
 track and compose asynchronous results uniformly.
 """
 
+import threading
 from abc import ABC, abstractmethod
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Any, Optional
 
@@ -117,3 +119,60 @@ class SequentialSemantivaExecutor(SemantivaExecutor):
         # Wrap the result in an ImmediateFuture so callers can uniformly
         # use Future.result() even in synchronous mode
         return SequentialSemantivaExecutor._ImmediateFuture(result)
+
+
+class ThreadPoolSemantivaExecutor(SemantivaExecutor):
+    """
+    Local executor that runs tasks on a shared pool of worker threads.
+
+    Paired with an orchestrator that submits independent nodes together (see
+    :class:`~semantiva.execution.orchestrator.orchestrator.GraphSemantivaOrchestrator`),
+    this lets branches of a pipeline graph overlap. It pays off for processors
+    that release the GIL (NumPy, I/O, native extensions). The pool is created
+    lazily on first submission and reused until :meth:`shutdown`.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Maximum number of worker threads. ``None`` uses the
+                :class:`concurrent.futures.ThreadPoolExecutor` default.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        ser_hooks: Optional[SemantivaExecutor.SERHooks] = None,
+        **kwargs,
+    ) -> Future:
+        """
+        Schedule the function on the thread pool.
+
+        Args:
+            fn:   The function or callable to execute.
+            *args/**kwargs: Arguments for the function.
+
+        Returns:
+            A Future that completes when a worker thread has run the callable.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="semantiva-node",
+                )
+            pool = self._pool
+        return pool.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads; a later submit() starts a fresh pool."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
@@ -17,9 +17,13 @@ Defines the `worker_loop` function, which continuously listens for new pipeline
 via a SemantivaTransport, executes them using a SemantivaExecutor, and publishes results.
 """
 
+import hashlib
+import json
+import os
 import time
+from collections import OrderedDict
 from threading import Event
-from typing import Optional
+from typing import Any, Optional
 
 from semantiva.execution.transport.base import SemantivaTransport
 from semantiva.data_types import NoDataType
@@ -27,10 +31,87 @@ from semantiva.context_processors.context_processors import ContextType
 from semantiva.execution.executor.executor import SemantivaExecutor
 from semantiva import Pipeline, Payload
 from semantiva.logger.logger import Logger
+from semantiva.pipeline.nodes.nodes import _ProbeResultCollectorNode
 from .logging_setup import _setup_log
 from semantiva.configurations.load_pipeline_from_yaml import load_pipeline_from_yaml
 from semantiva.registry.bootstrap import RegistryProfile, apply_profile
 
+#: Default number of prepared pipelines a worker keeps.
+DEFAULT_PIPELINE_CACHE_SIZE = 32
+
+
+def _config_default(obj: Any) -> str:
+    # Processors may be given as classes in in-process job configurations.
+    if isinstance(obj, type):
+        return f"{obj.__module__}.{obj.__qualname__}"
+    raise TypeError(f"{type(obj).__name__} is not hashable configuration")
+
+
+def _pipeline_cache_key(pcfg: Any, profile_fingerprint: str) -> Optional[str]:
+    """Return the cache key of a job's pipeline configuration.
+
+    YAML paths are keyed by absolute path and file content, node lists by
+    their canonical JSON. Returns ``None`` for configurations that cannot be
+    keyed (unreadable files, non-JSON values), which are never cached.
+    """
+
+    h = hashlib.sha256(profile_fingerprint.encode("utf-8") + b"\x00")
+    try:
+        if isinstance(pcfg, str):
+            path = os.path.abspath(pcfg)
+            with open(path, "rb") as handle:
+                content = handle.read()
+            h.update(b"path\x00" + path.encode("utf-8") + b"\x00" + content)
+        else:
+            h.update(
+                b"nodes\x00"
+                + json.dumps(
+                    pcfg, sort_keys=True, separators=(",", ":"), default=_config_default
+                ).encode("utf-8")
+            )
+    except (OSError, TypeError, ValueError):
+        return None
+    return h.hexdigest()
+
+
+class _PipelineCache:
+    """LRU cache of prepared pipelines, local to one worker.
+
+    Pipelines are returned with their timers reset and probe results cleared,
+    so a reused pipeline reports on the current job only.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Pipeline]" = OrderedDict()
+
+    def get(self, key: Optional[str]) -> Optional[Pipeline]:
+        if key is None:
+            return None
+        pipeline = self._entries.get(key)
+        if pipeline is not None:
+            self._entries.move_to_end(key)
+            _reset_pipeline(pipeline)
+        return pipeline
+
+    def put(self, key: Optional[str], pipeline: Pipeline) -> None:
+        if key is None or self.max_entries <= 0:
+            return
+        self._entries[key] = pipeline
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _reset_pipeline(pipeline: Pipeline) -> None:
+    """Clear per-run state that nodes accumulate across ``process`` calls."""
+
+    pipeline.stop_watch.reset()
+    for node in pipeline.nodes:
+        node.stop_watch.reset()
+        if isinstance(node, _ProbeResultCollectorNode):
+            node.clear_collected_data()
+
 
 def worker_loop(
     worker_id: int,
@@ -39,6 +120,7 @@ def worker_loop(
     stop_event: Event,
     logger: Optional[Logger] = None,
     poll_interval: float = 0.1,
+    pipeline_cache_size: int = DEFAULT_PIPELINE_CACHE_SIZE,
 ):
     """
     Main worker loop for processing Semantiva pipeline jobs.
@@ -50,6 +132,8 @@ def worker_loop(
         stop_event: Threading Event used to signal shutdown.
         logger: Optional Logger instance; if None, one is created via _setup_log.
         poll_interval: Seconds to sleep when no job is found.
+        pipeline_cache_size: Number of prepared pipelines kept for reuse
+            (``0`` disables the cache).
 
     Behavior:
       1. Connects to the transport.
@@ -57,7 +141,9 @@ def worker_loop(
          a. Subscribes to 'jobs.*.cfg' to receive new job payloads.
          b. For each Message:
             - Extract job_id, pipeline config, initial data, and context.
-            - Instantiate a Pipeline object (from dict, YAML, or direct instance).
+            - Apply the job's registry profile unless it is already applied.
+            - Reuse the prepared Pipeline for the same configuration content and
+              registry profile, or instantiate one (from a node list or YAML).
             - Call pipeline.process(data, context) to execute.
             - Publish the result to 'jobs.<job_id>.status'.
             - Acknowledge the incoming message if supported.
@@ -73,6 +159,10 @@ def worker_loop(
     assert worker_logger, "Logger must be provided or created"
     worker_logger.info(f"Worker_{worker_id} starting…")
 
+    # Prepared pipelines keyed by configuration content and registry profile
+    pipeline_cache = _PipelineCache(pipeline_cache_size)
+    applied_profile: Optional[str] = None
+
     # Establish transport connection (no-op for in-memory, real for NATS/Kafka, etc.)
     transport.connect()
 
@@ -94,9 +184,14 @@ def worker_loop(
 
                 try:
                     registry_profile_spec = msg.metadata.get("registry_profile")
+                    profile_fingerprint = ""
                     if registry_profile_spec:
                         try:
-                            apply_profile(RegistryProfile(**registry_profile_spec))
+                            profile = RegistryProfile(**registry_profile_spec)
+                            profile_fingerprint = profile.fingerprint()
+                            if profile_fingerprint != applied_profile:
+                                apply_profile(profile)
+                                applied_profile = profile_fingerprint
                         except Exception as exc:
                             worker_logger.warning(
                                 "Failed to apply registry profile for job %s: %s",
@@ -106,8 +201,10 @@ def worker_loop(
 
                     # 1) Unpack the payload dictionary
                     pcfg = msg.metadata.get("pipeline")
+                    cache_key = _pipeline_cache_key(pcfg, profile_fingerprint)
+                    pipeline = pipeline_cache.get(cache_key)
                     # If pipeline metadata is a path to a YAML file, load it
-                    if isinstance(pcfg, str):
+                    if pipeline is None and isinstance(pcfg, str):
                         try:
                             pcfg = load_pipeline_from_yaml(pcfg)
                         except Exception as e:
@@ -119,8 +216,9 @@ def worker_loop(
                             except Exception:
                                 pass
                             continue
-                    if not isinstance(pcfg, list) or not all(
-                        isinstance(step, dict) for step in pcfg
+                    if pipeline is None and (
+                        not isinstance(pcfg, list)
+                        or not all(isinstance(step, dict) for step in pcfg)
                     ):
                         worker_logger.error(
                             f"Invalid pipeline configuration received for job {job_id}: {pcfg}"
@@ -134,9 +232,14 @@ def worker_loop(
                         f"Worker {job_id} has data={data}, context={context}, pcfg={pcfg}"
                     )
 
-                    # 2) Instantiate the Pipeline object
-                    if isinstance(pcfg, list):
+                    # 2) Instantiate the Pipeline object, or reuse a prepared one
+                    if pipeline is not None:
+                        worker_logger.debug(
+                            f"Reusing prepared pipeline for job {job_id}"
+                        )
+                    elif isinstance(pcfg, list):
                         pipeline = Pipeline(pcfg, logger=worker_logger)
+                        pipeline_cache.put(cache_key, pipeline)
                     else:
                         raise TypeError(f"Unsupported pipeline config: {type(pcfg)}")
 
@@ -0,0 +1,379 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed cache of node results.
+
+A :class:`NodeResultCache` lets the orchestrator skip nodes whose result is
+already known. Entries are addressed by :func:`node_cache_key`, a digest of:
+
+- the node's static identity: semantic ID (see
+  :func:`~semantiva.metadata.semantic_id.compute_node_semantic_id`),
+  processor reference, node role and node options;
+- its resolved node-declared and default parameters;
+- the content digest of its input data;
+- the content digests of the context keys it consumes (see
+  :func:`consumed_context_keys`).
+
+An entry holds the node's output data and its context writes (created and
+updated values, deleted keys), pickled. Entries live in an in-memory tier and,
+when a directory is given, in an on-disk tier shared by processes and
+launches. Both tiers evict the least recently used entries once their byte
+budget is exceeded; the on-disk budget is enforced per process, so concurrent
+writers may briefly exceed it.
+
+Processor code is not part of the key: clear the cache directory after
+changing a processor. See :func:`is_cacheable` for the nodes that are never
+cached. Payloads whose input data or consumed context values have no exact
+content digest (see :meth:`~semantiva.trace.hashing.ContentHasher.exact_digest`)
+are not cached either, since unequal values could share a key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Tuple
+
+from semantiva.context_processors.context_types import (
+    ContextCollectionType,
+    ContextType,
+)
+from semantiva.pipeline.nodes.nodes import (
+    _DataSinkNode,
+    _PayloadSinkNode,
+    _PipelineNode,
+    _ProbeResultCollectorNode,
+)
+from semantiva.trace._utils import canonical_json_bytes, serialize_json_safe
+from semantiva.trace.hashing import ContentHasher
+
+if TYPE_CHECKING:
+    from semantiva.execution.orchestrator.plan import NodePlan
+
+#: Default byte budget of the in-memory tier.
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+#: Default byte budget of the on-disk tier.
+DEFAULT_DISK_BYTES = 4 * 1024 * 1024 * 1024
+
+# Node options that are not behaviour: they are keyed separately or not at all.
+_NON_IDENTITY_OPTIONS = frozenset({"processor", "parameters", "ports", "cache"})
+# Nodes with side effects or state outside their payload.
+_UNCACHEABLE_NODES = (_DataSinkNode, _PayloadSinkNode, _ProbeResultCollectorNode)
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """Output of one node execution, as stored in the cache.
+
+    Attributes:
+        data: The node's output data.
+        context_writes: Values of the context keys the node created or updated.
+        deleted_keys: Context keys the node deleted.
+    """
+
+    data: Any
+    context_writes: Dict[str, Any] = field(default_factory=dict)
+    deleted_keys: Tuple[str, ...] = ()
+
+    def apply(self, context: ContextType) -> None:
+        """Replay the recorded context writes on ``context``."""
+
+        for key, value in self.context_writes.items():
+            context.set_value(key, value)
+        existing = set(context.keys())
+        for key in self.deleted_keys:
+            if key in existing:
+                context.delete_value(key)
+
+
+def is_cacheable(node: _PipelineNode, node_def: Mapping[str, Any]) -> bool:
+    """Return whether results of ``node`` may be cached.
+
+    Sinks and probe result collectors are never cached: their effect is not
+    in the payload. Nodes opt out with ``cache: false`` in their pipeline
+    configuration, and processors (e.g. nondeterministic sources) with a
+    ``cacheable = False`` class attribute.
+    """
+
+    if node_def.get("cache") is False or isinstance(node, _UNCACHEABLE_NODES):
+        return False
+    for processor in (getattr(type(node), "processor", None), node.processor):
+        if getattr(processor, "cacheable", True) is False:
+            return False
+    return True
+
+
+def consumed_context_keys(
+    node: _PipelineNode, required_keys: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """Return the context keys ``node`` may read, sorted.
+
+    Besides its required keys, a node reads every processor parameter that
+    its configuration does not set: the context overrides parameter defaults.
+    """
+
+    keys = set(required_keys)
+    getter = getattr(node.processor, "get_processing_parameter_names", None)
+    try:
+        names = list(getter() or []) if callable(getter) else []
+    except Exception:
+        names = []
+    config = getattr(node, "processor_config", None) or {}
+    keys.update(str(name) for name in names if name not in config)
+    return tuple(sorted(keys))
+
+
+def node_cache_key(
+    hasher: ContentHasher, plan: NodePlan, data: Any, context: ContextType
+) -> str | None:
+    """Return the ``sha256-<hex>`` cache key of running ``plan`` on a payload.
+
+    Returns ``None`` when the input data or a consumed context value has no
+    exact content digest; such payloads must not be cached.
+
+    Args:
+        hasher: Hasher used for the input data and consumed context values.
+        plan: The node's execution plan entry.
+        data: Input data.
+        context: Input context.
+    """
+
+    identity = {
+        "semantic_id": plan.semantic_id,
+        "processor": plan.processor_ref.get("ref"),
+        "node": type(plan.node).__qualname__,
+        "options": {
+            str(k): serialize_json_safe(v)
+            for k, v in plan.node_def.items()
+            if k not in _NON_IDENTITY_OPTIONS
+        },
+        "params": dict(plan.node_params),
+        "defaults": dict(plan.default_params),
+    }
+    h = hashlib.sha256()
+    h.update(canonical_json_bytes(identity))
+    digest = hasher.exact_digest(data)
+    if digest is None:
+        return None
+    h.update(digest)
+    values = context.to_dict()
+    for key in consumed_context_keys(plan.node, plan.required_keys):
+        h.update(key.encode("utf-8") + b"\x00")
+        if key in values:
+            digest = hasher.exact_digest(values[key])
+            if digest is None:
+                return None
+            h.update(b"\x01" + digest)
+        else:
+            h.update(b"\x00")
+    return "sha256-" + h.hexdigest()
+
+
+def supports_context(context: Any) -> bool:
+    """Return whether the writes of a node to ``context`` can be replayed."""
+
+    return isinstance(context, ContextType) and not isinstance(
+        context, ContextCollectionType
+    )
+
+
+class NodeResultCache:
+    """Two-tier LRU store of :class:`CachedResult` entries.
+
+    Args:
+        directory: Directory of the on-disk tier; ``None`` keeps entries in
+            memory only.
+        max_memory_bytes: Byte budget of the in-memory tier (``0`` disables it).
+        max_disk_bytes: Byte budget of the on-disk tier.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        max_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        max_disk_bytes: int = DEFAULT_DISK_BYTES,
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: int | None = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[CachedResult, str] | None:
+        """Return the entry stored under ``key`` and its tier, or ``None``.
+
+        The tier is ``"memory"`` or ``"disk"``; disk hits are promoted to
+        memory.
+        """
+
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+        tier = "memory"
+        if blob is None:
+            blob = self._read_disk(key)
+            if blob is None:
+                return None
+            tier = "disk"
+            self._remember(key, blob)
+        try:
+            return pickle.loads(blob), tier
+        except Exception:
+            self._discard(key)
+            return None
+
+    def put(self, key: str, result: CachedResult) -> bool:
+        """Store ``result`` under ``key``; return ``False`` if it cannot be pickled."""
+
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        self._remember(key, blob)
+        if self.directory is not None:
+            self._write_disk(key, blob)
+        return True
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._disk_bytes = 0
+            for path in self._disk_entries():
+                path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+    def _remember(self, key: str, blob: bytes) -> None:
+        if len(blob) > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = blob
+            self._memory_bytes += len(blob)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            blob = self._memory.pop(key, None)
+            if blob is not None:
+                self._memory_bytes -= len(blob)
+        path = self._path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+    def _path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        digest = key.split("-", 1)[-1]
+        return self.directory / digest[:2] / f"{digest}.pkl"
+
+    def _disk_entries(self) -> list[Path]:
+        if self.directory is None or not self.directory.is_dir():
+            return []
+        return list(self.directory.glob("??/*.pkl"))
+
+    def _read_disk(self, key: str) -> bytes | None:
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            blob = path.read_bytes()
+            os.utime(path)  # mark as recently used
+        except OSError:
+            return None
+        return blob
+
+    def _write_disk(self, key: str, blob: bytes) -> None:
+        path = self._path(key)
+        assert path is not None
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(blob)
+            os.replace(tmp, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(self._sizes().values())
+            else:
+                self._disk_bytes += len(blob) - replaced
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _sizes(self) -> Dict[Path, int]:
+        sizes: Dict[Path, int] = {}
+        for path in self._disk_entries():
+            try:
+                sizes[path] = path.stat().st_size
+            except OSError:
+                continue
+        return sizes
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until the disk budget is met."""
+
+        entries = []
+        for path in self._disk_entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
+
+
+__all__ = [
+    "CachedResult",
+    "DEFAULT_DISK_BYTES",
+    "DEFAULT_MEMORY_BYTES",
+    "NodeResultCache",
+    "consumed_context_keys",
+    "is_cacheable",
+    "node_cache_key",
+    "supports_context",
+]
@@ -17,9 +17,17 @@
 Manages pipeline graph traversal and node execution coordination.
 """
 
-from .orchestrator import SemantivaOrchestrator, LocalSemantivaOrchestrator
+from .orchestrator import (
+    SemantivaOrchestrator,
+    LocalSemantivaOrchestrator,
+    GraphSemantivaOrchestrator,
+)
+from .plan import ExecutionPlan, NodePlan
 
 __all__ = [
     "SemantivaOrchestrator",
     "LocalSemantivaOrchestrator",
+    "GraphSemantivaOrchestrator",
+    "ExecutionPlan",
+    "NodePlan",
 ]
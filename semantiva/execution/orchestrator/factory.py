@@ -15,13 +15,16 @@
 
 from __future__ import annotations
 
+import inspect
 from typing import Any, Dict
 
 from semantiva.configurations.schema import ExecutionConfig
 from ..component_registry import ExecutionComponentRegistry
 
 
-def _instantiate_if_present(name: str | None, component_type: str) -> Any | None:
+def _instantiate_if_present(
+    name: str | None, component_type: str, options: Dict[str, Any] | None = None
+) -> Any | None:
     if not name:
         return None
 
@@ -37,31 +40,24 @@ def _instantiate_if_present(name: str | None, component_type: str) -> Any | None
     except KeyError as exc:
         raise ValueError(f"Unknown {component_type}: {name}") from exc
 
-    return cls()
+    return cls(**(options or {}))
 
 
 def _attempt_construct(cls: type, kwargs: Dict[str, Any]) -> Any:
-    attempt_order = [
-        dict(kwargs),
-        {k: v for k, v in kwargs.items() if k != "options"},
-        {k: v for k, v in kwargs.items() if k not in {"options", "transport"}},
-        {
-            k: v
-            for k, v in kwargs.items()
-            if k not in {"options", "transport", "executor"}
-        },
-        {},
-    ]
-    last_error: Exception | None = None
-    for candidate in attempt_order:
-        try:
-            return cls(**candidate)
-        except TypeError as exc:
-            last_error = exc
-            continue
-    if last_error:
-        raise last_error
-    return cls()
+    """Construct ``cls`` with the keyword arguments its constructor declares.
+
+    Arguments the constructor does not accept (e.g. ``transport`` for
+    orchestrators that do not publish) are dropped; errors raised by the
+    constructor itself propagate.
+    """
+
+    try:
+        params = inspect.signature(cls).parameters
+    except (TypeError, ValueError):  # pragma: no cover - builtins without signature
+        return cls(**kwargs)
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return cls(**kwargs)
+    return cls(**{k: v for k, v in kwargs.items() if k in params})
 
 
 def build_orchestrator(
@@ -74,7 +70,11 @@ def build_orchestrator(
 
     This factory function uses the ExecutionComponentRegistry to resolve orchestrator,
     executor, and transport classes by name, then constructs them with dependency
-    injection. It provides graceful fallbacks for constructor argument compatibility.
+    injection, passing each constructor only the arguments it declares.
+    When ``exec_cfg.profile_dir`` is set, the orchestrator profiles every node
+    into that directory (see :mod:`semantiva.execution.profiling`). When
+    ``exec_cfg.cache_dir`` is set, it reuses node results from a
+    :class:`~semantiva.execution.node_cache.NodeResultCache` stored there.
 
     Args:
         exec_cfg: Execution configuration containing component names and options
@@ -95,7 +95,7 @@ def build_orchestrator(
     """
 
     transport_obj = transport or _instantiate_if_present(
-        exec_cfg.transport, "transport"
+        exec_cfg.transport, "transport", exec_cfg.transport_options
     )
     executor_obj = executor or _instantiate_if_present(exec_cfg.executor, "executor")
 
@@ -120,6 +120,20 @@ def build_orchestrator(
         kwargs["options"] = exec_cfg.options
 
     orchestrator = _attempt_construct(orch_cls, kwargs)
+    if exec_cfg.profile_dir and hasattr(orchestrator, "configure_profiler"):
+        from ..profiling import NodeProfiler
+
+        orchestrator.configure_profiler(NodeProfiler(exec_cfg.profile_dir))
+    if exec_cfg.cache_dir and hasattr(orchestrator, "configure_node_cache"):
+        from ..node_cache import DEFAULT_DISK_BYTES, NodeResultCache
+
+        max_bytes = exec_cfg.cache_max_bytes
+        orchestrator.configure_node_cache(
+            NodeResultCache(
+                exec_cfg.cache_dir,
+                max_disk_bytes=DEFAULT_DISK_BYTES if max_bytes is None else max_bytes,
+            )
+        )
     return orchestrator
 
 
@@ -0,0 +1,237 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Payload routing along the edges of a GraphV1 pipeline.
+
+The router decides which ``(data, context)`` each node receives and what the
+pipeline returns, independently of the order in which an orchestrator runs
+ready nodes:
+
+- **Fan-out**: a payload consumed by several nodes hands each consumer its own
+  shallow copy of the context (the last consumer receives the original). Data
+  objects are shared and must be treated as immutable by processors.
+- **Fan-in**: data comes from the first declared input. Contexts are merged in
+  input order using write provenance: a key takes the value written most
+  recently along the graph, and writes made concurrently on independent
+  branches resolve in favour of the later input.
+- **Result**: data of the last declared node and the merge of the contexts of
+  all nodes without consumers (in declaration order).
+
+For a linear chain every payload has exactly one consumer, so the router
+forwards objects unchanged and performs no copies or merges.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+
+from semantiva.pipeline.payload import Payload
+
+# Virtual source index representing the pipeline input.
+_PIPELINE_INPUT = -1
+
+
+def _context_items(context: Any) -> Dict[str, Any]:
+    """Return a shallow copy of the (global) key/value store of ``context``."""
+
+    container = getattr(context, "_context_container", None)
+    return dict(container) if isinstance(container, dict) else {}
+
+
+def _copy_context(context: Any) -> Any:
+    """Return a shallow copy of ``context`` that can be mutated independently."""
+
+    clone = copy.copy(context)
+    container = getattr(context, "_context_container", None)
+    if isinstance(container, dict):
+        clone._context_container = dict(container)
+    local_contexts = getattr(context, "_context_list", None)
+    if isinstance(local_contexts, list):
+        clone._context_list = [_copy_context(item) for item in local_contexts]
+    return clone
+
+
+@dataclass
+class _Routed:
+    """Output of a node (or the pipeline input) awaiting its consumers."""
+
+    data: Any
+    context: Any
+    writers: Dict[str, int] = field(default_factory=dict)
+    remaining: int = 0
+
+
+class PayloadRouter:
+    """Route payloads between pipeline nodes according to upstream indices.
+
+    Args:
+        upstream: For each node (in declaration order), the indices of the
+            nodes whose outputs it consumes. An empty list marks a root fed by
+            the pipeline input. Declaration order must be topological.
+        payload: Pipeline input payload.
+    """
+
+    def __init__(self, upstream: Sequence[Sequence[int]], payload: Payload) -> None:
+        self._upstream: List[List[int]] = [
+            list(sources) if sources else [_PIPELINE_INPUT] for sources in upstream
+        ]
+        self._count = len(self._upstream)
+        consumers = {index: 0 for index in range(_PIPELINE_INPUT, self._count)}
+        for sources in self._upstream:
+            for source in sources:
+                consumers[source] += 1
+        self._consumers = consumers
+        self._sinks = [i for i in range(self._count) if consumers[i] == 0]
+        # Write provenance is only needed where contexts are merged.
+        self._track = len(self._sinks) > 1 or any(
+            len(sources) > 1 for sources in self._upstream
+        )
+        self._ancestors: List[FrozenSet[int]] = []
+        if self._track:
+            for sources in self._upstream:
+                acc: set[int] = set()
+                for source in sources:
+                    if source != _PIPELINE_INPUT:
+                        acc.add(source)
+                        acc.update(self._ancestors[source])
+                self._ancestors.append(frozenset(acc))
+        self._outputs: Dict[int, _Routed] = {
+            _PIPELINE_INPUT: _Routed(
+                payload.data,
+                payload.context,
+                remaining=consumers[_PIPELINE_INPUT],
+            )
+        }
+        self._input_state: Dict[int, tuple[Dict[str, int], Dict[str, Any]]] = {}
+
+    @classmethod
+    def from_canonical(
+        cls, canonical: Dict[str, Any], payload: Payload
+    ) -> "PayloadRouter":
+        """Build a router from the nodes and edges of a GraphV1 mapping."""
+
+        nodes = canonical.get("nodes", [])
+        index_of = {node.get("node_uuid"): i for i, node in enumerate(nodes)}
+        upstream: List[List[int]] = [[] for _ in nodes]
+        for edge in canonical.get("edges", []):
+            upstream[index_of[edge["target"]]].append(index_of[edge["source"]])
+        return cls(upstream, payload)
+
+    def upstream(self, index: int) -> List[int]:
+        """Return the node indices ``index`` depends on (empty for roots)."""
+
+        return [s for s in self._upstream[index] if s != _PIPELINE_INPUT]
+
+    def is_ready(self, index: int) -> bool:
+        """Return whether every input of node ``index`` has been recorded."""
+
+        return all(source in self._outputs for source in self._upstream[index])
+
+    def input_for(self, index: int) -> Payload:
+        """Return the payload node ``index`` must process.
+
+        Must be called exactly once per node, after :meth:`is_ready` holds.
+        """
+
+        sources = self._upstream[index]
+        primary = self._outputs[sources[0]]
+        data = primary.data
+        writers = dict(primary.writers) if self._track else {}
+        context = self._take(sources[0])
+        for source in sources[1:]:
+            self._merge_into(context, writers, self._outputs[source])
+            self._release(source)
+        if self._track:
+            self._input_state[index] = (writers, _context_items(context))
+        return Payload(data, context)
+
+    def record(self, index: int, payload: Payload) -> None:
+        """Store the output of node ``index`` for its consumers."""
+
+        writers: Dict[str, int] = {}
+        if self._track:
+            writers, before = self._input_state.pop(index)
+            after = _context_items(payload.context)
+            for key, value in after.items():
+                if key not in before or before[key] is not value:
+                    writers[key] = index
+            for key in before:
+                if key not in after:
+                    writers[key] = index
+        self._outputs[index] = _Routed(
+            payload.data,
+            payload.context,
+            writers,
+            remaining=self._consumers[index],
+        )
+
+    def result(self) -> Payload:
+        """Return the pipeline output once every node has been recorded."""
+
+        if not self._count:
+            source = self._outputs[_PIPELINE_INPUT]
+            return Payload(source.data, source.context)
+        first = self._outputs[self._sinks[0]]
+        context = first.context
+        writers = dict(first.writers)
+        for sink in self._sinks[1:]:
+            self._merge_into(context, writers, self._outputs[sink])
+        return Payload(self._outputs[self._count - 1].data, context)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _take(self, source: int) -> Any:
+        """Return a context the consumer may mutate; copy on fan-out."""
+
+        routed = self._outputs[source]
+        routed.remaining -= 1
+        if routed.remaining > 0:
+            return _copy_context(routed.context)
+        context = routed.context
+        self._drop_if_done(source)
+        return context
+
+    def _release(self, source: int) -> None:
+        self._outputs[source].remaining -= 1
+        self._drop_if_done(source)
+
+    def _drop_if_done(self, source: int) -> None:
+        # Keep sinks (needed for the result) and the input entry (readiness).
+        routed = self._outputs[source]
+        if routed.remaining <= 0 and source != _PIPELINE_INPUT:
+            if self._consumers[source] > 0:
+                routed.data = routed.context = None
+
+    def _merge_into(
+        self, context: Any, writers: Dict[str, int], other: _Routed
+    ) -> None:
+        other_items = _context_items(other.context)
+        for key, writer in other.writers.items():
+            current: Optional[int] = writers.get(key)
+            if current == writer:
+                continue
+            if current is not None and writer in self._ancestors[current]:
+                # Our value was written downstream of theirs: it is newer.
+                continue
+            if key in other_items:
+                context.set_value(key, other_items[key])
+            elif key in _context_items(context):
+                context.delete_value(key)
+            writers[key] = writer
+
+
+__all__ = ["PayloadRouter"]
@@ -21,18 +21,52 @@ The canonical documentation for the orchestrator lifecycle and SER integration l
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
 import time
 import uuid
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Iterable, List, Optional, Sequence, TypeVar, cast
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
+from semantiva.context_processors.context_types import ContextChanges
 from semantiva.data_processors.data_processors import ParameterInfo, _NO_DEFAULT
 from semantiva.execution.executor.executor import (
     SemantivaExecutor,
     SequentialSemantivaExecutor,
+    ThreadPoolSemantivaExecutor,
+)
+from semantiva.execution.node_cache import (
+    CachedResult,
+    NodeResultCache,
+    is_cacheable,
+    node_cache_key,
+    supports_context,
 )
+from semantiva.execution.profiling import NodeProfiler
 from semantiva.execution.transport import SemantivaTransport
+from semantiva.execution.orchestrator.graph_router import PayloadRouter
+from semantiva.execution.orchestrator.plan import (
+    ExecutionPlan,
+    NodePlan,
+    node_channel,
+)
 from semantiva.logger import Logger
 from semantiva.pipeline.graph_builder import (
     build_canonical_spec,
@@ -40,7 +74,14 @@ from semantiva.pipeline.graph_builder import (
     compute_upstream_map,
 )
 from semantiva.pipeline.nodes._pipeline_node_factory import _pipeline_node_factory
-from semantiva.pipeline.nodes.nodes import _PipelineNode
+from semantiva.pipeline.nodes.nodes import (
+    _DataSinkNode,
+    _DataSourceNode,
+    _PayloadSinkNode,
+    _PayloadSourceNode,
+    _PipelineNode,
+    _ProbeNode,
+)
 from semantiva.pipeline.payload import Payload
 from semantiva.registry.descriptors import instantiate_from_descriptor
 from semantiva.metadata import (
@@ -49,20 +90,28 @@ from semantiva.metadata import (
     compute_pipeline_semantic_id,
 )
 from semantiva.trace._utils import (
-    canonical_json_bytes,
     collect_env_pins as _collect_env_pins_util,
     context_to_kv_repr,
     safe_repr,
-    serialize,
     serialize_json_safe,
-    sha256_bytes,
 )
 from semantiva.trace.delta_collector import DeltaCollector
+from semantiva.trace.detail import TraceDetailPolicy
+from semantiva.trace.hashing import ContentHasher
 from semantiva.trace.model import ContextDelta, SERRecord, TraceDriver
+from semantiva.trace.resources import ResourceMeter, object_size
 from semantiva.trace.runtime.context import TraceContext
+from semantiva.trace.runtime.session import active_trace_session
 
 T = TypeVar("T")
 
+# Node classes matched by the role selectors of ``node_detail`` trace options.
+_NODE_ROLE_CLASSES: tuple[tuple[str, tuple[type, ...]], ...] = (
+    ("sources", (_DataSourceNode, _PayloadSourceNode)),
+    ("sinks", (_DataSinkNode, _PayloadSinkNode)),
+    ("probes", (_ProbeNode,)),
+)
+
 
 def _const_supplier(value: T) -> Callable[[], T]:
     def _supplier() -> T:
@@ -71,6 +120,77 @@ def _const_supplier(value: T) -> Callable[[], T]:
     return _supplier
 
 
+@dataclass
+class _GraphFacts:
+    """Identities and topology derived from a pipeline before instantiation."""
+
+    canonical: dict[str, Any]
+    resolved_spec: Sequence[dict[str, Any]]
+    pipeline_id: str
+    start_meta: dict[str, Any]
+    node_uuids: list[str]
+    semantic_ids: list[str]
+    upstream_map: dict[str, list[str]]
+    upstream_indices: tuple[tuple[int, ...], ...]
+
+
+@dataclass
+class _RunState:
+    """Per-execution state shared by the node execution steps."""
+
+    plan: ExecutionPlan
+    trace: TraceDriver | None
+    run_id: str
+    pipeline_id: str
+    trace_opts: Mapping[str, Any]
+    env_pins: dict[str, Any]
+    transport: SemantivaTransport
+    # Per-node detail flags that differ from ``trace_opts``.
+    node_trace_opts: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    # Directory name of this run's node profiles; empty when not profiling.
+    profile_run_id: str = ""
+
+    def node_opts(self, node_id: str) -> Mapping[str, Any]:
+        """Return the detail flags for ``node_id`` in this run."""
+        return self.node_trace_opts.get(node_id, self.trace_opts)
+
+
+@dataclass
+class _NodeRun:
+    """Evidence gathered for one node between submission and completion."""
+
+    plan: NodePlan
+    data: Any
+    context: Any
+    pre_ctx_view: dict[str, Any]
+    params: dict[str, Any]
+    param_sources: dict[str, str]
+    pre_checks: list[dict[str, Any]]
+    hooks: SemantivaExecutor.SERHooks | None = None
+    journal_mark: Any = None
+    post_ctx_view: dict[str, Any] | None = None
+    context_changes: ContextChanges | None = None
+    summaries: dict[str, dict[str, object]] = field(default_factory=dict)
+    traced: bool = False
+    timing: tuple[float, float, str] | None = None
+    profile: dict[str, Any] | None = None
+    resources: dict[str, Any] | None = None
+    cache: dict[str, Any] | None = None
+    thread: str | None = None
+
+    @property
+    def index(self) -> int:
+        return self.plan.index
+
+    @property
+    def node(self) -> _PipelineNode:
+        return self.plan.node
+
+    @property
+    def node_id(self) -> str:
+        return self.plan.node_id
+
+
 class SemantivaOrchestrator(ABC):
     """Template-method orchestrator that centralises SER composition.
 
@@ -83,6 +203,14 @@ class SemantivaOrchestrator(ABC):
         self._last_nodes: list[_PipelineNode] = []
         self._next_run_metadata: dict[str, Any] | None = None
         self._current_run_metadata: dict[str, Any] | None = None
+        # Publication channel of every node this orchestrator has planned.
+        self._channels: "weakref.WeakKeyDictionary[_PipelineNode, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Content digests for SER summaries, memoized until the next node runs.
+        self._hasher = ContentHasher()
+        self._profiler: NodeProfiler | None = None
+        self._node_cache: NodeResultCache | None = None
 
     @property
     def last_nodes(self) -> List[_PipelineNode]:
@@ -93,6 +221,22 @@ class SemantivaOrchestrator(ABC):
         """Stage metadata dictionary to be used for the next execute call."""
         self._next_run_metadata = dict(metadata or {})
 
+    def configure_profiler(self, profiler: NodeProfiler | None) -> None:
+        """Profile every node of subsequent runs with ``profiler`` (``None`` stops).
+
+        Profile file paths are referenced from the ``profile`` entry of each
+        SER's ``summaries``; see :mod:`semantiva.execution.profiling`.
+        """
+        self._profiler = profiler
+
+    def configure_node_cache(self, cache: NodeResultCache | None) -> None:
+        """Reuse node results from ``cache`` in subsequent runs (``None`` stops).
+
+        Cache lookups are recorded in the ``cache`` entry of each SER's
+        ``summaries``; see :mod:`semantiva.execution.node_cache`.
+        """
+        self._node_cache = cache
+
     # ------------------------------------------------------------------
     # Public lifecycle
     # ------------------------------------------------------------------
@@ -105,32 +249,38 @@ class SemantivaOrchestrator(ABC):
         trace: TraceDriver | None = None,
         canonical_spec: dict[str, Any] | None = None,
         run_metadata: dict[str, Any] | None = None,
+        plan: ExecutionPlan | None = None,
     ) -> Payload:
         """Run the pipeline and emit SER records via the template method.
 
+        When ``plan`` is given (see :meth:`compile`), its nodes and static
+        evidence are reused and ``pipeline_spec``/``canonical_spec`` are
+        ignored. Otherwise the pipeline is compiled for this call only, with
+        nodes instantiated after ``on_pipeline_start`` is emitted.
+
         For behaviour details (checks, IO delta, timing, env pins), refer to
         docs/source/execution.rst and docs/source/ser.rst.
         """
 
-        data = payload.data
-        context = payload.context
-
         pending_meta = run_metadata
         if pending_meta is None and self._next_run_metadata is not None:
             pending_meta = self._next_run_metadata
         self._next_run_metadata = None
         self._current_run_metadata = dict(pending_meta or {})
 
-        canonical = canonical_spec
-        resolved_spec: Sequence[dict[str, Any]] = pipeline_spec
-        if canonical is None:
-            canonical, resolved_spec = build_canonical_spec(pipeline_spec)
+        graph: _GraphFacts | None = None
+        if plan is None:
+            graph = self._compile_graph(pipeline_spec, canonical_spec)
+            canonical, pipeline_id, start_meta = (
+                graph.canonical,
+                graph.pipeline_id,
+                graph.start_meta,
+            )
+        else:
+            canonical = cast(dict, plan.canonical_spec)
+            pipeline_id, start_meta = plan.pipeline_id, dict(plan.start_meta)
 
         run_id: str | None = None
-        pipeline_id: str | None = None
-        node_uuids: list[str] = []
-        upstream_map: dict[str, list[str]] = {}
-        trace_opts = self._trace_options(trace)
 
         trace_ctx: TraceContext | None = None
         run_space_index: int | None = None
@@ -144,47 +294,12 @@ class SemantivaOrchestrator(ABC):
                 run_space_index = self._current_run_metadata["run_space_index"]
             if "run_space_context" in self._current_run_metadata:
                 run_space_context = self._current_run_metadata["run_space_context"]
+        detail_policy = TraceDetailPolicy.from_options(self._trace_options(trace))
+        trace_opts = detail_policy.run_flags(run_space_index)
 
-        # Compute semantic IDs BEFORE on_pipeline_start (without instantiation)
         if trace is not None:
-            pipeline_id = compute_pipeline_id(canonical)
-            node_uuids = [n["node_uuid"] for n in canonical.get("nodes", [])]
-            upstream_map = compute_upstream_map(canonical)
             run_id = f"run-{uuid.uuid4().hex}"
 
-            # Resolve processor classes without instantiating nodes
-            proc_classes = self._resolve_processor_classes(canonical, resolved_spec)
-
-            semantic_pairs: list[tuple[str, str]] = []
-            for index, proc_cls in enumerate(proc_classes):
-                node_uuid = node_uuids[index] if index < len(node_uuids) else ""
-                semantic_id = "none"
-                try:
-                    proc_meta = cast(Any, proc_cls).get_metadata()
-                except Exception:
-                    proc_meta = {}
-                pre = (
-                    proc_meta.get("preprocessor")
-                    if isinstance(proc_meta, dict)
-                    else None
-                )
-                if isinstance(pre, dict):
-                    try:
-                        semantic_id = compute_node_semantic_id(pre)
-                    except Exception:
-                        semantic_id = "error"
-                    # Enrich canonical spec nodes with preprocessor metadata
-                    if index < len(canonical.get("nodes", [])):
-                        canonical["nodes"][index]["preprocessor_metadata"] = pre
-                semantic_pairs.append((node_uuid, semantic_id))
-
-            meta: dict[str, Any] = {"num_nodes": len(node_uuids)}
-            meta["node_semantic_ids"] = {
-                uuid_: sem_id for uuid_, sem_id in semantic_pairs if uuid_
-            }
-            meta["semantic_id"] = compute_pipeline_semantic_id(canonical)
-            meta["config_id"] = compute_pipeline_config_id(semantic_pairs)
-
             run_space_kwargs: dict[str, Any] = {}
             if trace_ctx is not None:
                 fk = trace_ctx.as_run_space_fk()
@@ -199,6 +314,10 @@ class SemantivaOrchestrator(ABC):
             if run_space_context is not None:
                 run_space_kwargs["run_space_context"] = run_space_context
 
+            meta = {
+                key: dict(value) if isinstance(value, Mapping) else value
+                for key, value in start_meta.items()
+            }
             # Emit pipeline_start BEFORE instantiating nodes
             trace.on_pipeline_start(
                 pipeline_id,
@@ -209,16 +328,21 @@ class SemantivaOrchestrator(ABC):
                 **run_space_kwargs,
             )
 
-        # NOW instantiate nodes (this may emit 'instantiate' events)
-        nodes, node_defs = self._instantiate_nodes(resolved_spec, logger)
-        self._last_nodes = list(nodes)
-
-        trace_active = (
-            trace is not None and run_id is not None and pipeline_id is not None
-        )
+        if plan is None:
+            # NOW instantiate nodes (this may emit 'instantiate' events)
+            graph = cast(_GraphFacts, graph)
+            nodes, node_defs = self._instantiate_nodes(graph.resolved_spec, logger)
+            plan = self._build_plan(graph, nodes, node_defs)
+        elif plan.nodes and plan.nodes[0].node not in self._channels:
+            # Plan compiled elsewhere: adopt its channels once.
+            for node_plan in plan.nodes:
+                self._channels[node_plan.node] = node_plan.channel
+        self._last_nodes = plan.pipeline_nodes
+
+        trace_active = trace is not None and run_id is not None
         trace_driver = cast(TraceDriver, trace) if trace_active else None
         run_token = cast(str, run_id) if trace_active else ""
-        pipeline_token = cast(str, pipeline_id) if trace_active else ""
+        pipeline_token = pipeline_id if trace_active else ""
         env_pins_static = self._collect_env_pins() if trace_driver is not None else {}
         if trace_driver is not None:
             try:
@@ -231,180 +355,565 @@ class SemantivaOrchestrator(ABC):
             except Exception:
                 pass
 
+        run = _RunState(
+            plan=plan,
+            trace=trace_driver,
+            run_id=run_token,
+            pipeline_id=pipeline_token,
+            trace_opts=trace_opts,
+            env_pins=env_pins_static,
+            transport=transport,
+            node_trace_opts=(
+                self._node_trace_options(detail_policy, plan, trace_opts)
+                if trace_driver is not None
+                else {}
+            ),
+            profile_run_id=(
+                (run_token or f"run-{uuid.uuid4().hex}")
+                if self._profiler is not None
+                else ""
+            ),
+        )
+        router = PayloadRouter(plan.upstream_indices, payload)
+
+        failed = True
         try:
-            for index, node in enumerate(nodes):
-                node_def = node_defs[index]
-                node_id = node_uuids[index] if index < len(node_uuids) else ""
-                pre_ctx_view = self._context_snapshot(context)
-                required_keys = self._required_keys_for(node, node_def)
-                params, param_sources = self._resolve_params_with_sources(
-                    node, node_def, pre_ctx_view, required_keys
+            result = self._execute_nodes(run, router)
+            if trace_driver is not None:
+                trace_driver.on_pipeline_end(run_token, {"status": "ok"})
+            failed = False
+        except Exception as exc:
+            if trace_driver is not None:
+                trace_driver.on_pipeline_end(
+                    run_token, {"status": "error", "error": str(exc)}
                 )
-                pre_checks = self._build_pre_checks(
-                    node, pre_ctx_view, data, required_keys
-                ) + self._extra_pre_checks(node, pre_ctx_view, data, required_keys)
+            raise
+        finally:
+            self._current_run_metadata = None
+            if trace_driver is not None:
+                session = active_trace_session(trace_driver)
+                if session is not None:
+                    # The session owns the driver: flush by policy, close once.
+                    session.run_finished(failed=failed)
+                else:
+                    trace_driver.flush()
+                    trace_driver.close()
 
-                collector = DeltaCollector(
-                    enable_hash=bool(trace_opts.get("hash")),
-                    enable_repr=bool(trace_opts.get("repr")),
-                )
-                hooks = SemantivaExecutor.SERHooks(
-                    upstream=upstream_map.get(node_id, []),
-                    trigger="dependency",
-                    upstream_evidence=[
-                        {"node_id": u, "state": "completed"}
-                        for u in upstream_map.get(node_id, [])
-                    ],
-                    context_delta_provider=lambda: collector.compute(
-                        pre_ctx=pre_ctx_view,
-                        post_ctx=self._context_snapshot(context),
-                        required_keys=required_keys,
+        return result
+
+    def compile(
+        self,
+        pipeline_spec: Sequence[dict[str, Any]],
+        logger: Logger,
+        canonical_spec: dict[str, Any] | None = None,
+    ) -> ExecutionPlan:
+        """Compile ``pipeline_spec`` into a reusable :class:`ExecutionPlan`.
+
+        Builds the canonical graph (unless ``canonical_spec`` is supplied),
+        computes semantic identifiers, instantiates every node once and
+        precomputes the per-node facts that do not depend on the payload.
+
+        Args:
+            pipeline_spec: Resolved node configurations.
+            logger: Logger handed to instantiated nodes.
+            canonical_spec: Optional precomputed GraphV1 for ``pipeline_spec``.
+
+        Returns:
+            An immutable plan accepted by :meth:`execute`.
+        """
+
+        graph = self._compile_graph(pipeline_spec, canonical_spec)
+        nodes, node_defs = self._instantiate_nodes(graph.resolved_spec, logger)
+        return self._build_plan(graph, nodes, node_defs)
+
+    def _compile_graph(
+        self,
+        pipeline_spec: Sequence[dict[str, Any]],
+        canonical_spec: dict[str, Any] | None,
+    ) -> _GraphFacts:
+        """Derive identities and topology without instantiating nodes."""
+
+        resolved_spec: Sequence[dict[str, Any]] = pipeline_spec
+        if canonical_spec is None:
+            canonical_spec, resolved_spec = build_canonical_spec(pipeline_spec)
+        pipeline_id = compute_pipeline_id(canonical_spec)
+        # Enrich a copy so the caller's canonical spec (and pipeline_id) is stable.
+        canonical = dict(canonical_spec)
+        canonical["nodes"] = [dict(n) for n in canonical_spec.get("nodes", [])]
+        node_uuids = [n["node_uuid"] for n in canonical["nodes"]]
+
+        # Resolve processor classes without instantiating nodes
+        proc_classes = self._resolve_processor_classes(canonical, resolved_spec)
+
+        semantic_pairs: list[tuple[str, str]] = []
+        for index, proc_cls in enumerate(proc_classes):
+            node_uuid = node_uuids[index] if index < len(node_uuids) else ""
+            semantic_id = "none"
+            try:
+                proc_meta = cast(Any, proc_cls).get_metadata()
+            except Exception:
+                proc_meta = {}
+            pre = proc_meta.get("preprocessor") if isinstance(proc_meta, dict) else None
+            if isinstance(pre, dict):
+                try:
+                    semantic_id = compute_node_semantic_id(pre)
+                except Exception:
+                    semantic_id = "error"
+                # Enrich canonical spec nodes with preprocessor metadata
+                if index < len(canonical["nodes"]):
+                    canonical["nodes"][index]["preprocessor_metadata"] = pre
+            semantic_pairs.append((node_uuid, semantic_id))
+
+        meta: dict[str, Any] = {"num_nodes": len(node_uuids)}
+        meta["node_semantic_ids"] = {
+            uuid_: sem_id for uuid_, sem_id in semantic_pairs if uuid_
+        }
+        meta["semantic_id"] = compute_pipeline_semantic_id(canonical)
+        meta["config_id"] = compute_pipeline_config_id(semantic_pairs)
+
+        index_of = {uuid_: i for i, uuid_ in enumerate(node_uuids)}
+        upstream_map = compute_upstream_map(canonical)
+        upstream_indices = tuple(
+            tuple(index_of[u] for u in upstream_map.get(uuid_, []))
+            for uuid_ in node_uuids
+        )
+        return _GraphFacts(
+            canonical=canonical,
+            resolved_spec=resolved_spec,
+            pipeline_id=pipeline_id,
+            start_meta=meta,
+            node_uuids=node_uuids,
+            semantic_ids=[sem_id for _, sem_id in semantic_pairs],
+            upstream_map=upstream_map,
+            upstream_indices=upstream_indices,
+        )
+
+    def _build_plan(
+        self,
+        graph: _GraphFacts,
+        nodes: Sequence[_PipelineNode],
+        node_defs: Sequence[dict[str, Any]],
+    ) -> ExecutionPlan:
+        """Precompute payload-independent facts for instantiated ``nodes``."""
+
+        node_plans: list[NodePlan] = []
+        for index, node in enumerate(nodes):
+            node_def = node_defs[index]
+            node_id = graph.node_uuids[index] if index < len(graph.node_uuids) else ""
+            params, sources = self._resolve_params_with_sources(node, node_def, {}, [])
+            channel = node_channel(node_id) if node_id else self._channel_for(node)
+            self._channels[node] = channel
+            node_plans.append(
+                NodePlan(
+                    index=index,
+                    node=node,
+                    node_def=MappingProxyType(dict(node_def)),
+                    node_id=node_id,
+                    semantic_id=(
+                        graph.semantic_ids[index]
+                        if index < len(graph.semantic_ids)
+                        else "none"
+                    ),
+                    upstream=tuple(graph.upstream_map.get(node_id, [])),
+                    required_keys=tuple(self._required_keys_for(node, node_def)),
+                    node_params=MappingProxyType(
+                        {k: v for k, v in params.items() if sources[k] == "node"}
                     ),
-                    pre_checks=pre_checks,
-                    post_checks_provider=_const_supplier([]),
-                    env_pins_provider=_const_supplier(env_pins_static),
-                    redaction_policy_provider=_const_supplier({}),
+                    default_params=MappingProxyType(
+                        {k: v for k, v in params.items() if sources[k] != "node"}
+                    ),
+                    processor_ref=MappingProxyType(self._processor_ref(node)),
+                    channel=channel,
                 )
+            )
+        return ExecutionPlan(
+            canonical_spec=graph.canonical,
+            pipeline_id=graph.pipeline_id,
+            start_meta=MappingProxyType(graph.start_meta),
+            nodes=tuple(node_plans),
+            upstream_indices=graph.upstream_indices,
+        )
 
-                start_wall = start_cpu = 0.0
-                start_iso = ""
-                summaries: dict[str, dict[str, object]] = {}
-                if trace_driver is not None:
-                    start_wall, start_cpu, start_iso = self._start_timing()
-                    summaries = self._init_summaries(data, pre_ctx_view, trace_opts)
+    # ------------------------------------------------------------------
+    # Node execution steps
+    # ------------------------------------------------------------------
+    def _execute_nodes(self, run: _RunState, router: PayloadRouter) -> Payload:
+        """Run every node once, in declaration order, and return the result.
 
-                def node_callable() -> Payload:
-                    return node.process(Payload(data, context))
+        Declaration order is a topological order of the pipeline graph, so each
+        node's inputs are available when it is reached. Subclasses override
+        this hook to schedule independent nodes concurrently.
+        """
 
-                try:
-                    result = self._submit_and_wait(node_callable, ser_hooks=hooks)
-                    if not isinstance(result, Payload):
-                        raise TypeError("Node execution must return a Payload instance")
-                    payload = result
-                    data, context = payload.data, payload.context
-                    post_ctx_view = self._context_snapshot(context)
-                    context_delta = self._ensure_context_delta(
-                        hooks.context_delta_provider()
-                        if hooks.context_delta_provider
-                        else {}
-                    )
-                    post_checks = self._build_post_checks(
-                        node, post_ctx_view, data, context_delta
-                    ) + self._extra_post_checks(
-                        node, post_ctx_view, data, context_delta
+        for node_plan in run.plan.nodes:
+            node_run = self._begin_node(
+                run, node_plan, router.input_for(node_plan.index)
+            )
+            try:
+                result = self._submit_and_wait(
+                    self._node_callable(run, node_run),
+                    ser_hooks=cast(SemantivaExecutor.SERHooks, node_run.hooks),
+                )
+                self._finish_node(run, node_run, result)
+            except Exception as exc:
+                self._fail_node(run, node_run, exc)
+                raise
+            self._publish(
+                node_plan.node, node_run.data, node_run.context, run.transport
+            )
+            router.record(node_plan.index, result)
+        return router.result()
+
+    def _begin_node(
+        self, run: _RunState, node_plan: NodePlan, payload: Payload
+    ) -> _NodeRun:
+        """Collect pre-execution evidence for ``node_plan`` processing ``payload``."""
+
+        node = node_plan.node
+        data, context = payload.data, payload.context
+        pre_ctx_view = self._context_snapshot(context)
+        required_keys = list(node_plan.required_keys)
+        params, param_sources = self._plan_params(node_plan, pre_ctx_view)
+        pre_checks = self._build_pre_checks(
+            node, pre_ctx_view, data, required_keys
+        ) + self._extra_pre_checks(node, pre_ctx_view, data, required_keys)
+
+        mark_fn = getattr(context, "journal_mark", None)
+        trace_opts = run.node_opts(node_plan.node_id)
+        collector = DeltaCollector(
+            enable_hash=bool(trace_opts.get("hash")),
+            enable_repr=bool(trace_opts.get("repr")),
+            hasher=self._hasher,
+        )
+        upstream = list(node_plan.upstream)
+        node_run = _NodeRun(
+            plan=node_plan,
+            data=data,
+            context=context,
+            pre_ctx_view=pre_ctx_view,
+            params=params,
+            param_sources=param_sources,
+            pre_checks=pre_checks,
+            journal_mark=mark_fn() if callable(mark_fn) else None,
+        )
+        node_run.hooks = SemantivaExecutor.SERHooks(
+            upstream=upstream,
+            trigger="dependency",
+            upstream_evidence=[{"node_id": u, "state": "completed"} for u in upstream],
+            context_delta_provider=lambda: self._context_delta(
+                run, collector, node_run, context, required_keys
+            ),
+            pre_checks=pre_checks,
+            post_checks_provider=_const_supplier([]),
+            env_pins_provider=_const_supplier(run.env_pins),
+            redaction_policy_provider=_const_supplier({}),
+        )
+        if run.trace is not None:
+            node_run.traced = True
+            node_run.summaries = self._init_summaries(data, pre_ctx_view, trace_opts)
+        return node_run
+
+    def _context_delta(
+        self,
+        run: _RunState,
+        collector: DeltaCollector,
+        node_run: _NodeRun,
+        context: Any,
+        required_keys: list[str],
+    ) -> dict[str, Any]:
+        """Return the context delta of ``node_run`` given input ``context``.
+
+        Uses the view recorded by :meth:`_observe_post_context`, taking it
+        first if needed. Journaled writes are compared key by key; otherwise
+        the pre- and post-snapshots are diffed.
+        """
+
+        if node_run.post_ctx_view is None:
+            self._observe_post_context(run, node_run, context)
+        post_ctx = cast(dict[str, Any], node_run.post_ctx_view)
+        changes = node_run.context_changes
+        if changes is not None:
+            return collector.compute_from_journal(
+                changes,
+                pre_ctx=node_run.pre_ctx_view,
+                post_ctx=post_ctx,
+                required_keys=required_keys,
+            )
+        return collector.compute(
+            pre_ctx=node_run.pre_ctx_view,
+            post_ctx=post_ctx,
+            required_keys=required_keys,
+        )
+
+    def _observe_post_context(
+        self, run: _RunState, node_run: _NodeRun, context: Any
+    ) -> dict[str, Any]:
+        """Record and return the post-execution context view of ``node_run``.
+
+        When the node returned its input ``context`` and that context's write
+        journal reaches back to the node's mark, the view holds only the
+        written and required keys, unless post-context summaries are traced.
+        Otherwise it is a full snapshot.
+        """
+
+        changes = None
+        if node_run.journal_mark is not None and node_run.context is context:
+            changes = context.journal_since(node_run.journal_mark)
+        subset = getattr(node_run.context, "to_dict_subset", None)
+        trace_opts = run.node_opts(node_run.node_id)
+        full_view = bool(
+            trace_opts.get("hash")
+            or (trace_opts.get("repr") and trace_opts.get("context"))
+        )
+        if changes is not None and callable(subset) and not full_view:
+            keys = (*changes.created, *changes.updated, *node_run.plan.required_keys)
+            view = subset(keys)
+        else:
+            view = self._context_snapshot(node_run.context)
+        node_run.context_changes = changes
+        node_run.post_ctx_view = view
+        return view
+
+    def _plan_params(
+        self, node_plan: NodePlan, ctx_view: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Return SER parameters and their sources for one run of ``node_plan``.
+
+        Mirrors :meth:`_resolve_params_with_sources` (node, then context, then
+        defaults) using the values precomputed at compile time, so only the
+        context-sourced entries are serialized per run.
+        """
+
+        params = dict(node_plan.node_params)
+        sources = dict.fromkeys(params, "node")
+        for key in node_plan.required_keys:
+            if key not in params and key in ctx_view:
+                params[key] = serialize_json_safe(ctx_view[key])
+                sources[key] = "context"
+        for key, value in node_plan.default_params.items():
+            if key not in params:
+                params[key] = value
+                sources[key] = "default"
+        return params, sources
+
+    def _node_callable(
+        self, run: _RunState, node_run: _NodeRun
+    ) -> Callable[[], Payload]:
+        """Return the callable submitted to the executor for ``node_run``.
+
+        Timing starts inside the callable so that time spent queued behind
+        other nodes is not attributed to this one. With a node cache, the
+        cache key is computed and looked up there too.
+        """
+
+        timed = node_run.traced
+        measure = timed and bool(run.node_opts(node_run.node_id).get("resources"))
+        data, context = node_run.data, node_run.context
+        hasher = self._hasher
+        profiler = self._profiler if run.profile_run_id else None
+        processor_name = str(node_run.plan.processor_ref.get("ref", "node"))
+        processor_name = processor_name.rsplit(".", 1)[-1]
+        cache = self._node_cache
+        if cache is not None and not (
+            supports_context(context)
+            and is_cacheable(node_run.node, node_run.plan.node_def)
+        ):
+            cache = None
+
+        def process() -> Payload:
+            meter = ResourceMeter().start() if measure else None
+            try:
+                if profiler is not None:
+                    node_run.profile = {}
+                    return profiler.profile(
+                        node_run.node.process,
+                        Payload(data, context),
+                        run_id=run.profile_run_id,
+                        name=f"{node_run.index:03d}-{processor_name}",
+                        refs=node_run.profile,
                     )
-                    hooks.post_checks_provider = _const_supplier(post_checks)
+                return node_run.node.process(Payload(data, context))
+            finally:
+                if meter is not None:
+                    node_run.resources = meter.stop()
+
+        def node_callable() -> Payload:
+            # The node may mutate values in place; memoized digests are stale.
+            hasher.invalidate()
+            if timed:
+                node_run.timing = self._start_timing()
+                node_run.thread = threading.current_thread().name
+            if cache is None:
+                return process()
+            key = node_cache_key(hasher, node_run.plan, data, context)
+            if key is None:
+                return process()
+            cached = cache.get(key)
+            if cached is not None:
+                entry, tier = cached
+                entry.apply(context)
+                node_run.cache = {"key": key, "hit": True, "tier": tier}
+                return Payload(entry.data, context)
+            mark = context.journal_mark()
+            result = process()
+            node_run.cache = {
+                "key": key,
+                "hit": False,
+                "stored": self._cache_result(cache, key, context, mark, result),
+            }
+            return result
 
-                    if trace_driver is not None:
-                        end_iso, duration_ms, cpu_ms = self._end_timing(
-                            start_wall, start_cpu
-                        )
-                        summaries = self._augment_output_summaries(
-                            summaries, data, post_ctx_view, trace_opts
-                        )
-                        ser = self._make_ser_record(
-                            status="succeeded",
-                            node=node,
-                            node_id=node_id,
-                            pipeline_id=pipeline_token,
-                            run_id=run_token,
-                            upstream_ids=upstream_map.get(node_id, []),
-                            trigger=hooks.trigger,
-                            upstream_evidence=hooks.upstream_evidence,
-                            pre_checks=pre_checks,
-                            post_checks=post_checks,
-                            env_pins=env_pins_static,
-                            context_delta=context_delta,
-                            timing={
-                                "started_at": start_iso,
-                                "finished_at": end_iso,
-                                "wall_ms": duration_ms,
-                                "cpu_ms": cpu_ms,
-                            },
-                            params=params,
-                            param_sources=param_sources,
-                            summaries=summaries,
-                            error=None,
-                        )
-                        trace_driver.on_node_event(ser)
+        return node_callable
 
-                except Exception as exc:
-                    if trace_driver is not None:
-                        post_ctx_view = self._context_snapshot(context)
-                        context_delta = self._ensure_context_delta(
-                            hooks.context_delta_provider()
-                            if hooks.context_delta_provider
-                            else {}
-                        )
-                        post_checks = (
-                            [
-                                {
-                                    "code": type(exc).__name__,
-                                    "result": "FAIL",
-                                    "details": {"error": str(exc)},
-                                }
-                            ]
-                            + self._build_post_checks(
-                                node, post_ctx_view, data, context_delta
-                            )
-                            + self._extra_post_checks(
-                                node, post_ctx_view, data, context_delta
-                            )
-                        )
-                        hooks.post_checks_provider = _const_supplier(post_checks)
-                        end_iso, duration_ms, cpu_ms = self._end_timing(
-                            start_wall, start_cpu
-                        )
-                        summaries = self._augment_output_summaries(
-                            summaries, data, post_ctx_view, trace_opts
-                        )
-                        ser = self._make_ser_record(
-                            status="error",
-                            node=node,
-                            node_id=node_id,
-                            pipeline_id=pipeline_token,
-                            run_id=run_token,
-                            upstream_ids=upstream_map.get(node_id, []),
-                            trigger=hooks.trigger,
-                            upstream_evidence=hooks.upstream_evidence,
-                            pre_checks=pre_checks,
-                            post_checks=post_checks,
-                            env_pins=env_pins_static,
-                            context_delta=context_delta,
-                            timing={
-                                "started_at": start_iso,
-                                "finished_at": end_iso,
-                                "wall_ms": duration_ms,
-                                "cpu_ms": cpu_ms,
-                            },
-                            params=params,
-                            param_sources=param_sources,
-                            summaries=summaries,
-                            error={
-                                "type": type(exc).__name__,
-                                "message": str(exc),
-                            },
-                        )
-                        trace_driver.on_node_event(ser)
-                    raise
+    def _cache_result(
+        self,
+        cache: NodeResultCache,
+        key: str,
+        context: Any,
+        journal_mark: Any,
+        result: Any,
+    ) -> bool:
+        """Store ``result`` under ``key``; return whether it was stored.
 
-                self._publish(node, data, context, transport)
+        The context writes are taken from ``context``'s write journal, so
+        results returning a different context are not cached.
+        """
 
-            if trace_driver is not None:
-                trace_driver.on_pipeline_end(run_token, {"status": "ok"})
-        except Exception as exc:
-            if trace_driver is not None:
-                trace_driver.on_pipeline_end(
-                    run_token, {"status": "error", "error": str(exc)}
-                )
-            raise
-        finally:
-            self._current_run_metadata = None
-            if trace_driver is not None:
-                trace_driver.flush()
-                trace_driver.close()
+        if not isinstance(result, Payload) or result.context is not context:
+            return False
+        changes = context.journal_since(journal_mark)
+        if changes is None:
+            return False
+        writes = {
+            key_: context.get_value(key_) for key_ in changes.created + changes.updated
+        }
+        return cache.put(key, CachedResult(result.data, writes, changes.deleted))
+
+    def _finish_node(self, run: _RunState, node_run: _NodeRun, result: Any) -> None:
+        """Validate ``result`` and emit the success SER for ``node_run``."""
+
+        if not isinstance(result, Payload):
+            raise TypeError("Node execution must return a Payload instance")
+        hooks = cast(SemantivaExecutor.SERHooks, node_run.hooks)
+        context = node_run.context
+        node_run.data, node_run.context = result.data, result.context
+        post_ctx_view = self._observe_post_context(run, node_run, context)
+        context_delta = self._ensure_context_delta(
+            hooks.context_delta_provider() if hooks.context_delta_provider else {}
+        )
+        post_checks = self._build_post_checks(
+            node_run.node, post_ctx_view, node_run.data, context_delta
+        ) + self._extra_post_checks(
+            node_run.node, post_ctx_view, node_run.data, context_delta
+        )
+        hooks.post_checks_provider = _const_supplier(post_checks)
+        if run.trace is not None:
+            self._emit_ser(
+                run,
+                node_run,
+                status="succeeded",
+                post_ctx_view=post_ctx_view,
+                post_checks=post_checks,
+                context_delta=context_delta,
+                error=None,
+            )
 
-        return Payload(data, context)
+    def _fail_node(self, run: _RunState, node_run: _NodeRun, exc: Exception) -> None:
+        """Emit the error SER for ``node_run`` failing with ``exc``."""
+
+        if run.trace is None:
+            return
+        hooks = cast(SemantivaExecutor.SERHooks, node_run.hooks)
+        post_ctx_view = self._observe_post_context(run, node_run, node_run.context)
+        context_delta = self._ensure_context_delta(
+            hooks.context_delta_provider() if hooks.context_delta_provider else {}
+        )
+        post_checks = (
+            [
+                {
+                    "code": type(exc).__name__,
+                    "result": "FAIL",
+                    "details": {"error": str(exc)},
+                }
+            ]
+            + self._build_post_checks(
+                node_run.node, post_ctx_view, node_run.data, context_delta
+            )
+            + self._extra_post_checks(
+                node_run.node, post_ctx_view, node_run.data, context_delta
+            )
+        )
+        hooks.post_checks_provider = _const_supplier(post_checks)
+        self._emit_ser(
+            run,
+            node_run,
+            status="error",
+            post_ctx_view=post_ctx_view,
+            post_checks=post_checks,
+            context_delta=context_delta,
+            error={"type": type(exc).__name__, "message": str(exc)},
+        )
+
+    def _emit_ser(
+        self,
+        run: _RunState,
+        node_run: _NodeRun,
+        *,
+        status: str,
+        post_ctx_view: dict[str, Any],
+        post_checks: list[dict[str, Any]],
+        context_delta: ContextDelta,
+        error: dict[str, Any] | None,
+    ) -> None:
+        trace_driver = cast(TraceDriver, run.trace)
+        hooks = cast(SemantivaExecutor.SERHooks, node_run.hooks)
+        if node_run.timing is None:
+            # The node never started (e.g. the executor rejected it).
+            node_run.timing = self._start_timing()
+        start_wall, start_cpu, start_iso = node_run.timing
+        end_iso, duration_ms, cpu_ms = self._end_timing(start_wall, start_cpu)
+        summaries = self._augment_output_summaries(
+            node_run.summaries,
+            node_run.data,
+            post_ctx_view,
+            run.node_opts(node_run.node_id),
+        )
+        if node_run.profile:
+            summaries["profile"] = dict(node_run.profile)
+        if node_run.cache is not None:
+            summaries["cache"] = dict(node_run.cache)
+        if node_run.resources is not None:
+            summaries["resources"] = self._resource_summary(
+                node_run, post_ctx_view, context_delta
+            )
+        ser = self._make_ser_record(
+            status=status,
+            node=node_run.node,
+            node_id=node_run.node_id,
+            pipeline_id=run.pipeline_id,
+            run_id=run.run_id,
+            upstream_ids=hooks.upstream,
+            trigger=hooks.trigger,
+            upstream_evidence=hooks.upstream_evidence,
+            pre_checks=node_run.pre_checks,
+            post_checks=post_checks,
+            env_pins=run.env_pins,
+            context_delta=context_delta,
+            timing={
+                "started_at": start_iso,
+                "finished_at": end_iso,
+                "wall_ms": duration_ms,
+                "cpu_ms": cpu_ms,
+                "pid": os.getpid(),
+                "thread": node_run.thread or threading.current_thread().name,
+            },
+            params=node_run.params,
+            param_sources=node_run.param_sources,
+            summaries=summaries,
+            error=error,
+            processor_ref=node_run.plan.processor_ref,
+        )
+        trace_driver.on_node_event(ser)
 
     # ------------------------------------------------------------------
     # Abstract hooks for concrete orchestrators
@@ -426,11 +935,32 @@ class SemantivaOrchestrator(ABC):
         context: Any,
         transport: SemantivaTransport,
     ) -> None:
-        """Publish the node output through the orchestrator's transport."""
+        """Publish the node output through the orchestrator's transport.
+
+        Implementations should publish on :meth:`_channel_for` and skip the
+        work when the transport does not :meth:`~SemantivaTransport.accepts`
+        the channel.
+        """
 
     # ------------------------------------------------------------------
     # Shared helper utilities
     # ------------------------------------------------------------------
+    def _channel_for(self, node: _PipelineNode) -> str:
+        """Return the compact publication channel of ``node``.
+
+        Planned nodes use the channel recorded in their :class:`NodePlan`;
+        other nodes get one derived from a hash of the processor's semantic ID,
+        computed once and cached.
+        """
+
+        channel = self._channels.get(node)
+        if channel is None:
+            semantic_id = node.processor.semantic_id()
+            digest = hashlib.sha256(semantic_id.encode("utf-8")).hexdigest()
+            channel = f"node.sha256-{digest[:16]}"
+            self._channels[node] = channel
+        return channel
+
     def _context_snapshot(self, ctx: Any) -> dict[str, Any]:
         if hasattr(ctx, "to_dict"):
             try:
@@ -647,7 +1177,9 @@ class SemantivaOrchestrator(ABC):
         params_out: dict[str, Any] = {}
         source_out: dict[str, str] = {}
         declared = (node_def or {}).get("parameters", {}) or {}
-        defaults = getattr(node.processor, "get_default_params", lambda: {})() or {}
+        defaults: dict[str, Any] = (
+            getattr(node.processor, "get_default_params", lambda: {})() or {}
+        )
         for k, v in declared.items():
             params_out[k] = serialize_json_safe(v)
             source_out[k] = "node"
@@ -702,7 +1234,9 @@ class SemantivaOrchestrator(ABC):
             ),
         )
 
-    def _data_summary(self, data: Any, trace_opts: dict[str, Any]) -> dict[str, object]:
+    def _data_summary(
+        self, data: Any, trace_opts: Mapping[str, Any]
+    ) -> dict[str, object]:
         if not trace_opts.get("hash") and not trace_opts.get("repr"):
             return {}
         summary: dict[str, object] = {"dtype": type(data).__name__}
@@ -712,7 +1246,7 @@ class SemantivaOrchestrator(ABC):
             pass
         if trace_opts.get("hash"):
             try:
-                summary["sha256"] = sha256_bytes(serialize(data))
+                summary["sha256"] = self._hasher.hexdigest(data)
             except Exception:
                 pass
         if trace_opts.get("repr"):
@@ -723,12 +1257,12 @@ class SemantivaOrchestrator(ABC):
         return summary
 
     def _context_summary(
-        self, context_view: dict[str, Any], trace_opts: dict[str, Any]
+        self, context_view: dict[str, Any], trace_opts: Mapping[str, Any]
     ) -> dict[str, object]:
         summary: dict[str, object] = {}
         if trace_opts.get("hash"):
             try:
-                summary["sha256"] = sha256_bytes(canonical_json_bytes(context_view))
+                summary["sha256"] = self._hasher.hexdigest(context_view)
             except Exception:
                 pass
         if trace_opts.get("repr") and trace_opts.get("context"):
@@ -742,7 +1276,7 @@ class SemantivaOrchestrator(ABC):
         self,
         data: Any,
         context_view: dict[str, Any],
-        trace_opts: dict[str, Any],
+        trace_opts: Mapping[str, Any],
     ) -> dict[str, dict[str, object]]:
         summaries: dict[str, dict[str, object]] = {}
         data_summary = self._data_summary(data, trace_opts)
@@ -758,7 +1292,7 @@ class SemantivaOrchestrator(ABC):
         summaries: dict[str, dict[str, object]],
         data: Any,
         context_view: dict[str, Any],
-        trace_opts: dict[str, Any],
+        trace_opts: Mapping[str, Any],
     ) -> dict[str, dict[str, object]]:
         data_summary = self._data_summary(data, trace_opts)
         if data_summary:
@@ -768,6 +1302,22 @@ class SemantivaOrchestrator(ABC):
             summaries["post_context"] = ctx_summary
         return summaries
 
+    def _resource_summary(
+        self,
+        node_run: _NodeRun,
+        post_ctx_view: dict[str, Any],
+        context_delta: ContextDelta,
+    ) -> dict[str, Any]:
+        """Return the measured resources of ``node_run`` plus its output sizes."""
+
+        summary = dict(cast(dict, node_run.resources))
+        summary["output_data_bytes"] = object_size(node_run.data)
+        written = [*context_delta.created_keys, *context_delta.updated_keys]
+        summary["context_delta_bytes"] = sum(
+            object_size(post_ctx_view[key]) for key in written if key in post_ctx_view
+        )
+        return summary
+
     def _start_timing(self) -> tuple[float, float, str]:
         return time.time(), time.process_time(), self._iso_now()
 
@@ -778,7 +1328,8 @@ class SemantivaOrchestrator(ABC):
         return end_iso, duration_ms, cpu_ms
 
     def _iso_now(self) -> str:
-        return datetime.now().isoformat(timespec="milliseconds") + "Z"
+        # Microseconds: sub-millisecond nodes stay visible on timelines.
+        return datetime.now().isoformat(timespec="microseconds") + "Z"
 
     def _resolve_processor_classes(
         self, canonical: dict[str, Any], resolved_spec: Sequence[dict[str, Any]]
@@ -820,6 +1371,33 @@ class SemantivaOrchestrator(ABC):
             node_defs.append(nd)
         return nodes, node_defs
 
+    def _processor_ref(self, node: _PipelineNode) -> dict[str, Any]:
+        """Return the static ``processor`` block of SERs emitted for ``node``."""
+
+        proc_cls = node.processor.__class__
+        fqcn = f"{proc_cls.__module__}.{proc_cls.__qualname__}"
+        try:
+            proc_meta = cast(Any, proc_cls).get_metadata()
+        except Exception:
+            proc_meta = {}
+        pre = proc_meta.get("preprocessor") if isinstance(proc_meta, dict) else None
+
+        ref: dict[str, Any] = {"ref": fqcn}
+        # Build preprocessing_provenance with raw expressions
+        if isinstance(pre, dict):
+            # Deep copy the sanitized metadata
+            prov = json.loads(json.dumps(pre))
+            # Add raw expressions from _expr_src
+            raw_exprs = getattr(proc_cls, "_expr_src", {})
+            if raw_exprs:
+                for param_name, expr_src in raw_exprs.items():
+                    prov.setdefault("param_expressions", {}).setdefault(param_name, {})[
+                        "expr"
+                    ] = expr_src
+            ref["semantic_id"] = compute_node_semantic_id(pre)
+            ref["preprocessing_provenance"] = prov
+        return ref
+
     def _make_ser_record(
         self,
         *,
@@ -840,6 +1418,7 @@ class SemantivaOrchestrator(ABC):
         param_sources: dict[str, str],
         summaries: dict[str, dict[str, object]] | None,
         error: dict[str, Any] | None,
+        processor_ref: Mapping[str, Any] | None = None,
     ) -> SERRecord:
         if pipeline_id is None or run_id is None:
             raise RuntimeError("SER construction requires pipeline and run identifiers")
@@ -854,32 +1433,9 @@ class SemantivaOrchestrator(ABC):
             "success": "succeeded",
             "ok": "succeeded",
         }.get(status, status)
-        proc_cls = node.processor.__class__
-        fqcn = f"{proc_cls.__module__}.{proc_cls.__qualname__}"
-        try:
-            proc_meta = cast(Any, proc_cls).get_metadata()
-        except Exception:
-            proc_meta = {}
-        pre = proc_meta.get("preprocessor") if isinstance(proc_meta, dict) else None
-
-        # Build preprocessing_provenance with raw expressions
-        preprocessing_data = {}
-        if isinstance(pre, dict):
-            import json
-
-            # Deep copy the sanitized metadata
-            prov = json.loads(json.dumps(pre))
-            # Add raw expressions from _expr_src
-            raw_exprs = getattr(proc_cls, "_expr_src", {})
-            if raw_exprs:
-                for param_name, expr_src in raw_exprs.items():
-                    prov.setdefault("param_expressions", {}).setdefault(param_name, {})[
-                        "expr"
-                    ] = expr_src
-            preprocessing_data = {
-                "semantic_id": compute_node_semantic_id(pre),
-                "preprocessing_provenance": prov,
-            }
+        if processor_ref is None:
+            processor_ref = self._processor_ref(node)
+        fqcn = processor_ref["ref"]
 
         return SERRecord(
             record_type="ser",
@@ -887,10 +1443,9 @@ class SemantivaOrchestrator(ABC):
             identity={"run_id": run_id, "pipeline_id": pipeline_id, "node_id": node_id},
             dependencies={"upstream": upstream_ids},
             processor={
-                "ref": fqcn,
+                **processor_ref,
                 "parameters": params,
                 "parameter_sources": param_sources,
-                **preprocessing_data,
             },
             context_delta=context_delta,
             assertions={
@@ -910,8 +1465,40 @@ class SemantivaOrchestrator(ABC):
             summaries=summaries or None,
         )
 
+    def _node_trace_options(
+        self,
+        policy: TraceDetailPolicy,
+        plan: ExecutionPlan,
+        run_flags: Mapping[str, Any],
+    ) -> dict[str, Mapping[str, Any]]:
+        """Resolve per-node detail overrides of ``policy`` for ``plan``."""
+
+        if not policy.node_detail:
+            return {}
+        resolved: dict[str, Mapping[str, Any]] = {}
+        for node_plan in plan.nodes:
+            node = node_plan.node
+            names = [type(getattr(node, "processor", node)).__name__]
+            ref = node_plan.processor_ref.get("ref")
+            if isinstance(ref, str):
+                names.append(ref)
+            roles = [
+                role
+                for role, classes in _NODE_ROLE_CLASSES
+                if isinstance(node, classes)
+            ]
+            flags = policy.node_flags(
+                run_flags,
+                node_id=node_plan.node_id,
+                processor_names=names,
+                roles=roles,
+            )
+            if flags is not run_flags:
+                resolved[node_plan.node_id] = flags
+        return resolved
+
     def _trace_options(self, trace: TraceDriver | None) -> dict[str, Any]:
-        defaults = {"hash": False, "repr": False, "context": False}
+        defaults = {"hash": False, "repr": False, "context": False, "resources": False}
         if trace is None:
             return defaults
         getter = getattr(trace, "get_options", None)
@@ -962,6 +1549,84 @@ class LocalSemantivaOrchestrator(SemantivaOrchestrator):
         context: Any,
         transport: SemantivaTransport,
     ) -> None:
-        transport.publish(
-            channel=node.processor.semantic_id(), data=data, context=context
-        )
+        channel = self._channel_for(node)
+        accepts = getattr(transport, "accepts", None)
+        if accepts is not None and not accepts(channel):
+            return
+        transport.publish(channel=channel, data=data, context=context)
+
+
+class GraphSemantivaOrchestrator(LocalSemantivaOrchestrator):
+    """Orchestrator that runs independent branches of the pipeline graph together.
+
+    Every node whose inputs are available is submitted to the executor at
+    once, and completions are processed as they arrive. SER composition,
+    tracing and publication stay on the calling thread; only
+    :meth:`_PipelineNode.process` runs on executor workers. Payload routing is
+    identical to :class:`LocalSemantivaOrchestrator`, so results do not depend
+    on completion order.
+
+    When a node fails no further nodes are scheduled; nodes already running
+    are allowed to finish (and emit their SERs) before the first error is
+    re-raised.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[SemantivaExecutor] = None,
+        options: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            executor: Executor receiving node callables. Defaults to a
+                :class:`ThreadPoolSemantivaExecutor`.
+            options: Execution options; ``max_workers`` sizes the default
+                thread pool.
+        """
+        if executor is None:
+            max_workers = (options or {}).get("max_workers")
+            executor = ThreadPoolSemantivaExecutor(
+                max_workers=int(max_workers) if max_workers is not None else None
+            )
+        super().__init__(executor=executor)
+
+    def _execute_nodes(self, run: _RunState, router: PayloadRouter) -> Payload:
+        waiting = list(run.plan.nodes)
+        in_flight: dict[Future, _NodeRun] = {}
+        failure: Exception | None = None
+        while waiting or in_flight:
+            if failure is None:
+                ready = [p for p in waiting if router.is_ready(p.index)]
+                for node_plan in ready:
+                    waiting.remove(node_plan)
+                    node_run = self._begin_node(
+                        run, node_plan, router.input_for(node_plan.index)
+                    )
+                    try:
+                        future = self.executor.submit(
+                            self._node_callable(run, node_run), ser_hooks=node_run.hooks
+                        )
+                    except Exception as exc:
+                        self._fail_node(run, node_run, exc)
+                        failure = exc
+                        break
+                    in_flight[future] = node_run
+            if not in_flight:
+                break
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: in_flight[f].index):
+                node_run = in_flight.pop(future)
+                try:
+                    result = future.result()
+                    self._finish_node(run, node_run, result)
+                except Exception as exc:
+                    self._fail_node(run, node_run, exc)
+                    failure = failure or exc
+                    continue
+                self._publish(
+                    node_run.node, node_run.data, node_run.context, run.transport
+                )
+                router.record(node_run.index, result)
+        if failure is not None:
+            raise failure
+        return router.result()
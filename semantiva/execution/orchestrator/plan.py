@@ -0,0 +1,104 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compiled execution plans.
+
+An :class:`ExecutionPlan` captures everything about a pipeline run that does
+not depend on the input payload: instantiated nodes, graph topology, required
+context keys, node-declared and default parameters, semantic identifiers and
+the static parts of every SER. Plans are produced by
+:meth:`SemantivaOrchestrator.compile` (or :meth:`Pipeline.compile`) and can be
+executed any number of times; each execution only performs per-run work
+(context snapshots, context-sourced parameters, checks and timing).
+
+Plans are immutable: dataclasses are frozen and collections are tuples or
+read-only mappings. ``canonical_spec`` is a plain dictionary because it is
+handed to trace drivers for serialization; it must not be modified.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Tuple
+
+from semantiva.pipeline.nodes.nodes import _PipelineNode
+
+
+@dataclass(frozen=True)
+class NodePlan:
+    """Static execution facts for one pipeline node.
+
+    Attributes:
+        index: Declaration index of the node.
+        node: Instantiated pipeline node, reused across runs.
+        node_def: Node configuration with instantiated parameters.
+        node_id: Deterministic node UUID from the canonical graph.
+        semantic_id: Node semantic identifier (``"none"`` when the processor
+            has no preprocessor metadata).
+        upstream: Node UUIDs this node consumes, in input order.
+        required_keys: Context keys the node reads.
+        node_params: JSON-safe parameters declared in the node configuration.
+        default_params: JSON-safe processor defaults not declared by the node.
+        processor_ref: The ``processor`` block of the node's SER, excluding the
+            run-dependent ``parameters`` and ``parameter_sources`` entries.
+        channel: Transport channel the node's output is published on.
+    """
+
+    index: int
+    node: _PipelineNode
+    node_def: Mapping[str, Any]
+    node_id: str
+    semantic_id: str
+    upstream: Tuple[str, ...]
+    required_keys: Tuple[str, ...]
+    node_params: Mapping[str, Any]
+    default_params: Mapping[str, Any]
+    processor_ref: Mapping[str, Any]
+    channel: str
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Immutable, reusable description of how to execute a pipeline.
+
+    Attributes:
+        canonical_spec: GraphV1 mapping enriched with preprocessor metadata.
+        pipeline_id: Deterministic ``plid-…`` identifier of the graph.
+        start_meta: ``meta`` mapping passed to ``on_pipeline_start``
+            (node count, node semantic IDs, pipeline semantic and config IDs).
+        nodes: Per-node plans in declaration order.
+        upstream_indices: For each node, the declaration indices of the nodes
+            it consumes (empty for roots).
+    """
+
+    canonical_spec: Mapping[str, Any]
+    pipeline_id: str
+    start_meta: Mapping[str, Any]
+    nodes: Tuple[NodePlan, ...]
+    upstream_indices: Tuple[Tuple[int, ...], ...]
+
+    @property
+    def pipeline_nodes(self) -> list[_PipelineNode]:
+        """The instantiated pipeline nodes, in declaration order."""
+
+        return [node_plan.node for node_plan in self.nodes]
+
+
+def node_channel(node_id: str) -> str:
+    """Return the publication channel for the node with UUID ``node_id``."""
+
+    return f"node.{node_id}"
+
+
+__all__ = ["ExecutionPlan", "NodePlan", "node_channel"]
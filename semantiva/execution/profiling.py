@@ -0,0 +1,159 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Deterministic per-node profiling.
+
+:class:`NodeProfiler` runs a node's ``process`` call under :mod:`cProfile`
+and writes two files per node and run under ``<output_dir>/<run_id>/``:
+
+``<index>-<processor>.pstats``
+    The raw profile, readable with :mod:`pstats` or tools such as snakeviz.
+
+``<index>-<processor>.collapsed``
+    Collapsed stacks (``frame;frame;frame <microseconds>``) for flamegraph
+    tools such as ``flamegraph.pl``, speedscope or inferno. cProfile records
+    caller/callee pairs rather than full stacks, so stack times are
+    apportioned along the call graph; recursive calls are folded into their
+    outermost frame.
+
+Profiled nodes run one at a time, and profiling overhead is included in the
+node's SER timing.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_Func = Tuple[str, int, str]
+
+# cProfile may not run concurrently on Python 3.12+ (sys.monitoring based).
+_PROFILE_LOCK = threading.Lock()
+_ACTIVE = threading.local()
+
+#: Stacks deeper than this are truncated in collapsed output.
+MAX_STACK_DEPTH = 256
+
+
+def _label(func: _Func) -> str:
+    filename, lineno, name = func
+    if filename == "~":  # built-in
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{lineno})"
+    return label.replace(";", ":")
+
+
+def collapse_stats(stats: Mapping[_Func, tuple]) -> Dict[str, int]:
+    """Return collapsed stacks with self time in microseconds.
+
+    Args:
+        stats: ``pstats.Stats.stats`` mapping of function to
+            ``(primitive calls, calls, self time, cumulative time, callers)``.
+    """
+
+    callees: Dict[_Func, Dict[_Func, tuple]] = {}
+    for func, (_cc, _nc, _tt, _ct, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge
+    stacks: Dict[str, int] = {}
+
+    def walk(func: _Func, path: list[_Func], labels: list[str], share: float) -> None:
+        _cc, _nc, tt, ct, _callers = stats[func]
+        ratio = share / ct if ct else 0.0
+        self_us = int(round(tt * ratio * 1e6))
+        if self_us > 0:
+            key = ";".join(labels)
+            stacks[key] = stacks.get(key, 0) + self_us
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge in callees.get(func, {}).items():
+            callee_share = edge[3] * ratio
+            if callee in path or callee_share * 1e6 < 1:
+                continue
+            path.append(callee)
+            labels.append(_label(callee))
+            walk(callee, path, labels, callee_share)
+            path.pop()
+            labels.pop()
+
+    for func, (_cc, _nc, _tt, ct, callers) in stats.items():
+        if callers or func[2].startswith("<method 'disable' of '_lsprof"):
+            continue
+        walk(func, [func], [_label(func)], ct)
+    return stacks
+
+
+class NodeProfiler:
+    """Profile node ``process`` calls and write pstats and collapsed stacks.
+
+    Args:
+        output_dir: Directory receiving one sub-directory per run.
+    """
+
+    def __init__(self, output_dir: str | os.PathLike[str]) -> None:
+        self.output_dir = Path(output_dir)
+
+    def profile(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        run_id: str,
+        name: str,
+        refs: Dict[str, Any],
+    ) -> T:
+        """Call ``func(*args)`` under cProfile and return its result.
+
+        The profile files are written even when ``func`` raises; their paths
+        and call counts are stored in ``refs``. A call nested in another
+        profiled call on the same thread is not profiled separately.
+        """
+
+        if getattr(_ACTIVE, "depth", 0):
+            return func(*args)
+        profiler = cProfile.Profile()
+        with _PROFILE_LOCK:
+            _ACTIVE.depth = 1
+            try:
+                return profiler.runcall(func, *args)
+            finally:
+                _ACTIVE.depth = 0
+                refs.update(self._write(profiler, run_id, name))
+
+    def _write(self, profiler: cProfile.Profile, run_id: str, name: str) -> dict:
+        stats = pstats.Stats(profiler)
+        run_dir = self.output_dir / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+        pstats_path = run_dir / f"{name}.pstats"
+        collapsed_path = run_dir / f"{name}.collapsed"
+        stats.dump_stats(str(pstats_path))
+        stacks = collapse_stats(stats.stats)  # type: ignore[attr-defined]
+        with collapsed_path.open("w", encoding="utf-8") as handle:
+            for stack, micros in sorted(stacks.items()):
+                handle.write(f"{stack} {micros}\n")
+        return {
+            "pstats": str(pstats_path),
+            "collapsed": str(collapsed_path),
+            "total_calls": stats.total_calls,  # type: ignore[attr-defined]
+            "primitive_calls": stats.prim_calls,  # type: ignore[attr-defined]
+        }
+
+
+__all__ = ["MAX_STACK_DEPTH", "NodeProfiler", "collapse_stats"]
@@ -73,8 +73,12 @@ Deterministic enumeration rules
 
 Returned value
 --------------
-``(runs, meta)`` where:
-* ``runs``  ``List[Dict[str, Any]]`` of expanded run dictionaries.
+:func:`plan_run_space` returns ``(runs, meta)`` without enumerating runs:
+``runs`` is a :class:`RunSpace`, a lazy sequence whose length is computed
+arithmetically from the block sizes and whose items are built on access (any
+run can be fetched by index in O(blocks)). :func:`expand_run_space` returns the
+same pair with ``runs`` materialized into a list. In both cases:
+* ``runs``  ordered run dictionaries.
 * ``meta``  ``Dict[str, Any]`` containing:
     - ``combine`` / ``max_runs`` / ``expanded_runs``.
     - ``blocks``  list with one entry per block: ``mode``, ``size``,
@@ -90,7 +94,7 @@ Error conditions (raise ``PipelineConfigurationError``):
 * Duplicate keys within a block (between context and source) or across blocks.
 * Missing columns requested by ``select``.
 * Rename collisions or collision with already present keys.
-* Cap exceeded after full expansion.
+* Cap exceeded (checked on the planned size, before any run is built).
 
 Design note: The implementation intentionally keeps state ephemeral and uses
 primitive Python containers so that higher layers can trivially serialize or
@@ -105,11 +109,11 @@ further transform the enumeration results without coupling to internal classes.
 from __future__ import annotations
 
 import csv
-import hashlib
-import itertools
+import io
 import json
+import math
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple, overload
 
 import yaml
 
@@ -118,6 +122,10 @@ from semantiva.exceptions.pipeline_exceptions import (
     PipelineConfigurationError as ConfigurationError,
     RunSpaceMaxRunsExceededError,
 )
+from semantiva.execution.run_space_sources import (
+    RunSpaceSourceCache,
+    default_source_cache,
+)
 
 
 def _coerce_scalar(value: Any) -> Any:
@@ -135,8 +143,8 @@ def _coerce_scalar(value: Any) -> Any:
         return value
 
 
-def _load_source_file(path: Path, file_format: str) -> Dict[str, List[Any]]:
-    """Load a source file into a columnar mapping.
+def _parse_source(raw: bytes, file_format: str) -> Dict[str, List[Any]]:
+    """Parse the content of a source file into a columnar mapping.
 
     Normalizes heterogeneous on-disk formats into a uniform ``Dict[str, List]``
     where each key represents a logical parameter dimension.
@@ -157,7 +165,7 @@ def _load_source_file(path: Path, file_format: str) -> Dict[str, List[Any]]:
     columns: Dict[str, List[Any]]
 
     if file_format == "csv":
-        with path.open(newline="", encoding="utf-8") as handle:
+        with io.StringIO(raw.decode("utf-8"), newline="") as handle:
             reader = csv.DictReader(handle)
             if reader.fieldnames is None:
                 raise ConfigurationError("CSV source requires a header row")
@@ -180,23 +188,22 @@ def _load_source_file(path: Path, file_format: str) -> Dict[str, List[Any]]:
 
     elif file_format == "ndjson":
         columns = {}
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                if not line.strip():
-                    continue
-                row = json.loads(line)
-                if not isinstance(row, Mapping):
-                    raise ConfigurationError("NDJSON source lines must be JSON objects")
-                for key, value in row.items():
-                    columns.setdefault(str(key), []).append(value)
+        for line in raw.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not isinstance(row, Mapping):
+                raise ConfigurationError("NDJSON source lines must be JSON objects")
+            for key, value in row.items():
+                columns.setdefault(str(key), []).append(value)
         return columns
 
     elif file_format in ("json", "yaml"):
         if file_format == "json":
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = json.loads(raw.decode("utf-8"))
         else:
             try:
-                payload = yaml.safe_load(path.read_text(encoding="utf-8"))
+                payload = yaml.safe_load(raw.decode("utf-8"))
             except yaml.YAMLError as exc:
                 raise ConfigurationError(f"Failed to parse YAML source: {exc}") from exc
 
@@ -224,58 +231,207 @@ def _load_source_file(path: Path, file_format: str) -> Dict[str, List[Any]]:
         raise ConfigurationError(f"Unsupported run_space source format: {file_format}")
 
 
-def _expand_entries(entries: Dict[str, List[Any]], mode: str) -> List[Dict[str, Any]]:
-    """Expand a columnar mapping into per-run dicts.
+class _EntriesView(Sequence[Dict[str, Any]]):
+    """Lazy expansion of a columnar mapping into per-run dicts.
+
+    Runs are computed from their index on access, honoring deterministic key
+    ordering: ``by_position`` takes the i-th value of every key and
+    ``combinatorial`` follows :func:`itertools.product` order over the keys
+    (last key varies fastest).
 
     Parameters
     ----------
     entries: Dict[str, List[Any]]
         Mapping of key -> list of possible values (lists may be empty).
     mode: str
-        'zip' or 'product'.
-
-    Returns
-    -------
-    List[Dict[str, Any]]
-        Concrete runs honoring deterministic key ordering.
+        'by_position' or 'combinatorial'.
     """
-    if not entries:
-        return []
 
-    ordered_keys = sorted(entries)
+    def __init__(self, entries: Dict[str, List[Any]], mode: str) -> None:
+        self._keys = sorted(entries)
+        self._columns = [entries[key] for key in self._keys]
+        self._mode = mode
+        lengths = [len(column) for column in self._columns]
+        if not entries:
+            self._size = 0
+        elif mode == "by_position":
+            if len(set(lengths)) > 1:
+                lengths_by_key = dict(zip(self._keys, lengths))
+                raise ConfigurationError(
+                    f"by_position block requires identical list lengths; got {lengths_by_key}"
+                )
+            self._size = lengths[0]
+        elif mode == "combinatorial":
+            self._size = math.prod(lengths)
+        else:
+            raise ConfigurationError(f"Unknown expansion mode '{mode}'")
+
+    def __len__(self) -> int:
+        return self._size
 
-    if mode == "by_position":
-        lengths = [len(entries[key]) for key in ordered_keys]
-        if len(set(lengths)) > 1:
-            lengths_by_key = {key: len(entries[key]) for key in ordered_keys}
-            raise ConfigurationError(
-                f"by_position block requires identical list lengths; got {lengths_by_key}"
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        index = _normalize_index(index, self._size)
+        if self._mode == "by_position":
+            return {
+                key: column[index] for key, column in zip(self._keys, self._columns)
+            }
+        run: Dict[str, Any] = {}
+        for key, column in zip(reversed(self._keys), reversed(self._columns)):
+            index, position = divmod(index, len(column))
+            run[key] = column[position]
+        return {key: run[key] for key in self._keys}
+
+
+class _BlockView(Sequence[Dict[str, Any]]):
+    """Lazy runs of one block: its context expansion merged with its source.
+
+    In ``by_position`` blocks the i-th context run is merged with the i-th
+    source run; in ``combinatorial`` blocks every context run is combined with
+    every source run (source varies fastest). A missing side contributes
+    nothing.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        context: _EntriesView | None,
+        source: _EntriesView | None,
+    ) -> None:
+        self._mode = mode
+        self._context = context
+        self._source = source
+        if mode == "by_position":
+            sizes = [len(part) for part in (context, source) if part is not None]
+            if sizes and len(set(sizes)) != 1:
+                raise ConfigurationError(
+                    f"by_position block requires equal run counts between context and source; got {sizes}"
+                )
+            self._size = sizes[0] if sizes else 0
+        elif mode == "combinatorial":
+            self._size = (len(context) if context is not None else 1) * (
+                len(source) if source is not None else 1
             )
+        else:
+            raise ConfigurationError(f"Unknown block mode '{mode}'")
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        index = _normalize_index(index, self._size)
+        context_index = source_index = index
+        if self._mode == "combinatorial" and self._source is not None:
+            context_index, source_index = divmod(index, len(self._source))
+        run: Dict[str, Any] = {}
+        if self._context is not None:
+            run.update(self._context[context_index])
+        if self._source is not None:
+            run.update(self._source[source_index])
+        return run
+
+
+class RunSpace(Sequence[Dict[str, Any]]):
+    """Lazily expanded runs of a run space.
+
+    The number of runs is known without enumerating them, any run can be
+    fetched by index in O(blocks) time and iteration yields runs one at a
+    time, so a run space is never held in memory as a whole. Runs are fresh
+    dictionaries on every access and follow the deterministic enumeration
+    order described in the module documentation.
+    """
 
-        size = lengths[0] if lengths else 0
-        return [
-            {key: entries[key][index] for key in ordered_keys} for index in range(size)
-        ]
+    def __init__(self, combine: str, blocks: Sequence[Sequence[Dict[str, Any]]]):
+        self._combine = combine
+        self._blocks = list(blocks)
+        sizes = [len(block) for block in self._blocks]
+        if not self._blocks:
+            self._size = 1
+        elif combine == "combinatorial":
+            self._size = math.prod(sizes)
+        elif combine == "by_position":
+            if len(set(sizes)) != 1:
+                raise ConfigurationError(
+                    f"combine=by_position requires equal block sizes; got {sizes}"
+                )
+            self._size = sizes[0]
+        else:
+            raise ConfigurationError(f"Unknown run_space combine mode '{combine}'")
 
-    elif mode == "combinatorial":
-        value_iters = [entries[key] for key in ordered_keys]
-        return [
-            dict(zip(ordered_keys, combo)) for combo in itertools.product(*value_iters)
-        ]
+    @property
+    def combine(self) -> str:
+        """Top-level combine mode."""
+        return self._combine
 
-    else:
-        raise ConfigurationError(f"Unknown expansion mode '{mode}'")
+    @property
+    def block_sizes(self) -> List[int]:
+        """Number of runs produced by each block, in declaration order."""
+        return [len(block) for block in self._blocks]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self._size):
+            yield self[index]
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        index = _normalize_index(index, self._size)
+        if self._combine == "by_position":
+            positions = [index] * len(self._blocks)
+        else:
+            positions = []
+            for block in reversed(self._blocks):
+                index, position = divmod(index, len(block))
+                positions.append(position)
+            positions.reverse()
+        run: Dict[str, Any] = {}
+        for block, position in zip(self._blocks, positions):
+            run.update(block[position])
+        return run
+
+
+def _normalize_index(index: int, size: int) -> int:
+    """Resolve a possibly negative ``index`` into ``range(size)``."""
+    if index < 0:
+        index += size
+    if not 0 <= index < size:
+        raise IndexError("run index out of range")
+    return index
 
 
 def _load_and_process_source(
-    src: RunSource, base_dir: Path
+    src: RunSource, base_dir: Path, source_cache: RunSpaceSourceCache
 ) -> Tuple[Dict[str, List[Any]], Dict[str, Any]]:
     """Load a :class:`RunSource` and apply select / rename transformations.
 
     Produces both the transformed columns and a metadata payload capturing
     provenance (path resolution + SHA256 digest) and the transformation
-    arguments.  The digest enables higher layers to invalidate caches when a
-    source file changes without re-parsing content here.
+    arguments.  The file is read, hashed and parsed through ``source_cache``,
+    so an unchanged file is neither re-read nor re-parsed.
     """
     # Resolve path
     candidate = Path(src.path)
@@ -285,8 +441,10 @@ def _load_and_process_source(
     if not resolved.exists():
         raise ConfigurationError(f"run_space source file not found: {src.path}")
 
-    # Load columns
-    columns = _load_source_file(resolved, src.format)
+    # Load columns (hashed from the same bytes)
+    columns, sha256 = source_cache.load(
+        resolved, src.format, lambda raw: _parse_source(raw, src.format)
+    )
 
     # Apply select transformation
     if src.select is not None:
@@ -317,13 +475,6 @@ def _load_and_process_source(
             renamed[target] = values
         columns = renamed
 
-    # Generate file hash
-    digest = hashlib.sha256()
-    with resolved.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            if chunk:
-                digest.update(chunk)
-
     meta = {
         "path": src.path,
         "resolved_path": str(resolved),
@@ -331,21 +482,23 @@ def _load_and_process_source(
         "mode": src.mode,
         "select": list(src.select or []),
         "rename": dict(src.rename),
-        "sha256": digest.hexdigest(),
+        "sha256": sha256,
     }
     return columns, meta
 
 
-def expand_run_space(
-    spec: RunSpaceV1Config, *, cwd: str | Path = "."
-) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    """Expand a :class:`RunSpaceV1Config` into concrete runs and metadata.
+def plan_run_space(
+    spec: RunSpaceV1Config,
+    *,
+    cwd: str | Path = ".",
+    source_cache: RunSpaceSourceCache | None = None,
+) -> Tuple[RunSpace, Dict[str, Any]]:
+    """Plan a :class:`RunSpaceV1Config` without materializing its runs.
 
-    This is the primary entry point for enumerating parameter spaces.  See the
-    module docstring for a detailed description of semantics.  The function is
-    intentionally *pure* (aside from reading source files) and side-effect
-    free—callers can safely memoize its result based on the hash of the input
-    specification + referenced file digests.
+    Sources are loaded and every validation of :func:`expand_run_space` is
+    performed, but runs are produced lazily by the returned :class:`RunSpace`.
+    Its size is computed arithmetically, so ``max_runs`` is enforced before any
+    run is built.
 
     Parameters
     ----------
@@ -354,15 +507,20 @@ def expand_run_space(
     cwd : Path | str, optional
         Base directory for resolving relative source file paths (defaults to
         ``'.'``).
+    source_cache : RunSpaceSourceCache, optional
+        Cache of source file digests and parsed columns (defaults to the
+        process-wide :func:`~semantiva.execution.run_space_sources.default_source_cache`).
 
     Returns
     -------
     (runs, meta)
-        ``runs`` is the ordered list of run dictionaries; ``meta`` is the
-        metadata structure described in the module level docs.
+        ``runs`` is the lazy, indexable sequence of run dictionaries; ``meta``
+        is the metadata structure described in the module level docs.
     """
     base_dir = Path(cwd)
-    all_block_runs = []
+    if source_cache is None:
+        source_cache = default_source_cache()
+    blocks: List[_BlockView] = []
     block_meta = []
     seen_keys: set[str] = set()
 
@@ -375,7 +533,7 @@ def expand_run_space(
         # Load source if present
         if block.source is not None:
             source_entries, source_meta = _load_and_process_source(
-                block.source, base_dir
+                block.source, base_dir, source_cache
             )
             duplicate_keys = set(context_entries).intersection(source_entries)
             if duplicate_keys:
@@ -383,57 +541,19 @@ def expand_run_space(
                     f"Duplicate context key(s) within block (context vs source): {sorted(duplicate_keys)!r}"
                 )
 
-        # Combine context and source based on block mode
-        if block.mode == "by_position":
-            context_runs = (
-                _expand_entries(context_entries, "by_position")
-                if context_entries
-                else None
-            )
-            source_mode = block.source.mode if block.source else "by_position"
-            source_runs = (
-                _expand_entries(source_entries, source_mode) if source_entries else None
-            )
-
-            sizes = [
-                len(runs) for runs in [context_runs, source_runs] if runs is not None
-            ]
-            if sizes and len(set(sizes)) != 1:
-                raise ConfigurationError(
-                    f"by_position block requires equal run counts between context and source; got {sizes}"
-                )
-
-            run_count = sizes[0] if sizes else 0
-            block_runs = []
-            for i in range(run_count):
-                combined = {}
-                if context_runs is not None:
-                    combined.update(context_runs[i])
-                if source_runs is not None:
-                    combined.update(source_runs[i])
-                block_runs.append(combined)
-
-        elif block.mode == "combinatorial":
-            context_runs = (
-                _expand_entries(context_entries, "combinatorial")
-                if context_entries
-                else [{}]
-            )
-            source_mode = block.source.mode if block.source else "combinatorial"
-            source_runs = (
-                _expand_entries(source_entries, source_mode) if source_entries else [{}]
-            )
-
-            block_runs = []
-            for ctx in context_runs:
-                for src in source_runs:
-                    merged = dict(ctx)
-                    merged.update(src)
-                    block_runs.append(merged)
-
-        else:
+        if block.mode not in ("by_position", "combinatorial"):
             raise ConfigurationError(f"Unknown block mode '{block.mode}'")
 
+        # Combine context and source based on block mode
+        context_runs = (
+            _EntriesView(context_entries, block.mode) if context_entries else None
+        )
+        source_mode = block.source.mode if block.source else block.mode
+        source_runs = (
+            _EntriesView(source_entries, source_mode) if source_entries else None
+        )
+        block_runs = _BlockView(block.mode, context_runs, source_runs)
+
         # Check for duplicate keys across blocks
         current_keys = set(context_entries) | set(source_entries)
         duplicate_keys = seen_keys.intersection(current_keys)
@@ -443,7 +563,7 @@ def expand_run_space(
             )
         seen_keys.update(current_keys)
 
-        all_block_runs.append(block_runs)
+        blocks.append(block_runs)
 
         # Build block metadata
         block_meta_dict: Dict[str, Any] = {
@@ -456,64 +576,62 @@ def expand_run_space(
         block_meta.append(block_meta_dict)
 
     # Combine all blocks
-    if not all_block_runs:
-        combined_runs: List[Dict[str, Any]] = [{}]
-    elif spec.combine == "combinatorial":
-        if any(len(runs) == 0 for runs in all_block_runs):
-            combined_runs = []
-        else:
-            total = 1
-            for runs in all_block_runs:
-                total *= len(runs)
-
-            if total > spec.max_runs:
-                raise RunSpaceMaxRunsExceededError(
-                    actual_runs=total,
-                    max_runs=spec.max_runs,
-                )
-
-            combined_runs = []
-            for combo in itertools.product(*all_block_runs):
-                merged = {}
-                for part in combo:
-                    merged.update(part)
-                combined_runs.append(merged)
-
-    elif spec.combine == "by_position":
-        sizes = [len(runs) for runs in all_block_runs]
-        if len(set(sizes)) != 1:
-            raise ConfigurationError(
-                f"combine=by_position requires equal block sizes; got {sizes}"
-            )
-
-        total = sizes[0] if sizes else 0
-        if total > spec.max_runs:
-            raise RunSpaceMaxRunsExceededError(
-                actual_runs=total,
-                max_runs=spec.max_runs,
-            )
-
-        combined_runs = []
-        for idx in range(total):
-            merged = {}
-            for runs in all_block_runs:
-                merged.update(runs[idx])
-            combined_runs.append(merged)
-
-    else:
-        raise ConfigurationError(f"Unknown run_space combine mode '{spec.combine}'")
+    runs = RunSpace(spec.combine, blocks)
+    if blocks and len(runs) > spec.max_runs:
+        raise RunSpaceMaxRunsExceededError(
+            actual_runs=len(runs),
+            max_runs=spec.max_runs,
+        )
 
     # Build final metadata
     meta: Dict[str, Any] = {
         "combine": spec.combine,
         "max_runs": spec.max_runs,
-        "expanded_runs": len(combined_runs),
+        "expanded_runs": len(runs),
         "blocks": block_meta,
     }
     if spec.dry_run:
         meta["dry_run"] = True
 
-    return combined_runs, meta
+    return runs, meta
+
+
+def expand_run_space(
+    spec: RunSpaceV1Config,
+    *,
+    cwd: str | Path = ".",
+    source_cache: RunSpaceSourceCache | None = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Expand a :class:`RunSpaceV1Config` into concrete runs and metadata.
+
+    This is the primary entry point for enumerating parameter spaces.  See the
+    module docstring for a detailed description of semantics.  The function is
+    intentionally *pure* (aside from reading source files) and side-effect
+    free—callers can safely memoize its result based on the hash of the input
+    specification + referenced file digests.
+
+    The runs are materialized from :func:`plan_run_space`; callers that only
+    iterate or index runs should use that function instead.
+
+    Parameters
+    ----------
+    spec : RunSpaceV1Config
+        Declarative run space description.
+    cwd : Path | str, optional
+        Base directory for resolving relative source file paths (defaults to
+        ``'.'``).
+    source_cache : RunSpaceSourceCache, optional
+        Cache of source file digests and parsed columns (defaults to the
+        process-wide :func:`~semantiva.execution.run_space_sources.default_source_cache`).
+
+    Returns
+    -------
+    (runs, meta)
+        ``runs`` is the ordered list of run dictionaries; ``meta`` is the
+        metadata structure described in the module level docs.
+    """
+    runs, meta = plan_run_space(spec, cwd=cwd, source_cache=source_cache)
+    return list(runs), meta
 
 
-__all__ = ["expand_run_space"]
+__all__ = ["RunSpace", "expand_run_space", "plan_run_space"]
@@ -0,0 +1,327 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-pool execution of independent run-space runs.
+
+Run-space runs share a pipeline definition but no runtime state, so a launch
+can be spread across worker processes. Each worker rebuilds the pipeline from
+the (already overridden) configuration mapping once, then executes the runs it
+is handed.
+
+Trace records are not written by workers. A :class:`RecordingTraceDriver`
+captures every driver call made while a run executes and ships it back with the
+:class:`RunOutcome`; the parent replays those calls on the real driver strictly
+in ``run_space_index`` order. Trace files are therefore identical in content
+and order to a sequential launch, and the ``run_space_start`` /
+``run_space_end`` lifecycle remains owned by the parent process.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+
+from semantiva.trace._utils import safe_repr
+from semantiva.trace.model import SERRecord
+from semantiva.trace.runtime.session import active_trace_session
+
+TraceCall = Tuple[str, tuple, Dict[str, Any]]
+
+
+@dataclass
+class RunOutcome:
+    """Result of a single run executed in a worker process.
+
+    Only picklable, display-oriented values cross the process boundary: the
+    output payload is summarised to text and trace activity is carried as a
+    list of recorded driver calls.
+    """
+
+    index: int
+    duration: float
+    output_data: str = ""
+    output_context: str = ""
+    trace_calls: List[TraceCall] = field(default_factory=list)
+    error: Optional[str] = None
+    error_traceback: Optional[str] = None
+
+
+class RunSpaceWorkerError(RuntimeError):
+    """Raised in the parent when a run failed inside a worker process."""
+
+    def __init__(self, index: int, message: str, worker_traceback: str | None):
+        super().__init__(message)
+        self.index = index
+        self.message = message
+        self.worker_traceback = worker_traceback
+
+
+def _portable(value: Any) -> Any:
+    """Return ``value`` if it pickles, else a JSON-safe approximation."""
+
+    try:
+        pickle.dumps(value)
+        return value
+    except Exception:
+        return json.loads(json.dumps(value, default=safe_repr))
+
+
+class RecordingTraceDriver:
+    """Trace driver that records calls for replay on another driver.
+
+    ``get_options`` mirrors the detail flags of the driver the calls will be
+    replayed on, so the orchestrator computes exactly the summaries a direct
+    driver would have requested.
+    """
+
+    def __init__(self, options: Dict[str, Any] | None = None) -> None:
+        self._options = dict(options or {})
+        self._calls: List[TraceCall] = []
+
+    def on_pipeline_start(
+        self,
+        pipeline_id: str,
+        run_id: str,
+        pipeline_spec_canonical: dict,
+        meta: dict,
+        pipeline_input: Optional[object] = None,
+        **kwargs: Any,
+    ) -> None:
+        # pipeline_input is live payload state; drivers do not persist it.
+        self._calls.append(
+            (
+                "on_pipeline_start",
+                (
+                    pipeline_id,
+                    run_id,
+                    _portable(pipeline_spec_canonical),
+                    _portable(meta),
+                ),
+                _portable(dict(kwargs)),
+            )
+        )
+
+    def on_node_event(self, event: SERRecord) -> None:
+        self._calls.append(("on_node_event", (event,), {}))
+
+    def on_pipeline_end(self, run_id: str, summary: dict) -> None:
+        self._calls.append(("on_pipeline_end", (run_id, _portable(summary)), {}))
+
+    def on_run_space_start(self, run_id: str, **kwargs: Any) -> None:
+        self._calls.append(("on_run_space_start", (run_id,), _portable(dict(kwargs))))
+
+    def on_run_space_end(self, run_id: str, **kwargs: Any) -> None:
+        self._calls.append(("on_run_space_end", (run_id,), _portable(dict(kwargs))))
+
+    def flush(self) -> None:
+        self._calls.append(("flush", (), {}))
+
+    def close(self) -> None:
+        self._calls.append(("close", (), {}))
+
+    def get_options(self) -> Dict[str, Any]:
+        """Return the detail flags of the driver that will replay the calls."""
+
+        return dict(self._options)
+
+    def drain(self) -> List[TraceCall]:
+        """Return and forget the calls recorded so far."""
+
+        calls, self._calls = self._calls, []
+        return calls
+
+
+def replay_trace_calls(driver: Any, calls: Iterable[TraceCall]) -> None:
+    """Replay recorded trace calls on ``driver`` in their original order.
+
+    When ``driver`` has an open :class:`~semantiva.trace.runtime.TraceSession`,
+    the per-run ``flush``/``close`` calls of the worker are not replayed; each
+    ``close`` is reported to the session as a finished run instead.
+    """
+
+    session = active_trace_session(driver)
+    failed = False
+    for name, args, kwargs in calls:
+        if name == "on_pipeline_end":
+            failed = (args[1] or {}).get("status") == "error"
+        if session is not None and name in ("flush", "close"):
+            if name == "close":
+                session.run_finished(failed=failed)
+            continue
+        getattr(driver, name)(*args, **kwargs)
+
+
+def summarize_payload(payload: Any) -> Tuple[str, str]:
+    """Return printable ``(data, context)`` descriptions of a run result."""
+
+    try:
+        data_text = repr(payload.data)
+    except Exception:  # pragma: no cover - defensive
+        data_text = "<unrepresentable data>"
+    try:
+        ctx = payload.context.to_dict()
+        lines = ["Output context:"]
+        for k, v in ctx.items():
+            try:
+                v_repr = repr(v)
+            except Exception:  # pragma: no cover - defensive
+                v_repr = "<unrepresentable>"
+            v_repr_repl = v_repr.replace("\n", " ")
+            lines.append(f"  {k}: {v_repr_repl}")
+        context_text = "\n".join(lines)
+    except Exception:  # pragma: no cover - defensive
+        context_text = "Output context: <unrepresentable context>"
+    return data_text, context_text
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(
+    config: Dict[str, Any],
+    pipeline_path: str,
+    log_level: str,
+    trace_options: Dict[str, Any] | None,
+) -> None:
+    """Build the pipeline once per worker process."""
+
+    from semantiva.configurations import parse_pipeline_config
+    from semantiva.execution.component_registry import ExecutionComponentRegistry
+    from semantiva.execution.orchestrator.factory import build_orchestrator
+    from semantiva.logger import Logger
+    from semantiva.pipeline import Pipeline
+
+    path = Path(pipeline_path)
+    pipeline_cfg = parse_pipeline_config(
+        config, source_path=str(path), base_dir=path.parent
+    )
+    exec_cfg = pipeline_cfg.execution
+    ExecutionComponentRegistry.initialize_defaults()
+    transport = None
+    if exec_cfg.transport:
+        transport = ExecutionComponentRegistry.get_transport(exec_cfg.transport)()
+    orchestrator = build_orchestrator(exec_cfg, transport=transport)
+
+    recorder = (
+        RecordingTraceDriver(trace_options) if trace_options is not None else None
+    )
+    _WORKER_STATE["recorder"] = recorder
+    _WORKER_STATE["pipeline"] = Pipeline(
+        pipeline_cfg.nodes,
+        logger=Logger(level=log_level),
+        transport=transport,
+        orchestrator=orchestrator,
+        trace=recorder,
+    )
+
+
+def _execute_run(
+    index: int, run_context: Dict[str, Any], metadata: Dict[str, Any]
+) -> RunOutcome:
+    """Execute a single run on the worker's pipeline."""
+
+    from semantiva.context_processors import ContextType
+    from semantiva.data_types import NoDataType
+    from semantiva.pipeline import Payload
+
+    pipeline = _WORKER_STATE["pipeline"]
+    recorder: RecordingTraceDriver | None = _WORKER_STATE["recorder"]
+
+    pipeline.set_run_metadata(metadata or None)
+    initial_payload = (
+        Payload(NoDataType(), ContextType(run_context)) if run_context else None
+    )
+    outcome = RunOutcome(index=index, duration=0.0)
+    start = time.time()
+    try:
+        result = pipeline.process(initial_payload)
+        outcome.output_data, outcome.output_context = summarize_payload(result)
+    except Exception as exc:
+        outcome.error = str(exc)
+        outcome.error_traceback = traceback.format_exc()
+    outcome.duration = time.time() - start
+    if recorder is not None:
+        outcome.trace_calls = recorder.drain()
+    return outcome
+
+
+# ---------------------------------------------------------------------------
+# Parent process side
+# ---------------------------------------------------------------------------
+def iter_run_outcomes(
+    runs: Iterable[Tuple[int, Dict[str, Any], Dict[str, Any]]],
+    *,
+    jobs: int,
+    config: Dict[str, Any],
+    pipeline_path: str | Path,
+    log_level: str = "INFO",
+    trace_options: Dict[str, Any] | None = None,
+) -> Generator[RunOutcome, None, None]:
+    """Execute ``runs`` on a pool of ``jobs`` workers, yielding in input order.
+
+    Args:
+        runs: Iterable of ``(run_space_index, run_context, run_metadata)``.
+        jobs: Number of worker processes.
+        config: Pipeline configuration mapping (after CLI overrides).
+        pipeline_path: Path of the pipeline YAML, used to resolve relative
+            paths exactly as the parent did.
+        log_level: Logger level used inside workers.
+        trace_options: Detail flags of the parent trace driver, or ``None``
+            when tracing is disabled.
+
+    Yields:
+        :class:`RunOutcome` objects ordered by submission, regardless of the
+        order in which workers finish. At most ``2 * jobs`` runs are in flight
+        so arbitrarily long run iterables are consumed lazily.
+    """
+
+    if jobs < 1:
+        raise ValueError("jobs must be >= 1")
+    window = 2 * jobs
+    pool = ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(dict(config), str(pipeline_path), log_level, trace_options),
+    )
+    pending: deque[Future] = deque()
+    source = iter(runs)
+    try:
+        for index, run_context, metadata in source:
+            pending.append(pool.submit(_execute_run, index, run_context, metadata))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = [
+    "RecordingTraceDriver",
+    "RunOutcome",
+    "RunSpaceWorkerError",
+    "iter_run_outcomes",
+    "replay_trace_calls",
+    "summarize_payload",
+]
@@ -0,0 +1,186 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache of parsed run-space source files.
+
+Run-space planning parses every ``run_space.blocks[].source`` file and records
+its SHA-256; run-space identity fingerprints the same files. A
+:class:`RunSpaceSourceCache` reads each file once per ``(path, size, mtime)``:
+the digest is computed from the bytes that are parsed, and both the digest and
+the parsed columns are reused until the file's size or modification time
+changes.
+
+With a directory, parsed columns are also kept in one pickle file per source
+path and format, so later processes skip parsing and hashing of unchanged
+files. The CLI places it under ``execution.cache_dir``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Columns = Dict[str, List[Any]]
+
+# Bump when the parsed representation changes to ignore older cache files.
+_FORMAT_VERSION = 1
+
+_StatKey = Tuple[int, int]
+
+
+def _stat_key(path: Path) -> _StatKey:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+class RunSpaceSourceCache:
+    """Digests and parsed columns of run-space source files.
+
+    Args:
+        directory: Directory of the on-disk tier; ``None`` keeps entries in
+            memory only.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self._digests: Dict[str, Tuple[_StatKey, str]] = {}
+        self._columns: Dict[Tuple[str, str], Tuple[_StatKey, str, Columns]] = {}
+        self._lock = threading.Lock()
+
+    def digest(self, path: Path) -> str:
+        """Return the SHA-256 hex digest of ``path``, hashing it only if changed."""
+
+        name = str(path)
+        key = _stat_key(path)
+        with self._lock:
+            known = self._digests.get(name)
+        if known is not None and known[0] == key:
+            return known[1]
+        h = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self._digests[name] = (key, digest)
+        return digest
+
+    def load(
+        self, path: Path, file_format: str, parse: Callable[[bytes], Columns]
+    ) -> Tuple[Columns, str]:
+        """Return the columns ``parse`` produces for ``path`` and its digest.
+
+        Args:
+            path: Resolved source file path.
+            file_format: Source format; part of the cache key.
+            parse: Parser of the raw file content; only called on a miss.
+
+        Returns:
+            A fresh copy of the column mapping (callers may modify it) and the
+            file's SHA-256 hex digest.
+        """
+
+        name = str(path)
+        key = _stat_key(path)
+        with self._lock:
+            entry = self._columns.get((name, file_format))
+        if entry is None or entry[0] != key:
+            entry = self._read_disk(name, file_format, key)
+            if entry is None:
+                raw = path.read_bytes()
+                digest = hashlib.sha256(raw).hexdigest()
+                entry = (key, digest, parse(raw))
+                self._write_disk(name, file_format, entry)
+            with self._lock:
+                self._columns[(name, file_format)] = entry
+                self._digests[name] = (key, entry[1])
+        _, digest, columns = entry
+        return {column: list(values) for column, values in columns.items()}, digest
+
+    def clear(self) -> None:
+        """Forget every entry, including the on-disk tier."""
+
+        with self._lock:
+            self._digests.clear()
+            self._columns.clear()
+        if self.directory is not None and self.directory.is_dir():
+            for path in self.directory.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+    def _path(self, name: str, file_format: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        token = hashlib.sha256(f"{name}\x00{file_format}".encode("utf-8"))
+        return self.directory / f"{token.hexdigest()[:32]}.pkl"
+
+    def _read_disk(
+        self, name: str, file_format: str, key: _StatKey
+    ) -> Optional[Tuple[_StatKey, str, Columns]]:
+        path = self._path(name, file_format)
+        if path is None:
+            return None
+        try:
+            stored = pickle.loads(path.read_bytes())
+        except Exception:
+            return None
+        if not isinstance(stored, dict) or stored.get("header") != (
+            _FORMAT_VERSION,
+            name,
+            file_format,
+            key,
+        ):
+            return None
+        return key, stored["sha256"], stored["columns"]
+
+    def _write_disk(
+        self, name: str, file_format: str, entry: Tuple[_StatKey, str, Columns]
+    ) -> None:
+        path = self._path(name, file_format)
+        if path is None:
+            return
+        key, digest, columns = entry
+        stored = {
+            "header": (_FORMAT_VERSION, name, file_format, key),
+            "sha256": digest,
+            "columns": columns,
+        }
+        try:
+            blob = pickle.dumps(stored, protocol=pickle.HIGHEST_PROTOCOL)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(blob)
+            os.replace(tmp, path)
+        except Exception:
+            return
+
+
+_DEFAULT_CACHE = RunSpaceSourceCache()
+
+
+def default_source_cache() -> RunSpaceSourceCache:
+    """Return the process-wide, memory-only source cache."""
+
+    return _DEFAULT_CACHE
+
+
+__all__ = ["RunSpaceSourceCache", "default_source_cache"]
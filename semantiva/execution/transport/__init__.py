@@ -19,10 +19,12 @@ Provides interfaces for distributed execution and transport.
 
 from .base import SemantivaTransport, Subscription, Message
 from .in_memory import InMemorySemantivaTransport
+from .null import NullSemantivaTransport
 
 __all__ = [
     "SemantivaTransport",
     "Subscription",
     "Message",
     "InMemorySemantivaTransport",
+    "NullSemantivaTransport",
 ]
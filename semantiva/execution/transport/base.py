@@ -21,6 +21,10 @@ Key concepts:
   - Message: encapsulates payload, context metadata, and an optional ack callback.
   - Subscription: sync/async iterable over incoming messages with lifecycle control.
   - SemantivaTransport: abstract interface for connecting, publishing, and subscribing.
+
+Publication is opt-in: pipelines default to :class:`NullSemantivaTransport`, and
+orchestrators skip node-output publication for channels a transport does not
+:meth:`~SemantivaTransport.accepts`.
 """
 
 from abc import ABC, abstractmethod
@@ -134,6 +138,22 @@ class SemantivaTransport(ABC):
         """
         ...
 
+    def accepts(self, channel: str) -> bool:
+        """
+        Report whether a message published on ``channel`` would be delivered or retained.
+
+        Orchestrators consult this before publishing node outputs so that
+        transports with nobody listening cost nothing. The default accepts
+        every channel; transports that discard messages should override it.
+
+        Args:
+            channel:  Subject or topic name a message would be published to.
+
+        Returns:
+            bool: ``False`` when publishing to ``channel`` would be a no-op.
+        """
+        return True
+
     @abstractmethod
     def subscribe(
         self, channel: str, *, callback: Optional[Callable[[Message], None]] = None
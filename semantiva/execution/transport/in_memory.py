@@ -21,17 +21,21 @@ This transport supports:
   - Synchronous and asynchronous iteration over matching messages.
   - Optional callback-based consumption in a background thread.
   - No-op acknowledgments and connect/close methods, since it's all in-process.
+  - A retention policy bounding how many undelivered messages are kept.
 """
 
 import threading
 from collections import defaultdict, deque
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Callable, Dict, Optional, Set
 from concurrent.futures import Future
 from fnmatch import fnmatch
 from semantiva.context_processors import ContextType
 
 from .base import SemantivaTransport, Subscription, Message
 
+#: Supported values for ``InMemorySemantivaTransport(retention=...)``.
+RETENTION_POLICIES = ("keep", "drop", "ring", "subscribers")
+
 
 class InMemorySubscription(Subscription):
     """
@@ -42,15 +46,27 @@ class InMemorySubscription(Subscription):
     are drained, the iterator exits. Calling close() stops iteration early.
     """
 
-    def __init__(self, queues: Dict[str, tuple[deque, threading.Lock]], pattern: str):
+    def __init__(
+        self,
+        queues: Dict[str, tuple[deque, threading.Lock]],
+        pattern: str,
+        on_close: Optional[Callable[["InMemorySubscription"], None]] = None,
+    ):
         """
         Args:
             queues:   Shared mapping of channel -> (deque of Message, Lock)
             pattern:  Channel pattern to match (exact name or wildcard)
+            on_close: Optional callback invoked once when the subscription closes
         """
         self._queues = queues
         self._pattern = pattern
         self._closed = False
+        self._on_close = on_close
+
+    @property
+    def pattern(self) -> str:
+        """Channel pattern this subscription matches."""
+        return self._pattern
 
     def __iter__(self):
         """
@@ -91,7 +107,11 @@ class InMemorySubscription(Subscription):
         """
         Stop the subscription. Subsequent iterations will terminate.
         """
+        if self._closed:
+            return
         self._closed = True
+        if self._on_close is not None:
+            self._on_close(self)
 
 
 class InMemorySemantivaTransport(SemantivaTransport):
@@ -99,16 +119,60 @@ class InMemorySemantivaTransport(SemantivaTransport):
     In-memory transport that implements the SemantivaTransport API.
 
     - Maintains per-channel queues of Message objects.
-    - publish() appends to the appropriate queue.
+    - publish() appends to the appropriate queue, subject to the retention policy.
     - subscribe() returns an InMemorySubscription for pattern-based consumption.
     - connect()/close() are no-ops, provided for API symmetry.
+
+    Retention policies bound how many undelivered messages a channel keeps:
+
+    - ``"keep"`` (default): retain every message until it is consumed.
+    - ``"drop"``: retain at most ``max_messages`` per channel (default ``0``)
+      and drop newer messages while the channel is full.
+    - ``"ring"``: retain the newest ``max_messages`` per channel, evicting the
+      oldest.
+    - ``"subscribers"``: retain messages only for channels matched by an open
+      subscription (optionally bounded like ``"ring"`` by ``max_messages``).
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, retention: str = "keep", max_messages: Optional[int] = None
+    ) -> None:
+        """
+        Args:
+            retention:    One of :data:`RETENTION_POLICIES`.
+            max_messages: Per-channel bound used by ``"drop"``, ``"ring"`` and
+                          ``"subscribers"``; required for ``"ring"``.
+
+        Raises:
+            ValueError: If the policy is unknown or ``max_messages`` is invalid
+                        for it.
+        """
+        if retention not in RETENTION_POLICIES:
+            raise ValueError(
+                f"Unknown retention policy {retention!r}; "
+                f"expected one of {', '.join(RETENTION_POLICIES)}"
+            )
+        if max_messages is not None and (
+            isinstance(max_messages, bool)
+            or not isinstance(max_messages, int)
+            or max_messages < 0
+        ):
+            raise ValueError("max_messages must be a non-negative integer")
+        if retention == "ring" and not max_messages:
+            raise ValueError("retention='ring' requires max_messages >= 1")
+        if retention == "keep" and max_messages is not None:
+            raise ValueError("retention='keep' does not accept max_messages")
+        if retention == "drop" and max_messages is None:
+            max_messages = 0
+        self.retention = retention
+        self.max_messages = max_messages
+        maxlen = max_messages if retention in ("ring", "subscribers") else None
         # channel -> (deque of Message, threading.Lock)
         self._queues: Dict[str, tuple[deque, threading.Lock]] = defaultdict(
-            lambda: (deque(), threading.Lock())
+            lambda: (deque(maxlen=maxlen), threading.Lock())
         )
+        self._subscriptions: Set[InMemorySubscription] = set()
+        self._subscriptions_lock = threading.Lock()
         self._connected = False
 
     def connect(self) -> None:
@@ -127,6 +191,23 @@ class InMemorySemantivaTransport(SemantivaTransport):
         """
         self._connected = False
 
+    def accepts(self, channel: str) -> bool:
+        """
+        Report whether a message on ``channel`` would be retained.
+
+        ``"drop"`` rejects channels that are full, and ``"subscribers"``
+        rejects channels without a matching open subscription.
+        """
+        if self.retention == "drop":
+            entry = self._queues.get(channel)
+            queued = len(entry[0]) if entry is not None else 0
+            return queued < (self.max_messages or 0)
+        if self.retention == "subscribers":
+            with self._subscriptions_lock:
+                patterns = [sub.pattern for sub in self._subscriptions]
+            return any(fnmatch(channel, pattern) for pattern in patterns)
+        return True
+
     def publish(
         self,
         channel: str,
@@ -148,15 +229,17 @@ class InMemorySemantivaTransport(SemantivaTransport):
         Returns:
             Future if require_ack=True, else None.
         """
-        q, lock = self._queues[channel]
-        msg = Message(
-            data=data,
-            context=context,
-            metadata=metadata or {},
-            ack=lambda: None,  # No-op ack for in-memory
-        )
-        with lock:
-            q.append(msg)
+        if self.retention == "keep" or self.accepts(channel):
+            q, lock = self._queues[channel]
+            msg = Message(
+                data=data,
+                context=context,
+                metadata=metadata or {},
+                ack=lambda: None,  # No-op ack for in-memory
+            )
+            with lock:
+                if self.retention != "drop" or len(q) < (self.max_messages or 0):
+                    q.append(msg)
 
         if require_ack:
             fut: Future = Future()
@@ -180,7 +263,15 @@ class InMemorySemantivaTransport(SemantivaTransport):
             InMemorySubscription instance for manual iteration if no callback,
             or a subscription with callback-driven background thread.
         """
-        sub = InMemorySubscription(self._queues, channel)
+        if self.retention != "subscribers":
+            sub = InMemorySubscription(self._queues, channel)
+        else:
+            # Open subscriptions decide which channels retain messages.
+            sub = InMemorySubscription(
+                self._queues, channel, on_close=self._forget_subscription
+            )
+            with self._subscriptions_lock:
+                self._subscriptions.add(sub)
 
         if callback:
             # Launch a daemon thread that pushes each Message to the callback
@@ -192,3 +283,7 @@ class InMemorySemantivaTransport(SemantivaTransport):
             t.start()
 
         return sub
+
+    def _forget_subscription(self, sub: InMemorySubscription) -> None:
+        with self._subscriptions_lock:
+            self._subscriptions.discard(sub)
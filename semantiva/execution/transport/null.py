@@ -0,0 +1,89 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Transport that discards every message.
+
+This is the default transport of :class:`~semantiva.pipeline.Pipeline`: node
+outputs are not published unless a real transport is supplied. Because
+:meth:`NullSemantivaTransport.accepts` returns ``False``, orchestrators skip
+publication entirely instead of building messages that would be thrown away.
+"""
+
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from semantiva.context_processors import ContextType
+
+from .base import Message, SemantivaTransport, Subscription
+
+
+class NullSubscription(Subscription):
+    """Subscription that never yields messages."""
+
+    def __iter__(self):
+        return iter(())
+
+    async def __aiter__(self):
+        return
+        yield  # pragma: no cover - makes this an async generator
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class NullSemantivaTransport(SemantivaTransport):
+    """
+    Transport that accepts no channels and retains nothing.
+
+    - publish() drops the message (acknowledging immediately when asked to).
+    - subscribe() returns an empty subscription; callbacks are never invoked.
+    - connect()/close() are no-ops.
+    """
+
+    def connect(self) -> None:
+        """No connection needed."""
+
+    def close(self) -> None:
+        """No resources to release."""
+
+    def accepts(self, channel: str) -> bool:
+        """Return ``False``: messages on any channel are discarded."""
+        return False
+
+    def publish(
+        self,
+        channel: str,
+        data: Any,
+        context: ContextType,
+        metadata: Optional[Dict[str, Any]] = None,
+        require_ack: bool = False,
+    ) -> Optional[Future]:
+        """
+        Discard the message.
+
+        Returns:
+            A completed Future if require_ack=True, else None.
+        """
+        if require_ack:
+            fut: Future = Future()
+            fut.set_result(None)
+            return fut
+        return None
+
+    def subscribe(
+        self, channel: str, *, callback: Optional[Callable[[Message], None]] = None
+    ) -> Subscription:
+        """Return a subscription that yields nothing."""
+        return NullSubscription()
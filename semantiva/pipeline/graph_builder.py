@@ -26,9 +26,15 @@ Stability guarantees
     - declaration_index/subindex are included in node canonical form to disambiguate
         otherwise-identical nodes declared in different positions.
 
-Scope
-    - Edges are emitted as a simple linear chain for demo/CLI pipelines; this preserves
-        UUID semantics and can be extended later without breaking IDs.
+Topology
+    - Edges are derived from the optional ``ports`` mapping of each node:
+        ``output`` names the node's result and ``inputs`` lists the outputs it
+        consumes. A node without ``inputs`` consumes the preceding node, so
+        pipelines that do not declare ports form the same linear chain (and keep
+        the same identities) as before. ``inputs: []`` marks an additional root
+        fed by the pipeline input.
+    - Inputs may only reference outputs of earlier-declared nodes, so declaration
+        order is always a valid topological order.
 """
 
 from __future__ import annotations
@@ -40,6 +46,7 @@ from pathlib import Path
 from typing import Any, List
 
 import yaml
+from semantiva.exceptions.pipeline_exceptions import PipelineTopologyError
 from semantiva.pipeline.node_preprocess import preprocess_node_config
 from semantiva.registry import resolve_parameters
 from semantiva.registry.descriptors import descriptor_to_json
@@ -110,6 +117,63 @@ def _canonical_node(
     return canon
 
 
+def _resolve_upstream_indices(spec: List[dict[str, Any]]) -> List[List[int]]:
+    """Return, for each declared node, the indices of the nodes it consumes.
+
+    Raises:
+        PipelineTopologyError: If ``ports`` is malformed, an output label is
+            declared twice, or an input references an unknown or later node.
+    """
+    labels: dict[str, int] = {}
+    upstream: List[List[int]] = []
+    for index, cfg in enumerate(spec):
+        ports = cfg.get("ports") or {}
+        if not isinstance(ports, dict):
+            raise PipelineTopologyError(
+                f"Node {index}: 'ports' must be a mapping, got {type(ports).__name__}"
+            )
+        unknown = sorted(set(ports) - {"inputs", "output"})
+        if unknown:
+            raise PipelineTopologyError(
+                f"Node {index}: unsupported ports {unknown}; expected 'inputs' and/or 'output'"
+            )
+        inputs = ports.get("inputs")
+        if inputs is None:
+            deps = [index - 1] if index > 0 else []
+        else:
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            if not isinstance(inputs, (list, tuple)) or not all(
+                isinstance(label, str) for label in inputs
+            ):
+                raise PipelineTopologyError(
+                    f"Node {index}: 'ports.inputs' must be a list of output labels"
+                )
+            deps = []
+            for label in inputs:
+                if label not in labels:
+                    raise PipelineTopologyError(
+                        f"Node {index}: input '{label}' does not name the output of "
+                        "an earlier node"
+                    )
+                if labels[label] not in deps:
+                    deps.append(labels[label])
+        output = ports.get("output")
+        if output is not None:
+            if not isinstance(output, str) or not output:
+                raise PipelineTopologyError(
+                    f"Node {index}: 'ports.output' must be a non-empty string"
+                )
+            if output in labels:
+                raise PipelineTopologyError(
+                    f"Node {index}: output '{output}' is already declared by node "
+                    f"{labels[output]}"
+                )
+            labels[output] = index
+        upstream.append(deps)
+    return upstream
+
+
 def build_canonical_spec(
     pipeline_or_spec: Any,
 ) -> tuple[dict[str, Any], List[dict[str, Any]]]:
@@ -148,8 +212,9 @@ def build_canonical_spec(
         nodes.append(canon_with_uuid)
         node_uuids.append(node_uuid)
     edges = [
-        {"source": node_uuids[i], "target": node_uuids[i + 1]}
-        for i in range(len(node_uuids) - 1)
+        {"source": node_uuids[source], "target": node_uuids[target]}
+        for target, sources in enumerate(_resolve_upstream_indices(resolved))
+        for source in sources
     ]
     return ({"version": 1, "nodes": nodes, "edges": edges}, resolved)
 
@@ -171,7 +236,10 @@ def compute_pipeline_id(canonical_spec: dict[str, Any]) -> str:
 
 
 def compute_upstream_map(canonical_spec: dict[str, Any]) -> dict[str, list[str]]:
-    """Return mapping of node_uuid -> list of upstream node_uuids."""
+    """Return mapping of node_uuid -> list of upstream node_uuids.
+
+    Upstream lists preserve edge order, i.e. the order of ``ports.inputs``.
+    """
 
     mapping: dict[str, list[str]] = {
         n["node_uuid"]: [] for n in canonical_spec.get("nodes", [])
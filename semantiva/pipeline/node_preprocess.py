@@ -40,6 +40,7 @@ from semantiva.data_processors.parametric_sweep_factory import (
     ParametricSweepFactory,
     RangeSpec,
     SequenceSpec,
+    SweepParallelism,
 )
 from semantiva.data_types.data_types import DataCollectionType
 from semantiva.registry.processor_registry import ProcessorRegistry
@@ -113,6 +114,18 @@ def preprocess_node_config(node_config: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(broadcast, bool):
         raise ValueError("derive.parameter_sweep.broadcast must be a boolean value")
 
+    vectorize = sweep_cfg.get("vectorize", False)
+    if not isinstance(vectorize, bool):
+        raise ValueError("derive.parameter_sweep.vectorize must be a boolean value")
+
+    parallel = None
+    parallel_spec = sweep_cfg.get("parallel")
+    if parallel_spec is not None:
+        try:
+            parallel = SweepParallelism.from_spec(parallel_spec)
+        except ValueError as exc:
+            raise ValueError(f"derive.parameter_sweep.parallel: {exc}") from exc
+
     processed_vars = _convert_var_specs(vars_spec)
 
     processor_spec = node_config.get("processor")
@@ -174,6 +187,8 @@ def preprocess_node_config(node_config: Dict[str, Any]) -> Dict[str, Any]:
         parametric_expressions=params_spec,
         mode=cast(Literal["combinatorial", "by_position"], mode),
         broadcast=broadcast,
+        vectorize=vectorize,
+        parallel=parallel,
     )
 
     new_config = dict(node_config)
@@ -51,6 +51,7 @@ See: io_operation_factory._IOOperationFactory for adapter generation details.
 from types import new_class
 from typing import Any, Dict, Optional, Type, Union
 from semantiva.data_processors.io_operation_factory import _IOOperationFactory
+from semantiva.data_processors.data_slicer_factory import SliceOptions
 from semantiva.data_io import DataSource, PayloadSource, DataSink, PayloadSink
 from semantiva.data_processors.data_processors import (
     DataOperation,
@@ -469,6 +470,9 @@ def _pipeline_node_factory(
       - "processor": The class (or a string that can be resolved to a class) for the processor.
       - "parameters": (Optional) A dictionary of parameters for the processor.
       - "context_key": (Optional) A string specifying the context key for probe injection.
+      - "slice": (Optional) Execution options for slicer processors
+        (``executor``, ``max_workers``, ``chunk_size``, ``batch``); see
+        :class:`~semantiva.data_processors.data_slicer_factory.SliceOptions`.
 
     Args:
         node_definition (Dict): A dictionary describing the node configuration.
@@ -495,6 +499,20 @@ def _pipeline_node_factory(
     if processor is None or not isinstance(processor, type):
         raise ValueError("processor must be a class type or a string, not None.")
 
+    slice_spec = node_definition.get("slice")
+    if slice_spec is not None:
+        if not hasattr(processor, "with_slice_options"):
+            raise PipelineConfigurationError(
+                f"'slice' options require a slicer processor (e.g. "
+                f"'slice:Processor:Collection'), got {processor.__name__}"
+            )
+        try:
+            processor = processor.with_slice_options(
+                SliceOptions.from_mapping(slice_spec)
+            )
+        except ValueError as exc:
+            raise PipelineConfigurationError(str(exc)) from exc
+
     if issubclass(processor, ContextProcessor):
         # pylint: disable=import-outside-toplevel
         from semantiva.workflows.fitting_model import (
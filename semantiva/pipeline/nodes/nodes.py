@@ -325,7 +325,8 @@ class _PayloadSourceNode(_DataNode):
 
         data = payload.data
         context = payload.context
-        # Save the current context to be used by the processor
+        # Collect keys injected by the processor into a fresh context per call
+        self.observer_context = ContextType()
         parameters = self._get_processor_parameters(payload.context)
         loaded_data = self.processor.process(data, **parameters)
         loaded_context = self.observer_context
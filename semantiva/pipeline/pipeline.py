@@ -29,12 +29,13 @@ from .nodes.nodes import (
 from .graph_builder import build_canonical_spec
 from semantiva.execution.transport import (
     SemantivaTransport,
-    InMemorySemantivaTransport,
+    NullSemantivaTransport,
 )
 from semantiva.execution.orchestrator.orchestrator import (
     SemantivaOrchestrator,
     LocalSemantivaOrchestrator,
 )
+from semantiva.execution.orchestrator.plan import ExecutionPlan
 from semantiva.trace.model import TraceDriver
 
 
@@ -58,7 +59,8 @@ class Pipeline(_PayloadProcessor):
             pipeline_configuration (List[Dict]): A list of dictionaries containing the pipeline configuration.
             logger (Optional[Logger], optional): An optional logger instance for logging information. Defaults to None.
             transport (Optional[SemantivaTransport], optional): An optional transport mechanism for the pipeline.
-                If not provided, an InMemorySemantivaTransport instance will be used. Defaults to None.
+                Node outputs are published to it after every node. If not provided, a
+                NullSemantivaTransport is used and nothing is published. Defaults to None.
             orchestrator (Optional[SemantivaOrchestrator], optional): An optional orchestrator for managing pipeline execution.
                 If not provided, a LocalSemantivaOrchestrator instance will be used. Defaults to None.
             trace (Optional[TraceDriver], optional): An optional trace driver for capturing execution events.
@@ -72,7 +74,7 @@ class Pipeline(_PayloadProcessor):
 
         super().__init__(logger)
         self.pipeline_configuration = pipeline_configuration
-        self.transport = transport or InMemorySemantivaTransport()
+        self.transport = transport or NullSemantivaTransport()
         self.orchestrator = orchestrator or LocalSemantivaOrchestrator()
         self.trace = trace
         self._run_metadata: dict[str, Any] | None = None
@@ -83,6 +85,7 @@ class Pipeline(_PayloadProcessor):
         self.resolved_spec = resolved
 
         self.nodes = []
+        self._plan: ExecutionPlan | None = None
         if self.logger:
             self.logger.debug(f"Initialized {self.__class__.__name__}")
 
@@ -105,6 +108,9 @@ class Pipeline(_PayloadProcessor):
         self.stop_watch.start()  # existing pipeline timer start
 
         run_meta = self._run_metadata
+        plan_kwargs: Dict[str, Any] = {}
+        if hasattr(self.orchestrator, "compile"):
+            plan_kwargs["plan"] = self._plan or self.compile()
         result_payload = self.orchestrator.execute(
             pipeline_spec=self.resolved_spec,
             payload=payload,
@@ -113,6 +119,7 @@ class Pipeline(_PayloadProcessor):
             trace=self.trace,
             canonical_spec=self.canonical_spec,
             run_metadata=run_meta,
+            **plan_kwargs,
         )
 
         self.nodes = self.orchestrator.last_nodes
@@ -127,6 +134,32 @@ class Pipeline(_PayloadProcessor):
         )
         return result_payload
 
+    def compile(self) -> ExecutionPlan:
+        """
+        Compile the pipeline into a reusable execution plan.
+
+        Nodes are instantiated once and payload-independent facts (graph
+        topology, semantic IDs, required context keys, declared and default
+        parameters, static SER fields) are computed up front. Subsequent calls
+        to :meth:`process` reuse the plan, so node instances and their timers
+        persist across runs. ``process`` compiles on first use; call this
+        method explicitly to surface configuration errors early or to
+        recompile after changing the orchestrator.
+
+        Returns:
+            ExecutionPlan: The compiled plan, also stored on the pipeline.
+        """
+        self._plan = self.orchestrator.compile(
+            self.resolved_spec, self.logger, canonical_spec=self.canonical_spec
+        )
+        self.nodes = self._plan.pipeline_nodes
+        return self._plan
+
+    @property
+    def execution_plan(self) -> Optional[ExecutionPlan]:
+        """The compiled execution plan, or ``None`` before the first compile."""
+        return self._plan
+
     def set_run_metadata(self, metadata: Optional[Dict[str, Any]]) -> None:
         """Set metadata that should be attached to the next run for tracing."""
 
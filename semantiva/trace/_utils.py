@@ -178,6 +178,35 @@ def sha256_bytes(data: bytes) -> str:
     return "sha256-" + h.hexdigest()
 
 
+def parse_detail_flags(detail: str | None) -> dict[str, bool]:
+    """Parse a comma-separated trace ``detail`` string into summary flags.
+
+    Flags are case-insensitive and whitespace is ignored; ``all`` enables every
+    summary flag (``hash``, ``repr``, ``context``), ``timing`` alone disables
+    every flag (timing-only records) and unknown flags are ignored. ``hash`` is
+    enabled when no summary flag is. ``resources`` (per-node resource
+    accounting) is never implied and must be requested explicitly.
+    """
+
+    flags = (detail or "hash").split(",")
+    opts = {"hash": False, "repr": False, "context": False}
+    resources = False
+    timing_only = False
+    for flag in [f.strip().lower() for f in flags]:
+        if flag == "all":
+            opts = {k: True for k in opts}
+        elif flag in opts:
+            opts[flag] = True
+        elif flag == "resources":
+            resources = True
+        elif flag == "timing":
+            timing_only = True
+    if not any(opts.values()) and not timing_only:
+        opts["hash"] = True
+    opts["resources"] = resources
+    return opts
+
+
 def context_to_kv_repr(mapping: Mapping[str, object], *, max_pairs: int = 150) -> str:
     """Return a deterministic ``k=v`` comma-separated string for ``mapping``.
 
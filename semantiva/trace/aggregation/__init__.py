@@ -20,14 +20,21 @@ from .models import (
     RunCompleteness,
     LaunchAggregate,
     LaunchCompleteness,
+    NodeSummary,
+    TraceSummary,
 )
 from .aggregator import TraceAggregator
+from .streaming import StreamingTraceAggregator, summarize_traces
 
 __all__ = [
     "TraceAggregator",
+    "StreamingTraceAggregator",
+    "summarize_traces",
     "NodeAggregate",
     "RunAggregate",
     "RunCompleteness",
     "LaunchAggregate",
     "LaunchCompleteness",
+    "NodeSummary",
+    "TraceSummary",
 ]
@@ -16,8 +16,10 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, cast
 
+from ..segments import iter_trace_records
 from .models import (
     LaunchAggregate,
     LaunchCompleteness,
@@ -61,6 +63,48 @@ class TraceAggregator:
         for record in records:
             self.ingest(record)
 
+    def ingest_path(
+        self,
+        path: str | Path,
+        *,
+        run_id: str | None = None,
+        run_space_launch_id: str | None = None,
+    ) -> None:
+        """Stream records from a trace file or directory into the aggregator.
+
+        Accepts plain, gzip (``.gz``) and lzma (``.xz``) JSONL files and
+        segment directories; see :func:`semantiva.trace.segments.iter_trace_records`
+        for the meaning of the filters.
+        """
+
+        self.ingest_many(
+            iter_trace_records(
+                path, run_id=run_id, run_space_launch_id=run_space_launch_id
+            )
+        )
+
+    def merge(self, other: "TraceAggregator") -> None:
+        """Merge the state of ``other`` into this aggregator.
+
+        ``other`` is assumed to hold records written *after* the ones ingested
+        here (e.g. the next chunk or segment of the same trace): its latest
+        node status, timing and error win, counts are summed and timestamps
+        widen. ``other`` must not be used afterwards.
+        """
+
+        for run in other._runs.values():
+            mine = self._runs.get(run.run_id)
+            if mine is None:
+                self._runs[run.run_id] = run
+            else:
+                _merge_run(mine, run)
+        for key, launch in other._launches.items():
+            current = self._launches.get(key)
+            if current is None:
+                self._launches[key] = launch
+            else:
+                _merge_launch(current, launch)
+
     # ---- query helpers ---------------------------------------------------------
     def get_run(self, run_id: str) -> Optional[RunAggregate]:
         """Return the aggregate for ``run_id`` if known."""
@@ -255,6 +299,30 @@ class TraceAggregator:
             summary=summary,
         )
 
+    def completed_run_space_indices(
+        self, launch_id: str, *, before_attempt: int | None = None
+    ) -> set[int]:
+        """Return the ``run_space_index`` of every successful run of a launch.
+
+        A run counts when :meth:`finalize_run` reports it ``complete`` and its
+        ``pipeline_end`` summary has status ``ok``. Runs of every attempt are
+        considered, or only of attempts below ``before_attempt`` when given.
+        """
+
+        indices: set[int] = set()
+        for run in self._runs.values():
+            if run.run_space_launch_id != launch_id or run.run_space_index is None:
+                continue
+            if before_attempt is not None and (
+                run.run_space_attempt is None or run.run_space_attempt >= before_attempt
+            ):
+                continue
+            if run.end_status != "ok":
+                continue
+            if self.finalize_run(run.run_id).status == "complete":
+                indices.add(run.run_space_index)
+        return indices
+
     def finalize_all(self) -> Tuple[List[RunCompleteness], List[LaunchCompleteness]]:
         """Compute completeness for every run and launch in deterministic order."""
 
@@ -331,6 +399,9 @@ class TraceAggregator:
             run.run_space_launch_id = launch_id
         if attempt is not None:
             run.run_space_attempt = attempt
+        index = _coerce_int(record.get("run_space_index"))
+        if index is not None:
+            run.run_space_index = index
         if launch_id is not None and attempt is not None:
             key = (launch_id, attempt)
             launch = self._launches.get(key)
@@ -350,6 +421,9 @@ class TraceAggregator:
             run = RunAggregate(run_id=run_id)
             self._runs[run_id] = run
         run.saw_end = True
+        summary = record.get("summary")
+        if isinstance(summary, dict) and summary.get("status") is not None:
+            run.end_status = str(summary["status"])
         timestamp = record.get("timestamp") or (record.get("timing") or {}).get(
             "finished_at"
         )
@@ -389,6 +463,67 @@ class TraceAggregator:
         node.last_error = record.get("error") if status == "error" else None
 
 
+def _merge_run(run: RunAggregate, later: RunAggregate) -> None:
+    run.saw_start = run.saw_start or later.saw_start
+    run.saw_end = run.saw_end or later.saw_end
+    for attr in (
+        "pipeline_id",
+        "pipeline_spec_canonical",
+        "meta",
+        "run_space_launch_id",
+        "run_space_attempt",
+        "run_space_index",
+        "end_status",
+    ):
+        value = getattr(later, attr)
+        if value is not None:
+            setattr(run, attr, value)
+    run.start_timestamp = _min_ts(run.start_timestamp, later.start_timestamp)
+    run.end_timestamp = _max_ts(run.end_timestamp, later.end_timestamp)
+    for node_id, node in later.nodes.items():
+        mine = run.nodes.get(node_id)
+        if mine is None:
+            run.nodes[node_id] = node
+            continue
+        mine.first_timestamp = _min_ts(mine.first_timestamp, node.first_timestamp)
+        mine.last_timestamp = _max_ts(mine.last_timestamp, node.last_timestamp)
+        if node.last_seq is not None:
+            mine.last_seq = node.last_seq
+        for status, count in node.counts.items():
+            mine.counts[status] = mine.counts.get(status, 0) + count
+        if node.last_status is not None:
+            mine.last_status = node.last_status
+            mine.timing = node.timing
+            mine.last_error = node.last_error
+
+
+def _merge_launch(launch: LaunchAggregate, later: LaunchAggregate) -> None:
+    launch.saw_start = launch.saw_start or later.saw_start
+    launch.saw_end = launch.saw_end or later.saw_end
+    for attr in (
+        "run_space_spec_id",
+        "run_space_inputs_id",
+        "planned_run_count",
+        "input_fingerprints",
+    ):
+        value = getattr(later, attr)
+        if value is not None:
+            setattr(launch, attr, value)
+    launch.pipelines |= later.pipelines
+
+
+def _min_ts(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    if a is None or (b is not None and b < a):
+        return b
+    return a
+
+
+def _max_ts(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    if a is None or (b is not None and b > a):
+        return b
+    return a
+
+
 def _expected_nodes(spec: Optional[Dict[str, Any]]) -> Optional[set[str]]:
     if not spec:
         return None
@@ -16,7 +16,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional, Set, Literal
 
 TerminalStatus = Literal["succeeded", "error", "skipped", "cancelled"]
@@ -46,6 +46,8 @@ class RunAggregate:
     meta: Optional[Dict[str, Any]] = None
     run_space_launch_id: Optional[str] = None
     run_space_attempt: Optional[int] = None
+    run_space_index: Optional[int] = None
+    end_status: Optional[str] = None
     saw_start: bool = False
     saw_end: bool = False
     start_timestamp: Optional[str] = None
@@ -90,3 +92,95 @@ class LaunchCompleteness:
     status: Literal["complete", "partial", "invalid"]
     problems: List[str]
     summary: Dict[str, Any]
+
+
+@dataclass
+class NodeSummary:
+    """Per-node statistics accumulated over finalized runs."""
+
+    node_id: str
+    processor_ref: Optional[str] = None
+    runs: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+    total_wall_ms: float = 0.0
+    max_wall_ms: float = 0.0
+
+
+@dataclass
+class TraceSummary:
+    """Bounded summary of a streamed trace collection.
+
+    Only counters, per-node statistics, launch verdicts and at most
+    ``max_problem_runs`` non-complete run verdicts are kept.
+    """
+
+    files: int = 0
+    max_problem_runs: int = 20
+    runs_by_status: Dict[str, int] = field(
+        default_factory=lambda: {"complete": 0, "partial": 0, "invalid": 0}
+    )
+    launches: List[LaunchCompleteness] = field(default_factory=list)
+    problem_runs: List[RunCompleteness] = field(default_factory=list)
+    problem_runs_omitted: int = 0
+    nodes: Dict[str, NodeSummary] = field(default_factory=dict)
+
+    def add_run(self, run: RunAggregate, completeness: RunCompleteness) -> None:
+        """Account for a finalized run."""
+
+        self.runs_by_status[completeness.status] += 1
+        if completeness.status != "complete":
+            if len(self.problem_runs) < self.max_problem_runs:
+                self.problem_runs.append(completeness)
+            else:
+                self.problem_runs_omitted += 1
+        refs: Dict[str, Any] = {}
+        spec_nodes = (run.pipeline_spec_canonical or {}).get("nodes")
+        if isinstance(spec_nodes, list):
+            refs = {
+                str(entry["node_uuid"]): entry.get("processor_ref")
+                for entry in spec_nodes
+                if isinstance(entry, dict) and entry.get("node_uuid") is not None
+            }
+        for node_id, node in run.nodes.items():
+            stats = self.nodes.get(node_id)
+            if stats is None:
+                stats = NodeSummary(node_id=node_id)
+                self.nodes[node_id] = stats
+            if stats.processor_ref is None:
+                stats.processor_ref = refs.get(node_id)
+            stats.runs += 1
+            for status, count in node.counts.items():
+                stats.counts[status] = stats.counts.get(status, 0) + count
+            wall_ms = node.timing.get("wall_ms")
+            if isinstance(wall_ms, (int, float)):
+                stats.total_wall_ms += wall_ms
+                stats.max_wall_ms = max(stats.max_wall_ms, wall_ms)
+
+    def add_launch(
+        self, launch: LaunchAggregate, completeness: LaunchCompleteness
+    ) -> None:
+        """Account for a finalized launch attempt."""
+
+        self.launches.append(completeness)
+
+    @property
+    def runs_total(self) -> int:
+        return sum(self.runs_by_status.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-ready representation."""
+
+        return {
+            "files": self.files,
+            "runs_total": self.runs_total,
+            "runs_by_status": dict(self.runs_by_status),
+            "launches": [asdict(launch) for launch in self.launches],
+            "problem_runs": [asdict(run) for run in self.problem_runs],
+            "problem_runs_omitted": self.problem_runs_omitted,
+            "nodes": [
+                asdict(node)
+                for node in sorted(
+                    self.nodes.values(), key=lambda n: n.total_wall_ms, reverse=True
+                )
+            ],
+        }
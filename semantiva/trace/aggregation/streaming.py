@@ -0,0 +1,272 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming aggregation of large trace collections.
+
+:class:`StreamingTraceAggregator` finalizes a run as soon as its
+``pipeline_end`` record arrives and a launch at its ``run_space_end``, hands
+the verdicts to callbacks and evicts the state, so memory is bounded by the
+runs still in flight instead of the size of the trace.
+
+:func:`summarize_traces` reads any number of plain or compressed JSONL files
+and segment directories. With ``workers > 1`` the files are cut into chunks
+(byte ranges of plain files, whole compressed files) that a process pool
+parses into partial :class:`~semantiva.trace.aggregation.TraceAggregator`
+states; the partials are merged in file order, which keeps the incremental
+finalization exact.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..segments import iter_trace_records, list_trace_files
+from .aggregator import TraceAggregator, _coerce_int
+from .models import (
+    LaunchAggregate,
+    LaunchCompleteness,
+    RunAggregate,
+    RunCompleteness,
+    TraceSummary,
+)
+
+#: Default size of the byte ranges plain JSONL files are cut into.
+DEFAULT_CHUNK_BYTES = 32 << 20
+
+RunCallback = Callable[[RunAggregate, RunCompleteness], None]
+LaunchCallback = Callable[[LaunchAggregate, LaunchCompleteness], None]
+
+#: ``(path, start, end)``; ``end`` is ``None`` for a whole file.
+_Chunk = Tuple[str, int, Optional[int]]
+
+
+class StreamingTraceAggregator(TraceAggregator):
+    """Trace aggregator that finalizes and evicts runs and launches early.
+
+    Records must be ingested in write order, as read from a trace file or
+    segment directory. A run is finalized when its ``pipeline_end`` record
+    (or a merged partial containing it) arrives; a launch attempt when its
+    ``run_space_end`` arrives, together with any of its runs that never
+    ended. Verdicts of runs that belong to an open launch are kept until the
+    launch is finalized. :meth:`finish` finalizes whatever is left.
+
+    Args:
+        on_run: Called with ``(run, completeness)`` for every finalized run.
+        on_launch: Called with ``(launch, completeness)`` for every finalized
+            launch attempt.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_run: RunCallback | None = None,
+        on_launch: LaunchCallback | None = None,
+    ) -> None:
+        super().__init__()
+        self._on_run = on_run
+        self._on_launch = on_launch
+        self._held: Dict[str, RunCompleteness] = {}
+
+    @property
+    def open_runs(self) -> int:
+        """Number of runs currently held in memory."""
+
+        return len(self._runs)
+
+    def ingest(self, record: Dict[str, Any]) -> None:
+        super().ingest(record)
+        record_type = record.get("record_type")
+        if record_type == "pipeline_end":
+            self._retire_run(record.get("run_id"))
+        elif record_type == "run_space_end":
+            self._retire_launch(
+                (
+                    record.get("run_space_launch_id"),
+                    _coerce_int(record.get("run_space_attempt")),
+                )
+            )
+
+    def merge(self, other: TraceAggregator) -> None:
+        ended_runs = [run.run_id for run in other.iter_runs() if run.saw_end]
+        ended_launches = [
+            (launch.run_space_launch_id, launch.run_space_attempt)
+            for launch in other.iter_launches()
+            if launch.saw_end
+        ]
+        super().merge(other)
+        for run_id in ended_runs:
+            self._retire_run(run_id)
+        for key in ended_launches:
+            self._retire_launch(key)
+
+    def finalize_run(self, run_id: str) -> RunCompleteness:
+        held = self._held.get(run_id)
+        if held is not None and run_id not in self._runs:
+            return held
+        return super().finalize_run(run_id)
+
+    def finish(self) -> None:
+        """Finalize and evict all runs and launches that are still open."""
+
+        for key in list(self._launches):
+            self._retire_launch(key)
+        for run_id in list(self._runs):
+            self._retire_run(run_id)
+
+    # ---- private helpers -------------------------------------------------------
+    def _retire_run(self, run_id: Any) -> None:
+        run = self._runs.get(run_id)
+        if run is None:
+            return
+        completeness = super().finalize_run(run_id)
+        del self._runs[run_id]
+        if (run.run_space_launch_id, run.run_space_attempt) in self._launches:
+            self._held[run_id] = completeness
+        if self._on_run is not None:
+            self._on_run(run, completeness)
+
+    def _retire_launch(self, key: Tuple[Any, Optional[int]]) -> None:
+        launch = self._launches.get(key)  # type: ignore[arg-type]
+        if launch is None:
+            return
+        for run_id in sorted(launch.pipelines):
+            self._retire_run(run_id)
+        completeness = self.finalize_launch(
+            launch.run_space_launch_id, launch.run_space_attempt
+        )
+        del self._launches[key]  # type: ignore[arg-type]
+        for run_id in launch.pipelines:
+            self._held.pop(run_id, None)
+        if self._on_launch is not None:
+            self._on_launch(launch, completeness)
+
+
+def iter_partial_aggregates(
+    files: Iterable[str | Path],
+    *,
+    workers: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[TraceAggregator]:
+    """Parse ``files`` on a process pool and yield partial aggregates in order.
+
+    Plain files larger than ``chunk_bytes`` are split into line-aligned byte
+    ranges; compressed files are parsed whole. At most ``2 * workers`` chunks
+    are in flight.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be a positive integer")
+    window = 2 * workers
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in _iter_chunks(files, chunk_bytes):
+            pending.append(pool.submit(_aggregate_chunk, chunk))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def summarize_traces(
+    paths: Sequence[str | Path],
+    *,
+    workers: int = 1,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_problem_runs: int = 20,
+) -> TraceSummary:
+    """Summarize trace files and directories in bounded memory.
+
+    Args:
+        paths: Trace files (``.jsonl``, ``.jsonl.gz``, ``.jsonl.xz``) and
+            directories, in write order.
+        workers: Parser processes; ``1`` streams records in-process.
+        chunk_bytes: Byte range size for splitting plain files across workers.
+        max_problem_runs: Number of non-complete run verdicts to keep.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    files = [file for path in paths for file in list_trace_files(path)]
+    summary = TraceSummary(files=len(files), max_problem_runs=max_problem_runs)
+    aggregator = StreamingTraceAggregator(
+        on_run=summary.add_run, on_launch=summary.add_launch
+    )
+    if workers == 1:
+        for file in files:
+            aggregator.ingest_many(iter_trace_records(file))
+    else:
+        for partial in iter_partial_aggregates(
+            files, workers=workers, chunk_bytes=chunk_bytes
+        ):
+            aggregator.merge(partial)
+    aggregator.finish()
+    return summary
+
+
+def _iter_chunks(files: Iterable[str | Path], chunk_bytes: int) -> Iterator[_Chunk]:
+    for file in files:
+        path = str(file)
+        if path.endswith((".gz", ".xz")):
+            yield (path, 0, None)
+            continue
+        size = os.path.getsize(path)
+        if size <= chunk_bytes:
+            yield (path, 0, None)
+            continue
+        for start in range(0, size, chunk_bytes):
+            yield (path, start, min(start + chunk_bytes, size))
+
+
+def _aggregate_chunk(chunk: _Chunk) -> TraceAggregator:
+    path, start, end = chunk
+    aggregator = TraceAggregator()
+    if end is None:
+        aggregator.ingest_many(iter_trace_records(path))
+        return aggregator
+    with open(path, "rb") as handle:
+        # A line belongs to the chunk its first byte falls in.
+        if start:
+            handle.seek(start - 1)
+            handle.readline()
+        while handle.tell() < end:
+            line = handle.readline()
+            if not line:
+                break
+            if line.strip():
+                aggregator.ingest(json.loads(line))
+    return aggregator
+
+
+__all__ = [
+    "DEFAULT_CHUNK_BYTES",
+    "StreamingTraceAggregator",
+    "iter_partial_aggregates",
+    "summarize_traces",
+]
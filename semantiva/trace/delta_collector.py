@@ -15,6 +15,11 @@
 """Context change tracking and summarization for execution traces.
 
 Computes minimal delta records capturing created, updated, and read context keys for SER evidence.
+When the context's write journal is available (see
+:meth:`~semantiva.context_processors.ContextType.journal_since`), only the keys
+written by the node are examined; otherwise the pre- and post-contexts are
+diffed in full. Values are compared and hashed with a
+:class:`~semantiva.trace.hashing.ContentHasher`.
 """
 
 from __future__ import annotations
@@ -22,7 +27,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, Set
 
-from ._utils import serialize, sha256_bytes, safe_repr
+from semantiva.context_processors.context_types import ContextChanges
+
+from ._utils import safe_repr
+from .hashing import ContentHasher
 
 
 def _len_or_none(v: Any) -> int | None:
@@ -42,10 +50,10 @@ def _rows_or_none(v: Any) -> int | None:
     return None
 
 
-def _stable_equal(a: Any, b: Any) -> bool:
-    # conservative: byte-level compare of safe serialization
+def _stable_equal(hasher: ContentHasher, a: Any, b: Any) -> bool:
+    # conservative: compare content digests
     try:
-        return serialize(a) == serialize(b)
+        return hasher.digest(a) == hasher.digest(b)
     except Exception:
         return a == b
 
@@ -74,11 +82,19 @@ class DeltaCollector:
     summary that lists declared read keys, newly created keys, updated keys,
     and per-key ContextKeySummary-style metadata. Hashing and string
     representation are optional and controlled by the constructor flags.
+    Passing a shared ``hasher`` reuses its memoized digests.
     """
 
-    def __init__(self, *, enable_hash: bool, enable_repr: bool):
+    def __init__(
+        self,
+        *,
+        enable_hash: bool,
+        enable_repr: bool,
+        hasher: ContentHasher | None = None,
+    ):
         self.enable_hash = enable_hash
         self.enable_repr = enable_repr
+        self.hasher = hasher if hasher is not None else ContentHasher()
 
     def compute(
         self,
@@ -87,18 +103,48 @@ class DeltaCollector:
         required_keys: Iterable[str] | None = None,
     ) -> dict:
         """Compare two context dictionaries and return a minimal delta summary."""
-        required = sorted(set(required_keys or []))
-
         pre_keys = set(pre_ctx.keys())
         post_keys = set(post_ctx.keys())
 
         created: Set[str] = post_keys - pre_keys
         maybe_updated: Set[str] = post_keys & pre_keys
+        return self._delta(pre_ctx, post_ctx, created, maybe_updated, required_keys)
+
+    def compute_from_journal(
+        self,
+        changes: ContextChanges,
+        pre_ctx: Dict[str, Any],
+        post_ctx: Dict[str, Any],
+        required_keys: Iterable[str] | None = None,
+    ) -> dict:
+        """Return the delta summary for the keys recorded in ``changes``.
+
+        Produces the same result as :meth:`compute` for contexts mutated
+        through their journaled methods, but only compares the written keys:
+        a written key whose value is unchanged is not reported as updated.
+        """
+        return self._delta(
+            pre_ctx,
+            post_ctx,
+            set(changes.created),
+            set(changes.updated),
+            required_keys,
+        )
 
+    def _delta(
+        self,
+        pre_ctx: Dict[str, Any],
+        post_ctx: Dict[str, Any],
+        created: Set[str],
+        maybe_updated: Set[str],
+        required_keys: Iterable[str] | None,
+    ) -> dict:
+        required = sorted(set(required_keys or []))
         updated = sorted(
             k
             for k in maybe_updated
-            if not _stable_equal(pre_ctx.get(k), post_ctx.get(k))
+            if pre_ctx.get(k) is not post_ctx.get(k)
+            and not _stable_equal(self.hasher, pre_ctx.get(k), post_ctx.get(k))
         )
         created_list = sorted(created)
 
@@ -113,7 +159,7 @@ class DeltaCollector:
             }
             if self.enable_hash:
                 try:
-                    rec["sha256"] = sha256_bytes(serialize(v))
+                    rec["sha256"] = self.hasher.hexdigest(v)
                 except Exception:
                     pass
             if self.enable_repr:
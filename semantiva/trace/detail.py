@@ -0,0 +1,145 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Trace detail policies: run sampling and per-node detail overrides.
+
+A driver's ``detail`` flags (``hash``, ``repr``, ``context``, ``resources``)
+decide which summaries the orchestrator computes for a node. Two driver options refine
+them:
+
+``sample_every``
+    Only every N-th run-space run (``run_space_index % N == 0``) is traced
+    at the configured detail; the other runs are traced timing-only. Runs
+    outside a run-space always use the configured detail.
+
+``node_detail``
+    Mapping of node selector to detail string, applied in every run. A
+    selector is a node UUID, a processor class name or fully qualified
+    reference, or one of the role keywords ``sources``, ``sinks`` and
+    ``probes``; the most specific matching selector wins (UUID, then
+    processor, then role).
+
+Drivers expose both through ``get_options()``;
+:meth:`TraceDetailPolicy.from_options` reads them back in the orchestrator.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping
+
+from ._utils import parse_detail_flags
+
+#: Role keywords accepted as ``node_detail`` selectors.
+NODE_ROLES = ("sources", "sinks", "probes")
+
+#: Detail flags of a timing-only trace.
+TIMING_ONLY: Mapping[str, bool] = MappingProxyType(
+    {"hash": False, "repr": False, "context": False, "resources": False}
+)
+
+
+def detail_policy_options(
+    *, sample_every: int = 1, node_detail: Mapping[str, Any] | None = None
+) -> Dict[str, Any]:
+    """Validate sampling options of a driver and return them for ``get_options``.
+
+    Raises:
+        ValueError: If ``sample_every`` is not a positive integer or
+            ``node_detail`` is not a mapping of selectors to detail strings.
+    """
+
+    if isinstance(sample_every, bool) or not isinstance(sample_every, int):
+        raise ValueError("sample_every must be a positive integer")
+    if sample_every < 1:
+        raise ValueError("sample_every must be a positive integer")
+    options: Dict[str, Any] = {}
+    if sample_every > 1:
+        options["sample_every"] = sample_every
+    if node_detail:
+        if not isinstance(node_detail, Mapping):
+            raise ValueError("node_detail must map node selectors to detail strings")
+        parsed: Dict[str, Dict[str, bool]] = {}
+        for selector, detail in node_detail.items():
+            if detail is not None and not isinstance(detail, str):
+                raise ValueError(
+                    f"node_detail[{selector!r}] must be a detail string, "
+                    f"got {type(detail).__name__}"
+                )
+            parsed[str(selector)] = parse_detail_flags(detail)
+        options["node_detail"] = parsed
+    return options
+
+
+@dataclass(frozen=True)
+class TraceDetailPolicy:
+    """Resolve the detail flags of a run and of its nodes.
+
+    Attributes:
+        flags: Detail flags configured on the driver.
+        sample_every: Trace every N-th run-space run at ``flags``.
+        node_detail: Detail flags per node selector.
+    """
+
+    flags: Mapping[str, bool]
+    sample_every: int = 1
+    node_detail: Mapping[str, Mapping[str, bool]] = field(default_factory=dict)
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> "TraceDetailPolicy":
+        """Build a policy from merged ``get_options()`` output."""
+
+        flags = {key: bool(options.get(key)) for key in TIMING_ONLY}
+        sample_every = options.get("sample_every") or 1
+        node_detail = options.get("node_detail") or {}
+        return cls(
+            flags=flags,
+            sample_every=int(sample_every),
+            node_detail={
+                str(selector): {key: bool(value.get(key)) for key in TIMING_ONLY}
+                for selector, value in node_detail.items()
+            },
+        )
+
+    def run_flags(self, run_space_index: int | None) -> Dict[str, bool]:
+        """Return the detail flags of a run with ``run_space_index``."""
+
+        if (
+            self.sample_every > 1
+            and run_space_index is not None
+            and run_space_index % self.sample_every
+        ):
+            return dict(TIMING_ONLY)
+        return dict(self.flags)
+
+    def node_flags(
+        self,
+        run_flags: Mapping[str, bool],
+        *,
+        node_id: str,
+        processor_names: Iterable[str] = (),
+        roles: Iterable[str] = (),
+    ) -> Mapping[str, bool]:
+        """Return the detail flags of a node, falling back to ``run_flags``."""
+
+        overrides = self.node_detail
+        if not overrides:
+            return run_flags
+        for selectors in ((node_id,), processor_names, roles):
+            for selector in selectors:
+                flags = overrides.get(selector)
+                if flags is not None:
+                    return flags
+        return run_flags
@@ -20,4 +20,5 @@ including comprehensive error handling and resource cleanup.
 
 Available Drivers:
 - JsonlTraceDriver: Append-only JSONL files with background buffering and error event capture
+- SqliteTraceDriver: Local SQLite database with indexed identity and timing columns
 """
@@ -0,0 +1,177 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Trace stream record construction shared by the built-in drivers.
+
+The builders return the lifecycle records documented in
+docs/source/trace_stream_v1.rst; :func:`serialize_record` turns any record,
+including :class:`~semantiva.trace.model.SERRecord` events, into its JSON line.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict
+
+# Record kinds handed to ``serialize_record``.
+START, NODE, PLAIN = "start", "node", "plain"
+
+
+def now_timestamp() -> str:
+    """Generate RFC3339 timestamp with millisecond precision and UTC 'Z'."""
+    return datetime.now().replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z"
+
+
+def node_record(event: Any) -> Dict[str, Any]:
+    """Return the JSON-ready mapping of an SER event.
+
+    Top-level ``None`` values are removed so the record conforms to the SER
+    schema (which disallows null for object fields like 'error').
+    """
+    record = asdict(event)
+    return {k: v for k, v in record.items() if v is not None}
+
+
+def serialize_record(kind: str, record: Any) -> str:
+    """Return the JSON line for ``record`` (an SER event for ``NODE``)."""
+    if kind == NODE:
+        record = node_record(record)
+    try:
+        return json.dumps(record, sort_keys=True) + "\n"
+    except TypeError:
+        if kind == START:
+            logging.getLogger(__name__).warning(
+                "pipeline_spec_canonical not JSON serializable; omitting from trace"
+            )
+            record = dict(record)
+            record.pop("pipeline_spec_canonical", None)
+            return json.dumps(record, sort_keys=True) + "\n"
+        if kind == NODE:
+            # Fall back to omitting problematic fields if serialization fails
+            cleaned = {
+                k: v
+                for k, v in record.items()
+                if isinstance(v, (str, int, float, bool, dict, list))
+            }
+            return json.dumps(cleaned, sort_keys=True) + "\n"
+        raise
+
+
+def pipeline_start_record(
+    *,
+    seq: int,
+    pipeline_id: str,
+    run_id: str,
+    pipeline_spec_canonical: dict,
+    meta: dict,
+    run_space_launch_id: str | None = None,
+    run_space_attempt: int | None = None,
+    run_space_index: int | None = None,
+    run_space_context: dict | None = None,
+) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "record_type": "pipeline_start",
+        "schema_version": 1,
+        "timestamp": now_timestamp(),
+        "seq": seq,
+        "pipeline_id": pipeline_id,
+        "run_id": run_id,
+        "pipeline_spec_canonical": pipeline_spec_canonical,
+        "meta": meta,
+    }
+    if run_space_launch_id is not None:
+        record["run_space_launch_id"] = run_space_launch_id
+    if run_space_attempt is not None:
+        record["run_space_attempt"] = run_space_attempt
+    if run_space_index is not None:
+        record["run_space_index"] = run_space_index
+    if run_space_context is not None:
+        record["run_space_context"] = run_space_context
+    return record
+
+
+def pipeline_end_record(*, seq: int, run_id: str, summary: dict) -> Dict[str, Any]:
+    return {
+        "record_type": "pipeline_end",
+        "schema_version": 1,
+        "timestamp": now_timestamp(),
+        "seq": seq,
+        "run_id": run_id,
+        "summary": summary,
+    }
+
+
+def run_space_start_record(
+    *,
+    seq: int,
+    run_id: str,
+    run_space_spec_id: str,
+    run_space_launch_id: str,
+    run_space_attempt: int,
+    run_space_combine_mode: str,
+    run_space_total_runs: int,
+    run_space_max_runs_limit: int | None = None,
+    run_space_inputs_id: str | None = None,
+    run_space_input_fingerprints: list[dict[str, Any]] | None = None,
+    run_space_planned_run_count: int | None = None,
+    run_space_resumed_from: dict | None = None,
+) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "record_type": "run_space_start",
+        "schema_version": 1,
+        "timestamp": now_timestamp(),
+        "seq": seq,
+        "run_id": run_id,
+        "run_space_spec_id": run_space_spec_id,
+        "run_space_launch_id": run_space_launch_id,
+        "run_space_attempt": run_space_attempt,
+        "run_space_combine_mode": run_space_combine_mode,
+        "run_space_total_runs": run_space_total_runs,
+    }
+    if run_space_max_runs_limit is not None:
+        record["run_space_max_runs_limit"] = run_space_max_runs_limit
+    if run_space_inputs_id is not None:
+        record["run_space_inputs_id"] = run_space_inputs_id
+    if run_space_input_fingerprints:
+        record["run_space_input_fingerprints"] = run_space_input_fingerprints
+    if run_space_planned_run_count is not None:
+        record["run_space_planned_run_count"] = run_space_planned_run_count
+    if run_space_resumed_from is not None:
+        record["run_space_resumed_from"] = run_space_resumed_from
+    return record
+
+
+def run_space_end_record(
+    *,
+    seq: int,
+    run_id: str,
+    run_space_launch_id: str,
+    run_space_attempt: int,
+    summary: dict | None = None,
+) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "record_type": "run_space_end",
+        "schema_version": 1,
+        "timestamp": now_timestamp(),
+        "seq": seq,
+        "run_id": run_id,
+        "run_space_launch_id": run_space_launch_id,
+        "run_space_attempt": run_space_attempt,
+    }
+    if summary:
+        record["summary"] = summary
+    return record
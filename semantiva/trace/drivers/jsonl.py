@@ -16,25 +16,179 @@
 
 Detailed SER fields, versioning, and trace detail flags are described in
 docs/source/ser.rst.
+
+By default records are serialized and written on the calling (execution)
+thread. In *buffered* mode the driver only stamps lifecycle records and hands
+them to a background writer thread through a bounded queue; the writer
+serializes them and writes them in batches. ``flush()`` and ``close()`` wait
+until every record emitted so far is on disk.
+
+When rotation or compression is enabled, records of all runs go to the
+segments of a :class:`~semantiva.trace.segments.SegmentedTraceWriter` instead
+of one file per run.
 """
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import IO, Optional, Dict, Any
+from typing import IO, Optional, Dict, Any, List, Mapping, Tuple, cast
 import logging
 
+from .._utils import parse_detail_flags
+from ..detail import detail_policy_options
 from ..model import SERRecord, TraceDriver
+from ..segments import COMPRESSION_CODECS, SegmentedTraceWriter
+from ._records import (
+    NODE as _NODE,
+    PLAIN as _PLAIN,
+    START as _START,
+    now_timestamp,
+    pipeline_end_record,
+    pipeline_start_record,
+    run_space_end_record,
+    run_space_start_record,
+    serialize_record,
+)
+
+#: Behaviours when the buffered writer's queue is full.
+BACKPRESSURE_POLICIES = ("block", "drop")
+
+_serialize = serialize_record
+
+
+def _record_ids(kind: str, record: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Return ``(run_id, run_space_launch_id)`` of a record for segment indexing."""
+    if kind == _NODE:
+        return record.identity.get("run_id"), None
+    return record.get("run_id"), record.get("run_space_launch_id")
+
+
+def _write_lines(handle: Any, lines: List[Tuple[str, str, Any]]) -> None:
+    """Write ``(line, kind, record)`` entries to a file or segment writer."""
+    if isinstance(handle, SegmentedTraceWriter):
+        handle.write_lines(
+            (line, *_record_ids(kind, record)) for line, kind, record in lines
+        )
+    else:
+        handle.write("".join(line for line, _, _ in lines))
+
+
+class _FlushRequest:
+    """Queue marker asking the writer to persist everything queued before it."""
+
+    def __init__(self, stop: bool = False) -> None:
+        self.stop = stop
+        self.done = threading.Event()
+
+
+class _BatchWriter:
+    """Background thread writing queued records to their files in batches.
+
+    Items are ``(handle, kind, record)`` tuples. Lines are buffered per file and
+    written when ``flush_records`` lines or ``flush_bytes`` characters are
+    pending, when the oldest pending line is ``flush_interval`` seconds old, and
+    on every :class:`_FlushRequest`. Queue order is write order.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int,
+        flush_records: int,
+        flush_bytes: int,
+        flush_interval: float,
+    ) -> None:
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self.error: BaseException | None = None
+        self._flush_records = flush_records
+        self._flush_bytes = flush_bytes
+        self._flush_interval = flush_interval
+        self._pending: Dict[Any, List[Tuple[str, str, Any]]] = {}
+        self._pending_records = 0
+        self._pending_bytes = 0
+        self._thread = threading.Thread(
+            target=self._run, name="semantiva-trace-writer", daemon=True
+        )
+        self._thread.start()
+
+    def join(self) -> None:
+        self._thread.join()
+
+    def _run(self) -> None:
+        deadline: float | None = None
+        while True:
+            timeout = (
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write_pending()
+                deadline = None
+                continue
+            if isinstance(item, _FlushRequest):
+                self._write_pending()
+                deadline = None
+                item.done.set()
+                if item.stop:
+                    return
+                continue
+            if self.error is not None:
+                continue
+            handle, kind, record = item
+            try:
+                line = _serialize(kind, record)
+            except BaseException as exc:
+                self.error = exc
+                continue
+            self._pending.setdefault(handle, []).append((line, kind, record))
+            self._pending_records += 1
+            self._pending_bytes += len(line)
+            if deadline is None:
+                deadline = time.monotonic() + self._flush_interval
+            if (
+                self._pending_records >= self._flush_records
+                or self._pending_bytes >= self._flush_bytes
+            ):
+                self._write_pending()
+                deadline = None
+
+    def _write_pending(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._pending_records = self._pending_bytes = 0
+        if self.error is not None:
+            return
+        try:
+            for handle, lines in pending.items():
+                _write_lines(handle, lines)
+                handle.flush()
+        except BaseException as exc:
+            self.error = exc
 
 
 class JsonlTraceDriver(TraceDriver):
     """Persist SER records to ``*.ser.jsonl`` files."""
 
     def __init__(
-        self, output_path: str | None = None, detail: str | None = None
+        self,
+        output_path: str | None = None,
+        detail: str | None = None,
+        *,
+        buffered: bool = False,
+        queue_size: int = 4096,
+        flush_records: int = 512,
+        flush_bytes: int = 1 << 20,
+        flush_interval: float = 1.0,
+        backpressure: str = "block",
+        rotate_bytes: int | None = None,
+        rotate_records: int | None = None,
+        compression: str | None = None,
+        sample_every: int = 1,
+        node_detail: Mapping[str, str] | None = None,
     ) -> None:
         """Create a JSONL-based trace driver for SER v1 records.
 
@@ -45,9 +199,13 @@ class JsonlTraceDriver(TraceDriver):
                 * ``None`` (default): use the current directory and create a
                   timestamped ``<timestamp>_<run_id>.ser.jsonl`` file per run.
                 * Directory or path without suffix: create timestamped files
-                  under that directory.
+                  under that directory (one per run, or one per
+                  :class:`~semantiva.trace.runtime.TraceSession`).
                 * File path with an extension: append all records to the given
                   file.
+                * With ``rotate_bytes``, ``rotate_records`` or ``compression``:
+                  a segment directory shared by all runs (see
+                  :mod:`semantiva.trace.segments`).
 
             detail: Comma-separated list of detail flags. Flags are
                 case-insensitive, whitespace is ignored, and unknown flags are
@@ -59,6 +217,35 @@ class JsonlTraceDriver(TraceDriver):
                   values where available.
                 * ``context``: include context extracts in supported records.
                 * ``all``: enable all available flags.
+                * ``timing``: on its own, record timing and status only.
+
+            buffered: Serialize and write records on a background thread
+                instead of the execution thread.
+            queue_size: Maximum number of records waiting for the writer
+                (buffered mode).
+            flush_records: Write a batch once this many records are pending.
+            flush_bytes: Write a batch once this many characters are pending.
+            flush_interval: Write pending records at the latest this many
+                seconds after the oldest of them was queued.
+            backpressure: What emitting does when the queue is full:
+                ``"block"`` (default) waits for the writer, ``"drop"``
+                discards the record and counts it in :attr:`dropped_records`.
+            rotate_bytes: Start a new segment once the current one holds this
+                many bytes of uncompressed JSONL.
+            rotate_records: Start a new segment once the current one holds
+                this many records.
+            compression: Compress segments with ``"gzip"`` or ``"lzma"``.
+            sample_every: Trace only every N-th run-space run at ``detail``
+                and the others timing-only (see :mod:`semantiva.trace.detail`).
+            node_detail: Detail string per node selector (node UUID,
+                processor name, or ``sources`` / ``sinks`` / ``probes``),
+                overriding ``detail`` for matching nodes in every run.
+
+        Raises:
+            ValueError: If a buffering, segment or sampling option is
+                invalid, or if
+                segments are requested for an ``output_path`` with a file
+                extension.
 
         Notes:
             If no flags evaluate to ``True``, ``hash`` is enforced by default to
@@ -70,33 +257,143 @@ class JsonlTraceDriver(TraceDriver):
             None  # Dedicated file for run_space lifecycle
         )
         self._seq = 0
-        flags = (detail or "hash").split(",")
-        opts = {"hash": False, "repr": False, "context": False}
-        for flag in [f.strip().lower() for f in flags]:
-            if flag == "all":
-                opts = {k: True for k in opts}
-                break
-            if flag in opts:
-                opts[flag] = True
-        if not any(opts.values()):
-            opts["hash"] = True
-        self._opts = opts
+        self._seq_lock = threading.Lock()
+        for name, value in (
+            ("queue_size", queue_size),
+            ("flush_records", flush_records),
+            ("flush_bytes", flush_bytes),
+        ):
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ValueError(f"{name} must be a positive integer")
+        if isinstance(flush_interval, bool) or not (
+            isinstance(flush_interval, (int, float)) and flush_interval > 0
+        ):
+            raise ValueError("flush_interval must be a positive number")
+        for name, limit in (
+            ("rotate_bytes", rotate_bytes),
+            ("rotate_records", rotate_records),
+        ):
+            if limit is not None and (
+                isinstance(limit, bool) or not isinstance(limit, int) or limit < 1
+            ):
+                raise ValueError(f"{name} must be a positive integer")
+        if compression is not None and compression not in COMPRESSION_CODECS:
+            raise ValueError(
+                f"compression must be one of {', '.join(COMPRESSION_CODECS)}, "
+                f"got {compression!r}"
+            )
+        self._segments: SegmentedTraceWriter | None = None
+        if rotate_bytes or rotate_records or compression:
+            if self._path.suffix:
+                raise ValueError(
+                    "Segmented traces need a directory output_path, "
+                    f"got {str(self._path)!r}"
+                )
+            self._segments = SegmentedTraceWriter(
+                self._path,
+                compression=compression,
+                rotate_bytes=rotate_bytes,
+                rotate_records=rotate_records,
+            )
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"backpressure must be one of {', '.join(BACKPRESSURE_POLICIES)}, "
+                f"got {backpressure!r}"
+            )
+        self._buffered = bool(buffered)
+        self._queue_size = queue_size
+        self._flush_records = flush_records
+        self._flush_bytes = flush_bytes
+        self._flush_interval = float(flush_interval)
+        self._block = backpressure == "block"
+        self._writer: _BatchWriter | None = None
+        self._writer_lock = threading.Lock()
+        self.dropped_records = 0
+        self._dropped_reported = 0
+        self._opts = parse_detail_flags(detail)
+        self._policy_opts = detail_policy_options(
+            sample_every=sample_every, node_detail=node_detail
+        )
 
     def _now_timestamp(self) -> str:
         """Generate RFC3339 timestamp with millisecond precision and UTC 'Z'."""
-        return (
-            datetime.now().replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z"
-        )
+        return now_timestamp()
 
     def _next_seq(self) -> int:
-        """Return next monotonic sequence number."""
-        self._seq += 1
-        return self._seq
+        """Return next monotonic sequence number (thread-safe)."""
+        with self._seq_lock:
+            self._seq += 1
+            return self._seq
+
+    def _emit(self, handle: IO[str], kind: str, record: Any) -> None:
+        """Write ``record`` to ``handle`` now, or queue it in buffered mode."""
+        if not self._buffered:
+            _write_lines(handle, [(_serialize(kind, record), kind, record)])
+            return
+        writer = self._ensure_writer()
+        item = (handle, kind, record)
+        if self._block:
+            writer.queue.put(item)
+            return
+        try:
+            writer.queue.put_nowait(item)
+        except queue.Full:
+            with self._seq_lock:
+                self.dropped_records += 1
+
+    def _ensure_writer(self) -> _BatchWriter:
+        """Return the running writer, starting one if needed.
+
+        Raises:
+            Exception: The error that stopped the previous writer, if any.
+        """
+        with self._writer_lock:
+            writer = self._writer
+            if writer is not None and writer.error is not None:
+                self._writer = None
+                self._stop_writer(writer)
+                error, writer.error = writer.error, None
+                raise error
+            if writer is None:
+                writer = self._writer = _BatchWriter(
+                    queue_size=self._queue_size,
+                    flush_records=self._flush_records,
+                    flush_bytes=self._flush_bytes,
+                    flush_interval=self._flush_interval,
+                )
+            return writer
+
+    def _drain_writer(self, *, stop: bool) -> None:
+        """Wait until queued records are written; optionally stop the writer."""
+        with self._writer_lock:
+            writer = self._writer
+            if writer is None:
+                return
+            if stop:
+                self._writer = None
+        request = _FlushRequest(stop=stop)
+        writer.queue.put(request)
+        request.done.wait()
+        if stop:
+            writer.join()
+        if writer.error is not None:
+            error, writer.error = writer.error, None
+            raise error
+
+    @staticmethod
+    def _stop_writer(writer: _BatchWriter) -> None:
+        request = _FlushRequest(stop=True)
+        writer.queue.put(request)
+        request.done.wait()
+        writer.join()
 
     # internal -----------------------------------------------------------------
     def _open_file(self, run_id: str) -> None:
         if self._file:
             return
+        if self._segments is not None:
+            self._file = cast(IO[str], self._segments)
+            return
         path = self._path
         if path.is_dir() or path.suffix == "":
             path.mkdir(parents=True, exist_ok=True)
@@ -118,8 +415,8 @@ class JsonlTraceDriver(TraceDriver):
 
         path = self._path
 
-        # Single file mode: reuse the main file handle
-        if path.suffix:
+        # Single file and segment modes: reuse the main file handle
+        if path.suffix or self._segments is not None:
             if not self._file:
                 self._open_file(run_space_launch_id)
             self._run_space_file = self._file
@@ -147,63 +444,30 @@ class JsonlTraceDriver(TraceDriver):
     ) -> None:
         self._open_file(run_id)
         assert self._file is not None
-        record = {
-            "record_type": "pipeline_start",
-            "schema_version": 1,
-            "timestamp": self._now_timestamp(),
-            "seq": self._next_seq(),
-            "pipeline_id": pipeline_id,
-            "run_id": run_id,
-            "pipeline_spec_canonical": pipeline_spec_canonical,
-            "meta": meta,
-        }
-        if run_space_launch_id is not None:
-            record["run_space_launch_id"] = run_space_launch_id
-        if run_space_attempt is not None:
-            record["run_space_attempt"] = run_space_attempt
-        if run_space_index is not None:
-            record["run_space_index"] = run_space_index
-        if run_space_context is not None:
-            record["run_space_context"] = run_space_context
-        try:
-            self._file.write(json.dumps(record, sort_keys=True) + "\n")
-        except TypeError:
-            logging.getLogger(__name__).warning(
-                "pipeline_spec_canonical not JSON serializable; omitting from trace"
-            )
-            record.pop("pipeline_spec_canonical", None)
-            self._file.write(json.dumps(record, sort_keys=True) + "\n")
+        record = pipeline_start_record(
+            seq=self._next_seq(),
+            pipeline_id=pipeline_id,
+            run_id=run_id,
+            pipeline_spec_canonical=pipeline_spec_canonical,
+            meta=meta,
+            run_space_launch_id=run_space_launch_id,
+            run_space_attempt=run_space_attempt,
+            run_space_index=run_space_index,
+            run_space_context=run_space_context,
+        )
+        self._emit(self._file, _START, record)
 
     def on_node_event(self, event: SERRecord) -> None:
         assert self._file is not None, "trace file not open"
-        # Convert dataclass to dict and remove top-level None values so the
-        # emitted JSON conforms to the SER schema (which disallows null for
-        # object fields like 'error').
-        record = asdict(event)
-        record = {k: v for k, v in record.items() if v is not None}
-        try:
-            self._file.write(json.dumps(record, sort_keys=True) + "\n")
-        except TypeError:
-            # Fall back to omitting problematic fields if serialization fails
-            cleaned = {
-                k: v
-                for k, v in record.items()
-                if isinstance(v, (str, int, float, bool, dict, list))
-            }
-            self._file.write(json.dumps(cleaned, sort_keys=True) + "\n")
+        self._emit(self._file, _NODE, event)
 
     def on_pipeline_end(self, run_id: str, summary: dict) -> None:
         if not self._file:
             return
-        record = {
-            "record_type": "pipeline_end",
-            "schema_version": 1,
-            "timestamp": self._now_timestamp(),
-            "seq": self._next_seq(),
-            "run_id": run_id,
-            "summary": summary,
-        }
-        self._file.write(json.dumps(record, sort_keys=True) + "\n")
+        record = pipeline_end_record(
+            seq=self._next_seq(), run_id=run_id, summary=summary
+        )
+        self._emit(self._file, _PLAIN, record)
 
     def on_run_space_start(
         self,
@@ -218,30 +482,25 @@ class JsonlTraceDriver(TraceDriver):
         run_space_inputs_id: str | None = None,
         run_space_input_fingerprints: list[dict[str, Any]] | None = None,
         run_space_planned_run_count: int | None = None,
+        run_space_resumed_from: dict | None = None,
     ) -> None:
         self._open_run_space_file(run_space_launch_id)
         assert self._run_space_file is not None
-        record: Dict[str, Any] = {
-            "record_type": "run_space_start",
-            "schema_version": 1,
-            "timestamp": self._now_timestamp(),
-            "seq": self._next_seq(),
-            "run_id": run_id,
-            "run_space_spec_id": run_space_spec_id,
-            "run_space_launch_id": run_space_launch_id,
-            "run_space_attempt": run_space_attempt,
-            "run_space_combine_mode": run_space_combine_mode,
-            "run_space_total_runs": run_space_total_runs,
-        }
-        if run_space_max_runs_limit is not None:
-            record["run_space_max_runs_limit"] = run_space_max_runs_limit
-        if run_space_inputs_id is not None:
-            record["run_space_inputs_id"] = run_space_inputs_id
-        if run_space_input_fingerprints:
-            record["run_space_input_fingerprints"] = run_space_input_fingerprints
-        if run_space_planned_run_count is not None:
-            record["run_space_planned_run_count"] = run_space_planned_run_count
-        self._run_space_file.write(json.dumps(record, sort_keys=True) + "\n")
+        record = run_space_start_record(
+            seq=self._next_seq(),
+            run_id=run_id,
+            run_space_spec_id=run_space_spec_id,
+            run_space_launch_id=run_space_launch_id,
+            run_space_attempt=run_space_attempt,
+            run_space_combine_mode=run_space_combine_mode,
+            run_space_total_runs=run_space_total_runs,
+            run_space_max_runs_limit=run_space_max_runs_limit,
+            run_space_inputs_id=run_space_inputs_id,
+            run_space_input_fingerprints=run_space_input_fingerprints,
+            run_space_planned_run_count=run_space_planned_run_count,
+            run_space_resumed_from=run_space_resumed_from,
+        )
+        self._emit(self._run_space_file, _PLAIN, record)
 
     def on_run_space_end(
         self,
@@ -253,20 +512,22 @@ class JsonlTraceDriver(TraceDriver):
     ) -> None:
         self._open_run_space_file(run_space_launch_id)
         assert self._run_space_file is not None
-        record = {
-            "record_type": "run_space_end",
-            "schema_version": 1,
-            "timestamp": self._now_timestamp(),
-            "seq": self._next_seq(),
-            "run_id": run_id,
-            "run_space_launch_id": run_space_launch_id,
-            "run_space_attempt": run_space_attempt,
-        }
-        if summary:
-            record["summary"] = summary
-        self._run_space_file.write(json.dumps(record, sort_keys=True) + "\n")
+        record = run_space_end_record(
+            seq=self._next_seq(),
+            run_id=run_id,
+            run_space_launch_id=run_space_launch_id,
+            run_space_attempt=run_space_attempt,
+            summary=summary,
+        )
+        self._emit(self._run_space_file, _PLAIN, record)
 
     def flush(self) -> None:
+        """Persist every record emitted so far.
+
+        In buffered mode this waits for the writer thread to write them and
+        re-raises the first error the writer encountered.
+        """
+        self._drain_writer(stop=False)
         if self._file:
             self._file.flush()
         # Only flush run_space_file if it's a different handle
@@ -274,21 +535,32 @@ class JsonlTraceDriver(TraceDriver):
             self._run_space_file.flush()
 
     def close(self) -> None:
-        if self._file:
-            self._file.close()
-            self._file = None
-        # Only close run_space_file if it's a different handle
-        if self._run_space_file and self._run_space_file is not self._file:
-            self._run_space_file.close()
-        self._run_space_file = None
+        """Drain the writer thread (buffered mode) and close trace files."""
+        try:
+            self._drain_writer(stop=True)
+        finally:
+            # Only close run_space_file if it's a different handle
+            if self._run_space_file and self._run_space_file is not self._file:
+                self._run_space_file.close()
+            self._run_space_file = None
+            if self._file:
+                self._file.close()
+                self._file = None
+            if self.dropped_records > self._dropped_reported:
+                logging.getLogger(__name__).warning(
+                    "Trace writer queue was full; dropped %d record(s)",
+                    self.dropped_records - self._dropped_reported,
+                )
+                self._dropped_reported = self.dropped_records
 
     # options ---------------------------------------------------------------
-    def get_options(self) -> Dict[str, bool]:
+    def get_options(self) -> Dict[str, Any]:
         """Return detail flag options for orchestrator.
 
         The mapping contains boolean flags for ``hash``, ``repr``, and
         ``context`` which control the amount of work performed to produce
-        summaries in SER records.
+        summaries in SER records, plus ``sample_every`` / ``node_detail``
+        when a sampling policy is configured.
         """
 
-        return dict(self._opts)
+        return {**self._opts, **self._policy_opts}
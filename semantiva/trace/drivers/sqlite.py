@@ -0,0 +1,439 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite trace driver persisting trace stream records in a local database.
+
+Records are the same as those written by
+:class:`~semantiva.trace.drivers.jsonl.JsonlTraceDriver`; each row keeps the
+full JSON record next to indexed identity and timing columns, so questions
+such as "which node is slowest across all runs" are answered from indexes
+instead of scanning trace files. The database uses WAL journaling and rows
+are inserted in batches, one transaction per batch.
+
+Tables (see docs/source/trace_stream_v1.rst):
+
+* ``pipeline_events`` — ``pipeline_start`` / ``pipeline_end`` records.
+* ``ser`` — one row per Semantic Execution Record.
+* ``run_space_events`` — ``run_space_start`` / ``run_space_end`` records.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .._utils import parse_detail_flags
+from ..detail import detail_policy_options
+from ..model import SERRecord, TraceDriver
+from ._records import (
+    NODE,
+    PLAIN,
+    START,
+    pipeline_end_record,
+    pipeline_start_record,
+    run_space_end_record,
+    run_space_start_record,
+    serialize_record,
+)
+
+#: Default database file name when ``output_path`` is a directory.
+DEFAULT_DB_NAME = "trace.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pipeline_events (
+    id INTEGER PRIMARY KEY,
+    record_type TEXT NOT NULL,
+    seq INTEGER,
+    timestamp TEXT,
+    run_id TEXT NOT NULL,
+    pipeline_id TEXT,
+    run_space_launch_id TEXT,
+    run_space_attempt INTEGER,
+    run_space_index INTEGER,
+    record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ser (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT,
+    pipeline_id TEXT,
+    node_id TEXT,
+    processor_ref TEXT,
+    status TEXT,
+    started_at TEXT,
+    finished_at TEXT,
+    wall_ms REAL,
+    cpu_ms REAL,
+    record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_space_events (
+    id INTEGER PRIMARY KEY,
+    record_type TEXT NOT NULL,
+    seq INTEGER,
+    timestamp TEXT,
+    run_id TEXT,
+    run_space_spec_id TEXT,
+    run_space_launch_id TEXT NOT NULL,
+    run_space_attempt INTEGER,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_pipeline_events_run_id ON pipeline_events (run_id);
+CREATE INDEX IF NOT EXISTS ix_pipeline_events_pipeline_id
+    ON pipeline_events (pipeline_id);
+CREATE INDEX IF NOT EXISTS ix_pipeline_events_launch
+    ON pipeline_events (run_space_launch_id, run_space_attempt);
+CREATE INDEX IF NOT EXISTS ix_ser_run_id ON ser (run_id);
+CREATE INDEX IF NOT EXISTS ix_ser_pipeline_id ON ser (pipeline_id);
+CREATE INDEX IF NOT EXISTS ix_ser_node_wall ON ser (node_id, wall_ms);
+CREATE INDEX IF NOT EXISTS ix_ser_status ON ser (status);
+CREATE INDEX IF NOT EXISTS ix_ser_wall_ms ON ser (wall_ms);
+CREATE INDEX IF NOT EXISTS ix_run_space_events_launch
+    ON run_space_events (run_space_launch_id, run_space_attempt);
+"""
+
+_INSERTS = {
+    "pipeline_events": (
+        "INSERT INTO pipeline_events (record_type, seq, timestamp, run_id, "
+        "pipeline_id, run_space_launch_id, run_space_attempt, run_space_index, "
+        "record) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "ser": (
+        "INSERT INTO ser (run_id, pipeline_id, node_id, processor_ref, status, "
+        "started_at, finished_at, wall_ms, cpu_ms, record) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "run_space_events": (
+        "INSERT INTO run_space_events (record_type, seq, timestamp, run_id, "
+        "run_space_spec_id, run_space_launch_id, run_space_attempt, record) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+}
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL")
+
+
+class SqliteTraceDriver(TraceDriver):
+    """Persist trace records to a SQLite database."""
+
+    def __init__(
+        self,
+        output_path: str | None = None,
+        detail: str | None = None,
+        *,
+        batch_size: int = 500,
+        synchronous: str = "NORMAL",
+        sample_every: int = 1,
+        node_detail: Mapping[str, str] | None = None,
+    ) -> None:
+        """Create a SQLite-based trace driver.
+
+        Args:
+            output_path: Database file. ``None`` (default), an existing
+                directory or a path without suffix stores
+                ``trace.sqlite`` in that directory (the current directory for
+                ``None``). The database and its tables are created on first
+                use; existing databases are appended to.
+            detail: Comma-separated detail flags, as for
+                :class:`~semantiva.trace.drivers.jsonl.JsonlTraceDriver`.
+            batch_size: Insert pending rows in one transaction once this many
+                records are pending. Pending rows are also written by
+                ``flush()`` and ``close()``.
+            synchronous: SQLite ``synchronous`` pragma (``"OFF"``,
+                ``"NORMAL"`` or ``"FULL"``). ``NORMAL`` is durable across
+                application crashes in WAL mode.
+            sample_every: Trace only every N-th run-space run at ``detail``
+                and the others timing-only (see :mod:`semantiva.trace.detail`).
+            node_detail: Detail string per node selector, overriding
+                ``detail`` for matching nodes.
+
+        Raises:
+            ValueError: If ``batch_size``, ``synchronous`` or a sampling
+                option is invalid.
+        """
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+            raise ValueError("batch_size must be a positive integer")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if str(synchronous).upper() not in _SYNCHRONOUS_MODES:
+            raise ValueError(
+                f"synchronous must be one of {', '.join(_SYNCHRONOUS_MODES)}, "
+                f"got {synchronous!r}"
+            )
+        path = Path(output_path) if output_path else Path(".")
+        if path.is_dir() or path.suffix == "":
+            path = path / DEFAULT_DB_NAME
+        self.path = path
+        self._batch_size = batch_size
+        self._synchronous = str(synchronous).upper()
+        self._opts = parse_detail_flags(detail)
+        self._policy_opts = detail_policy_options(
+            sample_every=sample_every, node_detail=node_detail
+        )
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._pending: Dict[str, List[Tuple[Any, ...]]] = {t: [] for t in _INSERTS}
+        self._pending_count = 0
+        # pipeline_id of started runs, so pipeline_end rows can carry it
+        self._pipeline_of_run: Dict[str, str] = {}
+
+    # internal -----------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path), isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self._synchronous}")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _add(self, table: str, row: Tuple[Any, ...]) -> None:
+        with self._lock:
+            self._pending[table].append(row)
+            self._pending_count += 1
+            if self._pending_count >= self._batch_size:
+                self._write_pending()
+
+    def _next_seq(self) -> int:
+        with self._lock:
+            self._seq += 1
+            return self._seq
+
+    def _write_pending(self) -> None:
+        """Insert pending rows in one transaction (caller holds the lock)."""
+        if not self._pending_count:
+            return
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            for table, rows in self._pending.items():
+                if rows:
+                    conn.executemany(_INSERTS[table], rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            self._pending = {t: [] for t in _INSERTS}
+            self._pending_count = 0
+
+    @staticmethod
+    def _json(kind: str, record: Any) -> str:
+        return serialize_record(kind, record).rstrip("\n")
+
+    # TraceDriver --------------------------------------------------------------
+    def on_pipeline_start(
+        self,
+        pipeline_id: str,
+        run_id: str,
+        pipeline_spec_canonical: dict,
+        meta: dict,
+        pipeline_input: Optional[object] = None,
+        *,
+        run_space_launch_id: str | None = None,
+        run_space_attempt: int | None = None,
+        run_space_index: int | None = None,
+        run_space_context: dict | None = None,
+    ) -> None:
+        record = pipeline_start_record(
+            seq=self._next_seq(),
+            pipeline_id=pipeline_id,
+            run_id=run_id,
+            pipeline_spec_canonical=pipeline_spec_canonical,
+            meta=meta,
+            run_space_launch_id=run_space_launch_id,
+            run_space_attempt=run_space_attempt,
+            run_space_index=run_space_index,
+            run_space_context=run_space_context,
+        )
+        self._pipeline_of_run[run_id] = pipeline_id
+        self._add(
+            "pipeline_events",
+            (
+                "pipeline_start",
+                record["seq"],
+                record["timestamp"],
+                run_id,
+                pipeline_id,
+                run_space_launch_id,
+                run_space_attempt,
+                run_space_index,
+                self._json(START, record),
+            ),
+        )
+
+    def on_node_event(self, event: SERRecord) -> None:
+        identity = event.identity or {}
+        timing = event.timing or {}
+        processor = event.processor or {}
+        self._add(
+            "ser",
+            (
+                identity.get("run_id"),
+                identity.get("pipeline_id"),
+                identity.get("node_id"),
+                processor.get("ref"),
+                event.status,
+                timing.get("started_at"),
+                timing.get("finished_at"),
+                timing.get("wall_ms"),
+                timing.get("cpu_ms"),
+                self._json(NODE, event),
+            ),
+        )
+
+    def on_pipeline_end(self, run_id: str, summary: dict) -> None:
+        record = pipeline_end_record(
+            seq=self._next_seq(), run_id=run_id, summary=summary
+        )
+        self._add(
+            "pipeline_events",
+            (
+                "pipeline_end",
+                record["seq"],
+                record["timestamp"],
+                run_id,
+                self._pipeline_of_run.pop(run_id, None),
+                None,
+                None,
+                None,
+                self._json(PLAIN, record),
+            ),
+        )
+
+    def on_run_space_start(
+        self,
+        run_id: str,
+        *,
+        run_space_spec_id: str,
+        run_space_launch_id: str,
+        run_space_attempt: int,
+        run_space_combine_mode: str,
+        run_space_total_runs: int,
+        run_space_max_runs_limit: int | None = None,
+        run_space_inputs_id: str | None = None,
+        run_space_input_fingerprints: list[dict[str, Any]] | None = None,
+        run_space_planned_run_count: int | None = None,
+        run_space_resumed_from: dict | None = None,
+    ) -> None:
+        record = run_space_start_record(
+            seq=self._next_seq(),
+            run_id=run_id,
+            run_space_spec_id=run_space_spec_id,
+            run_space_launch_id=run_space_launch_id,
+            run_space_attempt=run_space_attempt,
+            run_space_combine_mode=run_space_combine_mode,
+            run_space_total_runs=run_space_total_runs,
+            run_space_max_runs_limit=run_space_max_runs_limit,
+            run_space_inputs_id=run_space_inputs_id,
+            run_space_input_fingerprints=run_space_input_fingerprints,
+            run_space_planned_run_count=run_space_planned_run_count,
+            run_space_resumed_from=run_space_resumed_from,
+        )
+        self._add(
+            "run_space_events",
+            (
+                "run_space_start",
+                record["seq"],
+                record["timestamp"],
+                run_id,
+                run_space_spec_id,
+                run_space_launch_id,
+                run_space_attempt,
+                self._json(PLAIN, record),
+            ),
+        )
+
+    def on_run_space_end(
+        self,
+        run_id: str,
+        *,
+        run_space_launch_id: str,
+        run_space_attempt: int,
+        summary: dict | None = None,
+    ) -> None:
+        record = run_space_end_record(
+            seq=self._next_seq(),
+            run_id=run_id,
+            run_space_launch_id=run_space_launch_id,
+            run_space_attempt=run_space_attempt,
+            summary=summary,
+        )
+        self._add(
+            "run_space_events",
+            (
+                "run_space_end",
+                record["seq"],
+                record["timestamp"],
+                run_id,
+                None,
+                run_space_launch_id,
+                run_space_attempt,
+                self._json(PLAIN, record),
+            ),
+        )
+
+    def flush(self) -> None:
+        """Insert every pending record."""
+        with self._lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        """Insert pending records and close the database connection.
+
+        The driver reconnects on the next record, so it can be reused for
+        further runs after ``close()``.
+        """
+        with self._lock:
+            try:
+                self._write_pending()
+            finally:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+    # queries -------------------------------------------------------------------
+    def slowest_nodes(
+        self, limit: int = 10, *, pipeline_id: str | None = None
+    ) -> List[Dict[str, Any]]:
+        """Return per-node wall-time statistics, slowest (by maximum) first.
+
+        Pending records are flushed first. Each entry holds ``node_id``,
+        ``runs``, ``max_wall_ms`` and ``avg_wall_ms``.
+        """
+        self.flush()
+        sql = (
+            "SELECT node_id, COUNT(*), MAX(wall_ms), AVG(wall_ms) FROM ser "
+            + ("WHERE pipeline_id = ? " if pipeline_id is not None else "")
+            + "GROUP BY node_id ORDER BY MAX(wall_ms) DESC LIMIT ?"
+        )
+        params: Tuple[Any, ...] = (
+            (pipeline_id, limit) if pipeline_id is not None else (limit,)
+        )
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+        return [
+            {"node_id": n, "runs": c, "max_wall_ms": mx, "avg_wall_ms": avg}
+            for n, c, mx, avg in rows
+        ]
+
+    # options ---------------------------------------------------------------
+    def get_options(self) -> Dict[str, Any]:
+        """Return detail flags and sampling options for the orchestrator."""
+
+        return {**self._opts, **self._policy_opts}
@@ -33,4 +33,8 @@ def build_trace_driver(trace_cfg: TraceConfig):
         from semantiva.trace.drivers.jsonl import JsonlTraceDriver
 
         return JsonlTraceDriver(**options)
-    raise ValueError(f"Unknown trace driver {name!r}; use 'jsonl' instead.")
+    if name == "sqlite":
+        from semantiva.trace.drivers.sqlite import SqliteTraceDriver
+
+        return SqliteTraceDriver(**options)
+    raise ValueError(f"Unknown trace driver {name!r}; use 'jsonl' or 'sqlite'.")
@@ -0,0 +1,331 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming content hashes for trace summaries.
+
+:class:`ContentHasher` computes the ``sha256-<hex>`` digests recorded in SER
+``summaries`` and ``context_delta.key_summaries``. Values are fed into the
+hash incrementally by per-type *hashers* looked up along the value's MRO:
+
+- ``bytes`` / ``bytearray`` / ``memoryview`` and contiguous NumPy arrays are
+  fed through ``memoryview`` slices, without an intermediate ``bytes`` copy.
+- :class:`~semantiva.data_types.BaseDataType` hashes its class name and its
+  wrapped ``data``; :class:`~semantiva.data_types.DataCollectionType` hashes
+  each element in iteration order.
+- ``dict`` hashes its items in sorted key order.
+- Any other value falls back to :func:`semantiva.trace._utils.serialize`.
+
+Additional types are supported with :func:`register_hasher`.
+
+The fallback is exact for JSON values (``None``, booleans, numbers, strings
+and lists, tuples or string-keyed dicts of them) and for objects that
+serialize themselves with ``to_bytes`` or ``to_json``. Other objects, and
+NumPy object arrays holding them, are hashed from their ``__dict__`` or
+``repr``, so unequal values may share a digest;
+:meth:`ContentHasher.exact_digest` returns ``None`` for them.
+
+Digests of weak-referenceable values are memoized per hasher instance.
+:meth:`ContentHasher.invalidate` drops them and is called by the orchestrator
+whenever a node starts, so a value passed unchanged from one node to the next
+is hashed once. Read-only NumPy arrays that do not share memory with a
+writeable buffer keep their entry across invalidations.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ._utils import _bytes_from_known_interfaces, canonical_json_bytes
+
+HasherFn = Callable[["ContentHasher", Any, Any], None]
+"""Signature of a hasher: ``fn(content_hasher, value, hash_object)``.
+
+The function feeds ``value`` into ``hash_object`` (a :mod:`hashlib` object)
+with ``hash_object.update`` and may hash nested values with
+:meth:`ContentHasher.feed`.
+"""
+
+FrozenFn = Callable[[Any], bool]
+
+CHUNK_BYTES = 1 << 20
+"""Size of the ``memoryview`` slices fed to the hash object."""
+
+_HASHERS: Dict[type, Tuple[HasherFn, Optional[FrozenFn]]] = {}
+_BUILTINS_REGISTERED = False
+
+
+def register_hasher(
+    cls: type, fn: HasherFn, *, frozen: Optional[FrozenFn] = None
+) -> None:
+    """Register ``fn`` as the hasher for instances of ``cls`` and its subclasses.
+
+    The most specific registration along the value's MRO wins. ``frozen``
+    optionally reports whether a value can never change; memoized digests of
+    frozen values survive :meth:`ContentHasher.invalidate`.
+    """
+
+    _register_builtin_hashers()
+    _HASHERS[cls] = (fn, frozen)
+
+
+def unregister_hasher(cls: type) -> None:
+    """Remove the hasher registered for exactly ``cls`` (no-op when absent)."""
+
+    _register_builtin_hashers()
+    _HASHERS.pop(cls, None)
+
+
+def _lookup(value: Any) -> Tuple[HasherFn, Optional[FrozenFn]] | None:
+    _register_builtin_hashers()
+    for klass in type(value).__mro__:
+        entry = _HASHERS.get(klass)
+        if entry is not None:
+            return entry
+    return None
+
+
+def _update_chunked(h: Any, view: memoryview) -> None:
+    """Feed ``view`` into ``h`` in :data:`CHUNK_BYTES` slices (no copies)."""
+
+    if not view.c_contiguous:
+        h.update(view.tobytes())
+        return
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    for start in range(0, view.nbytes, CHUNK_BYTES):
+        h.update(view[start : start + CHUNK_BYTES])
+
+
+def _header(h: Any, tag: str) -> None:
+    h.update(tag.encode("utf-8") + b"\x00")
+
+
+class ContentHasher:
+    """Compute content digests with a bounded per-object memo.
+
+    Args:
+        memo_size: Maximum number of memoized digests (least recently used
+            entries are evicted first). ``0`` disables memoization.
+    """
+
+    def __init__(self, *, memo_size: int = 1024) -> None:
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[int, tuple[weakref.ref, bytes, bool, bool]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        # ``exact`` is cleared when the value being hashed uses an inexact
+        # fallback (see _write).
+        self._state = threading.local()
+
+    def hexdigest(self, value: Any) -> str:
+        """Return ``"sha256-<hex>"`` for ``value``."""
+
+        return "sha256-" + self.digest(value).hex()
+
+    def digest(self, value: Any) -> bytes:
+        """Return the raw SHA-256 digest of ``value``, memoized when possible."""
+
+        return self._digest(value)[0]
+
+    def exact_digest(self, value: Any) -> Optional[bytes]:
+        """Return the digest of ``value``, or ``None`` when it is not exact.
+
+        A digest is exact when every part of ``value`` is hashed by a
+        registered hasher or an exact fallback (see the module docstring), so
+        unequal values get different digests.
+        """
+
+        result, exact = self._digest(value)
+        return result if exact else None
+
+    def _digest(self, value: Any) -> Tuple[bytes, bool]:
+        entry = _lookup(value)
+        ref = self._ref(value) if self.memo_size else None
+        if ref is not None:
+            with self._lock:
+                cached = self._memo.get(id(value))
+                if cached is not None and cached[0]() is value:
+                    self._memo.move_to_end(id(value))
+                    self._mark(cached[3])
+                    return cached[1], cached[3]
+        h = hashlib.sha256()
+        outer = getattr(self._state, "exact", True)
+        self._state.exact = True
+        try:
+            self._write(value, h, entry)
+            exact = self._state.exact
+        finally:
+            self._state.exact = outer
+        self._mark(exact)
+        result = h.digest()
+        if ref is not None:
+            frozen = entry is not None and entry[1] is not None and entry[1](value)
+            with self._lock:
+                self._memo[id(value)] = (ref, result, bool(frozen), exact)
+                self._memo.move_to_end(id(value))
+                while len(self._memo) > self.memo_size:
+                    self._memo.popitem(last=False)
+        return result, exact
+
+    def feed(self, value: Any, h: Any) -> None:
+        """Feed ``value`` into the hash object ``h``.
+
+        Memoizable values contribute their (memoized) digest; others are
+        written directly by their hasher.
+        """
+
+        if self.memo_size and self._ref(value) is not None:
+            h.update(self.digest(value))
+        else:
+            self._write(value, h, _lookup(value))
+
+    def invalidate(self) -> None:
+        """Drop memoized digests of values that may have changed."""
+
+        with self._lock:
+            for key in [k for k, e in self._memo.items() if not e[2]]:
+                del self._memo[key]
+
+    def clear(self) -> None:
+        """Drop every memoized digest."""
+
+        with self._lock:
+            self._memo.clear()
+
+    def _write(
+        self,
+        value: Any,
+        h: Any,
+        entry: Tuple[HasherFn, Optional[FrozenFn]] | None,
+    ) -> None:
+        if entry is not None:
+            entry[0](self, value, h)
+            return
+        # Same result as serialize(value), noting whether it is exact.
+        data = _bytes_from_known_interfaces(value)
+        if data is None:
+            if not _is_json_value(value):
+                self._mark(False)
+            data = canonical_json_bytes(value)
+        h.update(data)
+
+    def _mark(self, exact: bool) -> None:
+        if not exact:
+            self._state.exact = False
+
+    @staticmethod
+    def _ref(value: Any) -> weakref.ref | None:
+        try:
+            return weakref.ref(value)
+        except TypeError:
+            return None
+
+
+def _is_json_value(value: Any) -> bool:
+    """Return whether canonical JSON represents ``value`` without loss."""
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json_value(item) for key, item in value.items()
+        )
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Built-in hashers
+# ---------------------------------------------------------------------------
+
+
+def _hash_buffer(hasher: ContentHasher, value: Any, h: Any) -> None:
+    # Raw bytes, identical to sha256(bytes(value)).
+    with memoryview(value) as view:
+        _update_chunked(h, view)
+
+
+def _hash_dict(hasher: ContentHasher, value: Any, h: Any) -> None:
+    _header(h, "dict")
+    for key in sorted(value, key=str):
+        _header(h, str(key))
+        hasher.feed(value[key], h)
+
+
+def _hash_ndarray(hasher: ContentHasher, value: Any, h: Any) -> None:
+    import numpy as np
+
+    _header(h, f"ndarray:{value.dtype.str}:{value.shape}")
+    if value.dtype.hasobject:
+        items = value.tolist()
+        hasher._mark(_is_json_value(items))
+        h.update(canonical_json_bytes(items))
+        return
+    if not value.flags.c_contiguous:
+        # Strided views cannot be exposed as one flat buffer.
+        value = np.ascontiguousarray(value)
+    # A flat uint8 view also covers dtypes the buffer protocol rejects
+    # (e.g. datetime64).
+    with memoryview(value.reshape(-1).view(np.uint8)) as view:
+        _update_chunked(h, view)
+
+
+def _ndarray_frozen(value: Any) -> bool:
+    import numpy as np
+
+    base = value
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable:
+            return False
+        base = base.base
+    return base is None or isinstance(base, bytes)
+
+
+def _hash_data_type(hasher: ContentHasher, value: Any, h: Any) -> None:
+    _header(h, type(value).__qualname__)
+    hasher.feed(value.data, h)
+
+
+def _hash_data_collection(hasher: ContentHasher, value: Any, h: Any) -> None:
+    _header(h, type(value).__qualname__)
+    for item in value:
+        hasher.feed(item, h)
+
+
+def _register_builtin_hashers() -> None:
+    global _BUILTINS_REGISTERED
+    if _BUILTINS_REGISTERED:
+        return
+    _BUILTINS_REGISTERED = True
+    for cls in (bytes, bytearray, memoryview):
+        _HASHERS[cls] = (_hash_buffer, None)
+    _HASHERS[dict] = (_hash_dict, None)
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - numpy is a core dependency
+        pass
+    else:
+        _HASHERS[np.ndarray] = (_hash_ndarray, _ndarray_frozen)
+    # Imported lazily: data types import the component registry, which is
+    # not needed for hashing plain values.
+    from semantiva.data_types import BaseDataType, DataCollectionType
+
+    _HASHERS[BaseDataType] = (_hash_data_type, None)
+    _HASHERS[DataCollectionType] = (_hash_data_collection, None)
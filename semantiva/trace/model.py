@@ -116,6 +116,7 @@ class TraceDriver(Protocol):
         run_space_inputs_id: str | None = None,
         run_space_input_fingerprints: list[dict] | None = None,
         run_space_planned_run_count: int | None = None,
+        run_space_resumed_from: dict | None = None,
     ) -> None:
         """Emit a ``run_space_start`` lifecycle record."""
 
@@ -0,0 +1,188 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-node resource accounting for the ``resources`` trace detail flag.
+
+:class:`ResourceMeter` measures what a node's ``process`` call consumed:
+
+- ``py_peak_bytes`` / ``py_net_bytes``: peak and retained Python allocations
+  (:mod:`tracemalloc`, started only while a meter runs).
+- ``rss_delta_bytes``: change of the resident set size (Linux ``/proc``).
+- ``max_rss_bytes``, ``minor_faults``, ``major_faults``: process high-water
+  mark and page faults (:func:`resource.getrusage`, POSIX only).
+- ``gc_collections`` / ``gc_pause_ms``: garbage collections per generation and
+  the time spent in them (:data:`gc.callbacks`).
+
+Allocation, RSS and GC figures are process-wide: nodes running concurrently
+(``graph`` orchestrator) are included in each other's figures.
+:func:`object_size` estimates the size of node outputs.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+try:
+    import resource as _resource
+except ImportError:  # pragma: no cover - Windows
+    _resource = None  # type: ignore[assignment]
+
+_LOCK = threading.Lock()
+_ACTIVE = 0
+_OWNS_TRACEMALLOC = False
+_GC_COLLECTIONS: List[int] = [0, 0, 0]
+_GC_PAUSE = [0.0]
+_GC_STARTED: List[float | None] = [None]
+
+# ``ru_maxrss`` is in KiB on Linux and in bytes on macOS.
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _gc_callback(phase: str, info: Dict[str, Any]) -> None:
+    if phase == "start":
+        _GC_STARTED[0] = time.perf_counter()
+        return
+    started = _GC_STARTED[0]
+    if started is not None:
+        _GC_PAUSE[0] += time.perf_counter() - started
+        _GC_STARTED[0] = None
+    generation = info.get("generation", 0)
+    if 0 <= generation < len(_GC_COLLECTIONS):
+        _GC_COLLECTIONS[generation] += 1
+
+
+def _acquire() -> None:
+    global _ACTIVE, _OWNS_TRACEMALLOC
+    with _LOCK:
+        if _ACTIVE == 0:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _OWNS_TRACEMALLOC = True
+            gc.callbacks.append(_gc_callback)
+        _ACTIVE += 1
+
+
+def _release() -> None:
+    global _ACTIVE, _OWNS_TRACEMALLOC
+    with _LOCK:
+        _ACTIVE -= 1
+        if _ACTIVE == 0:
+            if _gc_callback in gc.callbacks:
+                gc.callbacks.remove(_gc_callback)
+            if _OWNS_TRACEMALLOC:
+                tracemalloc.stop()
+                _OWNS_TRACEMALLOC = False
+
+
+def _current_rss() -> int | None:
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class ResourceMeter:
+    """Measure the resources used between :meth:`start` and :meth:`stop`."""
+
+    def __init__(self) -> None:
+        self._traced = 0
+        self._rss: int | None = None
+        self._usage: Any = None
+        self._gc: List[int] = []
+        self._gc_pause = 0.0
+
+    def start(self) -> "ResourceMeter":
+        _acquire()
+        self._traced = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        self._rss = _current_rss()
+        if _resource is not None:
+            self._usage = _resource.getrusage(_resource.RUSAGE_SELF)
+        self._gc = list(_GC_COLLECTIONS)
+        self._gc_pause = _GC_PAUSE[0]
+        return self
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop measuring and return the resource figures (see module docs)."""
+
+        try:
+            current, peak = tracemalloc.get_traced_memory()
+            result: Dict[str, Any] = {
+                "py_peak_bytes": max(0, peak - self._traced),
+                "py_net_bytes": current - self._traced,
+            }
+            rss = _current_rss()
+            if rss is not None and self._rss is not None:
+                result["rss_delta_bytes"] = rss - self._rss
+            if _resource is not None and self._usage is not None:
+                usage = _resource.getrusage(_resource.RUSAGE_SELF)
+                result["max_rss_bytes"] = usage.ru_maxrss * _MAXRSS_UNIT
+                result["minor_faults"] = usage.ru_minflt - self._usage.ru_minflt
+                result["major_faults"] = usage.ru_majflt - self._usage.ru_majflt
+            result["gc_collections"] = [
+                after - before for after, before in zip(_GC_COLLECTIONS, self._gc)
+            ]
+            result["gc_pause_ms"] = round((_GC_PAUSE[0] - self._gc_pause) * 1000, 3)
+            return result
+        finally:
+            _release()
+
+
+def object_size(value: Any, *, max_depth: int = 8) -> int:
+    """Estimate the memory held by ``value`` in bytes.
+
+    Buffers (NumPy arrays, ``memoryview``) count their ``nbytes``; Semantiva
+    data types count their wrapped data or elements; containers count
+    themselves plus their items, down to ``max_depth`` levels. Shared objects
+    are counted once.
+    """
+
+    from semantiva.data_types import BaseDataType, DataCollectionType
+
+    seen: set[int] = set()
+
+    def size(obj: Any, depth: int) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        if isinstance(obj, DataCollectionType):
+            return sum(size(item, depth + 1) for item in obj)
+        if isinstance(obj, BaseDataType):
+            return size(obj.data, depth)
+        nbytes = getattr(obj, "nbytes", None)
+        if isinstance(nbytes, int) and not isinstance(obj, type):
+            return nbytes
+        total = sys.getsizeof(obj, 0)
+        if depth >= max_depth:
+            return total
+        if isinstance(obj, dict):
+            for key, item in obj.items():
+                total += size(key, depth + 1) + size(item, depth + 1)
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            for item in obj:
+                total += size(item, depth + 1)
+        return total
+
+    return size(value, 0)
+
+
+__all__ = ["ResourceMeter", "object_size"]
@@ -18,6 +18,8 @@ from .context import TraceContext
 from .run_space_identity import Fingerprint, RunSpaceIds, RunSpaceIdentityService
 from .run_space_launch import RunSpaceLaunch, RunSpaceLaunchManager
 from .run_space_emitter import RunSpaceTraceEmitter
+from .run_space_resume import RunSpaceResume, RunSpaceResumeError, plan_resume
+from .session import TraceSession, active_trace_session
 
 __all__ = [
     "TraceContext",
@@ -27,4 +29,9 @@ __all__ = [
     "RunSpaceLaunch",
     "RunSpaceLaunchManager",
     "RunSpaceTraceEmitter",
+    "RunSpaceResume",
+    "RunSpaceResumeError",
+    "plan_resume",
+    "TraceSession",
+    "active_trace_session",
 ]
@@ -42,9 +42,14 @@ class RunSpaceTraceEmitter:
         run_space_inputs_id: Optional[str] = None,
         run_space_input_fingerprints: Optional[Iterable[Fingerprint]] = None,
         run_space_planned_run_count: Optional[int] = None,
+        run_space_resumed_from: Optional[dict] = None,
         run_id: Optional[str] = None,
     ) -> None:
-        """Emit a run space start trace event with input metadata."""
+        """Emit a run space start trace event with input metadata.
+
+        ``run_space_resumed_from`` links a resumed attempt to the attempt it
+        continues; it is only passed to the driver when set.
+        """
         if self._driver is None:
             return
         key = (run_space_launch_id, run_space_attempt)
@@ -68,6 +73,11 @@ class RunSpaceTraceEmitter:
                 for fp in run_space_input_fingerprints
             ]
 
+        extra = (
+            {"run_space_resumed_from": run_space_resumed_from}
+            if run_space_resumed_from is not None
+            else {}
+        )
         self._driver.on_run_space_start(
             run_id or run_space_launch_id,
             run_space_spec_id=run_space_spec_id,
@@ -79,6 +89,7 @@ class RunSpaceTraceEmitter:
             run_space_inputs_id=run_space_inputs_id,
             run_space_input_fingerprints=fingerprints_payload,
             run_space_planned_run_count=run_space_planned_run_count,
+            **extra,
         )
 
     def emit_end(
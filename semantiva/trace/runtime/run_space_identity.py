@@ -25,7 +25,7 @@ import hashlib
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Iterable
+from typing import Any, Callable, Dict, List, Optional, Iterable
 
 
 @dataclass
@@ -50,8 +50,17 @@ class RunSpaceIds:
 class RunSpaceIdentityService:
     """Computes Run-Space Configuration Format (RSCF v1) spec IDs, fingerprints,
     and optional Run-Space Materialization (RSM v1) inputs IDs.
+
+    Args:
+        file_digest: Returns the SHA-256 hex digest of a resolved source file,
+            e.g. :meth:`~semantiva.execution.run_space_sources.RunSpaceSourceCache.digest`
+            to reuse digests computed while planning the run space. Files are
+            hashed directly by default.
     """
 
+    def __init__(self, *, file_digest: Optional[Callable[[Path], str]] = None) -> None:
+        self._file_digest = file_digest or self._sha256_file
+
     def compute(
         self,
         run_space_spec: Dict[str, Any],
@@ -133,7 +142,7 @@ class RunSpaceIdentityService:
         if not resolved.is_file():
             raise FileNotFoundError(resolved)
         uri = resolved.as_uri()
-        digest = self._sha256_file(resolved)
+        digest = self._file_digest(resolved)
         size = resolved.stat().st_size
         return uri, digest, size
 
@@ -0,0 +1,112 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resume run-space launches from the trace of earlier attempts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional
+
+from semantiva.trace.aggregation import TraceAggregator
+
+
+class RunSpaceResumeError(ValueError):
+    """Raised when a trace cannot be used to resume the current run space."""
+
+
+@dataclass(frozen=True)
+class RunSpaceResume:
+    """Launch to resume and the runs its earlier attempts completed."""
+
+    run_space_launch_id: str
+    previous_attempt: int
+    completed_indices: FrozenSet[int]
+
+    def as_record(self) -> Dict[str, Any]:
+        """Return the ``run_space_resumed_from`` field of ``run_space_start``."""
+
+        return {
+            "run_space_launch_id": self.run_space_launch_id,
+            "run_space_attempt": self.previous_attempt,
+            "completed_runs": len(self.completed_indices),
+        }
+
+
+def plan_resume(
+    trace_path: str | os.PathLike[str],
+    *,
+    run_space_spec_id: str,
+    run_space_inputs_id: Optional[str],
+    run_space_launch_id: Optional[str] = None,
+) -> RunSpaceResume:
+    """Find the launch to resume in ``trace_path`` and its completed runs.
+
+    Args:
+        trace_path: JSONL trace file or directory of the earlier attempts.
+        run_space_spec_id: Spec ID of the run space being launched.
+        run_space_inputs_id: Inputs ID of the run space being launched.
+        run_space_launch_id: Launch to resume; by default the only launch of
+            this run space in the trace.
+
+    Returns:
+        The launch, its latest attempt and the ``run_space_index`` values of
+        runs that completed with status ``ok`` in any attempt.
+
+    Raises:
+        RunSpaceResumeError: If no matching launch is found, several are, or
+            the launch was started from a different run-space spec or inputs.
+    """
+
+    aggregator = TraceAggregator()
+    aggregator.ingest_path(Path(trace_path), run_space_launch_id=run_space_launch_id)
+    launches = [
+        launch
+        for launch in aggregator.iter_launches()
+        if run_space_launch_id is None
+        or launch.run_space_launch_id == run_space_launch_id
+    ]
+    if not launches:
+        raise RunSpaceResumeError(
+            f"no run-space launch{_named(run_space_launch_id)} found in {trace_path}"
+        )
+    matching = [
+        launch
+        for launch in launches
+        if launch.run_space_spec_id == run_space_spec_id
+        and launch.run_space_inputs_id == run_space_inputs_id
+    ]
+    if not matching:
+        raise RunSpaceResumeError(
+            f"run-space launch{_named(run_space_launch_id)} in {trace_path} was "
+            "started from a different run-space spec or inputs"
+        )
+    launch_ids = sorted({launch.run_space_launch_id for launch in matching})
+    if len(launch_ids) > 1:
+        raise RunSpaceResumeError(
+            f"{trace_path} holds several launches of this run space "
+            f"({', '.join(launch_ids)}); pass --run-space-launch-id"
+        )
+    launch_id = launch_ids[0]
+    return RunSpaceResume(
+        run_space_launch_id=launch_id,
+        previous_attempt=max(launch.run_space_attempt for launch in matching),
+        completed_indices=frozenset(aggregator.completed_run_space_indices(launch_id)),
+    )
+
+
+def _named(launch_id: Optional[str]) -> str:
+    return f" {launch_id}" if launch_id else ""
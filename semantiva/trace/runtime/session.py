@@ -0,0 +1,152 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Trace sessions: keep a trace driver open across many pipeline runs."""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from typing import Any, Optional
+
+from semantiva.trace.model import TraceDriver
+
+_ACTIVE: "weakref.WeakKeyDictionary[Any, TraceSession]" = weakref.WeakKeyDictionary()
+_ACTIVE_LOCK = threading.Lock()
+
+
+def active_trace_session(driver: Any) -> Optional["TraceSession"]:
+    """Return the open session of ``driver``, or ``None``."""
+
+    with _ACTIVE_LOCK:
+        return _ACTIVE.get(driver)
+
+
+class TraceSession:
+    """Own the lifecycle of a trace driver for a series of runs.
+
+    Without a session the orchestrator flushes and closes the driver after
+    every run, so the next run reopens its files (or, in JSONL directory
+    mode, creates a new one). While a session is open the orchestrator only
+    reports finished runs to it; the session flushes the driver according to
+    its policy and closes it once, in :meth:`close`. All runs of the session
+    therefore share the driver's open files, writer thread or database
+    connection.
+
+    A run that fails is flushed immediately. Use the session as a context
+    manager, or call :meth:`open` and :meth:`close`::
+
+        with TraceSession(driver):
+            for context in contexts:
+                pipeline.process(Payload(NoDataType(), context))
+
+    Args:
+        driver: Trace driver to keep open.
+        flush_runs: Flush after this many finished runs; ``None`` disables
+            the count trigger.
+        flush_interval: Flush at the end of a run once this many seconds
+            passed since the last flush; ``None`` disables the time trigger.
+
+    Raises:
+        ValueError: If a flush trigger is not positive.
+    """
+
+    def __init__(
+        self,
+        driver: TraceDriver,
+        *,
+        flush_runs: int | None = 100,
+        flush_interval: float | None = 5.0,
+    ) -> None:
+        if flush_runs is not None and (
+            isinstance(flush_runs, bool)
+            or not isinstance(flush_runs, int)
+            or flush_runs < 1
+        ):
+            raise ValueError("flush_runs must be a positive integer or None")
+        if flush_interval is not None and not flush_interval > 0:
+            raise ValueError("flush_interval must be positive or None")
+        self.driver = driver
+        self.flush_runs = flush_runs
+        self.flush_interval = flush_interval
+        self.runs = 0
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._open = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    def open(self) -> "TraceSession":
+        """Register the session for its driver.
+
+        Raises:
+            RuntimeError: If the driver already has an open session.
+        """
+
+        with _ACTIVE_LOCK:
+            if self.driver in _ACTIVE:
+                raise RuntimeError("trace driver already has an open session")
+            _ACTIVE[self.driver] = self
+        self._open = True
+        self._last_flush = time.monotonic()
+        return self
+
+    def run_finished(self, *, failed: bool = False) -> None:
+        """Record the end of a run and flush if the policy asks for it."""
+
+        with self._lock:
+            self.runs += 1
+            self._unflushed += 1
+            due = (
+                failed
+                or (self.flush_runs is not None and self._unflushed >= self.flush_runs)
+                or (
+                    self.flush_interval is not None
+                    and time.monotonic() - self._last_flush >= self.flush_interval
+                )
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush the driver now."""
+
+        with self._lock:
+            self._unflushed = 0
+            self._last_flush = time.monotonic()
+        self.driver.flush()
+
+    def close(self) -> None:
+        """Unregister the session, then flush and close the driver."""
+
+        if not self._open:
+            return
+        self._open = False
+        with _ACTIVE_LOCK:
+            if _ACTIVE.get(self.driver) is self:
+                del _ACTIVE[self.driver]
+        try:
+            self.driver.flush()
+        finally:
+            self.driver.close()
+
+    def __enter__(self) -> "TraceSession":
+        return self.open()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
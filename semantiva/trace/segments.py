@@ -0,0 +1,306 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Segmented, optionally compressed trace files and their readers.
+
+A *segment directory* holds trace records of many runs in numbered segment
+files (``segment-00001.trace.jsonl[.gz|.xz]``) plus a ``manifest.json`` that
+lists the segments in write order with their record counts and the
+``run_id`` / ``run_space_launch_id`` values they contain.
+:class:`SegmentedTraceWriter` is used by
+:class:`~semantiva.trace.drivers.jsonl.JsonlTraceDriver` when rotation or
+compression is enabled.
+
+:func:`iter_trace_records` streams records from a plain or compressed JSONL
+file or from a whole segment directory, decompressing on the fly;
+:func:`list_trace_files` lists the files it would read.
+
+A segment directory must have a single writer at a time.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import lzma
+import os
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, cast
+
+#: Supported segment compression codecs.
+COMPRESSION_CODECS = ("gzip", "lzma")
+
+#: File name of the segment index inside a segment directory.
+MANIFEST_NAME = "manifest.json"
+
+MANIFEST_FORMAT = "semantiva-trace-segments"
+
+_SUFFIXES = {None: "", "gzip": ".gz", "lzma": ".xz"}
+_TRACE_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.xz")
+
+#: ``(line, run_id, run_space_launch_id)`` as written by the driver.
+SegmentLine = Tuple[str, Optional[str], Optional[str]]
+
+
+def open_trace_file(path: str | Path, mode: str = "rt") -> IO[str]:
+    """Open a trace file as text, decompressing ``.gz`` / ``.xz`` files.
+
+    ``mode`` is a text mode (``"rt"``, ``"at"``, ``"wt"``).
+    """
+
+    path = Path(path)
+    if path.suffix == ".gz":
+        return cast(IO[str], gzip.open(path, mode, encoding="utf-8"))
+    if path.suffix == ".xz":
+        return cast(IO[str], lzma.open(path, mode, encoding="utf-8"))
+    return path.open(mode.replace("t", ""), encoding="utf-8")
+
+
+def read_manifest(directory: str | Path) -> Dict[str, Any] | None:
+    """Return the manifest of ``directory``, or ``None`` when there is none."""
+
+    path = Path(directory) / MANIFEST_NAME
+    if not path.is_file():
+        return None
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+class SegmentedTraceWriter:
+    """Write trace lines to rotating, optionally compressed segment files.
+
+    A new segment is started before a line would be written to a segment that
+    already holds ``rotate_records`` records or ``rotate_bytes`` bytes of
+    uncompressed JSONL. :meth:`close` only closes the current file; later
+    writes append to the same segment (a new gzip member or xz stream) until
+    it is full, so successive runs share segments.
+
+    Args:
+        directory: Segment directory (created on first write).
+        compression: ``None``, ``"gzip"`` or ``"lzma"``.
+        rotate_bytes: Maximum uncompressed bytes per segment.
+        rotate_records: Maximum records per segment.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        compression: str | None = None,
+        rotate_bytes: int | None = None,
+        rotate_records: int | None = None,
+    ) -> None:
+        if compression not in _SUFFIXES:
+            raise ValueError(
+                f"compression must be one of {', '.join(COMPRESSION_CODECS)}, "
+                f"got {compression!r}"
+            )
+        self.directory = Path(directory)
+        self.compression = compression
+        self.rotate_bytes = rotate_bytes
+        self.rotate_records = rotate_records
+        self._segments: List[Dict[str, Any]] | None = None
+        self._current: Dict[str, Any] | None = None
+        self._run_ids: set[str] = set()
+        self._launch_ids: set[str] = set()
+        self._launch_of_run: Dict[str, str] = {}
+        self._handle: IO[str] | None = None
+
+    # text sink ----------------------------------------------------------------
+    def write_lines(self, lines: Iterable[SegmentLine]) -> None:
+        """Write ``lines`` in order, rotating segments as needed."""
+
+        chunk: List[str] = []
+        for line, run_id, launch_id in lines:
+            if self._current is None or self._full():
+                self._write_chunk(chunk)
+                chunk = []
+                self._rotate()
+            current = self._current
+            assert current is not None
+            chunk.append(line)
+            current["records"] += 1
+            current["bytes"] += len(line)
+            if launch_id is not None and run_id is not None:
+                self._launch_of_run[run_id] = launch_id
+            elif run_id is not None:
+                launch_id = self._launch_of_run.get(run_id)
+            if run_id is not None:
+                self._run_ids.add(run_id)
+            if launch_id is not None:
+                self._launch_ids.add(launch_id)
+        self._write_chunk(chunk)
+
+    def flush(self) -> None:
+        """Flush the current segment file and persist the manifest."""
+
+        if self._handle is not None:
+            self._handle.flush()
+        if self._current is not None:
+            self._write_manifest()
+
+    def close(self) -> None:
+        """Close the current segment file and persist the manifest."""
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._current is not None:
+            self._write_manifest()
+
+    # internal -----------------------------------------------------------------
+    def _full(self) -> bool:
+        current = self._current
+        assert current is not None
+        return (
+            self.rotate_records is not None
+            and current["records"] >= self.rotate_records
+        ) or (self.rotate_bytes is not None and current["bytes"] >= self.rotate_bytes)
+
+    def _write_chunk(self, chunk: List[str]) -> None:
+        if not chunk:
+            return
+        if self._handle is None:
+            assert self._current is not None
+            self._handle = open_trace_file(self.directory / self._current["file"], "at")
+        self._handle.write("".join(chunk))
+
+    def _rotate(self) -> None:
+        if self._segments is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            manifest = read_manifest(self.directory)
+            self._segments = list(manifest["segments"]) if manifest else []
+        elif self._current is not None:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            self._write_manifest()
+        index = len(self._segments) + 1
+        suffix = _SUFFIXES[self.compression]
+        while (self.directory / f"segment-{index:05d}.trace.jsonl{suffix}").exists():
+            index += 1
+        self._current = {
+            "file": f"segment-{index:05d}.trace.jsonl{suffix}",
+            "compression": self.compression,
+            "records": 0,
+            "bytes": 0,
+            "run_ids": [],
+            "run_space_launch_ids": [],
+        }
+        self._segments.append(self._current)
+        self._run_ids = set()
+        self._launch_ids = set()
+
+    def _write_manifest(self) -> None:
+        current = self._current
+        assert current is not None and self._segments is not None
+        current["run_ids"] = sorted(self._run_ids)
+        current["run_space_launch_ids"] = sorted(self._launch_ids)
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "version": 1,
+            "segments": self._segments,
+        }
+        path = self.directory / MANIFEST_NAME
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+
+# readers ----------------------------------------------------------------------
+def _trace_files(directory: Path) -> List[Path]:
+    manifest = read_manifest(directory)
+    if manifest is not None:
+        return [directory / seg["file"] for seg in manifest.get("segments", [])]
+    return sorted(
+        p
+        for p in directory.iterdir()
+        if p.is_file() and p.name.endswith(_TRACE_SUFFIXES)
+    )
+
+
+def list_trace_files(path: str | Path) -> List[Path]:
+    """Return the trace files behind ``path`` in read order.
+
+    A file is returned as is; a segment directory lists its segments in
+    manifest order and other directories their ``.jsonl[.gz|.xz]`` files in
+    name order.
+    """
+
+    path = Path(path)
+    return _trace_files(path) if path.is_dir() else [path]
+
+
+def _record_run_id(record: Dict[str, Any]) -> Any:
+    run_id = record.get("run_id")
+    if run_id is None and isinstance(record.get("identity"), dict):
+        run_id = record["identity"].get("run_id")
+    return run_id
+
+
+def iter_trace_records(
+    path: str | Path,
+    *,
+    run_id: str | None = None,
+    run_space_launch_id: str | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Stream trace records from a JSONL file or a directory of trace files.
+
+    ``path`` may be a plain, ``.gz`` or ``.xz`` JSONL file, or a directory. In
+    a segment directory the manifest gives the file order and is used to skip
+    segments that cannot contain the requested run or launch; other
+    directories are read in file name order. Blank lines are ignored.
+
+    Args:
+        path: Trace file or directory.
+        run_id: Only yield records of this run.
+        run_space_launch_id: Only yield run-space records of this launch and
+            records of the runs it started.
+    """
+
+    path = Path(path)
+    if path.is_dir():
+        files = _trace_files(path)
+        manifest = read_manifest(path)
+        if manifest is not None:
+            wanted = []
+            for seg, file in zip(manifest.get("segments", []), files):
+                if run_id is not None and run_id not in seg.get("run_ids", []):
+                    continue
+                if run_space_launch_id is not None and run_space_launch_id not in (
+                    seg.get("run_space_launch_ids", [])
+                ):
+                    continue
+                wanted.append(file)
+            files = wanted
+    else:
+        files = [path]
+
+    launch_runs: set[Any] = set()
+    for file in files:
+        with open_trace_file(file) as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                rec_run_id = _record_run_id(record)
+                if run_id is not None and rec_run_id != run_id:
+                    continue
+                if run_space_launch_id is not None:
+                    if record.get("run_space_launch_id") == run_space_launch_id:
+                        launch_runs.add(rec_run_id)
+                    elif rec_run_id not in launch_runs:
+                        continue
+                yield record
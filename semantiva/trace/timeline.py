@@ -0,0 +1,384 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Timeline export of recorded traces in Chrome Trace Event Format.
+
+:class:`ChromeTraceConverter` turns a trace record stream into complete
+(``"ph": "X"``) events that open in Perfetto (https://ui.perfetto.dev) and
+``chrome://tracing``:
+
+- Every process that executed nodes (``timing.pid`` of its SERs) becomes a
+  process track. Nodes are spans on the thread that ran them
+  (``timing.thread``); runs are spans on the process's ``runs`` tracks.
+- Run-space launches are spans on a separate ``run-space launches`` process.
+
+Overlapping spans on one track (runs interleaved by threads, traces written
+before SERs carried ``pid``/``thread``) are spread over extra lanes. Runs of a
+parallel launch are replayed by the launching process, so their
+``pipeline_start``/``pipeline_end`` timestamps are replay times; such runs are
+bounded by their nodes' ``started_at``/``finished_at`` instead.
+
+Records are converted as they stream in; only slim node spans of runs still
+in flight are held in memory.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .segments import iter_trace_records
+
+#: Process id of the run-space launch tracks.
+LAUNCH_PID = 0
+#: Process id used for SERs that do not record ``timing.pid``.
+UNKNOWN_PID = 1
+# Thread ids below this are lanes of the ``runs`` track.
+_THREAD_TID_BASE = 100
+
+
+def _ts_us(value: Any) -> Optional[int]:
+    """Return microseconds of an ISO 8601 trace timestamp, or ``None``."""
+
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.rstrip("Z"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1_000_000)
+
+
+def _lane(lanes: List[int], start: int, end: int) -> int:
+    """Return the first lane free at ``start`` and occupy it until ``end``."""
+
+    for index, busy_until in enumerate(lanes):
+        if busy_until <= start:
+            lanes[index] = end
+            return index
+    lanes.append(end)
+    return len(lanes) - 1
+
+
+@dataclass
+class _NodeSpan:
+    name: str
+    start: int
+    end: int
+    pid: int
+    thread: str
+    args: Dict[str, Any]
+
+
+@dataclass
+class _OpenRun:
+    start: Optional[Mapping[str, Any]] = None
+    nodes: List[_NodeSpan] = field(default_factory=list)
+
+
+@dataclass
+class _Process:
+    run_lanes: List[int] = field(default_factory=list)
+    threads: Dict[str, Tuple[int, List[int]]] = field(default_factory=dict)
+
+
+class ChromeTraceConverter:
+    """Convert trace records into Chrome Trace Event Format events.
+
+    Feed records in write order with :meth:`feed` and call :meth:`finish`
+    once at the end; both return the events that became complete.
+    """
+
+    def __init__(self) -> None:
+        self._runs: Dict[str, _OpenRun] = {}
+        self._launches: Dict[Tuple[Any, Any], Mapping[str, Any]] = {}
+        self._processes: Dict[int, _Process] = {}
+        self._named: set[Tuple[int, int]] = set()
+
+    def feed(self, record: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """Consume one trace record and return the events it completes."""
+
+        kind = record.get("record_type")
+        if kind == "ser":
+            identity = record.get("identity") or {}
+            span = self._node_span(record)
+            if span is not None:
+                run = self._runs.setdefault(str(identity.get("run_id")), _OpenRun())
+                run.nodes.append(span)
+        elif kind == "pipeline_start":
+            self._runs.setdefault(str(record.get("run_id")), _OpenRun()).start = record
+        elif kind == "pipeline_end":
+            ended = self._runs.pop(str(record.get("run_id")), None)
+            if ended is not None:
+                return self._run_events(ended, record)
+        elif kind == "run_space_start":
+            self._launches[self._launch_key(record)] = record
+        elif kind == "run_space_end":
+            start = self._launches.pop(self._launch_key(record), None)
+            if start is not None:
+                return self._launch_events(start, record)
+        return []
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """Return the events of runs and launches that never ended."""
+
+        events: List[Dict[str, Any]] = []
+        for run in self._runs.values():
+            events.extend(self._run_events(run, None))
+        for start in self._launches.values():
+            events.extend(self._launch_events(start, None))
+        self._runs.clear()
+        self._launches.clear()
+        return events
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _launch_key(record: Mapping[str, Any]) -> Tuple[Any, Any]:
+        return record.get("run_space_launch_id"), record.get("run_space_attempt")
+
+    @staticmethod
+    def _node_span(record: Mapping[str, Any]) -> Optional[_NodeSpan]:
+        timing = record.get("timing") or {}
+        start = _ts_us(timing.get("started_at"))
+        end = _ts_us(timing.get("finished_at"))
+        if start is None or end is None:
+            return None
+        identity = record.get("identity") or {}
+        ref = str((record.get("processor") or {}).get("ref") or "node")
+        args: Dict[str, Any] = {
+            "node_id": identity.get("node_id"),
+            "run_id": identity.get("run_id"),
+            "processor": ref,
+            "status": record.get("status"),
+        }
+        for key in ("wall_ms", "cpu_ms"):
+            if key in timing:
+                args[key] = timing[key]
+        pid = timing.get("pid")
+        return _NodeSpan(
+            name=ref.rsplit(".", 1)[-1],
+            start=start,
+            end=max(end, start),
+            pid=pid if isinstance(pid, int) else UNKNOWN_PID,
+            thread=str(timing.get("thread") or "main"),
+            args=args,
+        )
+
+    def _process(self, pid: int, events: List[Dict[str, Any]]) -> _Process:
+        process = self._processes.get(pid)
+        if process is None:
+            process = self._processes[pid] = _Process()
+            if pid == LAUNCH_PID:
+                name = "run-space launches"
+            elif pid == UNKNOWN_PID:
+                name = "unknown process"
+            else:
+                name = f"process {pid}"
+            events.append(_meta("process_name", pid, 0, name=name))
+        return process
+
+    def _lane_tid(
+        self,
+        lanes: List[int],
+        span: Tuple[int, int],
+        pid: int,
+        base: int,
+        name: str,
+        events: List[Dict[str, Any]],
+    ) -> int:
+        """Place ``span`` on a lane of a track and return the lane's tid."""
+
+        lane = _lane(lanes, *span)
+        tid = base + lane
+        if (pid, tid) not in self._named:
+            self._named.add((pid, tid))
+            label = name if lane == 0 else f"{name} #{lane + 1}"
+            events.append(_meta("thread_name", pid, tid, name=label))
+            events.append(_meta("thread_sort_index", pid, tid, sort_index=tid))
+        return tid
+
+    def _thread_tid(self, span: _NodeSpan, events: List[Dict[str, Any]]) -> int:
+        process = self._process(span.pid, events)
+        entry = process.threads.get(span.thread)
+        if entry is None:
+            base = _THREAD_TID_BASE * (len(process.threads) + 1)
+            entry = process.threads[span.thread] = (base, [])
+        base, lanes = entry
+        return self._lane_tid(
+            lanes, (span.start, span.end), span.pid, base, span.thread, events
+        )
+
+    def _run_events(
+        self, run: _OpenRun, end_record: Optional[Mapping[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        nodes = sorted(run.nodes, key=lambda span: span.start)
+        start_record = run.start or {}
+        start = _ts_us(start_record.get("timestamp"))
+        end = _ts_us((end_record or {}).get("timestamp"))
+        if nodes:
+            first = nodes[0].start
+            last = max(span.end for span in nodes)
+            if start is None or start > first:  # replayed or truncated run
+                start, end = first, last
+            elif end is None or end < last:
+                end = last
+        run_id = start_record.get("run_id") or (
+            nodes[0].args.get("run_id") if nodes else None
+        )
+        if start is not None and end is not None and end >= start:
+            pid = nodes[0].pid if nodes else UNKNOWN_PID
+            index = start_record.get("run_space_index")
+            status = ((end_record or {}).get("summary") or {}).get("status")
+            args: Dict[str, Any] = {
+                "run_id": run_id,
+                "pipeline_id": start_record.get("pipeline_id"),
+                "status": status or "incomplete",
+            }
+            if index is not None:
+                args["run_space_index"] = index
+            if start_record.get("run_space_launch_id"):
+                args["run_space_launch_id"] = start_record["run_space_launch_id"]
+            lanes = self._process(pid, events).run_lanes
+            tid = self._lane_tid(lanes, (start, end), pid, 0, "runs", events)
+            events.append(
+                _span(
+                    f"run {index}" if index is not None else str(run_id),
+                    "run",
+                    start,
+                    end,
+                    pid,
+                    tid,
+                    args,
+                )
+            )
+        for span in nodes:
+            tid = self._thread_tid(span, events)
+            events.append(
+                _span(span.name, "node", span.start, span.end, span.pid, tid, span.args)
+            )
+        return events
+
+    def _launch_events(
+        self, start_record: Mapping[str, Any], end_record: Optional[Mapping[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        start = _ts_us(start_record.get("timestamp"))
+        end = _ts_us((end_record or {}).get("timestamp"))
+        if start is None:
+            return []
+        if end is None or end < start:
+            end = start
+        events: List[Dict[str, Any]] = []
+        lanes = self._process(LAUNCH_PID, events).run_lanes
+        tid = self._lane_tid(lanes, (start, end), LAUNCH_PID, 0, "launches", events)
+        launch_id = str(start_record.get("run_space_launch_id"))
+        args: Dict[str, Any] = {
+            "run_space_launch_id": launch_id,
+            "run_space_attempt": start_record.get("run_space_attempt"),
+            "run_space_spec_id": start_record.get("run_space_spec_id"),
+            "planned_runs": start_record.get("run_space_planned_run_count"),
+        }
+        summary = (end_record or {}).get("summary") or {}
+        args.update(summary)
+        if end_record is None:
+            args["status"] = "incomplete"
+        events.append(
+            _span(
+                f"launch {launch_id[:12]} (attempt {args['run_space_attempt']})",
+                "run_space",
+                start,
+                end,
+                LAUNCH_PID,
+                tid,
+                args,
+            )
+        )
+        return events
+
+
+def _span(
+    name: str,
+    category: str,
+    start: int,
+    end: int,
+    pid: int,
+    tid: int,
+    args: Mapping[str, Any],
+) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": start,
+        "dur": end - start,
+        "pid": pid,
+        "tid": tid,
+        "args": dict(args),
+    }
+
+
+def _meta(kind: str, pid: int, tid: int, **args: Any) -> Dict[str, Any]:
+    return {"name": kind, "ph": "M", "pid": pid, "tid": tid, "args": args}
+
+
+def iter_chrome_events(records: Iterable[Mapping[str, Any]]) -> Iterator[dict]:
+    """Yield Chrome Trace Event Format events for ``records`` (in write order)."""
+
+    converter = ChromeTraceConverter()
+    for record in records:
+        yield from converter.feed(record)
+    yield from converter.finish()
+
+
+def write_chrome_trace(
+    paths: Iterable[str | os.PathLike[str]], output: str | os.PathLike[str] | IO[str]
+) -> int:
+    """Convert the trace files or directories in ``paths`` into ``output``.
+
+    ``output`` is a path or a text stream receiving a JSON object with a
+    ``traceEvents`` array. Returns the number of events written.
+    """
+
+    def records() -> Iterator[Dict[str, Any]]:
+        for path in paths:
+            yield from iter_trace_records(Path(path))
+
+    if not hasattr(output, "write"):
+        with Path(output).open("w", encoding="utf-8") as handle:  # type: ignore[arg-type]
+            return write_chrome_trace(paths, handle)
+    stream: IO[str] = output  # type: ignore[assignment]
+    stream.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+    count = 0
+    for event in iter_chrome_events(records()):
+        if count:
+            stream.write(",\n")
+        stream.write(json.dumps(event, sort_keys=True, default=str))
+        count += 1
+    stream.write("\n]}\n")
+    return count
+
+
+__all__ = [
+    "LAUNCH_PID",
+    "UNKNOWN_PID",
+    "ChromeTraceConverter",
+    "iter_chrome_events",
+    "write_chrome_trace",
+]
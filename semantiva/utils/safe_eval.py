@@ -20,7 +20,11 @@ Provides controlled mathematical expression evaluation for parameter resolution.
 from __future__ import annotations
 
 import ast
-from typing import Callable, Any
+import builtins
+import functools
+from typing import Callable, Any, Optional
+
+import numpy as np
 
 
 class ExpressionError(Exception):
@@ -86,6 +90,53 @@ class _SafeVisitor(ast.NodeVisitor):
         super().generic_visit(node)
 
 
+def _vector_round(value: Any, ndigits: Optional[int] = None) -> Any:
+    # Python's round() returns an int without ``ndigits``; both round half to even.
+    if ndigits is None:
+        return np.round(value).astype(np.int64)
+    return np.round(value, ndigits)
+
+
+def _vector_reduce(func: Callable[[Any, Any], Any]) -> Callable[..., Any]:
+    def _apply(*args: Any) -> Any:
+        if len(args) < 2:
+            raise TypeError("vectorized min/max need at least two arguments")
+        return functools.reduce(func, args)
+
+    return _apply
+
+
+# NumPy counterparts of the builtins allowed in expressions. ``str`` has none,
+# so expressions calling it are evaluated point by point.
+_VECTOR_FUNCS: dict[str, Callable[..., Any]] = {
+    "abs": np.abs,
+    "min": _vector_reduce(np.minimum),
+    "max": _vector_reduce(np.maximum),
+    "round": _vector_round,
+    "float": lambda value: np.asarray(value, dtype=np.float64),
+    "int": lambda value: np.trunc(value).astype(np.int64),
+    "bool": lambda value: np.asarray(value, dtype=bool),
+}
+
+
+def _is_vectorizable(tree: ast.AST) -> bool:
+    """Return whether ``tree`` has the same meaning element-wise on arrays.
+
+    Conditionals, boolean operators and chained comparisons need a single
+    truth value; tuples and ``str`` have no element-wise form.
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.IfExp, ast.BoolOp, ast.Tuple)):
+            return False
+        if isinstance(node, ast.Compare) and len(node.ops) > 1:
+            return False
+        if isinstance(node, ast.Call) and (
+            not isinstance(node.func, ast.Name) or node.func.id not in _VECTOR_FUNCS
+        ):
+            return False
+    return True
+
+
 class ExpressionEvaluator:
     """Compile small mathematical expressions in a safe manner."""
 
@@ -117,3 +168,45 @@ class ExpressionEvaluator:
             return eval(code, self.env, kwargs)
 
         return _fn
+
+    def compile_vectorized(
+        self, expr: str, allowed_names: set[str]
+    ) -> Optional[Callable[..., Any]]:
+        """Compile ``expr`` for evaluation over NumPy arrays.
+
+        The returned callable takes one array per variable and returns the
+        expression evaluated element-wise. Floating point errors (division by
+        zero, invalid operations) raise ``FloatingPointError`` instead of
+        producing ``inf``/``nan``, so callers can fall back to :meth:`compile`
+        and get Python's error semantics.
+
+        Returns:
+            ``None`` when ``expr`` cannot be evaluated element-wise with the
+            same meaning: it uses conditionals, boolean operators, chained
+            comparisons or tuples, or it calls a function without a NumPy
+            counterpart.
+
+        Raises:
+            ExpressionError: If ``expr`` is invalid (as for :meth:`compile`).
+        """
+        try:
+            tree = ast.parse(expr, mode="eval")
+        except SyntaxError as exc:  # pragma: no cover - simple propagation
+            raise ExpressionError(f"Invalid expression syntax: {exc.msg}") from exc
+        _SafeVisitor(allowed_names).visit(tree)
+        if not _is_vectorizable(tree):
+            return None
+        for node in ast.walk(tree):
+            # A customised builtin has no known NumPy counterpart.
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                name = node.func.id
+                if self.env.get(name) is not getattr(builtins, name, None):
+                    return None
+        code = compile(tree, filename="<expr>", mode="eval")
+        env = dict(_VECTOR_FUNCS)
+
+        def _fn(**arrays: Any) -> Any:
+            with np.errstate(all="raise"):
+                return eval(code, env, arrays)
+
+        return _fn
@@ -0,0 +1,192 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming aggregation across many (compressed) trace files."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from semantiva.configurations import load_pipeline_from_yaml
+from semantiva.pipeline import Pipeline
+from semantiva.trace.aggregation import (
+    StreamingTraceAggregator,
+    TraceAggregator,
+    summarize_traces,
+)
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+from semantiva.trace.runtime import (
+    RunSpaceLaunchManager,
+    RunSpaceTraceEmitter,
+    TraceContext,
+)
+from semantiva.trace.segments import iter_trace_records
+
+from tests.test_utils import run_cli
+
+
+def _write_launch(driver: JsonlTraceDriver, runs: int) -> str:
+    emitter = RunSpaceTraceEmitter(driver)
+    launch = RunSpaceLaunchManager().create_launch(
+        run_space_spec_id="a" * 64, run_space_inputs_id=None
+    )
+    trace_ctx = TraceContext()
+    trace_ctx.set_run_space_fk(
+        spec_id="a" * 64, launch_id=launch.id, attempt=launch.attempt
+    )
+    emitter.emit_start(
+        run_space_spec_id="a" * 64,
+        run_space_launch_id=launch.id,
+        run_space_attempt=launch.attempt,
+        run_space_combine_mode="combinatorial",
+        run_space_total_runs=runs,
+        run_space_planned_run_count=runs,
+    )
+    pipeline = Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"), trace=driver
+    )
+    for index in range(runs):
+        pipeline.set_run_metadata(
+            {
+                "trace_context": trace_ctx,
+                "run_space_context": {},
+                "run_space_index": index,
+            }
+        )
+        pipeline.process()
+    emitter.emit_end(run_space_launch_id=launch.id, run_space_attempt=launch.attempt)
+    driver.close()
+    return launch.id
+
+
+def _write_traces(tmp_path: Path) -> list[Path]:
+    """Two files: a plain one with a launch and a truncated run, and segments."""
+
+    plain = tmp_path / "a.ser.jsonl"
+    _write_launch(JsonlTraceDriver(str(plain)), 3)
+    # A standalone run that never wrote its pipeline_end.
+    single = tmp_path / "single.jsonl"
+    Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"),
+        trace=JsonlTraceDriver(str(single)),
+    ).process()
+    run_id = json.loads(single.read_text().splitlines()[0])["run_id"]
+    with plain.open("a") as handle:
+        handle.writelines(
+            line.replace(run_id, "run-truncated")
+            for line in single.read_text().splitlines(True)
+            if '"pipeline_end"' not in line
+        )
+    single.unlink()
+    segments = tmp_path / "segments"
+    driver = JsonlTraceDriver(str(segments), compression="gzip", rotate_records=4)
+    Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"), trace=driver
+    ).process()
+    _write_launch(driver, 2)
+    return [plain, segments]
+
+
+def _classic(paths: list[Path]):
+    agg = TraceAggregator()
+    for path in paths:
+        agg.ingest_path(path)
+    runs, launches = agg.finalize_all()
+    return {r.run_id: r.status for r in runs}, {
+        (launch.run_space_launch_id, launch.status) for launch in launches
+    }
+
+
+def test_streaming_matches_classic_and_evicts(tmp_path: Path) -> None:
+    paths = _write_traces(tmp_path)
+    expected_runs, expected_launches = _classic(paths)
+
+    seen: dict[str, str] = {}
+    launches: set[tuple[str, str]] = set()
+    peak = 0
+    agg = StreamingTraceAggregator(
+        on_run=lambda run, c: seen.__setitem__(c.run_id, c.status),
+        on_launch=lambda launch, c: launches.add((c.run_space_launch_id, c.status)),
+    )
+    for path in paths:
+        for record in iter_trace_records(path):
+            agg.ingest(record)
+            peak = max(peak, agg.open_runs)
+    assert "run-truncated" not in seen
+    agg.finish()
+
+    assert seen == expected_runs
+    assert seen["run-truncated"] == "partial"
+    assert launches == expected_launches
+    assert {status for _, status in launches} == {"complete"}
+    assert peak == 2  # the standalone truncated run plus the run being written
+    assert agg.open_runs == 0 and not list(agg.iter_launches())
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_summarize_is_independent_of_workers_and_chunks(
+    tmp_path: Path, workers: int
+) -> None:
+    paths = _write_traces(tmp_path)
+    expected_runs, _ = _classic(paths)
+    summary = summarize_traces(paths, workers=workers, chunk_bytes=3000)
+
+    assert summary.files == 1 + len(list((tmp_path / "segments").glob("*.gz")))
+    assert summary.runs_by_status == {"complete": 6, "partial": 1, "invalid": 0}
+    assert summary.runs_total == len(expected_runs)
+    assert [run.run_id for run in summary.problem_runs] == ["run-truncated"]
+    assert [launch.summary["runs_total"] for launch in summary.launches] == [3, 2]
+    nodes = summary.to_dict()["nodes"]
+    assert len(nodes) == 5
+    assert all(node["runs"] == 7 for node in nodes)
+    assert {node["processor_ref"] for node in nodes} >= {"FloatAddOperation"}
+
+
+def test_merge_of_split_run_equals_single_ingest(tmp_path: Path) -> None:
+    path = tmp_path / "t.jsonl"
+    Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"),
+        trace=JsonlTraceDriver(str(path)),
+    ).process()
+    records = list(iter_trace_records(path))
+    whole = TraceAggregator()
+    whole.ingest_many(records)
+    head, tail = TraceAggregator(), TraceAggregator()
+    head.ingest_many(records[:3])
+    tail.ingest_many(records[3:])
+    head.merge(tail)
+
+    (run,) = head.iter_runs()
+    assert run == next(iter(whole.iter_runs()))
+    assert head.finalize_run(run.run_id).status == "complete"
+
+
+def test_cli_trace_summarize(tmp_path: Path) -> None:
+    paths = _write_traces(tmp_path)
+    result = run_cli(["trace", "summarize", *map(str, paths), "--json", "-j", "2"])
+    assert result.returncode == 0, result.stderr
+    data = json.loads(result.stdout)
+    assert data["runs_by_status"]["complete"] == 6
+    assert data["problem_runs"][0]["run_id"] == "run-truncated"
+
+    text = run_cli(["trace", "summarize", str(paths[1]), "--top", "2"])
+    assert text.returncode == 0, text.stderr
+    assert "Traces:" in text.stdout and "3 runs (complete 3" in text.stdout
+    assert "Nodes by total wall time:" in text.stdout
+
+    missing = run_cli(["trace", "summarize", str(tmp_path / "nope")])
+    assert missing.returncode == 2
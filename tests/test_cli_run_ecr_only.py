@@ -60,3 +60,27 @@ def test_cli_runs_with_ecr_aliases(tmp_path):
     lines = trace_path.read_text().splitlines()
     assert lines, "trace file must not be empty"
     json.loads(lines[0])
+
+
+def test_cli_forwards_transport_options(tmp_path):
+    pipeline_yaml = tmp_path / "pipeline.yaml"
+    pipeline_yaml.write_text(textwrap.dedent("""
+            extensions: ["semantiva-examples"]
+            pipeline:
+              nodes:
+                - processor: FloatValueDataSource
+                  parameters: { value: 2.0 }
+            execution:
+              transport: in_memory
+              transport_options: { retention: ring, max_messages: 4 }
+            """).strip())
+    cmd = [sys.executable, "-m", "semantiva.cli", "run", str(pipeline_yaml)]
+
+    assert subprocess.run(cmd, capture_output=True, text=True).returncode == 0
+    result = subprocess.run(
+        cmd + ["--execution.transport-option", "max_messages=0"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 3
+    assert "requires max_messages" in result.stderr
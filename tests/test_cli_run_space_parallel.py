@@ -0,0 +1,167 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from semantiva.configurations import parse_pipeline_config
+from semantiva.execution.run_space_pool import (
+    RecordingTraceDriver,
+    replay_trace_calls,
+)
+
+
+def run_cli(args, cwd: Path | None = None):
+    cmd = [sys.executable, "-m", "semantiva.semantiva", *args]
+    return subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
+
+
+def _write_pipeline(tmp_path: Path, extra: str = "") -> Path:
+    path = tmp_path / "pipeline.yaml"
+    path.write_text(textwrap.dedent("""
+            extensions: ["semantiva-examples"]
+            run_space:
+              combine: combinatorial
+              blocks:
+                - mode: combinatorial
+                  context:
+                    value: [1.0, 2.0, 3.0]
+                    factor: [10.0, 20.0]
+            pipeline:
+              nodes:
+                - processor: FloatValueDataSource
+                - processor: FloatMultiplyOperation
+            """) + textwrap.dedent(extra))
+    return path
+
+
+def _load(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def _normalized(records: list[dict]) -> list[tuple]:
+    out = []
+    for rec in records:
+        if rec["record_type"] == "ser":
+            out.append(("ser", rec["identity"]["node_id"], rec["status"]))
+        else:
+            out.append((rec["record_type"], rec.get("seq"), rec.get("run_space_index")))
+    return out
+
+
+def test_jobs_flag_matches_serial_trace_order(tmp_path: Path):
+    yaml_path = _write_pipeline(tmp_path)
+    serial = tmp_path / "serial.jsonl"
+    parallel = tmp_path / "parallel.jsonl"
+
+    trace_args = ["--trace.driver", "jsonl", "--trace.output"]
+
+    res = run_cli(["run", str(yaml_path), *trace_args, str(serial)])
+    assert res.returncode == 0, res.stderr
+    res = run_cli(["run", str(yaml_path), "--jobs", "3", *trace_args, str(parallel)])
+    assert res.returncode == 0, res.stderr
+    assert "Run 6/6 completed" in res.stdout
+
+    serial_records = _load(serial)
+    parallel_records = _load(parallel)
+    assert _normalized(parallel_records) == _normalized(serial_records)
+
+    starts = [r for r in parallel_records if r["record_type"] == "pipeline_start"]
+    assert [r["run_space_index"] for r in starts] == list(range(6))
+    assert parallel_records[0]["record_type"] == "run_space_start"
+    assert parallel_records[-1]["record_type"] == "run_space_end"
+    assert parallel_records[-1]["summary"]["completed_runs"] == 6
+
+
+def test_run_space_parallelism_yaml_key(tmp_path: Path):
+    yaml_path = _write_pipeline(
+        tmp_path,
+        """
+        execution:
+          run_space_parallelism: 2
+        """,
+    )
+    res = run_cli(["run", str(yaml_path)])
+    assert res.returncode == 0, res.stderr
+    assert "on 2 worker processes" in res.stdout
+
+
+def test_parallel_failure_reports_error_and_summary(tmp_path: Path):
+    trace = tmp_path / "trace.jsonl"
+    yaml_path = _write_pipeline(tmp_path)
+    res = run_cli(
+        [
+            "run",
+            str(yaml_path),
+            "--jobs",
+            "2",
+            "--trace.driver",
+            "jsonl",
+            "--trace.output",
+            str(trace),
+            "--set",
+            "pipeline.nodes.1.processor=FloatDivideOperation",
+            "--context",
+            "divisor=0",
+        ]
+    )
+    assert res.returncode == 4
+    assert "Execution failed" in res.stderr
+    records = _load(trace)
+    assert records[-1]["record_type"] == "run_space_end"
+    assert records[-1]["summary"]["status"] == "failed"
+    assert records[-1]["summary"]["completed_runs"] == 0
+
+
+@pytest.mark.parametrize("value", [0, -1, "two", True])
+def test_run_space_parallelism_must_be_positive_int(value):
+    with pytest.raises(ValueError, match="run_space_parallelism"):
+        parse_pipeline_config(
+            {
+                "pipeline": {"nodes": []},
+                "execution": {"run_space_parallelism": value},
+            }
+        )
+
+
+def test_recording_driver_replays_calls_in_order():
+    class _Sink:
+        def __init__(self):
+            self.calls = []
+
+        def __getattr__(self, name):
+            return lambda *a, **k: self.calls.append((name, a, k))
+
+    recorder = RecordingTraceDriver({"hash": True, "repr": True})
+    assert recorder.get_options() == {"hash": True, "repr": True}
+    recorder.on_pipeline_start("p", "r", {"nodes": []}, {}, object(), run_space_index=3)
+    recorder.on_pipeline_end("r", {"status": "ok"})
+    recorder.flush()
+    recorder.close()
+
+    sink = _Sink()
+    replay_trace_calls(sink, recorder.drain())
+    assert [c[0] for c in sink.calls] == [
+        "on_pipeline_start",
+        "on_pipeline_end",
+        "flush",
+        "close",
+    ]
+    assert sink.calls[0][2] == {"run_space_index": 3}
+    assert recorder.drain() == []
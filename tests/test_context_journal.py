@@ -0,0 +1,177 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import copy
+
+from semantiva import Payload
+from semantiva.context_processors import (
+    ContextChanges,
+    ContextCollectionType,
+    ContextType,
+)
+from semantiva.context_processors import context_types
+from semantiva.data_types import NoDataType
+from semantiva.execution.orchestrator.orchestrator import SemantivaOrchestrator
+from semantiva.pipeline import Pipeline
+from semantiva.trace import delta_collector
+
+
+class _Collector:
+    def __init__(self):
+        self.sers = []
+
+    def on_pipeline_start(self, *args, **kwargs):
+        pass
+
+    def on_node_event(self, event):
+        self.sers.append(event)
+
+    def on_pipeline_end(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _TimingCollector(_Collector):
+    def get_options(self):
+        return {}
+
+
+def test_journal_classifies_created_updated_deleted():
+    ctx = ContextType({"keep": 1, "change": 2, "drop": 3, "cycle": 4})
+    mark = ctx.journal_mark()
+    ctx.set_value("change", 20)
+    ctx.delete_value("drop")
+    ctx.set_value("new", 5)
+    ctx.delete_value("cycle")
+    ctx.set_value("cycle", 40)
+    ctx.set_value("temp", 0)
+    ctx.delete_value("temp")
+    assert ctx.journal_since(mark) == ContextChanges(
+        created=("new",), updated=("change", "cycle"), deleted=("drop",)
+    )
+    assert ctx.version == 7
+    assert not ctx.journal_since(ctx.journal_mark())
+
+    mark = ctx.journal_mark()
+    ctx.clear()
+    assert ctx.journal_since(mark).deleted == ("change", "cycle", "keep", "new")
+
+
+def test_journal_reset_invalidates_old_marks(monkeypatch):
+    monkeypatch.setattr(context_types, "_JOURNAL_LIMIT", 3)
+    ctx = ContextType()
+    mark = ctx.journal_mark()
+    for i in range(4):
+        ctx.set_value(f"k{i}", i)
+    assert ctx.journal_since(mark) is None
+    later = ctx.journal_mark()
+    ctx.set_value("k0", -1)
+    assert ctx.journal_since(later).updated == ("k0",)
+
+
+def test_copies_have_independent_journals():
+    ctx = ContextType({"a": 1})
+    mark = ctx.journal_mark()
+    clone = copy.copy(ctx)
+    clone._context_container = dict(ctx._context_container)
+    clone.set_value("b", 2)
+    assert not ctx.journal_since(mark)
+    assert clone.journal_since(mark).created == ("b",)
+
+
+def test_collection_journal_reports_to_dict_keys():
+    items = [ContextType({"x": 1}), ContextType({"x": 2})]
+    coll = ContextCollectionType({"g": 0}, items)
+    mark = coll.journal_mark()
+    assert not coll.journal_since(mark)
+    coll.set_value("g", 1)
+    assert coll.journal_since(mark).updated == ("global",)
+
+    mark = coll.journal_mark()
+    coll.set_item_value(0, "x", 10)
+    assert coll.journal_since(mark).updated == ("locals",)
+
+    mark = coll.journal_mark()
+    coll.append(ContextType())
+    coll.delete_value("g")
+    assert coll.journal_since(mark).updated == ("global", "locals")
+
+
+def test_ser_delta_from_journal_skips_untouched_keys(monkeypatch):
+    compared = []
+    original = delta_collector._stable_equal
+
+    def counting(hasher, a, b):
+        compared.append((a, b))
+        return original(hasher, a, b)
+
+    monkeypatch.setattr(delta_collector, "_stable_equal", counting)
+    nodes = [
+        {"processor": "FloatValueDataSource", "parameters": {"value": 2.0}},
+        {"processor": "FloatCollectValueProbe", "context_key": "result"},
+        {"processor": "FloatCollectValueProbe", "context_key": "result"},
+        {"processor": "FloatMultiplyOperation", "parameters": {"factor": 3.0}},
+        {"processor": "FloatCollectValueProbe", "context_key": "result"},
+    ]
+    collector = _Collector()
+    large = list(range(100_000))
+    Pipeline(nodes, trace=collector).process(
+        Payload(NoDataType(), ContextType({"large": large}))
+    )
+    deltas = [ser.context_delta for ser in collector.sers]
+    assert [d.created_keys for d in deltas] == [[], ["result"], [], [], []]
+    # Rewriting the same value is not an update; writing a new one is.
+    assert [d.updated_keys for d in deltas] == [[], [], [], [], ["result"]]
+    # Only the written key was compared, never the large untouched one.
+    assert compared and all(a is not large for a, _ in compared)
+
+
+def test_to_dict_subset_matches_to_dict_entries():
+    ctx = ContextType({"a": 1, "b": 2})
+    assert ctx.to_dict_subset(["b", "missing"]) == {"b": 2}
+    coll = ContextCollectionType({"g": 0}, [ContextType({"x": 1})])
+    assert coll.to_dict_subset(["locals", "x"]) == {"locals": [{"x": 1}]}
+    assert coll.to_dict_subset(["global"]) == {"global": {"g": 0}}
+
+
+def test_journaled_nodes_snapshot_context_once(monkeypatch):
+    snapshots = []
+    original = SemantivaOrchestrator._context_snapshot
+
+    def counting(self, ctx):
+        snapshots.append(ctx)
+        return original(self, ctx)
+
+    monkeypatch.setattr(SemantivaOrchestrator, "_context_snapshot", counting)
+    nodes = [
+        {"processor": "FloatValueDataSource", "parameters": {"value": 2.0}},
+        {"processor": "FloatCollectValueProbe", "context_key": "result"},
+    ]
+    collector = _TimingCollector()
+    Pipeline(nodes, trace=collector).process(Payload(NoDataType(), ContextType()))
+    # Only the pre-execution view is copied; the post view reads written keys.
+    assert len(snapshots) == len(nodes)
+    assert collector.sers[1].context_delta.created_keys == ["result"]
+    assert all(
+        check["result"] == "PASS"
+        for ser in collector.sers
+        for check in ser.assertions["postconditions"]
+    )
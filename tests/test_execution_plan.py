@@ -0,0 +1,120 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from semantiva import Payload
+from semantiva.context_processors import ContextType
+from semantiva.data_types import NoDataType
+from semantiva.execution.orchestrator import LocalSemantivaOrchestrator
+from semantiva.execution.orchestrator.plan import ExecutionPlan
+from semantiva.execution.transport.in_memory import InMemorySemantivaTransport
+from semantiva.logger import Logger
+from semantiva.pipeline import Pipeline
+
+NODES = [
+    {"processor": "FloatValueDataSource", "parameters": {"value": 3.0}},
+    {"processor": "FloatMultiplyOperation"},
+    {"processor": "FloatCollectValueProbe", "context_key": "result"},
+]
+
+
+class _Collector:
+    def __init__(self):
+        self.starts = []
+        self.sers = []
+
+    def on_pipeline_start(self, pipeline_id, run_id, canonical, meta, **kwargs):
+        self.starts.append((pipeline_id, meta))
+
+    def on_node_event(self, event):
+        self.sers.append(event)
+
+    def on_pipeline_end(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _payload(factor: float) -> Payload:
+    return Payload(NoDataType(), ContextType({"factor": factor}))
+
+
+def test_compile_returns_immutable_plan():
+    pipeline = Pipeline(NODES)
+    plan = pipeline.compile()
+    assert isinstance(plan, ExecutionPlan)
+    assert pipeline.execution_plan is plan
+    assert pipeline.nodes == plan.pipeline_nodes
+    assert [n.required_keys for n in plan.nodes][1] == ("factor",)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plan.pipeline_id = "other"  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        plan.nodes[0].node_params["value"] = 1.0  # type: ignore[index]
+
+
+def test_repeated_runs_reuse_plan(monkeypatch):
+    orchestrator = LocalSemantivaOrchestrator()
+    calls = []
+    original = orchestrator._instantiate_nodes
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(orchestrator, "_instantiate_nodes", counting)
+    pipeline = Pipeline(NODES, orchestrator=orchestrator)
+    results = [pipeline.process(_payload(f)) for f in (1.0, 2.0, 3.0)]
+    assert [r.context.get_value("result") for r in results] == [3.0, 6.0, 9.0]
+    assert len(calls) == 1
+    first_nodes = pipeline.nodes
+    pipeline.process(_payload(4.0))
+    assert all(a is b for a, b in zip(first_nodes, pipeline.nodes))
+
+
+def test_planned_and_unplanned_runs_emit_same_evidence():
+    planned = _Collector()
+    pipeline = Pipeline(NODES, trace=planned)
+    pipeline.process(_payload(2.0))
+    pipeline.process(_payload(5.0))
+
+    direct = _Collector()
+    LocalSemantivaOrchestrator().execute(
+        NODES,
+        _payload(5.0),
+        InMemorySemantivaTransport(),
+        Logger(),
+        trace=direct,
+    )
+
+    # Identity and start metadata are stable across planned runs and match
+    # a one-off execution.
+    assert planned.starts[0] == planned.starts[1] == direct.starts[0]
+    second_run = planned.sers[len(NODES) :]
+    for a, b in zip(second_run, direct.sers):
+        assert a.identity["node_id"] == b.identity["node_id"]
+        assert a.processor == b.processor
+        assert a.dependencies == b.dependencies
+    multiply = second_run[1].processor
+    assert multiply["parameters"] == {"factor": 5.0}
+    assert multiply["parameter_sources"] == {"factor": "context"}
+    assert planned.sers[1].processor["parameters"] == {"factor": 2.0}
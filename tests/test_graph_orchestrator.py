@@ -0,0 +1,265 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from semantiva import Payload
+from semantiva.configurations.schema import ExecutionConfig
+from semantiva.context_processors import ContextType
+from semantiva.data_processors.data_processors import DataOperation
+from semantiva.data_types import NoDataType
+from semantiva.examples.test_utils import FloatDataType
+from semantiva.exceptions import PipelineTopologyError
+from semantiva.execution.component_registry import ExecutionComponentRegistry
+from semantiva.execution.executor import ThreadPoolSemantivaExecutor
+from semantiva.execution.orchestrator import (
+    GraphSemantivaOrchestrator,
+    LocalSemantivaOrchestrator,
+)
+from semantiva.execution.orchestrator.factory import build_orchestrator
+from semantiva.execution.orchestrator.graph_router import PayloadRouter
+from semantiva.execution.transport.in_memory import InMemorySemantivaTransport
+from semantiva.logger import Logger
+from semantiva.pipeline import Pipeline
+from semantiva.pipeline.graph_builder import build_graph, compute_upstream_map
+
+# source -> (multiply -> probe "mul_value") and (add -> probe "add_value") -> join
+DIAMOND = [
+    {
+        "processor": "FloatValueDataSource",
+        "parameters": {"value": 2.0},
+        "ports": {"output": "src"},
+    },
+    {
+        "processor": "FloatMultiplyOperation",
+        "parameters": {"factor": 10.0},
+        "ports": {"inputs": ["src"]},
+    },
+    {
+        "processor": "FloatCollectValueProbe",
+        "context_key": "mul_value",
+        "ports": {"output": "mul"},
+    },
+    {
+        "processor": "FloatAddOperation",
+        "parameters": {"addend": 1.0},
+        "ports": {"inputs": ["src"]},
+    },
+    {
+        "processor": "FloatCollectValueProbe",
+        "context_key": "add_value",
+        "ports": {"output": "add"},
+    },
+    {
+        "processor": "FloatMultiplyOperation",
+        "parameters": {"factor": 1.0},
+        "ports": {"inputs": ["mul", "add"]},
+    },
+]
+
+
+class _Collector:
+    def __init__(self):
+        self.sers = []
+
+    def on_pipeline_start(self, *args, **kwargs):
+        pass
+
+    def on_node_event(self, event):
+        self.sers.append(event)
+
+    def on_pipeline_end(self, *args, **kwargs):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _edges(nodes):
+    graph = build_graph(nodes)
+    index = {n["node_uuid"]: i for i, n in enumerate(graph["nodes"])}
+    return [(index[e["source"]], index[e["target"]]) for e in graph["edges"]]
+
+
+def _run(nodes, orchestrator, context=None, trace=None):
+    pipeline = Pipeline(nodes, orchestrator=orchestrator, trace=trace)
+    return pipeline.process(Payload(NoDataType(), ContextType(context or {})))
+
+
+def test_ports_define_edges_and_default_to_chain():
+    assert _edges(DIAMOND) == [(0, 1), (1, 2), (0, 3), (3, 4), (2, 5), (4, 5)]
+    plain = [{k: v for k, v in n.items() if k != "ports"} for n in DIAMOND]
+    assert _edges(plain) == [(i, i + 1) for i in range(len(DIAMOND) - 1)]
+
+
+@pytest.mark.parametrize(
+    "ports, match",
+    [
+        ({"inputs": ["missing"]}, "does not name the output"),
+        ({"output": "src"}, "already declared"),
+        ({"inputs": "src", "extra": 1}, "unsupported ports"),
+        ({"inputs": [1]}, "list of output labels"),
+    ],
+)
+def test_invalid_ports_raise_topology_error(ports, match):
+    nodes = [dict(DIAMOND[0]), {"processor": "FloatMultiplyOperation", "ports": ports}]
+    with pytest.raises(PipelineTopologyError, match=match):
+        build_graph(nodes)
+
+
+@pytest.mark.parametrize(
+    "orchestrator_factory",
+    [LocalSemantivaOrchestrator, GraphSemantivaOrchestrator],
+)
+def test_diamond_result_is_orchestrator_independent(orchestrator_factory):
+    result = _run(DIAMOND, orchestrator_factory(), context={"seed": 1})
+    assert result.data.data == 20.0
+    assert result.context.to_dict() == {
+        "seed": 1,
+        "mul_value": 20.0,
+        "add_value": 3.0,
+    }
+
+
+@pytest.mark.parametrize("inputs", [["mul", "add"], ["add", "mul"]])
+def test_fan_in_keeps_most_recent_write(inputs):
+    nodes = [dict(n) for n in DIAMOND]
+    nodes[2] = dict(nodes[2], context_key="shared")
+    nodes[5] = dict(nodes[5], ports={"inputs": inputs})
+    result = _run(nodes, GraphSemantivaOrchestrator(), context={"shared": -1.0})
+    # Only the multiply branch wrote "shared"; the stale value carried by the
+    # add branch must not win regardless of input order.
+    assert result.context.get_value("shared") == 20.0
+
+
+def test_fan_out_copies_context_per_consumer():
+    ctx = ContextType({"a": 1})
+    router = PayloadRouter([[], [0], [0]], Payload(NoDataType(), ctx))
+    router.record(0, router.input_for(0))
+    first = router.input_for(1).context
+    second = router.input_for(2).context
+    assert first is not second
+    first.set_value("b", 2)
+    assert "b" not in second.keys()
+
+
+def test_ser_upstream_reflects_graph_edges():
+    collector = _Collector()
+    _run(DIAMOND, GraphSemantivaOrchestrator(), trace=collector)
+    graph = build_graph(DIAMOND)
+    upstream = compute_upstream_map(graph)
+    by_node = {s.identity["node_id"]: s for s in collector.sers}
+    assert len(by_node) == len(DIAMOND)
+    join_id = graph["nodes"][5]["node_uuid"]
+    assert len(upstream[join_id]) == 2
+    assert by_node[join_id].dependencies["upstream"] == upstream[join_id]
+    evidence = by_node[join_id].assertions["upstream_evidence"]
+    assert [e["node_id"] for e in evidence] == upstream[join_id]
+
+
+class _BarrierOperation(DataOperation):
+    """Blocks until both branches are running at the same time."""
+
+    barrier = threading.Barrier(2)
+
+    @classmethod
+    def input_data_type(cls):
+        return FloatDataType
+
+    @classmethod
+    def output_data_type(cls):
+        return FloatDataType
+
+    def _process_logic(self, data: FloatDataType) -> FloatDataType:
+        type(self).barrier.wait(timeout=5)
+        return data
+
+
+def test_graph_orchestrator_runs_branches_concurrently():
+    _BarrierOperation.barrier.reset()
+    nodes = [
+        dict(DIAMOND[0]),
+        {"processor": _BarrierOperation, "ports": {"inputs": ["src"], "output": "a"}},
+        {"processor": _BarrierOperation, "ports": {"inputs": ["src"], "output": "b"}},
+        {"processor": "FloatAddOperation", "parameters": {"addend": 1.0}},
+    ]
+    executor = ThreadPoolSemantivaExecutor(max_workers=2)
+    try:
+        result = _run(nodes, GraphSemantivaOrchestrator(executor=executor))
+    finally:
+        executor.shutdown()
+    assert result.data.data == 3.0
+
+
+def test_graph_orchestrator_failure_emits_error_ser():
+    nodes = [
+        dict(DIAMOND[0]),
+        {
+            "processor": "FloatDivideOperation",
+            "parameters": {"divisor": 0.0},
+            "ports": {"inputs": ["src"]},
+        },
+        {"processor": "FloatCollectValueProbe", "context_key": "never"},
+    ]
+    collector = _Collector()
+    orchestrator = GraphSemantivaOrchestrator()
+    with pytest.raises(ValueError, match="Division by zero"):
+        orchestrator.execute(
+            nodes,
+            Payload(NoDataType(), ContextType()),
+            InMemorySemantivaTransport(),
+            Logger(),
+            trace=collector,
+        )
+    assert [s.status for s in collector.sers] == ["succeeded", "error"]
+
+
+def test_graph_components_registered():
+    ExecutionComponentRegistry.initialize_defaults()
+    assert (
+        ExecutionComponentRegistry.get_orchestrator("graph")
+        is GraphSemantivaOrchestrator
+    )
+    assert (
+        ExecutionComponentRegistry.get_executor("thread_pool")
+        is ThreadPoolSemantivaExecutor
+    )
+
+
+def test_build_orchestrator_keeps_options_with_transport():
+    ExecutionComponentRegistry.initialize_defaults()
+    orchestrator = build_orchestrator(
+        ExecutionConfig(
+            orchestrator="graph", options={"max_workers": 3}, transport="in_memory"
+        )
+    )
+    assert isinstance(orchestrator, GraphSemantivaOrchestrator)
+    assert orchestrator.executor.max_workers == 3
+
+
+def test_build_orchestrator_forwards_transport_options():
+    ExecutionComponentRegistry.initialize_defaults()
+    with pytest.raises(ValueError, match="requires max_messages"):
+        build_orchestrator(
+            ExecutionConfig(
+                transport="in_memory", transport_options={"retention": "ring"}
+            )
+        )
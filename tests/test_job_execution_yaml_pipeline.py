@@ -88,3 +88,86 @@ def test_job_execution_with_yaml_pipeline(tmp_path):
     assert (
         abs(final_probe.get("value", 0.0) - expected_final_value) < 0.001
     ), f"Expected context final_value {expected_final_value}, got {final_probe.get('value')}"
+
+
+def test_worker_reuses_prepared_pipelines(tmp_path, monkeypatch):
+    from semantiva.execution.job_queue import worker
+
+    builds, applied = [], []
+    pipeline_cls, apply_profile = worker.Pipeline, worker.apply_profile
+    monkeypatch.setattr(
+        worker, "Pipeline", lambda *a, **k: builds.append(1) or pipeline_cls(*a, **k)
+    )
+    monkeypatch.setattr(
+        worker, "apply_profile", lambda p: applied.append(1) or apply_profile(p)
+    )
+    yaml_path = tmp_path / "pipeline.yaml"
+    yaml_path.write_text(
+        "extensions: [semantiva-examples]\n"
+        "pipeline:\n"
+        "  nodes:\n"
+        "    - processor: FloatValueDataSourceWithDefault\n"
+        "    - processor: FloatMultiplyOperation\n"
+        "      parameters: {factor: 2.0}\n"
+    )
+
+    transport = InMemorySemantivaTransport()
+    orchestrator = QueueSemantivaOrchestrator(transport=transport, stop_event=None)
+    threading.Thread(target=orchestrator.run_forever, daemon=True).start()
+    stop_event = threading.Event()
+    threading.Thread(
+        target=worker_loop,
+        args=(0, transport, SequentialSemantivaExecutor(), stop_event),
+        daemon=True,
+    ).start()
+
+    def run(cfg):
+        return orchestrator.enqueue(cfg, return_future=True).result(timeout=10)[0]
+
+    try:
+        assert [run(str(yaml_path)).data for _ in range(3)] == [84.0] * 3
+        assert len(builds) == 1 and len(applied) == 1
+        yaml_path.write_text(yaml_path.read_text().replace("2.0", "3.0"))
+        assert run(str(yaml_path)).data == 126.0
+        assert len(builds) == 2 and len(applied) == 1
+    finally:
+        stop_event.set()
+        orchestrator.stop()
+
+
+def test_reused_pipeline_reports_on_current_job_only(monkeypatch):
+    from semantiva.execution.job_queue import worker
+
+    pipelines = []
+    pipeline_cls = worker.Pipeline
+    monkeypatch.setattr(
+        worker,
+        "Pipeline",
+        lambda *a, **k: pipelines.append(pipeline_cls(*a, **k)) or pipelines[-1],
+    )
+    nodes = [
+        {"processor": "FloatValueDataSource", "parameters": {"value": 2.0}},
+        {"processor": "FloatCollectValueProbe", "context_key": "probed"},
+    ]
+
+    transport = InMemorySemantivaTransport()
+    orchestrator = QueueSemantivaOrchestrator(transport=transport, stop_event=None)
+    threading.Thread(target=orchestrator.run_forever, daemon=True).start()
+    stop_event = threading.Event()
+    threading.Thread(
+        target=worker_loop,
+        args=(0, transport, SequentialSemantivaExecutor(), stop_event),
+        daemon=True,
+    ).start()
+
+    try:
+        for _ in range(2):
+            result = orchestrator.enqueue(nodes, return_future=True).result(timeout=10)
+            assert result[1].get_value("probed") == 2.0
+        (pipeline,) = pipelines
+        # Timers cover the latest job, not every job the pipeline served.
+        assert pipeline.stop_watch._start_count == 1
+        assert all(node.stop_watch._start_count == 1 for node in pipeline.nodes)
+    finally:
+        stop_event.set()
+        orchestrator.stop()
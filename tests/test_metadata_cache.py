@@ -0,0 +1,167 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import copy
+import gc
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict
+
+import pytest
+
+from semantiva.context_processors.factory import _build_renamer
+from semantiva.core import (
+    get_component_registry,
+    get_registered_components,
+    invalidate_metadata_cache,
+)
+from semantiva.core import semantiva_component
+from semantiva.core.semantiva_component import (
+    _METADATA_CACHE,
+    _SemantivaComponent,
+    intern_generated_class,
+)
+from semantiva.data_processors.parametric_sweep_factory import (
+    ParametricSweepFactory,
+    SequenceSpec,
+)
+from semantiva.examples.test_utils import (
+    FloatCollectValueProbe,
+    FloatDataCollection,
+    FloatMultiplyOperation,
+    FloatValueDataSource,
+)
+from semantiva.registry import resolve_symbol
+from semantiva.utils.safe_eval import ExpressionEvaluator
+
+
+class _Counted(_SemantivaComponent):
+    """Component counting how often its metadata is built."""
+
+    calls = 0
+    label = "first"
+
+    @classmethod
+    def _define_metadata(cls) -> Dict[str, Any]:
+        type.__setattr__(cls, "calls", cls.calls + 1)
+        return {"label": cls.label, "nested": {"items": [1, 2]}}
+
+
+class _CountedChild(_Counted):
+    pass
+
+
+def test_metadata_is_built_once_per_class():
+    invalidate_metadata_cache(_Counted)
+    _Counted.calls = 0
+    first = _Counted.get_metadata()
+    assert _Counted.get_metadata() is first
+    assert _Counted.calls == 1
+
+
+def test_cached_metadata_is_read_only():
+    meta = _Counted.get_metadata()
+    with pytest.raises(TypeError, match="read-only"):
+        meta["label"] = "changed"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        meta["nested"]["items"].append(3)
+    with pytest.raises(TypeError):
+        meta.update(label="changed")
+
+    mutable = dict(meta)
+    mutable["label"] = "changed"
+    deep = copy.deepcopy(meta)
+    deep["nested"]["items"].append(3)
+    assert type(deep["nested"]["items"]) is list
+    assert pickle.loads(pickle.dumps(meta)) == meta
+    assert _Counted.get_metadata()["label"] == "first"
+
+
+def test_parameter_order_is_preserved():
+    parameters = FloatMultiplyOperation.get_metadata()["parameters"]
+    assert isinstance(parameters, OrderedDict)
+    assert type(copy.copy(parameters)) is OrderedDict
+
+
+def test_class_attribute_assignment_invalidates_subclasses():
+    _Counted.label = "first"
+    assert _CountedChild.get_metadata()["label"] == "first"
+    try:
+        _Counted.label = "second"
+        assert _Counted.get_metadata()["label"] == "second"
+        assert _CountedChild.get_metadata()["label"] == "second"
+    finally:
+        _Counted.label = "first"
+
+
+def test_invalidate_all_and_dynamic_classes_are_collected():
+    dynamic = type("_Dynamic", (_Counted,), {"label": "dynamic"})
+    assert dynamic.get_metadata()["label"] == "dynamic"
+    assert dynamic in _METADATA_CACHE
+
+    invalidate_metadata_cache()
+    assert dynamic not in _METADATA_CACHE
+
+    dynamic.get_metadata()
+    before = len(_METADATA_CACHE)
+    del dynamic
+    gc.collect()
+    assert len(_METADATA_CACHE) == before - 1
+
+
+def test_generated_classes_are_interned():
+    for symbol in ("rename:a:b", "delete:a", "template:'{a}':b"):
+        assert resolve_symbol(symbol) is resolve_symbol(symbol)
+    assert resolve_symbol("rename:a:b") is not resolve_symbol("rename:a:c")
+    slicer = resolve_symbol("slice:FloatCollectValueProbe:FloatDataCollection")
+    assert slicer is resolve_symbol("slice:FloatCollectValueProbe:FloatDataCollection")
+    assert slicer.__name__ == f"SlicerFor{FloatCollectValueProbe.__name__}"
+
+    def sweep(values, **kwargs):
+        return ParametricSweepFactory.create(
+            element=FloatValueDataSource,
+            element_kind="DataSource",
+            collection_output=FloatDataCollection,
+            vars={"t": SequenceSpec(values)},
+            parametric_expressions={"value": "t"},
+            **kwargs,
+        )
+
+    assert sweep([1.0, 2.0]) is sweep((1.0, 2.0))
+    assert sweep([1.0, 2.0]) is not sweep([1, 2])
+    evaluator = ExpressionEvaluator()
+    assert sweep([1.0], expression_evaluator=evaluator) is not sweep(
+        [1.0], expression_evaluator=evaluator
+    )
+
+
+def test_generated_classes_are_registered_weakly(monkeypatch):
+    monkeypatch.setattr(semantiva_component, "GENERATED_CLASS_CACHE_SIZE", 1)
+    first = intern_generated_class(("test", 1), lambda: _build_renamer("w1", "w2"))
+    category = first.get_metadata()["component_type"]
+    assert first in get_registered_components()[category]
+    assert intern_generated_class(("test", 1), lambda: None) is first
+
+    intern_generated_class(("test", 2), lambda: _build_renamer("w2", "w3"))
+    assert intern_generated_class(("test", 1), lambda: None) is None  # evicted
+    name = first.__name__
+    del first
+    gc.collect()
+    assert name not in {cls.__name__ for cls in get_registered_components()[category]}
+
+
+def test_component_registry_is_live():
+    assert get_component_registry() is semantiva_component._COMPONENT_REGISTRY
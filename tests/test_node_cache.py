@@ -0,0 +1,218 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import os
+import textwrap
+from pathlib import Path
+
+from semantiva.context_processors.context_types import ContextType
+from semantiva.data_io import DataSource
+from semantiva.data_types import NoDataType
+from semantiva.examples.test_utils import (
+    FloatDataType,
+    FloatMockDataSink,
+    FloatOperation,
+)
+from semantiva.execution.node_cache import CachedResult, NodeResultCache
+from semantiva.pipeline import Payload, Pipeline
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+
+from .test_utils import run_cli
+
+CALLS: list[str] = []
+
+
+class CountingScale(FloatOperation):
+    """Scale a float and record the input in context."""
+
+    @classmethod
+    def get_created_keys(cls):
+        return ["scaled_from"]
+
+    @classmethod
+    def context_keys(cls):
+        return ["scaled_from"]
+
+    def _process_logic(self, data, factor: float, offset: float = 0.0):
+        CALLS.append("scale")
+        self._notify_context_update("scaled_from", data.data)
+        return FloatDataType(data.data * factor + offset)
+
+
+class RandomSource(DataSource):
+    """A nondeterministic source."""
+
+    cacheable = False
+
+    @classmethod
+    def _get_data(cls):
+        CALLS.append("random")
+        return FloatDataType(float(len(CALLS)))
+
+    @classmethod
+    def output_data_type(cls):
+        return FloatDataType
+
+
+def _run(pipeline: Pipeline, value: float | None, **context) -> Payload:
+    data = NoDataType() if value is None else FloatDataType(value)
+    return pipeline.process(Payload(data, ContextType(dict(context))))
+
+
+def test_memory_and_disk_tiers_evict_least_recently_used(tmp_path: Path) -> None:
+    entry = CachedResult(b"x" * 1000, {"k": 1}, ("gone",))
+    cache = NodeResultCache(tmp_path, max_memory_bytes=2500, max_disk_bytes=2500)
+    for key in ("sha256-aa01", "sha256-aa02"):
+        assert cache.put(key, entry)
+    (old,) = tmp_path.glob("??/aa01.pkl")
+    os.utime(old, (1, 1))
+    assert cache.get("sha256-aa01") == (entry, "memory")  # refreshes memory LRU
+    assert cache.put("sha256-aa03", entry)
+    assert cache.get("sha256-aa02") == (entry, "disk")  # evicted from memory
+    # aa01 was least recently used on disk (its memory hit did not touch it).
+    assert sorted(p.stem for p in tmp_path.glob("??/*.pkl")) == ["aa02", "aa03"]
+
+    fresh = NodeResultCache(tmp_path)
+    assert fresh.get("sha256-aa01") is None
+    assert fresh.get("sha256-aa03") == (entry, "disk")
+    hit = fresh.get("sha256-aa03")
+    assert hit is not None and hit[1] == "memory"
+    assert not fresh.put("sha256-bb", CachedResult(lambda: None))
+    fresh.clear()
+    assert not list(tmp_path.glob("??/*.pkl"))
+
+
+def test_rewriting_a_key_does_not_grow_disk_usage(tmp_path: Path) -> None:
+    entry = CachedResult(b"x" * 1000, {"k": 1}, ("gone",))
+    cache = NodeResultCache(tmp_path, max_memory_bytes=0)
+    for _ in range(3):
+        assert cache.put("sha256-aa01", entry)
+    (path,) = tmp_path.glob("??/aa01.pkl")
+    assert cache._disk_bytes == path.stat().st_size
+
+
+def test_pipeline_reuses_results_and_marks_hits(tmp_path: Path) -> None:
+    trace_path = tmp_path / "trace.jsonl"
+    pipeline = Pipeline(
+        [
+            {"processor": CountingScale, "parameters": {"factor": 2.0}},
+            {"processor": CountingScale, "parameters": {"factor": 3.0}, "cache": False},
+            {"processor": FloatMockDataSink, "parameters": {"path": "unused"}},
+        ],
+        trace=JsonlTraceDriver(str(trace_path)),
+    )
+    pipeline.orchestrator.configure_node_cache(NodeResultCache())
+    CALLS.clear()
+    first = _run(pipeline, 1.0)
+    assert CALLS == ["scale", "scale"]
+    second = _run(pipeline, 1.0)
+    assert CALLS == ["scale"] * 3
+    assert second.data.data == first.data.data == 6.0
+    assert second.context.to_dict() == first.context.to_dict()
+    # A different input, or a context value overriding a default, misses.
+    _run(pipeline, 2.0)
+    _run(pipeline, 1.0, offset=1.0)
+    assert CALLS == ["scale"] * 7
+
+    sers = [
+        json.loads(line)
+        for line in trace_path.read_text().splitlines()
+        if '"record_type": "ser"' in line
+    ]
+    caches = [ser["summaries"].get("cache") for ser in sers]
+    assert caches[0]["hit"] is False and caches[0]["stored"] is True
+    assert caches[1] is None and caches[2] is None  # opted out; sink
+    assert caches[3] == {"key": caches[0]["key"], "hit": True, "tier": "memory"}
+    assert sers[3]["context_delta"]["created_keys"] == ["scaled_from"]
+    assert caches[6]["key"] != caches[0]["key"] != caches[9]["key"]
+
+
+class _Offset:
+    """An offset without ``__dict__`` whose repr hides its value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def __radd__(self, other: float) -> float:
+        return other + self.value
+
+    def __repr__(self) -> str:
+        return "_Offset(...)"
+
+
+def test_values_without_exact_hash_are_not_cached() -> None:
+    pipeline = Pipeline([{"processor": CountingScale, "parameters": {"factor": 2.0}}])
+    pipeline.orchestrator.configure_node_cache(NodeResultCache())
+    CALLS.clear()
+    assert _run(pipeline, 1.0, offset=_Offset(1.0)).data.data == 3.0
+    assert _run(pipeline, 1.0, offset=_Offset(2.0)).data.data == 4.0
+    assert CALLS == ["scale", "scale"]
+
+
+def test_uncacheable_processor_always_runs() -> None:
+    pipeline = Pipeline([{"processor": RandomSource}])
+    pipeline.orchestrator.configure_node_cache(NodeResultCache())
+    CALLS.clear()
+    assert _run(pipeline, None).data.data == 1.0
+    assert _run(pipeline, None).data.data == 2.0
+
+
+def test_cli_cache_is_shared_across_launches(tmp_path: Path) -> None:
+    yaml_path = tmp_path / "pipeline.yaml"
+    yaml_path.write_text(textwrap.dedent("""
+            extensions: ["semantiva-examples"]
+            run_space:
+              blocks:
+                - mode: by_position
+                  context:
+                    value: [1.0, 2.0]
+                    factor: [10.0, 20.0]
+            pipeline:
+              nodes:
+                - processor: FloatValueDataSource
+                - processor: FloatMultiplyOperation
+            """))
+    hits = []
+    for launch in ("a", "b"):
+        traces = tmp_path / launch
+        result = run_cli(
+            [
+                "run",
+                str(yaml_path),
+                "--jobs",
+                "2",
+                "--cache",
+                str(tmp_path / "cache"),
+                "--trace.driver",
+                "jsonl",
+                "--trace.output",
+                str(traces),
+            ]
+        )
+        assert result.returncode == 0, result.stderr
+        hits.append(
+            sorted(
+                json.loads(line)["summaries"]["cache"]["hit"]
+                for path in traces.glob("*.jsonl")
+                for line in path.read_text().splitlines()
+                if '"record_type": "ser"' in line
+            )
+        )
+    assert hits == [[False] * 4, [True] * 4]
+    assert len(list((tmp_path / "cache").glob("??/*.pkl"))) == 4
@@ -0,0 +1,110 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import pstats
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from semantiva.configurations import load_pipeline_from_yaml
+from semantiva.execution.profiling import NodeProfiler, collapse_stats
+from semantiva.pipeline import Pipeline
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+
+from .test_utils import run_cli
+
+
+def test_collapse_stats_apportions_along_call_graph() -> None:
+    root, a, b = ("m.py", 1, "root"), ("m.py", 5, "a"), ("~", 0, "<len>")
+    stats = {
+        # func: (cc, nc, tt, ct, callers{caller: (nc, cc, tt, ct)})
+        root: (1, 1, 0.001, 0.010, {}),
+        a: (2, 2, 0.004, 0.009, {root: (2, 2, 0.004, 0.009)}),
+        b: (4, 4, 0.005, 0.005, {a: (4, 4, 0.005, 0.005)}),
+    }
+    assert collapse_stats(stats) == {
+        "root (m.py:1)": 1000,
+        "root (m.py:1);a (m.py:5)": 4000,
+        "root (m.py:1);a (m.py:5);<len>": 5000,
+    }
+
+
+def test_profiled_pipeline_references_profiles_in_ser(tmp_path: Path) -> None:
+    trace_path = tmp_path / "trace.jsonl"
+    pipeline = Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"),
+        trace=JsonlTraceDriver(str(trace_path), detail="timing"),
+    )
+    pipeline.orchestrator.configure_profiler(NodeProfiler(tmp_path / "prof"))
+    pipeline.process()
+
+    sers = [
+        json.loads(line)
+        for line in trace_path.read_text().splitlines()
+        if '"ser"' in line
+    ]
+    (run_dir,) = (tmp_path / "prof").iterdir()
+    assert run_dir.name == sers[0]["identity"]["run_id"]
+    assert len(list(run_dir.glob("*.pstats"))) == len(sers) == 5
+    for ser in sers:
+        profile = ser["summaries"]["profile"]
+        assert Path(profile["pstats"]).parent == run_dir
+        stats = pstats.Stats(profile["pstats"])
+        assert getattr(stats, "total_calls") == profile["total_calls"]
+        lines = Path(profile["collapsed"]).read_text().splitlines()
+        assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert all(line.startswith("process (") for line in lines)
+    assert Path(sers[1]["summaries"]["profile"]["pstats"]).name.startswith("001-")
+
+    # Untraced runs are profiled too; configure_profiler(None) turns it off.
+    pipeline.trace = None
+    pipeline.process()
+    assert len(list((tmp_path / "prof").iterdir())) == 2
+    pipeline.orchestrator.configure_profiler(None)
+    pipeline.process()
+    assert len(list((tmp_path / "prof").iterdir())) == 2
+
+
+@pytest.mark.parametrize("jobs", [[], ["--jobs", "2"]])
+def test_cli_profile_flag(tmp_path: Path, jobs: list[str]) -> None:
+    yaml_path = tmp_path / "pipeline.yaml"
+    yaml_path.write_text(textwrap.dedent("""
+            extensions: ["semantiva-examples"]
+            run_space:
+              blocks:
+                - mode: by_position
+                  context:
+                    value: [1.0, 2.0]
+                    factor: [10.0, 20.0]
+            pipeline:
+              nodes:
+                - processor: FloatValueDataSource
+                - processor: FloatMultiplyOperation
+            """))
+    prof = tmp_path / "prof"
+    result = run_cli(["run", str(yaml_path), *jobs, "--profile", str(prof)])
+    assert result.returncode == 0, result.stderr
+    run_dirs = list(prof.iterdir())
+    assert len(run_dirs) == 2
+    for run_dir in run_dirs:
+        assert sorted(p.name for p in run_dir.iterdir()) == [
+            "000-FloatValueDataSource.collapsed",
+            "000-FloatValueDataSource.pstats",
+            "001-FloatMultiplyOperation.collapsed",
+            "001-FloatMultiplyOperation.pstats",
+        ]
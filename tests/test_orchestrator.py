@@ -161,6 +161,7 @@ class _CaptureTraceDriver(TraceDriver):
         run_space_inputs_id: str | None = None,
         run_space_input_fingerprints: list[dict] | None = None,
         run_space_planned_run_count: int | None = None,
+        run_space_resumed_from: dict | None = None,
     ) -> None:
         pass
 
@@ -234,3 +235,39 @@ def test_remote_stub_inherits_template(fake_pipeline):
     assert remote_ser.context_delta == local_ser.context_delta
     assert remote_ser.processor == local_ser.processor
     assert len(stub.published) == len(fake_pipeline.resolved_spec)
+
+
+def test_publication_uses_compact_channels_and_skips_unaccepted(fake_pipeline):
+    transport = InMemorySemantivaTransport(retention="subscribers")
+    subscription = transport.subscribe("node.*")
+    published = []
+    original = transport.publish
+
+    def capture(channel, *args, **kwargs):
+        published.append(channel)
+        return original(channel, *args, **kwargs)
+
+    transport.publish = capture
+    orch = LocalSemantivaOrchestrator()
+    plan = fake_pipeline.compile()
+    orch.execute(
+        fake_pipeline.resolved_spec,
+        Payload(FloatDataType(2.0), ContextType({})),
+        transport,
+        Logger(),
+        plan=plan,
+    )
+    assert published == [node_plan.channel for node_plan in plan.nodes]
+    assert all("\n" not in channel for channel in published)
+    assert [msg.data.data for msg in subscription] == [4.0, 8.0]
+
+    subscription.close()
+    published.clear()
+    orch.execute(
+        fake_pipeline.resolved_spec,
+        Payload(FloatDataType(2.0), ContextType({})),
+        transport,
+        Logger(),
+        plan=plan,
+    )
+    assert published == []
@@ -0,0 +1,185 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pool execution of parametric sweep points."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from semantiva import Payload, Pipeline
+from semantiva.context_processors import ContextType
+from semantiva.data_processors.parametric_sweep_factory import (
+    ParametricSweepFactory,
+    RangeSpec,
+    SequenceSpec,
+    SweepParallelism,
+)
+from semantiva.data_types import NoDataType
+from semantiva.examples.test_utils import (
+    FloatDataCollection,
+    FloatDataType,
+    FloatMultiplyOperation,
+    FloatOperation,
+    FloatValueDataSource,
+)
+
+VARS = {"a": RangeSpec(0.0, 1.0, steps=7), "b": SequenceSpec([1, 2, 3])}
+
+
+class _CountingMultiply(FloatOperation):
+    """Multiply operation recording the threads that construct it."""
+
+    lock = threading.Lock()
+    builders: list[int] = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        with type(self).lock:
+            type(self).builders.append(threading.get_ident())
+
+    def _process_logic(self, data: FloatDataType, factor: float) -> FloatDataType:
+        return FloatDataType(data.data * factor)
+
+
+class _NotingMultiply(FloatOperation):
+    """Multiply operation that writes to the context."""
+
+    @classmethod
+    def get_created_keys(cls):
+        return ["last_factor"]
+
+    def _process_logic(self, data: FloatDataType, factor: float) -> FloatDataType:
+        self._notify_context_update("last_factor", factor)
+        return FloatDataType(data.data * factor)
+
+
+def _source_values(parallel):
+    sweep = ParametricSweepFactory.create(
+        element=FloatValueDataSource,
+        element_kind="DataSource",
+        collection_output=FloatDataCollection,
+        vars=VARS,
+        parametric_expressions={"value": "a * 10 + b"},
+        parallel=parallel,
+    )
+    context = ContextType()
+    values = [item.data for item in sweep._get_data(context=context)]
+    return values, context
+
+
+@pytest.mark.parametrize(
+    "parallel",
+    [
+        SweepParallelism("thread", max_workers=3, chunk_size=2),
+        SweepParallelism("process", max_workers=2),
+    ],
+)
+def test_parallel_source_sweep_matches_sequential(parallel):
+    expected, expected_context = _source_values(None)
+    values, context = _source_values(parallel)
+    assert values == expected
+    assert context.get_value("a_values") == expected_context.get_value("a_values")
+    assert context.get_value("b_values") == [1, 2, 3]
+
+
+def test_thread_sweep_reuses_element_per_worker():
+    _CountingMultiply.builders.clear()
+    sweep = ParametricSweepFactory.create(
+        element=_CountingMultiply,
+        element_kind="DataOperation",
+        collection_output=FloatDataCollection,
+        vars={"k": SequenceSpec(list(range(12)))},
+        parametric_expressions={"factor": "k"},
+        parallel=SweepParallelism("thread", max_workers=2, chunk_size=1),
+    )
+    result = sweep().process(FloatDataType(2.0))
+    assert [item.data for item in result] == [2.0 * k for k in range(12)]
+    # One instance per worker thread rather than one per sweep point.
+    assert len(_CountingMultiply.builders) == len(set(_CountingMultiply.builders))
+    assert len(_CountingMultiply.builders) <= 2
+
+
+def test_process_sweep_operation_preserves_order():
+    sweep = ParametricSweepFactory.create(
+        element=FloatMultiplyOperation,
+        element_kind="DataOperation",
+        collection_output=FloatDataCollection,
+        vars={"k": SequenceSpec(list(range(9)))},
+        parametric_expressions={"factor": "k"},
+        parallel=SweepParallelism("process", max_workers=2, chunk_size=2),
+    )
+    result = sweep().process(FloatDataType(3.0))
+    assert [item.data for item in result] == [3.0 * k for k in range(9)]
+
+
+def test_process_sweep_rejects_context_writers():
+    with pytest.raises(ValueError, match="creates context keys"):
+        ParametricSweepFactory.create(
+            element=_NotingMultiply,
+            element_kind="DataOperation",
+            collection_output=FloatDataCollection,
+            vars={"k": SequenceSpec([1, 2])},
+            parametric_expressions={"factor": "k"},
+            parallel=SweepParallelism("process"),
+        )
+
+
+def test_parallel_operation_sweep_via_yaml_option():
+    nodes = [
+        {"processor": "FloatValueDataSource", "parameters": {"value": 2.0}},
+        {
+            "processor": "FloatMultiplyOperation",
+            "derive": {
+                "parameter_sweep": {
+                    "parameters": {"factor": "k"},
+                    "variables": {"k": [1, 2, 3, 4, 5]},
+                    "collection": "FloatDataCollection",
+                    "parallel": {"executor": "thread", "chunk_size": 2},
+                }
+            },
+        },
+    ]
+    result = Pipeline(nodes).process(Payload(NoDataType(), ContextType()))
+    assert [item.data for item in result.data] == [2.0, 4.0, 6.0, 8.0, 10.0]
+    assert list(result.context.get_value("k_values")) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "spec, match",
+    [
+        ("gpu", "executor must be one of"),
+        ({"executor": "thread", "workers": 2}, "Unknown sweep parallel option"),
+        ({"chunk_size": 0}, "chunk_size must be a positive integer"),
+        (True, "must be a string or a mapping"),
+    ],
+)
+def test_invalid_parallel_options(spec, match):
+    nodes = [
+        {
+            "processor": "FloatValueDataSource",
+            "derive": {
+                "parameter_sweep": {
+                    "parameters": {"value": "k"},
+                    "variables": {"k": [1, 2]},
+                    "collection": "FloatDataCollection",
+                    "parallel": spec,
+                }
+            },
+        }
+    ]
+    with pytest.raises(ValueError, match=match):
+        Pipeline(nodes)
@@ -94,3 +94,35 @@ def test_comprehensive_regression_combination() -> None:
 
     # Should be (float("10.5") + 5 * 2, int("3")) = (20.5, 3)
     assert result == (20.5, 3)
+
+
+def test_vectorized_matches_scalar_evaluation() -> None:
+    import numpy as np
+
+    ev = ExpressionEvaluator()
+    expr = "round(abs(x - 2) * max(x, y) / 3, 2) + int(y) ** 2"
+    vector = ev.compile_vectorized(expr, {"x", "y"})
+    assert vector is not None
+    scalar = ev.compile(expr, {"x", "y"})
+    xs = np.array([0.5, 1.5, 2.5, -3.0])
+    ys = np.array([1.2, -2.7, 3.0, 0.0])
+    assert vector(x=xs, y=ys).tolist() == [
+        scalar(x=x, y=y) for x, y in zip(xs.tolist(), ys.tolist())
+    ]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["t if t > 0 else -t", "t > 0 and t < 1", "0 < t < 1", "str(t)", "(t, t)"],
+)
+def test_vectorized_rejects_non_elementwise_expressions(expr) -> None:
+    assert ExpressionEvaluator().compile_vectorized(expr, {"t"}) is None
+
+
+def test_vectorized_raises_on_floating_point_errors() -> None:
+    import numpy as np
+
+    fn = ExpressionEvaluator().compile_vectorized("1.0 / t", {"t"})
+    assert fn is not None
+    with pytest.raises(FloatingPointError):
+        fn(t=np.array([1.0, 0.0]))
@@ -0,0 +1,155 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Vectorized expression evaluation in parametric sweeps."""
+
+from __future__ import annotations
+
+import pytest
+
+from semantiva import Payload, Pipeline
+from semantiva.context_processors import ContextType
+from semantiva.data_processors.parametric_sweep_factory import (
+    ParametricSweepFactory,
+    RangeSpec,
+    SequenceSpec,
+)
+from semantiva.data_types import NoDataType
+from semantiva.examples.test_utils import (
+    FloatCollectValueProbe,
+    FloatDataCollection,
+    FloatDataType,
+    FloatValueDataSource,
+)
+
+
+def _source_values(vectorize: bool, **kwargs) -> list[float]:
+    sweep = ParametricSweepFactory.create(
+        element=FloatValueDataSource,
+        element_kind="DataSource",
+        collection_output=FloatDataCollection,
+        vectorize=vectorize,
+        **kwargs,
+    )
+    return [item.data for item in sweep._get_data(context=ContextType())]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {
+            "vars": {"a": RangeSpec(0.0, 1.0, steps=5), "b": SequenceSpec([1, 2, 3])},
+            "parametric_expressions": {"value": "a * b - round(a, 1)"},
+        },
+        {
+            "vars": {
+                "a": RangeSpec(1.0, 100.0, steps=4, scale="log"),
+                "b": SequenceSpec([1, 2]),
+            },
+            "parametric_expressions": {"value": "max(a, b) / b"},
+            "mode": "by_position",
+            "broadcast": True,
+        },
+        {
+            # Conditionals are evaluated point by point.
+            "vars": {"a": SequenceSpec([-1.0, 2.0]), "b": SequenceSpec([3.0, 4.0])},
+            "parametric_expressions": {"value": "a if a > 0 else b"},
+        },
+        {
+            # Non-numeric variables disable the vectorized path.
+            "vars": {"s": SequenceSpec(["1.5", "2.5"])},
+            "parametric_expressions": {"value": "float(s) * 2"},
+        },
+    ],
+)
+def test_vectorized_sweep_matches_scalar_sweep(kwargs):
+    assert _source_values(True, **kwargs) == _source_values(False, **kwargs)
+
+
+class _ParameterProbe(FloatCollectValueProbe):
+    """Return the swept parameter unchanged."""
+
+    def _process_logic(self, data, factor):
+        return factor
+
+
+def test_vectorized_sweep_keeps_per_point_numeric_types():
+    sweep = ParametricSweepFactory.create(
+        element=_ParameterProbe,
+        element_kind="DataProbe",
+        collection_output=None,
+        vars={"a": SequenceSpec([1, 2.5, 3])},
+        parametric_expressions={"factor": "a * 2"},
+        vectorize=True,
+    )
+    values = sweep().process(FloatDataType(0.0))
+    assert values == [2, 5.0, 6]
+    assert [type(v) for v in values] == [int, float, int]
+
+
+def test_vectorized_sweep_keeps_python_error_semantics():
+    kwargs = {
+        "vars": {"t": SequenceSpec([1.0, 0.0])},
+        "parametric_expressions": {"value": "1.0 / t"},
+    }
+    with pytest.raises(ZeroDivisionError):
+        _source_values(True, **kwargs)
+
+
+def test_vectorized_probe_sweep_via_yaml_option():
+    nodes = [
+        {"processor": "FloatValueDataSource", "parameters": {"value": 2.0}},
+        {
+            "processor": "FloatMultiplyOperation",
+            "derive": {
+                "parameter_sweep": {
+                    "parameters": {"factor": "k * 10"},
+                    "variables": {"k": {"lo": 0, "hi": 3, "steps": 4}},
+                    "collection": "FloatDataCollection",
+                    "vectorize": True,
+                }
+            },
+        },
+    ]
+    result = Pipeline(nodes).process(Payload(NoDataType(), ContextType()))
+    assert [item.data for item in result.data] == [0.0, 20.0, 40.0, 60.0]
+    assert list(result.context.get_value("k_values")) == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_vectorize_option_must_be_boolean():
+    nodes = [
+        {
+            "processor": "FloatCollectValueProbe",
+            "context_key": "values",
+            "derive": {
+                "parameter_sweep": {
+                    "variables": {"k": [1, 2, 3]},
+                    "vectorize": "yes",
+                }
+            },
+        }
+    ]
+    with pytest.raises(ValueError, match="vectorize must be a boolean"):
+        Pipeline(nodes)
+
+
+def test_probe_sweep_vectorized():
+    sweep = ParametricSweepFactory.create(
+        element=FloatCollectValueProbe,
+        element_kind="DataProbe",
+        collection_output=None,
+        vars={"k": SequenceSpec([1, 2, 3])},
+        vectorize=True,
+    )
+    assert sweep().process(FloatDataType(4.0)) == [4.0, 4.0, 4.0]
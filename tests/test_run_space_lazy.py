@@ -0,0 +1,145 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import types
+
+import pytest
+
+from semantiva.cli import _print_run_space_plan
+from semantiva.configurations.schema import RunBlock, RunSource, RunSpaceV1Config
+from semantiva.exceptions.pipeline_exceptions import RunSpaceMaxRunsExceededError
+from semantiva.execution.run_space import RunSpace, expand_run_space, plan_run_space
+
+
+def _reference_runs(block_runs, combine):
+    """Eager expansion used as the ordering oracle."""
+    if combine == "combinatorial":
+        combos = itertools.product(*block_runs)
+    else:
+        combos = zip(*block_runs)
+    runs = []
+    for combo in combos:
+        merged = {}
+        for part in combo:
+            merged.update(part)
+        runs.append(merged)
+    return runs
+
+
+def _product(entries):
+    keys = sorted(entries)
+    return [
+        dict(zip(keys, combo))
+        for combo in itertools.product(*(entries[k] for k in keys))
+    ]
+
+
+def test_plan_matches_eager_expansion(tmp_path):
+    (tmp_path / "rows.csv").write_text("seed,shard\n1,a\n2,b\n3,c\n")
+    cfg = RunSpaceV1Config(
+        combine="combinatorial",
+        blocks=[
+            RunBlock(mode="combinatorial", context={"lr": [0.1, 0.2], "bs": [8, 16]}),
+            RunBlock(
+                mode="combinatorial",
+                context={"opt": ["sgd", "adam"]},
+                source=RunSource(format="csv", path="rows.csv"),
+            ),
+            RunBlock(mode="by_position", context={"x": [1, 2], "y": [3, 4]}),
+        ],
+    )
+    runs, meta = plan_run_space(cfg, cwd=tmp_path)
+    assert isinstance(runs, RunSpace)
+    rows = [
+        {"seed": 1, "shard": "a"},
+        {"seed": 2, "shard": "b"},
+        {"seed": 3, "shard": "c"},
+    ]
+    blocks = [
+        _product({"lr": [0.1, 0.2], "bs": [8, 16]}),
+        [{**c, **r} for c in _product({"opt": ["sgd", "adam"]}) for r in rows],
+        [{"x": 1, "y": 3}, {"x": 2, "y": 4}],
+    ]
+    expected = _reference_runs(blocks, "combinatorial")
+    assert len(runs) == meta["expanded_runs"] == len(expected) == 48
+    assert list(runs) == expected
+    assert [runs[i] for i in range(len(runs))] == expected
+    assert runs[-1] == expected[-1]
+    assert runs[10:13] == expected[10:13]
+    assert expand_run_space(cfg, cwd=tmp_path)[0] == expected
+
+
+def test_plan_by_position_combine():
+    cfg = RunSpaceV1Config(
+        combine="by_position",
+        blocks=[
+            RunBlock(mode="by_position", context={"a": [1, 2, 3]}),
+            RunBlock(mode="combinatorial", context={"b": [1], "c": [7, 8, 9]}),
+        ],
+    )
+    runs, _ = plan_run_space(cfg)
+    assert list(runs) == [
+        {"a": 1, "b": 1, "c": 7},
+        {"a": 2, "b": 1, "c": 8},
+        {"a": 3, "b": 1, "c": 9},
+    ]
+    with pytest.raises(IndexError):
+        runs[3]
+
+
+def test_cap_is_checked_before_expansion():
+    values = list(range(1000))
+    cfg = RunSpaceV1Config(
+        max_runs=10,
+        blocks=[
+            RunBlock(mode="combinatorial", context={"a": values, "b": values}),
+            RunBlock(mode="combinatorial", context={"c": values}),
+        ],
+    )
+    with pytest.raises(RunSpaceMaxRunsExceededError) as exc:
+        plan_run_space(cfg)
+    assert exc.value.actual_runs == 10**9
+
+
+def test_huge_plan_is_indexable_and_previewed(capsys):
+    values = list(range(1000))
+    cfg = RunSpaceV1Config(
+        max_runs=10**12,
+        blocks=[
+            RunBlock(mode="combinatorial", context={"a": values, "b": values}),
+            RunBlock(mode="by_position", context={"c": values, "d": values}),
+        ],
+    )
+    runs, meta = plan_run_space(cfg)
+    assert len(runs) == 10**9
+    assert runs[-1] == {"a": 999, "b": 999, "c": 999, "d": 999}
+    assert runs[1001] == {"a": 0, "b": 1, "c": 1, "d": 1}
+
+    _print_run_space_plan(meta, runs)
+    out = capsys.readouterr().out
+    assert "expanded_runs: 1000000000" in out
+    assert '1000000000: {"a":999,"b":999,"c":999,"d":999}' in out
+
+
+def test_iteration_is_lazy():
+    cfg = RunSpaceV1Config(
+        max_runs=10**6,
+        blocks=[RunBlock(mode="combinatorial", context={"a": list(range(1000))})],
+    )
+    runs, _ = plan_run_space(cfg)
+    iterator = iter(runs)
+    assert isinstance(iterator, types.GeneratorType)
+    assert next(iterator) == {"a": 0}
+    assert next(iterator) == {"a": 1}
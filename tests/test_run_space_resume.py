@@ -0,0 +1,153 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from semantiva.trace.aggregation import TraceAggregator
+
+from .test_utils import run_cli
+
+
+def _run(run_id: str, index: int, attempt: int, status: str | None) -> list[dict]:
+    records = [
+        {
+            "record_type": "pipeline_start",
+            "run_id": run_id,
+            "run_space_launch_id": "L",
+            "run_space_attempt": attempt,
+            "run_space_index": index,
+        }
+    ]
+    if status is not None:
+        records.append(
+            {
+                "record_type": "pipeline_end",
+                "run_id": run_id,
+                "summary": {"status": status},
+            }
+        )
+    return records
+
+
+def test_completed_run_space_indices() -> None:
+    aggregator = TraceAggregator()
+    aggregator.ingest_many(
+        _run("a", 0, 1, "ok")
+        + _run("b", 1, 1, "error")
+        + _run("c", 2, 1, None)  # crashed
+        + _run("d", 1, 2, "ok")
+        + [{"record_type": "pipeline_end", "run_id": "e", "summary": {"status": "ok"}}]
+    )
+    assert aggregator.completed_run_space_indices("L") == {0, 1}
+    assert aggregator.completed_run_space_indices("L", before_attempt=2) == {0}
+    assert aggregator.completed_run_space_indices("other") == set()
+
+
+def _sweep(tmp_path: Path, paths: list[str]) -> Path:
+    yaml_path = tmp_path / "pipeline.yaml"
+    yaml_path.write_text(textwrap.dedent(f"""
+            extensions: ["semantiva-examples"]
+            run_space:
+              blocks:
+                - mode: by_position
+                  context:
+                    value: [1.0, 2.0, 3.0, 4.0]
+                    path: {json.dumps(paths)}
+            pipeline:
+              nodes:
+                - processor: FloatValueDataSource
+                - processor: FloatTxtFileSaver
+            """))
+    return yaml_path
+
+
+def _records(traces: Path, record_type: str) -> list[dict]:
+    return [
+        json.loads(line)
+        for path in sorted(traces.iterdir())
+        for line in path.read_text().splitlines()
+        if f'"record_type": "{record_type}"' in line
+    ]
+
+
+@pytest.mark.parametrize("jobs", [[], ["--jobs", "2"]])
+def test_resume_executes_only_missing_runs(tmp_path: Path, jobs: list[str]) -> None:
+    out = tmp_path / "out"
+    out.mkdir()
+    # Run 1 fails until its output directory exists.
+    paths = [str(out / "a"), str(tmp_path / "later" / "b"), str(out / "c")]
+    yaml_path = _sweep(tmp_path, paths + [str(out / "d")])
+    traces = tmp_path / "traces"
+    trace_args = ["--trace.driver", "jsonl", "--trace.output", str(traces)]
+
+    first = run_cli(["run", str(yaml_path), *jobs, *trace_args])
+    assert first.returncode == 4
+    (tmp_path / "later").mkdir()
+    for path in out.iterdir():
+        path.unlink()
+
+    second = run_cli(["run", str(yaml_path), *jobs, *trace_args, "--resume"])
+    assert second.returncode == 0, second.stderr
+    rerun = {
+        run["run_space_index"]
+        for run in _records(traces, "pipeline_start")
+        if run["run_space_attempt"] == 2
+    }
+    assert rerun == {1, 2, 3}
+    assert (tmp_path / "later" / "b").exists()
+    assert not (out / "a").exists() and 0 not in rerun
+    starts = _records(traces, "run_space_start")
+    (launch_id,) = {start["run_space_launch_id"] for start in starts}
+    (start,) = [start for start in starts if start["run_space_attempt"] == 2]
+    assert start["run_space_planned_run_count"] == 3
+    assert start["run_space_resumed_from"] == {
+        "run_space_launch_id": launch_id,
+        "run_space_attempt": 1,
+        "completed_runs": 1,
+    }
+
+    # Nothing is left: a third attempt runs nothing.
+    third = run_cli(["run", str(yaml_path), *jobs, *trace_args, "--resume"])
+    assert third.returncode == 0, third.stderr
+    (end,) = [
+        end
+        for end in _records(traces, "run_space_end")
+        if end["run_space_attempt"] == 3
+    ]
+    assert end["summary"] == {
+        "planned_runs": 0,
+        "completed_runs": 0,
+        "skipped_runs": 4,
+    }
+
+
+def test_resume_rejects_changed_run_space(tmp_path: Path) -> None:
+    traces = tmp_path / "traces"
+    trace_args = ["--trace.driver", "jsonl", "--trace.output", str(traces)]
+    paths = [str(tmp_path / name) for name in "abcd"]
+    result = run_cli(["run", str(_sweep(tmp_path, paths)), *trace_args])
+    assert result.returncode == 0, result.stderr
+
+    changed = _sweep(tmp_path, paths[::-1])
+    result = run_cli(["run", str(changed), *trace_args, "--resume"])
+    assert result.returncode == 3
+    assert "different run-space spec" in result.stderr
+    missing = run_cli(["run", str(changed), "--resume", str(tmp_path / "nope")])
+    assert missing.returncode == 2
@@ -13,17 +13,22 @@
 # limitations under the License.
 
 import csv
+import hashlib
 import json
+import os
 import tempfile
+from dataclasses import asdict
 
 import pytest
 import yaml
 
 from semantiva.configurations.schema import RunBlock, RunSource, RunSpaceV1Config
 from semantiva.execution.run_space import expand_run_space
+from semantiva.execution.run_space_sources import RunSpaceSourceCache
 from semantiva.exceptions.pipeline_exceptions import (
     PipelineConfigurationError as ConfigurationError,
 )
+from semantiva.trace.runtime import RunSpaceIdentityService
 
 
 def _write_csv(columns: dict[str, list[object]]) -> str:
@@ -343,3 +348,46 @@ def test_source_rename_with_combinatorial_mode(tmp_path):
     for run in runs:
         assert "x_val" not in run
         assert "y_val" not in run
+
+
+def test_source_cache_reads_each_file_once(tmp_path, monkeypatch):
+    path = tmp_path / "grid.csv"
+    path.write_text("lr,momentum\n0.1,0.9\n0.2,0.95\n")
+    cfg = RunSpaceV1Config(
+        blocks=[
+            RunBlock(mode="by_position", source=RunSource(format="csv", path=path.name))
+        ]
+    )
+    cache = RunSpaceSourceCache(tmp_path / "cache")
+    reads = []
+    read_bytes = type(path).read_bytes
+
+    def counting_read_bytes(self):
+        if self.suffix == ".csv":
+            reads.append(self.name)
+        return read_bytes(self)
+
+    monkeypatch.setattr(type(path), "read_bytes", counting_read_bytes)
+    runs, meta = expand_run_space(cfg, cwd=tmp_path, source_cache=cache)
+    ids = RunSpaceIdentityService(file_digest=cache.digest).compute(
+        asdict(cfg), base_dir=tmp_path
+    )
+    again, _ = expand_run_space(cfg, cwd=tmp_path, source_cache=cache)
+    assert reads == ["grid.csv"]
+    sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+    assert meta["blocks"][0]["source"]["sha256"] == sha256
+    assert ids.fingerprints[0].digest_sha256 == sha256
+    assert (
+        again == runs == [{"lr": 0.1, "momentum": 0.9}, {"lr": 0.2, "momentum": 0.95}]
+    )
+
+    # A new process reuses the parsed file; a modified file is read again.
+    reads.clear()
+    fresh = RunSpaceSourceCache(tmp_path / "cache")
+    assert expand_run_space(cfg, cwd=tmp_path, source_cache=fresh)[0] == runs
+    assert reads == []
+    path.write_text("lr,momentum\n0.3,0.5\n")
+    os.utime(path, ns=(1, 1))
+    runs, meta = expand_run_space(cfg, cwd=tmp_path, source_cache=fresh)
+    assert runs == [{"lr": 0.3, "momentum": 0.5}] and reads == ["grid.csv"]
+    assert fresh.digest(path) == meta["blocks"][0]["source"]["sha256"] != sha256
@@ -57,6 +57,7 @@ class _CaptureTrace(TraceDriver):
         run_space_inputs_id: str | None = None,
         run_space_input_fingerprints: list[dict] | None = None,
         run_space_planned_run_count: int | None = None,
+        run_space_resumed_from: dict | None = None,
     ) -> None:
         return None
 
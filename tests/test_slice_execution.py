@@ -0,0 +1,154 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from semantiva import Payload, Pipeline
+from semantiva.context_processors import ContextType
+from semantiva.data_processors.data_slicer_factory import SliceOptions, slice
+from semantiva.exceptions import PipelineConfigurationError
+from semantiva.examples.test_utils import (
+    FloatCollectValueProbe,
+    FloatDataCollection,
+    FloatDataType,
+    FloatMultiplyOperation,
+    FloatOperation,
+)
+
+
+class _BatchedDouble(FloatOperation):
+    """Double a float, with a batch hook that records chunk sizes."""
+
+    batches: list[int] = []
+
+    def _process_logic(self, data, factor: float = 2.0):
+        return FloatDataType(data.data * factor)
+
+    def _process_batch(self, items, factor: float = 2.0):
+        type(self).batches.append(len(items))
+        return [FloatDataType(item.data * factor) for item in items]
+
+
+def _collection(n: int) -> FloatDataCollection:
+    return FloatDataCollection([FloatDataType(float(i)) for i in range(n)])
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        SliceOptions(),
+        SliceOptions(executor="thread", max_workers=3, chunk_size=7),
+        SliceOptions(executor="thread", max_workers=2),
+        SliceOptions(executor="process", max_workers=2, chunk_size=25),
+    ],
+)
+def test_executors_preserve_element_order(options):
+    slicer = slice(FloatMultiplyOperation, FloatDataCollection, options)
+    result = slicer().process(_collection(100), factor=3.0)
+    assert isinstance(result, FloatDataCollection)
+    assert [item.data for item in result] == [3.0 * i for i in range(100)]
+
+
+def test_probe_slicer_on_thread_pool():
+    options = SliceOptions(executor="thread", max_workers=4, chunk_size=3)
+    probe = slice(FloatCollectValueProbe, FloatDataCollection, options)()
+    assert probe.process(_collection(10)) == [float(i) for i in range(10)]
+
+
+def test_batch_hook_receives_chunks():
+    _BatchedDouble.batches = []
+    slicer = slice(_BatchedDouble, FloatDataCollection, SliceOptions(chunk_size=4))
+    result = slicer().process(_collection(10), factor=5.0)
+    assert [item.data for item in result] == [5.0 * i for i in range(10)]
+    assert _BatchedDouble.batches == [4, 4, 2]
+
+    _BatchedDouble.batches = []
+    unbatched = slicer.with_slice_options(SliceOptions(batch=False))
+    unbatched().process(_collection(3))
+    assert _BatchedDouble.batches == []
+
+
+def test_slice_options_from_yaml_node():
+    nodes = [
+        {
+            "processor": "slice:FloatMultiplyOperation:FloatDataCollection",
+            "parameters": {"factor": 2.0},
+            "slice": {"executor": "thread", "max_workers": 2, "chunk_size": 2},
+        }
+    ]
+    pipeline = Pipeline(nodes)
+    output = pipeline.process(Payload(_collection(5), ContextType()))
+    assert [item.data for item in output.data] == [0.0, 2.0, 4.0, 6.0, 8.0]
+    assert pipeline.nodes[0].processor.slice_options.chunk_size == 2
+
+
+@pytest.mark.parametrize(
+    "node, match",
+    [
+        (
+            {
+                "processor": "slice:FloatMultiplyOperation:FloatDataCollection",
+                "slice": {"executor": "gpu"},
+            },
+            "executor",
+        ),
+        (
+            {
+                "processor": "slice:FloatMultiplyOperation:FloatDataCollection",
+                "slice": {"chunks": 4},
+            },
+            "Unknown slice option",
+        ),
+        (
+            {"processor": "FloatMultiplyOperation", "slice": {"chunk_size": 4}},
+            "require a slicer processor",
+        ),
+    ],
+)
+def test_invalid_slice_options_raise(node, match):
+    with pytest.raises(PipelineConfigurationError, match=match):
+        Pipeline([dict(node, parameters={"factor": 1.0})]).compile()
+
+
+class _NotifyingDouble(FloatOperation):
+    """Double a float and record the last input in context."""
+
+    @classmethod
+    def context_keys(cls):
+        return ["last_value"]
+
+    def _process_logic(self, data):
+        # Early elements finish last, so completion order differs from input order.
+        time.sleep(0.002 * (8 - data.data))
+        self._notify_context_update("last_value", data.data)
+        return FloatDataType(data.data * 2)
+
+
+def test_process_executor_rejects_context_updates():
+    with pytest.raises(ValueError, match="cannot propagate context updates"):
+        slice(_NotifyingDouble, FloatDataCollection, SliceOptions(executor="process"))
+
+
+def test_thread_executor_applies_context_updates_in_element_order():
+    options = SliceOptions(executor="thread", max_workers=4, chunk_size=1)
+    pipeline = Pipeline(
+        [{"processor": slice(_NotifyingDouble, FloatDataCollection, options)}]
+    )
+    output = pipeline.process(Payload(_collection(8), ContextType()))
+    assert [item.data for item in output.data] == [2.0 * i for i in range(8)]
+    assert output.context.get_value("last_value") == 7.0
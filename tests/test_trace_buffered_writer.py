@@ -0,0 +1,173 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from semantiva.configurations import load_pipeline_from_yaml
+from semantiva.configurations.schema import TraceConfig
+from semantiva.pipeline import Pipeline
+from semantiva.trace.drivers import jsonl
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+from semantiva.trace.factory import build_trace_driver
+
+
+def _records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def _wait_for_lines(path: Path, count: int, timeout: float = 5.0) -> int:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        lines = len(path.read_text().splitlines()) if path.exists() else 0
+        if lines >= count:
+            return lines
+        time.sleep(0.01)
+    return len(path.read_text().splitlines())
+
+
+def _strip_volatile(record: dict) -> dict:
+    volatile = {"timestamp", "run_id", "timing", "identity"}
+    return {k: v for k, v in record.items() if k not in volatile}
+
+
+def _end_runs(driver: JsonlTraceDriver, count: int) -> None:
+    for _ in range(count):
+        driver.on_pipeline_end("run", {})
+
+
+def test_buffered_trace_matches_synchronous(tmp_path: Path) -> None:
+    nodes = load_pipeline_from_yaml("tests/simple_pipeline.yaml")
+    traces = {}
+    for buffered in (False, True):
+        path = tmp_path / f"{buffered}.ser.jsonl"
+        driver = JsonlTraceDriver(str(path), buffered=buffered, flush_records=2)
+        Pipeline(nodes, trace=driver).process()
+        traces[buffered] = [_strip_volatile(r) for r in _records(path)]
+    assert traces[True] == traces[False]
+    assert [r["record_type"] for r in traces[True]][-1] == "pipeline_end"
+
+
+def test_record_count_and_interval_flush_policies(tmp_path: Path) -> None:
+    by_count = tmp_path / "count.jsonl"
+    driver = JsonlTraceDriver(
+        str(by_count), buffered=True, flush_records=3, flush_interval=60
+    )
+    driver.on_pipeline_start("plid", "run", {}, {})
+    for _ in range(2):
+        driver.on_pipeline_end("run", {"status": "ok"})
+    # Three records queued: the writer writes them without an explicit flush.
+    assert _wait_for_lines(by_count, 3) == 3
+    driver.close()
+
+    by_time = tmp_path / "time.jsonl"
+    driver = JsonlTraceDriver(
+        str(by_time), buffered=True, flush_records=1000, flush_interval=0.05
+    )
+    driver.on_pipeline_start("plid", "run", {}, {})
+    assert _wait_for_lines(by_time, 1) == 1
+    driver.close()
+
+
+def test_close_drains_queue_and_stops_writer(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    driver = JsonlTraceDriver(str(path), buffered=True, flush_interval=60)
+    driver.on_pipeline_start("plid", "run", {}, {})
+    for _ in range(999):
+        driver.on_pipeline_end("run", {"status": "ok"})
+    driver.close()
+    assert [r["seq"] for r in _records(path)] == list(range(1, 1001))
+    assert not any(t.name == "semantiva-trace-writer" for t in threading.enumerate())
+
+
+def test_backpressure_policies(tmp_path: Path, monkeypatch) -> None:
+    release = threading.Event()
+    original = jsonl._serialize
+
+    def slow_serialize(kind, record):
+        release.wait(timeout=5)
+        return original(kind, record)
+
+    monkeypatch.setattr(jsonl, "_serialize", slow_serialize)
+
+    path = tmp_path / "drop.jsonl"
+    driver = JsonlTraceDriver(
+        str(path), buffered=True, queue_size=1, backpressure="drop"
+    )
+    driver.on_pipeline_start("plid", "run", {}, {})
+    for _ in range(10):
+        driver.on_pipeline_end("run", {"status": "ok"})
+    assert driver.dropped_records >= 8
+    release.set()
+    driver.close()
+    assert len(_records(path)) == 11 - driver.dropped_records
+
+    release.clear()
+    path = tmp_path / "block.jsonl"
+    driver = JsonlTraceDriver(str(path), buffered=True, queue_size=1)
+    driver.on_pipeline_start("plid", "run", {}, {})
+    emitter = threading.Thread(target=_end_runs, args=(driver, 5))
+    emitter.start()
+    emitter.join(timeout=0.2)
+    assert emitter.is_alive()  # blocked on the full queue
+    release.set()
+    emitter.join(timeout=5)
+    driver.close()
+    assert len(_records(path)) == 6
+
+
+def test_sequence_numbers_are_thread_safe(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    driver = JsonlTraceDriver(str(path), buffered=True)
+    driver.on_pipeline_start("plid", "run", {}, {})
+    threads = [threading.Thread(target=_end_runs, args=(driver, 200)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    driver.close()
+    assert sorted(r["seq"] for r in _records(path)) == list(range(1, 1602))
+
+
+def test_writer_errors_surface_on_flush(tmp_path: Path, monkeypatch) -> None:
+    def failing(kind, record):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(jsonl, "_serialize", failing)
+    driver = JsonlTraceDriver(str(tmp_path / "trace.jsonl"), buffered=True)
+    driver.on_pipeline_start("plid", "run", {}, {})
+    with pytest.raises(OSError, match="disk full"):
+        driver.flush()
+    driver.close()
+
+
+def test_buffering_options_from_trace_config(tmp_path: Path) -> None:
+    driver = build_trace_driver(
+        TraceConfig(
+            driver="jsonl",
+            output_path=str(tmp_path / "t.jsonl"),
+            options={"buffered": True, "flush_records": 8, "backpressure": "drop"},
+        )
+    )
+    assert driver._buffered and not driver._block
+    with pytest.raises(ValueError, match="backpressure must be one of"):
+        JsonlTraceDriver(str(tmp_path), backpressure="spill")
+    with pytest.raises(ValueError, match="flush_interval must be a positive"):
+        JsonlTraceDriver(str(tmp_path), flush_interval=0)
@@ -0,0 +1,143 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from semantiva.configurations import load_pipeline_from_yaml
+from semantiva.configurations.schema import TraceConfig
+from semantiva.pipeline import Pipeline
+from semantiva.trace._utils import parse_detail_flags
+from semantiva.trace.detail import TraceDetailPolicy, detail_policy_options
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+from semantiva.trace.factory import build_trace_driver
+from semantiva.trace.hashing import ContentHasher
+
+
+def _ser_records(path: Path) -> list[dict]:
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    return [r for r in records if r["record_type"] == "ser"]
+
+
+def _summarized(ser: dict) -> bool:
+    return bool(ser.get("summaries"))
+
+
+def test_detail_flags_and_option_validation() -> None:
+    assert parse_detail_flags("timing") == {
+        "hash": False,
+        "repr": False,
+        "context": False,
+        "resources": False,
+    }
+    assert parse_detail_flags("timing,repr")["repr"] is True
+    assert parse_detail_flags("bogus")["hash"] is True
+    assert detail_policy_options() == {}
+    assert detail_policy_options(sample_every=4, node_detail={"sinks": "all"}) == {
+        "sample_every": 4,
+        "node_detail": {
+            "sinks": {"hash": True, "repr": True, "context": True, "resources": False}
+        },
+    }
+    with pytest.raises(ValueError, match="sample_every"):
+        detail_policy_options(sample_every=0)
+    with pytest.raises(ValueError, match="node_detail"):
+        detail_policy_options(node_detail={"sinks": ["hash"]})
+
+    policy = TraceDetailPolicy.from_options(
+        {"hash": True, "sample_every": 3, "node_detail": {"n1": {"repr": True}}}
+    )
+    assert policy.run_flags(None)["hash"] and policy.run_flags(3)["hash"]
+    assert not any(policy.run_flags(4).values())
+    flags = policy.run_flags(0)
+    assert policy.node_flags(flags, node_id="n2") is flags
+    assert policy.node_flags(flags, node_id="n1")["repr"] is True
+
+
+def test_sampled_run_space_runs(tmp_path: Path, monkeypatch) -> None:
+    calls = {"n": 0}
+    original = ContentHasher.hexdigest
+
+    def counting(self, value):
+        calls["n"] += 1
+        return original(self, value)
+
+    monkeypatch.setattr(ContentHasher, "hexdigest", counting)
+    path = tmp_path / "trace.ser.jsonl"
+    driver = JsonlTraceDriver(str(path), sample_every=2)
+    pipeline = Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"), trace=driver
+    )
+    hashes_per_run = []
+    for index in range(4):
+        before = calls["n"]
+        pipeline.set_run_metadata({"run_space_index": index})
+        pipeline.process()
+        hashes_per_run.append(calls["n"] - before)
+    pipeline.process()  # outside a run-space: full detail
+
+    sers = _ser_records(path)
+    per_run: dict[str, list[dict]] = {}
+    for ser in sers:
+        per_run.setdefault(ser["identity"]["run_id"], []).append(ser)
+    summarized = [all(map(_summarized, runs)) for runs in per_run.values()]
+    timing_only = [not any(map(_summarized, runs)) for runs in per_run.values()]
+    assert summarized == [True, False, True, False, True]
+    assert timing_only == [False, True, False, True, False]
+    assert all("wall_ms" in ser["timing"] for ser in sers)
+    assert hashes_per_run[1] == hashes_per_run[3] == 0
+    assert hashes_per_run[0] > 0
+
+
+def test_node_detail_overrides(tmp_path: Path) -> None:
+    path = tmp_path / "trace.ser.jsonl"
+    driver = build_trace_driver(
+        TraceConfig(
+            driver="jsonl",
+            output_path=str(path),
+            options={
+                "detail": "timing",
+                "node_detail": {"sinks": "hash", "FloatAddOperation": "hash,repr"},
+            },
+        )
+    )
+    Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"), trace=driver
+    ).process()
+
+    sers = {
+        ser["processor"]["ref"].rsplit(".", 1)[-1]: ser for ser in _ser_records(path)
+    }
+    assert "repr" not in sers["FloatTxtFileSaver"]["summaries"]["input_data"]
+    assert "sha256" in sers["FloatTxtFileSaver"]["summaries"]["input_data"]
+    assert "repr" in sers["FloatAddOperation"]["summaries"]["output_data"]
+    for name in ("FloatValueDataSourceWithDefault", "FloatBasicProbe"):
+        assert not _summarized(sers[name])
+
+    # A node UUID selector beats the processor and role selectors.
+    sink_id = sers["FloatTxtFileSaver"]["identity"]["node_id"]
+    path.unlink()
+    driver = JsonlTraceDriver(
+        str(path), node_detail={"sinks": "hash", sink_id: "timing"}
+    )
+    Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"), trace=driver
+    ).process()
+    sers = {ser["identity"]["node_id"]: ser for ser in _ser_records(path)}
+    assert not _summarized(sers.pop(sink_id))
+    assert all(_summarized(ser) for ser in sers.values())
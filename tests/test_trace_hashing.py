@@ -0,0 +1,158 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+
+from semantiva.data_types import BaseDataType
+from semantiva.examples.test_utils import FloatDataCollection, FloatDataType
+from semantiva.trace import hashing
+from semantiva.trace.delta_collector import DeltaCollector
+from semantiva.trace.hashing import ContentHasher, register_hasher, unregister_hasher
+
+
+class ArrayDataType(BaseDataType[np.ndarray]):
+    def validate(self, data):
+        return True
+
+
+def test_bytes_digest_matches_plain_sha256(monkeypatch):
+    monkeypatch.setattr(hashing, "CHUNK_BYTES", 7)
+    payload = bytes(range(100))
+    expected = "sha256-" + hashlib.sha256(payload).hexdigest()
+    hasher = ContentHasher()
+    assert hasher.hexdigest(payload) == expected
+    assert hasher.hexdigest(bytearray(payload)) == expected
+    assert hasher.hexdigest(memoryview(payload)) == expected
+
+
+def test_ndarray_digest_reflects_full_content_dtype_and_shape():
+    hasher = ContentHasher(memo_size=0)
+    a = np.zeros(10_000)
+    b = a.copy()
+    b[5_000] = 1.0
+    # Both arrays have the same truncated repr; their digests must differ.
+    assert hasher.digest(a) != hasher.digest(b)
+    assert hasher.digest(a) != hasher.digest(a.reshape(100, 100))
+    assert hasher.digest(a) != hasher.digest(a.astype(np.float32))
+    strided = np.arange(20.0)[::2]
+    assert hasher.digest(strided) == hasher.digest(np.ascontiguousarray(strided))
+    assert hasher.digest(np.array(["2024-01-01"], dtype="datetime64[D]"))
+    assert hasher.digest(np.array([{"a": 1}], dtype=object))
+
+
+def test_data_type_and_collection_hash_wrapped_content():
+    hasher = ContentHasher(memo_size=0)
+    arr = np.arange(6.0)
+    assert hasher.digest(ArrayDataType(arr)) == hasher.digest(ArrayDataType(arr.copy()))
+    assert hasher.digest(ArrayDataType(arr)) != hasher.digest(ArrayDataType(arr + 1))
+
+    first = FloatDataCollection.from_list([FloatDataType(1.0), FloatDataType(2.0)])
+    same = FloatDataCollection.from_list([FloatDataType(1.0), FloatDataType(2.0)])
+    other = FloatDataCollection.from_list([FloatDataType(2.0), FloatDataType(1.0)])
+    assert hasher.digest(first) == hasher.digest(same)
+    assert hasher.digest(first) != hasher.digest(other)
+
+
+def test_memo_skips_rehash_until_invalidated(monkeypatch):
+    calls: list[int] = []
+    original = hashing._hash_ndarray
+
+    def counting(hasher, value, h):
+        calls.append(1)
+        original(hasher, value, h)
+
+    monkeypatch.setitem(hashing._HASHERS, np.ndarray, (counting, None))
+    hasher = ContentHasher()
+    arr = np.ones(1000)
+    wrapped = ArrayDataType(arr)
+    first = hasher.digest(wrapped)
+    assert hasher.digest(wrapped) == first
+    assert hasher.digest(arr)
+    assert len(calls) == 1
+
+    arr[0] = 5.0
+    hasher.invalidate()
+    assert hasher.digest(wrapped) != first
+    assert len(calls) == 2
+
+
+def test_frozen_arrays_survive_invalidation():
+    hasher = ContentHasher()
+    frozen = np.arange(4.0)
+    frozen.flags.writeable = False
+    view = np.arange(4.0)[:]
+    view.flags.writeable = False  # base is still writeable
+    hasher.digest(frozen)
+    hasher.digest(view)
+    hasher.invalidate()
+    assert list(hasher._memo) == [id(frozen)]
+
+
+def test_register_hasher_takes_precedence_along_mro():
+    class Point:
+        def __init__(self, x):
+            self.x = x
+
+    class Point3(Point):
+        pass
+
+    def hash_point(hasher, value, h):
+        h.update(b"point")
+
+    register_hasher(Point, hash_point)
+    try:
+        hasher = ContentHasher(memo_size=0)
+        assert hasher.digest(Point(1)) == hasher.digest(Point3(2))
+    finally:
+        unregister_hasher(Point)
+    assert ContentHasher().digest(Point(1)) != ContentHasher().digest(Point(2))
+
+
+class _Slotted:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return "_Slotted(...)"
+
+
+def test_exact_digest_rejects_repr_fallback():
+    hasher = ContentHasher()
+    for value in ({"a": [1, 2.5, "x", None]}, np.arange(3), FloatDataType(1.0)):
+        assert hasher.exact_digest(value) == hasher.digest(value)
+    slotted = _Slotted(np.arange(3))
+    assert hasher.digest(slotted) == hasher.digest(_Slotted(np.zeros(3)))
+    assert hasher.exact_digest(slotted) is None
+    # Inexact parts taint their containers, also when memoized.
+    assert hasher.exact_digest({"nested": slotted}) is None
+    assert hasher.exact_digest(np.array([slotted], dtype=object)) is None
+    assert hasher.exact_digest([1, 2]) is not None
+
+
+def test_delta_collector_detects_array_updates():
+    collector = DeltaCollector(enable_hash=True, enable_repr=False)
+    pre = {"arr": np.zeros(5000), "n": 1}
+    post = {"arr": pre["arr"].copy(), "n": 1}
+    post["arr"][2500] = 3.0
+    delta = collector.compute(pre, post)
+    assert delta["updated_keys"] == ["arr"]
+    assert delta["key_summaries"]["arr"]["sha256"] == collector.hasher.hexdigest(
+        post["arr"]
+    )
@@ -0,0 +1,113 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from semantiva.configurations import load_pipeline_from_yaml
+from semantiva.data_io import DataSource
+from semantiva.data_types import BaseDataType
+from semantiva.pipeline import Pipeline
+from semantiva.trace._utils import parse_detail_flags
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+from semantiva.trace.resources import ResourceMeter, object_size
+
+MIB = 1 << 20
+
+
+class ArrayType(BaseDataType[np.ndarray]):
+    def validate(self, data):
+        return True
+
+
+class ArraySource(DataSource):
+    @classmethod
+    def _get_data(cls):
+        scratch = [bytearray(MIB) for _ in range(8)]  # freed before returning
+        del scratch
+        return ArrayType(np.ones(MIB // 8))
+
+    @classmethod
+    def output_data_type(cls):
+        return ArrayType
+
+
+def _sers(path: Path) -> list[dict]:
+    return [
+        json.loads(line)
+        for line in path.read_text().splitlines()
+        if '"record_type": "ser"' in line
+    ]
+
+
+def test_resources_flag_parsing() -> None:
+    assert parse_detail_flags("resources") == {
+        "hash": True,
+        "repr": False,
+        "context": False,
+        "resources": True,
+    }
+    assert parse_detail_flags("all")["resources"] is False
+    assert parse_detail_flags("timing,resources") == {
+        "hash": False,
+        "repr": False,
+        "context": False,
+        "resources": True,
+    }
+
+
+def test_meter_measures_allocations_and_gc() -> None:
+    was_tracing = tracemalloc.is_tracing()
+    meter = ResourceMeter().start()
+    block = bytearray(4 * MIB)
+    gc.collect()
+    figures = meter.stop()
+    assert figures["py_peak_bytes"] >= 4 * MIB
+    assert figures["py_net_bytes"] >= 4 * MIB
+    assert figures["gc_collections"][2] >= 1 and figures["gc_pause_ms"] >= 0
+    assert tracemalloc.is_tracing() is was_tracing
+    del block
+    assert object_size(np.zeros(1000)) == 8000
+    assert object_size(ArrayType(np.zeros(10))) == 80
+    assert object_size({"a": [b"x" * 100]}) > 100
+
+
+def test_resources_in_ser_summaries(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    Pipeline(
+        [{"processor": ArraySource}],
+        trace=JsonlTraceDriver(str(path), detail="timing,resources"),
+    ).process()
+    (ser,) = _sers(path)
+    resources = ser["summaries"]["resources"]
+    assert set(ser["summaries"]) == {"resources"}
+    assert resources["py_peak_bytes"] >= 8 * MIB
+    assert 0 < resources["py_net_bytes"] < 8 * MIB
+    assert resources["output_data_bytes"] == MIB
+    assert resources["context_delta_bytes"] == 0
+    assert len(resources["gc_collections"]) == 3
+
+    # Without the flag no resources are measured.
+    path.unlink()
+    Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"),
+        trace=JsonlTraceDriver(str(path), detail="hash"),
+    ).process()
+    assert all("resources" not in ser["summaries"] for ser in _sers(path))
@@ -0,0 +1,166 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import gzip
+import lzma
+from pathlib import Path
+
+import pytest
+
+from semantiva.configurations import load_pipeline_from_yaml
+from semantiva.trace.aggregation import TraceAggregator
+from semantiva.pipeline import Pipeline
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+from semantiva.trace.runtime import (
+    RunSpaceLaunchManager,
+    RunSpaceTraceEmitter,
+    TraceContext,
+)
+from semantiva.trace.segments import (
+    MANIFEST_NAME,
+    iter_trace_records,
+    open_trace_file,
+    read_manifest,
+)
+
+
+def _run_pipelines(driver: JsonlTraceDriver, count: int, **metadata) -> None:
+    nodes = load_pipeline_from_yaml("tests/simple_pipeline.yaml")
+    pipeline = Pipeline(nodes, trace=driver)
+    for index in range(count):
+        if metadata:
+            pipeline.set_run_metadata({**metadata, "run_space_index": index})
+        pipeline.process()
+
+
+def _segments(directory: Path) -> list[dict]:
+    manifest = read_manifest(directory)
+    assert manifest is not None
+    return manifest["segments"]
+
+
+def test_gzip_segments_rotate_by_record_count(tmp_path: Path) -> None:
+    driver = JsonlTraceDriver(str(tmp_path), compression="gzip", rotate_records=4)
+    _run_pipelines(driver, 3)
+
+    manifest = read_manifest(tmp_path)
+    assert manifest is not None
+    segments = manifest["segments"]
+    records = list(iter_trace_records(tmp_path))
+    assert sum(seg["records"] for seg in segments) == len(records)
+    assert all(seg["records"] <= 4 for seg in segments)
+    assert len(segments) == -(-len(records) // 4)
+    # Runs share segments instead of getting one file each.
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        [MANIFEST_NAME] + [seg["file"] for seg in segments]
+    )
+    with gzip.open(tmp_path / segments[0]["file"], "rt") as handle:
+        assert handle.readline().startswith("{")
+    seqs = [r["seq"] for r in records if "seq" in r]
+    assert seqs == sorted(seqs) and len(seqs) == 6
+    run_ids = {r["run_id"] for r in records if r["record_type"] == "pipeline_start"}
+    assert len(run_ids) == 3
+    indexed = set().union(*(seg["run_ids"] for seg in segments))
+    assert indexed == run_ids
+
+
+def test_lzma_buffered_segments_filter_by_run(tmp_path: Path) -> None:
+    driver = JsonlTraceDriver(
+        str(tmp_path), compression="lzma", rotate_bytes=2000, buffered=True
+    )
+    _run_pipelines(driver, 2)
+    segments = _segments(tmp_path)
+    assert len(segments) > 1
+    assert all(seg["file"].endswith(".trace.jsonl.xz") for seg in segments)
+    with lzma.open(tmp_path / segments[0]["file"], "rt") as handle:
+        assert handle.readline().startswith("{")
+
+    first_run = next(iter_trace_records(tmp_path))["run_id"]
+    selected = list(iter_trace_records(tmp_path, run_id=first_run))
+    assert selected[0]["record_type"] == "pipeline_start"
+    assert selected[-1]["record_type"] == "pipeline_end"
+    assert all(
+        r.get("run_id", r.get("identity", {}).get("run_id")) == first_run
+        for r in selected
+    )
+
+
+def test_new_driver_continues_with_new_segment(tmp_path: Path) -> None:
+    _run_pipelines(JsonlTraceDriver(str(tmp_path), compression="gzip"), 2)
+    assert len(_segments(tmp_path)) == 1
+    _run_pipelines(JsonlTraceDriver(str(tmp_path), compression="gzip"), 1)
+    segments = _segments(tmp_path)
+    assert [seg["file"] for seg in segments] == [
+        "segment-00001.trace.jsonl.gz",
+        "segment-00002.trace.jsonl.gz",
+    ]
+    assert [len(seg["run_ids"]) for seg in segments] == [2, 1]
+
+
+def test_aggregator_ingests_launch_from_segments(tmp_path: Path) -> None:
+    driver = JsonlTraceDriver(str(tmp_path), compression="gzip", rotate_records=5)
+    emitter = RunSpaceTraceEmitter(driver)
+    launch = RunSpaceLaunchManager().create_launch(
+        run_space_spec_id="a" * 64, run_space_inputs_id=None
+    )
+    trace_ctx = TraceContext()
+    trace_ctx.set_run_space_fk(
+        spec_id="a" * 64, launch_id=launch.id, attempt=launch.attempt
+    )
+    emitter.emit_start(
+        run_space_spec_id="a" * 64,
+        run_space_launch_id=launch.id,
+        run_space_attempt=launch.attempt,
+        run_space_combine_mode="combinatorial",
+        run_space_total_runs=2,
+        run_space_planned_run_count=2,
+    )
+    _run_pipelines(driver, 2, trace_context=trace_ctx, run_space_context={})
+    emitter.emit_end(
+        run_space_launch_id=launch.id,
+        run_space_attempt=launch.attempt,
+        summary={"completed_runs": 2},
+    )
+    driver.close()
+    # An unrelated run in the same directory is filtered out.
+    _run_pipelines(JsonlTraceDriver(str(tmp_path), compression="gzip"), 1)
+
+    segments = _segments(tmp_path)
+    assert all(launch.id in seg["run_space_launch_ids"] for seg in segments[:-1])
+    assert launch.id not in segments[-1]["run_space_launch_ids"]
+
+    agg = TraceAggregator()
+    agg.ingest_path(tmp_path, run_space_launch_id=launch.id)
+    assert len(list(agg.iter_runs())) == 2
+    completeness = agg.finalize_launch(launch.id, launch.attempt)
+    assert completeness.status == "complete"
+
+
+def test_open_trace_file_reads_plain_files(tmp_path: Path) -> None:
+    path = tmp_path / "trace.ser.jsonl"
+    _run_pipelines(JsonlTraceDriver(str(path)), 1)
+    with open_trace_file(path) as handle:
+        lines = handle.read().splitlines()
+    assert len(list(iter_trace_records(path))) == len(lines)
+
+
+def test_segment_option_validation(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="compression must be one of"):
+        JsonlTraceDriver(str(tmp_path), compression="zip")
+    with pytest.raises(ValueError, match="rotate_records must be a positive"):
+        JsonlTraceDriver(str(tmp_path), rotate_records=0)
+    with pytest.raises(ValueError, match="directory output_path"):
+        JsonlTraceDriver(str(tmp_path / "t.jsonl"), compression="gzip")
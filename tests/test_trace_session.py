@@ -0,0 +1,148 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from semantiva.configurations import load_pipeline_from_yaml
+from semantiva.execution.orchestrator.orchestrator import SemantivaOrchestrator
+from semantiva.pipeline import Pipeline
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+from semantiva.trace.runtime import TraceSession, active_trace_session
+
+from .test_utils import run_cli
+
+
+class CountingDriver(JsonlTraceDriver):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flushes = 0
+        self.closes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+    def close(self) -> None:
+        self.closes += 1
+        super().close()
+
+
+def _pipeline(driver) -> Pipeline:
+    return Pipeline(load_pipeline_from_yaml("tests/simple_pipeline.yaml"), trace=driver)
+
+
+def test_session_keeps_driver_open_and_flushes_by_policy(tmp_path: Path) -> None:
+    driver = CountingDriver(str(tmp_path))
+    pipeline = _pipeline(driver)
+    with TraceSession(driver, flush_runs=2, flush_interval=None) as session:
+        assert active_trace_session(driver) is session
+        for _ in range(5):
+            pipeline.process()
+        assert (driver.flushes, driver.closes) == (2, 0)
+    assert (driver.flushes, driver.closes) == (3, 1)
+    assert session.runs == 5 and active_trace_session(driver) is None
+
+    (trace_file,) = tmp_path.iterdir()
+    records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    starts = [r for r in records if r["record_type"] == "pipeline_start"]
+    assert len(starts) == 5 and len({r["run_id"] for r in starts}) == 5
+
+    # Without a session every run is flushed and closed again.
+    pipeline.process()
+    assert (driver.flushes, driver.closes) == (4, 2)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_failed_run_is_flushed_immediately(tmp_path: Path, monkeypatch) -> None:
+    driver = CountingDriver(str(tmp_path / "t.jsonl"))
+    pipeline = _pipeline(driver)
+    with TraceSession(driver, flush_runs=None, flush_interval=None):
+        pipeline.process()
+        assert driver.flushes == 0
+
+        def boom(self, run, router):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(SemantivaOrchestrator, "_execute_nodes", boom)
+        with pytest.raises(RuntimeError, match="boom"):
+            pipeline.process()
+        assert driver.flushes == 1
+    assert driver.closes == 1
+    ends = [
+        json.loads(line)["summary"]["status"]
+        for line in (tmp_path / "t.jsonl").read_text().splitlines()
+        if '"pipeline_end"' in line
+    ]
+    assert ends == ["ok", "error"]
+
+
+def test_session_validation_and_single_owner(tmp_path: Path) -> None:
+    driver = JsonlTraceDriver(str(tmp_path))
+    with pytest.raises(ValueError, match="flush_runs"):
+        TraceSession(driver, flush_runs=0)
+    with pytest.raises(ValueError, match="flush_interval"):
+        TraceSession(driver, flush_interval=0)
+    with TraceSession(driver):
+        with pytest.raises(RuntimeError, match="already has an open session"):
+            TraceSession(driver).open()
+
+
+@pytest.mark.parametrize("jobs", [[], ["--jobs", "2"]])
+def test_cli_launch_writes_one_trace_file(tmp_path: Path, jobs: list[str]) -> None:
+    yaml_path = tmp_path / "pipeline.yaml"
+    yaml_path.write_text(textwrap.dedent("""
+            extensions: ["semantiva-examples"]
+            run_space:
+              combine: combinatorial
+              blocks:
+                - mode: combinatorial
+                  context:
+                    value: [1.0, 2.0, 3.0]
+                    factor: [10.0, 20.0]
+            pipeline:
+              nodes:
+                - processor: FloatValueDataSource
+                - processor: FloatMultiplyOperation
+            """))
+    out = tmp_path / "traces"
+    result = run_cli(
+        [
+            "run",
+            str(yaml_path),
+            *jobs,
+            "--trace.driver",
+            "jsonl",
+            "--trace.output",
+            str(out),
+        ]
+    )
+    assert result.returncode == 0, result.stderr
+
+    run_files = sorted(out.glob("*.ser.jsonl"))
+    assert len(run_files) == 1
+    lines = run_files[0].read_text().splitlines()
+    starts = [json.loads(line) for line in lines if '"pipeline_start"' in line]
+    assert [r["run_space_index"] for r in starts] == list(range(6))
+    (run_space_file,) = out.glob("*_runspace-*.trace.jsonl")
+    kinds = [
+        json.loads(line)["record_type"]
+        for line in run_space_file.read_text().splitlines()
+    ]
+    assert kinds == ["run_space_start", "run_space_end"]
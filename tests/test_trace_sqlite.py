@@ -0,0 +1,162 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from semantiva.configurations import load_pipeline_from_yaml
+from semantiva.configurations.schema import TraceConfig
+from semantiva.pipeline import Pipeline
+from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+from semantiva.trace.drivers.sqlite import SqliteTraceDriver
+from semantiva.trace.factory import build_trace_driver
+from semantiva.trace.runtime import RunSpaceTraceEmitter
+
+from .test_utils import run_cli
+
+
+def _run(driver, count: int = 1) -> None:
+    pipeline = Pipeline(
+        load_pipeline_from_yaml("tests/simple_pipeline.yaml"), trace=driver
+    )
+    for _ in range(count):
+        pipeline.process()
+
+
+def _strip_volatile(record: dict) -> dict:
+    volatile = {"timestamp", "run_id", "timing", "identity"}
+    return {k: v for k, v in record.items() if k not in volatile}
+
+
+def test_sqlite_rows_match_jsonl_records(tmp_path: Path) -> None:
+    jsonl_path = tmp_path / "trace.ser.jsonl"
+    _run(JsonlTraceDriver(str(jsonl_path)))
+    db = tmp_path / "trace.db"
+    _run(SqliteTraceDriver(str(db)))
+
+    expected = [
+        _strip_volatile(json.loads(line))
+        for line in jsonl_path.read_text().splitlines()
+    ]
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        rows = conn.execute(
+            "SELECT record FROM pipeline_events WHERE record_type = 'pipeline_start' "
+            "UNION ALL SELECT record FROM (SELECT record FROM ser ORDER BY id) "
+            "UNION ALL SELECT record FROM pipeline_events "
+            "WHERE record_type = 'pipeline_end'"
+        ).fetchall()
+        ser = conn.execute(
+            "SELECT run_id, pipeline_id, node_id, status, wall_ms FROM ser"
+        ).fetchall()
+        end_pipeline = conn.execute(
+            "SELECT pipeline_id FROM pipeline_events WHERE record_type = 'pipeline_end'"
+        ).fetchone()[0]
+    assert [_strip_volatile(json.loads(r[0])) for r in rows] == expected
+    assert len(ser) == 5
+    assert all(
+        run_id and pipeline_id and node_id for run_id, pipeline_id, node_id, *_ in ser
+    )
+    assert {status for *_, status, _ in ser} == {"succeeded"}
+    assert end_pipeline == ser[0][1]
+
+
+def test_batches_and_reuse_across_runs(tmp_path: Path) -> None:
+    driver = SqliteTraceDriver(str(tmp_path), batch_size=3)
+    driver.on_pipeline_start("plid", "run-1", {}, {})
+    driver.on_pipeline_end("run-1", {})
+    # Below the batch size nothing is written (or even created) yet.
+    assert not driver.path.exists()
+    driver.flush()
+    _run(driver, 2)
+    with sqlite3.connect(tmp_path / "trace.sqlite") as conn:
+        runs = conn.execute(
+            "SELECT COUNT(DISTINCT run_id) FROM pipeline_events"
+        ).fetchone()[0]
+        sers = conn.execute("SELECT COUNT(*) FROM ser").fetchone()[0]
+    assert (runs, sers) == (3, 10)
+
+
+def test_run_space_records_and_slowest_nodes(tmp_path: Path) -> None:
+    driver = SqliteTraceDriver(str(tmp_path / "t.sqlite"))
+    emitter = RunSpaceTraceEmitter(driver)
+    emitter.emit_start(
+        run_space_spec_id="a" * 64,
+        run_space_launch_id="launch-1",
+        run_space_attempt=1,
+        run_space_combine_mode="combinatorial",
+        run_space_total_runs=0,
+    )
+    emitter.emit_end(run_space_launch_id="launch-1", run_space_attempt=1)
+    _run(driver, 2)
+
+    slowest = driver.slowest_nodes(limit=2)
+    assert len(slowest) == 2 and all(entry["runs"] == 2 for entry in slowest)
+    assert slowest[0]["max_wall_ms"] >= slowest[1]["max_wall_ms"]
+    with sqlite3.connect(driver.path) as conn:
+        events = conn.execute(
+            "SELECT record_type FROM run_space_events "
+            "WHERE run_space_launch_id = 'launch-1' ORDER BY seq"
+        ).fetchall()
+        plan = " ".join(
+            str(row)
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM ser WHERE node_id = 'x'"
+            )
+        )
+    assert events == [("run_space_start",), ("run_space_end",)]
+    assert "ix_ser_node_wall" in plan
+
+
+def test_sqlite_selectable_through_config(tmp_path: Path) -> None:
+    driver = build_trace_driver(
+        TraceConfig(
+            driver="sqlite",
+            output_path=str(tmp_path / "t.db"),
+            options={"batch_size": 10, "detail": "all"},
+        )
+    )
+    assert isinstance(driver, SqliteTraceDriver)
+    assert driver.get_options() == {
+        "hash": True,
+        "repr": True,
+        "context": True,
+        "resources": False,
+    }
+    with pytest.raises(ValueError, match="batch_size must be a positive"):
+        SqliteTraceDriver(str(tmp_path), batch_size=0)
+    with pytest.raises(ValueError, match="Unknown trace driver"):
+        build_trace_driver(TraceConfig(driver="parquet"))
+
+
+def test_cli_run_with_sqlite_driver(tmp_path: Path) -> None:
+    db = tmp_path / "cli.sqlite"
+    result = run_cli(
+        [
+            "run",
+            "tests/simple_pipeline.yaml",
+            "--trace.driver",
+            "sqlite",
+            "--trace.output",
+            str(db),
+        ]
+    )
+    assert result.returncode == 0, result.stderr
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM ser").fetchone()[0] == 5
@@ -0,0 +1,150 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+import textwrap
+from pathlib import Path
+
+from semantiva.trace.timeline import LAUNCH_PID, UNKNOWN_PID, iter_chrome_events
+
+from .test_utils import run_cli
+
+
+def _ser(run_id: str, node: str, start: str, end: str, **timing) -> dict:
+    return {
+        "record_type": "ser",
+        "identity": {"run_id": run_id, "node_id": node, "pipeline_id": "p"},
+        "processor": {"ref": f"pkg.{node}"},
+        "status": "succeeded",
+        "timing": {"started_at": start, "finished_at": end, **timing},
+    }
+
+
+def _start(run_id: str, ts: str, **extra) -> dict:
+    return {"record_type": "pipeline_start", "run_id": run_id, "timestamp": ts, **extra}
+
+
+def _end(run_id: str, ts: str) -> dict:
+    return {
+        "record_type": "pipeline_end",
+        "run_id": run_id,
+        "timestamp": ts,
+        "summary": {"status": "ok"},
+    }
+
+
+def _spans(events: list[dict]) -> dict[str, dict]:
+    return {e["name"]: e for e in events if e["ph"] == "X"}
+
+
+def test_runs_nodes_and_launches_become_spans() -> None:
+    t = "2025-01-01T00:00:0"
+    events = list(
+        iter_chrome_events(
+            [
+                {
+                    "record_type": "run_space_start",
+                    "run_space_launch_id": "launch-1",
+                    "run_space_attempt": 1,
+                    "timestamp": t + "0.000Z",
+                },
+                # Replayed run: start/end records are later than its nodes.
+                _start("r0", t + "5.000Z", run_space_index=0),
+                _ser("r0", "A", t + "1.000000Z", t + "1.500000Z", pid=7, thread="T"),
+                _end("r0", t + "5.001Z"),
+                # Old-style SERs without pid/thread overlap: two lanes.
+                _start("r1", t + "1.000Z"),
+                _ser("r1", "B", t + "1.100Z", t + "1.300Z"),
+                _ser("r1", "C", t + "1.200Z", t + "1.400Z"),
+                _end("r1", t + "1.500Z"),
+                # Never ended.
+                _start("r2", t + "2.000Z"),
+                _ser("r2", "D", t + "2.000Z", t + "2.250Z", pid=7, thread="T"),
+            ]
+        )
+    )
+    spans = _spans(events)
+    assert spans["run 0"]["ts"] == spans["A"]["ts"]
+    assert spans["run 0"]["dur"] == spans["A"]["dur"] == 500_000
+    assert spans["A"]["pid"] == 7 and spans["run 0"]["pid"] == 7
+    assert spans["B"]["pid"] == spans["C"]["pid"] == UNKNOWN_PID
+    assert spans["B"]["tid"] != spans["C"]["tid"]
+    assert spans["r1"]["dur"] == 500_000 and spans["r1"]["args"]["status"] == "ok"
+    assert spans["r2"]["args"]["status"] == "incomplete"
+    launch = spans["launch launch-1 (attempt 1)"]
+    assert launch["pid"] == LAUNCH_PID and launch["args"]["status"] == "incomplete"
+
+    names = {
+        (e["pid"], e["tid"]): e["args"]["name"]
+        for e in events
+        if e["ph"] == "M" and e["name"] == "thread_name"
+    }
+    assert names[(7, spans["A"]["tid"])] == "T"
+    assert sorted(names[(UNKNOWN_PID, spans[n]["tid"])] for n in ("B", "C")) == [
+        "main",
+        "main #2",
+    ]
+
+
+def test_cli_timeline_of_parallel_launch(tmp_path: Path) -> None:
+    yaml_path = tmp_path / "pipeline.yaml"
+    yaml_path.write_text(textwrap.dedent("""
+            extensions: ["semantiva-examples"]
+            run_space:
+              blocks:
+                - mode: by_position
+                  context:
+                    value: [1.0, 2.0, 3.0, 4.0]
+                    factor: [10.0, 20.0, 30.0, 40.0]
+            pipeline:
+              nodes:
+                - processor: FloatValueDataSource
+                - processor: FloatMultiplyOperation
+            """))
+    traces = tmp_path / "traces"
+    result = run_cli(
+        [
+            "run",
+            str(yaml_path),
+            "--jobs",
+            "2",
+            "--trace.driver",
+            "jsonl",
+            "--trace.output",
+            str(traces),
+        ]
+    )
+    assert result.returncode == 0, result.stderr
+    out = tmp_path / "timeline.json"
+    result = run_cli(["trace", "timeline", str(traces), "-o", str(out)])
+    assert result.returncode == 0, result.stderr
+
+    events = json.loads(out.read_text())["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    by_cat: dict[str, list[dict]] = {}
+    for span in spans:
+        by_cat.setdefault(span["cat"], []).append(span)
+    assert len(by_cat["run_space"]) == 1 and len(by_cat["run"]) == 4
+    assert len(by_cat["node"]) == 8
+    worker_pids = {span["pid"] for span in by_cat["node"]}
+    assert LAUNCH_PID not in worker_pids and 1 <= len(worker_pids) <= 2
+    launch = by_cat["run_space"][0]
+    for run in by_cat["run"]:
+        assert launch["ts"] <= run["ts"]
+        assert run["ts"] + run["dur"] <= launch["ts"] + launch["dur"]
+
+    missing = run_cli(["trace", "timeline", str(tmp_path / "nope"), "-o", str(out)])
+    assert missing.returncode == 2
@@ -27,6 +27,9 @@ This file tests the `InMemorySemantivaTransport`, which is:
   - No-op connect()/close() and ack() semantics.
 """
 
+import pytest
+
+from semantiva.execution.transport import NullSemantivaTransport
 from semantiva.execution.transport.in_memory import InMemorySemantivaTransport
 
 
@@ -93,3 +96,56 @@ def test_multiple_subjects_isolated():
     assert extract_data_context(transport.subscribe("s1")) == []
 
     transport.close()
+
+
+def test_ring_retention_keeps_newest_messages():
+    transport = InMemorySemantivaTransport(retention="ring", max_messages=2)
+    for value in range(5):
+        transport.publish("ring", value, {})
+    assert extract_data_context(transport.subscribe("ring")) == [(3, {}), (4, {})]
+
+
+def test_drop_retention_rejects_full_channels():
+    transport = InMemorySemantivaTransport(retention="drop", max_messages=1)
+    assert transport.accepts("c")
+    transport.publish("c", "first", {})
+    assert not transport.accepts("c")
+    transport.publish("c", "second", {})
+    assert extract_data_context(transport.subscribe("c")) == [("first", {})]
+    assert not InMemorySemantivaTransport(retention="drop").accepts("c")
+
+
+def test_subscribers_retention_requires_open_subscription():
+    transport = InMemorySemantivaTransport(retention="subscribers")
+    transport.publish("node.a", "lost", {})
+    assert not transport.accepts("node.a")
+
+    sub = transport.subscribe("node.*")
+    assert transport.accepts("node.a")
+    transport.publish("node.a", "kept", {})
+    assert extract_data_context(sub) == [("kept", {})]
+
+    sub.close()
+    assert not transport.accepts("node.a")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"retention": "forever"},
+        {"retention": "ring"},
+        {"retention": "keep", "max_messages": 3},
+        {"retention": "drop", "max_messages": -1},
+    ],
+)
+def test_invalid_retention_configuration(kwargs):
+    with pytest.raises(ValueError):
+        InMemorySemantivaTransport(**kwargs)
+
+
+def test_null_transport_discards_everything():
+    transport = NullSemantivaTransport()
+    assert not transport.accepts("anything")
+    assert transport.publish("c", 1, {}) is None
+    assert transport.publish("c", 1, {}, require_ack=True).done()
+    assert list(transport.subscribe("c")) == []
@@ -23,6 +23,9 @@ execution:
   transport: InMemorySemantivaTransport
   options:
     retries: 2
+  transport_options:
+    retention: ring
+    max_messages: 8
 trace:
   driver: jsonl
   output_path: ./trace/out.trace.jsonl
@@ -52,6 +55,10 @@ pipeline:
     assert pipeline_cfg.execution.executor == "SequentialSemantivaExecutor"
     assert pipeline_cfg.execution.transport == "InMemorySemantivaTransport"
     assert pipeline_cfg.execution.options["retries"] == 2
+    assert pipeline_cfg.execution.transport_options == {
+        "retention": "ring",
+        "max_messages": 8,
+    }
 
     assert pipeline_cfg.trace.driver == "jsonl"
     assert pipeline_cfg.trace.output_path == "./trace/out.trace.jsonl"